@@ -9,27 +9,8 @@
 
 CLASSES = yaml_load(resource_path(os.path.join("resources", "autotrack_models", "coco128.yaml")))["names"]
 colors = np.random.uniform(0, 255, size=(len(CLASSES), 3))
-
-
-def _apply_nms(boxes, scores):
-    result_boxes = cv2.dnn.NMSBoxes(boxes, scores, 0.25, 0.45, 0.5)
-    return result_boxes
-
-
-def _create_detections(result_boxes, boxes, scores, class_ids, scale):
-    detections = []
-    for i in range(len(result_boxes)):
-        index = result_boxes[i]
-        box = boxes[index]
-        detection = {
-            "class_id": class_ids[index],
-            "class_name": CLASSES[class_ids[index]],
-            "confidence": scores[index],
-            "box": box,
-            "scale": scale,
-        }
-        detections.append(detection)
-    return detections
+_ATTRIBUTES = 4 + len(CLASSES)
+_PERSON_CLASSES = np.array([index for index, name in CLASSES.items() if name == "person"])
 
 
 def post_process_yolov8_output(output, confidence_threshold=0.5):
@@ -102,55 +83,79 @@ def draw_boxes(frame, detections, scale):
         )
 
 
-def get_filtered_detections(outputs, scale: int, confidence_threshold: float):
-    boxes = []
-    scores = []
-    class_ids = []
-
-    for i in range(outputs.shape[1]):
-        classes_scores = outputs[0][i][4:]
-        (minScore, maxScore, minClassLoc, (x, maxClassIndex)) = cv2.minMaxLoc(
-            classes_scores
-        )
-        if (
-                maxScore >= confidence_threshold
-                and CLASSES[maxClassIndex] == "person"
-        ):
-            box = [
-                outputs[0][i][0] - (0.5 * outputs[0][i][2]),
-                outputs[0][i][1] - (0.5 * outputs[0][i][3]),
-                outputs[0][i][2],
-                outputs[0][i][3],
-            ]
-            boxes.append(box)
-            scores.append(maxScore)
-            class_ids.append(maxClassIndex)
-
-    result_boxes = _apply_nms(boxes, scores)
-    detections = _create_detections(
-        result_boxes, boxes, scores, class_ids, scale
-    )
-    return detections
-
-
-def process(outputs: np.ndarray, scale: float) -> list[dict[str, int]]:
-    scores = []
-    boxes = []
-    for i in range(8400):
-        scores.append(outputs[4][i])
-        boxes.append([outputs[0][i], outputs[1][i], outputs[2][i], outputs[3][i]])
-    result_boxes = _apply_nms(boxes, scores)
-    print(f"Humans found: {result_boxes}")
-    detections: list[dict[str, int]] = []
-    for i in range(len(result_boxes)):
-        index = result_boxes[i]
-        box = boxes[index]
-        detection: dict[str, int] = {
-            "class_id": 0,
-            "class_name": CLASSES[0],
-            "confidence": scores[index],
-            "box": box,
+def decode_yolov8(outputs: np.ndarray, confidence_threshold: float,
+                  accepted_classes: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Decode the raw output of a YOLOv8 detector into candidate boxes.
+
+    The candidates are decoded in array operations: candidates without an accepted class above the threshold are masked
+    out, the best class of the others is found with an argmax over the class scores, candidates whose best class is
+    not accepted are dropped and the remaining boxes are converted to the top left corner format expected by
+    `cv2.dnn.NMSBoxes`.
+
+    Args:
+        outputs: The detector output, either as (4 + classes, candidates) or as (candidates, 4 + classes), optionally
+            with a leading batch dimension of one.
+        confidence_threshold: The minimum score of the best class of a candidate.
+        accepted_classes: The class ids to keep. All classes are kept if omitted.
+
+    Returns:
+        The center boxes (x, y, w, h), the top left boxes (x, y, w, h), the scores and the class ids of the candidates.
+    """
+    predictions = np.asarray(outputs, dtype=np.float32)
+    if predictions.ndim == 3:
+        predictions = predictions[0]
+    if predictions.shape[0] != _ATTRIBUTES and predictions.shape[1] == _ATTRIBUTES:
+        predictions = predictions.T
+    class_scores = predictions[4:]
+    # Only candidates with an accepted class above the threshold can pass, so the argmax is limited to them
+    prefilter_scores = class_scores if accepted_classes is None else class_scores[accepted_classes]
+    candidates = np.flatnonzero(prefilter_scores.max(axis=0) >= confidence_threshold)
+    class_ids = class_scores[:, candidates].argmax(axis=0)
+    scores = class_scores[class_ids, candidates]
+    if accepted_classes is not None:
+        accepted = np.isin(class_ids, accepted_classes)
+        candidates, class_ids, scores = candidates[accepted], class_ids[accepted], scores[accepted]
+    center_boxes = predictions[:4, candidates].T
+    corner_boxes = center_boxes.copy()
+    corner_boxes[:, :2] -= 0.5 * center_boxes[:, 2:]
+    return center_boxes, corner_boxes, scores, class_ids
+
+
+def _select_detections(center_boxes: np.ndarray, corner_boxes: np.ndarray, scores: np.ndarray, class_ids: np.ndarray,
+                       scale: float, confidence_threshold: float) -> list[dict]:
+    if len(scores) == 0:
+        return []
+    result_boxes = np.asarray(
+        cv2.dnn.NMSBoxes(corner_boxes, scores, confidence_threshold, 0.45, 0.5), dtype=np.intp
+    ).reshape(-1)
+    return [
+        {
+            "class_id": int(class_ids[index]),
+            "class_name": CLASSES[class_ids[index]],
+            "confidence": float(scores[index]),
+            "box": center_boxes[index].tolist(),
             "scale": scale,
         }
-        detections.append(detection)
-    return detections
+        for index in result_boxes
+    ]
+
+
+def get_filtered_detections(outputs, scale: int, confidence_threshold: float):
+    center_boxes, corner_boxes, scores, class_ids = decode_yolov8(outputs, confidence_threshold, _PERSON_CLASSES)
+    return _select_detections(center_boxes, corner_boxes, scores, class_ids, scale, confidence_threshold)
+
+
+def process(outputs: np.ndarray, scale: float, confidence_threshold: float = 0.25) -> list[dict[str, int]]:
+    """Find the persons in the output of the detector.
+
+    Args:
+        outputs: The detector output, see `decode_yolov8`.
+        scale: The factor from model input coordinates to frame coordinates.
+        confidence_threshold: The minimum score of a detection.
+
+    Returns:
+        The detections after non maximum suppression. Their boxes are (center x, center y, w, h) in model input
+        coordinates.
+    """
+    center_boxes, corner_boxes, scores, class_ids = decode_yolov8(outputs, confidence_threshold, _PERSON_CLASSES)
+    return _select_detections(center_boxes, corner_boxes, scores, class_ids, scale, confidence_threshold)
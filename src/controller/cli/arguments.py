@@ -0,0 +1,52 @@
+"""Splitting of command lines into arguments."""
+
+
+def split_arguments(line: str) -> list[str]:
+    """Split a line into individual arguments."""
+    argument_list: list[str] = []
+    in_string: bool = False
+    current_arg = ""
+    in_escape: bool = False
+    for c in line:
+        if in_string:
+            if c == '"' and not in_escape:
+                in_string = False
+                continue
+            if c == "\\":
+                in_escape = not in_escape
+            if not in_escape:
+                current_arg += c
+            else:
+                match c:
+                    case "t":
+                        current_arg += "\t"
+                        in_string = False
+                    case "n":
+                        current_arg += "\n"
+                        in_escape = False
+                    case "r":
+                        current_arg += "\r"
+                        in_escape = False
+                    case "$":
+                        current_arg += "\\$"
+                        in_escape = False
+                    case '"':
+                        current_arg += c
+                        in_escape = False
+        else:
+            if c == '"':
+                in_string = True
+                in_escape = False
+            elif c == "#":
+                if current_arg != "":
+                    argument_list.append(current_arg)
+                break
+            elif c in (" ", "\t"):
+                if current_arg != "":
+                    argument_list.append(current_arg)
+                    current_arg = ""
+            else:
+                current_arg += c
+    if current_arg != "":
+        argument_list.append(current_arg)
+    return argument_list
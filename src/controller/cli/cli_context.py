@@ -8,6 +8,7 @@
 from types import MappingProxyType
 from typing import TYPE_CHECKING
 
+from controller.cli.arguments import split_arguments
 from controller.cli.asset_command import AssetCommand
 from controller.cli.bankset_command import BankSetCommand
 from controller.cli.connect_command import ConnectCommand
@@ -28,57 +29,6 @@
     from model.control_desk import BankSet
 
 
-def _split_args(line: str) -> list[str]:
-    """Split a line into individual arguments."""
-    argument_list: list[str] = []
-    in_string: bool = False
-    current_arg = ""
-    in_escape: bool = False
-    for c in line:
-        if in_string:
-            if c == '"' and not in_escape:
-                in_string = False
-                continue
-            if c == "\\":
-                in_escape = not in_escape
-            if not in_escape:
-                current_arg += c
-            else:
-                match c:
-                    case "t":
-                        current_arg += "\t"
-                        in_string = False
-                    case "n":
-                        current_arg += "\n"
-                        in_escape = False
-                    case "r":
-                        current_arg += "\r"
-                        in_escape = False
-                    case "$":
-                        current_arg += "\\$"
-                        in_escape = False
-                    case '"':
-                        current_arg += c
-                        in_escape = False
-        else:
-            if c == '"':
-                in_string = True
-                in_escape = False
-            elif c == "#":
-                if current_arg != "":
-                    argument_list.append(current_arg)
-                break
-            elif c in (" ", "\t"):
-                if current_arg != "":
-                    argument_list.append(current_arg)
-                    current_arg = ""
-            else:
-                current_arg += c
-    if current_arg != "":
-        argument_list.append(current_arg)
-    return argument_list
-
-
 class CLIContext:
     """Context of the Client."""
 
@@ -225,7 +175,7 @@ def exec_command(self, line: str) -> bool:
 
         """
         try:
-            args = _split_args(line)
+            args = split_arguments(line)
             args = self._replace_variables(args)
             if len(args) == 0:
                 return True
@@ -0,0 +1,78 @@
+"""Runs show file serialization work outside the GUI thread."""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from PySide6 import QtCore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = getLogger(__name__)
+
+# A single worker keeps saves and uploads in the order they were requested.
+_show_file_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ShowFileWorker")
+
+
+class _MainThreadInvoker(QtCore.QObject):
+    """Executes callables in the thread the invoker lives in."""
+
+    _invoke: QtCore.Signal = QtCore.Signal(object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._invoke.connect(self._run, QtCore.Qt.ConnectionType.QueuedConnection)
+
+    @QtCore.Slot(object)
+    def _run(self, function: Callable[[], None]) -> None:
+        function()
+
+    def call(self, function: Callable[[], None]) -> None:
+        """Queue a callable for execution in the thread of the invoker."""
+        self._invoke.emit(function)
+
+
+_invoker: _MainThreadInvoker | None = None
+
+
+def _get_invoker() -> _MainThreadInvoker:
+    global _invoker  # noqa: PLW0603 the invoker needs to be created after the application
+    if _invoker is None:
+        _invoker = _MainThreadInvoker()
+        application = QtCore.QCoreApplication.instance()
+        if application is not None:
+            _invoker.moveToThread(application.thread())
+    return _invoker
+
+
+def run_in_background[T](work: Callable[[], T], on_success: Callable[[T], None],
+                      on_error: Callable[[Exception], None]) -> Future[T]:
+    """Run a job in the show file worker and deliver its outcome in the GUI thread.
+
+    The job must not access the show model. Hand it a snapshot instead.
+
+    Args:
+        work: The job to execute.
+        on_success: Called with the result of the job in the GUI thread.
+        on_error: Called with the raised exception in the GUI thread.
+
+    Returns:
+        The future of the job.
+
+    """
+    invoker = _get_invoker()
+
+    def _execute() -> T:
+        try:
+            result = work()
+        except Exception as e:
+            logger.exception("Background show file job failed.")
+            invoker.call(lambda error=e: on_error(error))
+            raise
+        invoker.call(lambda: on_success(result))
+        return result
+
+    return _show_file_worker.submit(_execute)
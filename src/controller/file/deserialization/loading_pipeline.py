@@ -0,0 +1,246 @@
+"""Background stages of the show file loading pipeline.
+
+Schema validation, fixture definition loading and image decoding do not touch the show model. They run in a worker
+pool, and only their results are consumed by the model construction on the GUI thread. Show files are streamed
+instead of being loaded as a whole, in order to bound the memory required for large shows.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from logging import getLogger
+from typing import TYPE_CHECKING, Final
+
+import xmlschema
+from defusedxml.ElementTree import iterparse
+from PySide6 import QtCore, QtGui
+
+from model.media_assets.factory_hint import AssetFactoryObjectHint
+from model.media_assets.image import decode_image, resolve_image_path
+from model.ofl.fixture import file_stamp, load_fixture
+from utility import resource_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from xml.etree import ElementTree as ET
+
+    from PySide6.QtGui import QImage
+
+logger = getLogger(__name__)
+
+FIXTURES_PATH: Final[str] = "/var/cache/missionDMX/fixtures"  # TODO config file
+"""Directory of the fixture library patched fixtures are loaded from."""
+
+XSI_SCHEMA_LOCATION: Final[str] = "{http://www.w3.org/2001/XMLSchema-instance}schemaLocation"
+
+_SCHEMA_FILE: Final[str] = os.path.join("resources", "ShowFileSchema.xsd")
+
+_schema_cache: dict[str, tuple[tuple[int, int], xmlschema.XMLSchema]] = {}
+_schema_lock = threading.Lock()
+_loader_pool: ThreadPoolExecutor | None = None
+
+
+def get_show_file_schema(schema_file: str | None = None) -> xmlschema.XMLSchema:
+    """Get the compiled show file schema.
+
+    Compiling the schema is expensive. It is only done once and repeated if the schema file changes.
+
+    Args:
+        schema_file: The XSD to compile. Defaults to the bundled show file schema.
+
+    Returns:
+        The compiled schema.
+
+    """
+    if schema_file is None:
+        schema_file = resource_path(_SCHEMA_FILE)
+    stamp = file_stamp(schema_file)
+    with _schema_lock:
+        cached = _schema_cache.get(schema_file)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        with open(schema_file, "r", encoding="UTF-8") as f:
+            schema = xmlschema.XMLSchema(f)
+        _schema_cache[schema_file] = (stamp, schema)
+        return schema
+
+
+def validate_show_file(schema: xmlschema.XMLSchema, file_name: str) -> None:
+    """Validate a show file without loading the complete document into memory.
+
+    Args:
+        schema: The compiled show file schema.
+        file_name: The show file to validate.
+
+    Raises:
+        xmlschema.XMLSchemaValidationError: The show file does not conform to the schema.
+
+    """
+    schema.validate(xmlschema.XMLResource(file_name, lazy=True))
+
+
+def iter_show_file_elements(file_name: str) -> Iterator[ET.Element]:
+    """Stream the top-level elements of a show file.
+
+    The root element is yielded first, as soon as its start tag was read. It only carries its attributes. Afterwards,
+    every child of the root is yielded once it is complete. The namespace prefix is stripped from all tags on the fly
+    and each child is discarded once the consumer requested the next one. Thus, at most one top-level element is held
+    in memory at a time.
+
+    Args:
+        file_name: The show file to read.
+
+    Yields:
+        The root element followed by its completed children.
+
+    """
+    depth = 0
+    prefix = ""
+    root: ET.Element | None = None
+    for event, element in iterparse(file_name, events=("start", "end")):
+        if event == "start":
+            if depth == 0:
+                root = element
+                schema_location = element.attrib.get(XSI_SCHEMA_LOCATION)
+                prefix = "{" + schema_location + "}" if schema_location else ""
+                yield root
+            depth += 1
+            continue
+        depth -= 1
+        if prefix and element.tag.startswith(prefix):
+            element.tag = element.tag[len(prefix):]
+        if depth == 1:
+            yield element
+            element.clear()
+            root.remove(element)
+
+
+def get_loader_pool() -> ThreadPoolExecutor:
+    """Get the worker pool of the show file loader."""
+    global _loader_pool  # noqa: PLW0603 the pool is created on first use
+    if _loader_pool is None:
+        _loader_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                          thread_name_prefix="ShowFileLoader")
+    return _loader_pool
+
+
+def wait_for_futures(futures: Iterable[Future], process_events: bool = False) -> None:
+    """Block until all futures are done.
+
+    Args:
+        futures: The futures to wait for. Their exceptions are not raised.
+        process_events: Keep repainting the GUI while waiting. User input is not processed. This must only be used while
+            the show model is still intact, as timers and network events are still delivered.
+
+    """
+    pending = set(futures)
+    if not process_events:
+        wait(pending)
+        return
+    while pending:
+        _, pending = wait(pending, timeout=0.02, return_when=FIRST_COMPLETED)
+        QtGui.QGuiApplication.processEvents(QtCore.QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+
+
+class ShowFilePrefetch:
+    """Loads resources referenced by a show file in the worker pool."""
+
+    def __init__(self, pool: ThreadPoolExecutor, show_file_path: str) -> None:
+        """Initialize an empty prefetch.
+
+        Args:
+            pool: The worker pool to use.
+            show_file_path: The path of the show file, used to resolve relative asset paths.
+
+        """
+        self._pool = pool
+        self._show_file_path = show_file_path
+        self._fixture_futures: dict[str, Future] = {}
+        self._image_futures: dict[str, Future[tuple[QImage, QImage]]] = {}
+        self.element_count: int = 0
+        """The number of top-level elements found by `scan`."""
+        self.scene_count: int = 0
+        """The number of scenes found by `scan`."""
+
+    def scan(self) -> None:
+        """Stream through the show file and start loading all referenced resources.
+
+        This is meant to run in the worker pool itself, next to the validation of the show file.
+        """
+        elements = iter_show_file_elements(self._show_file_path)
+        next(elements)
+        for child in elements:
+            self.element_count += 1
+            match child.tag:
+                case "scene":
+                    self.scene_count += 1
+                case "universe":
+                    self.prefetch_universe(child)
+                case "uihint" if child.attrib.get("name") == "media_assets":
+                    self.prefetch_media_assets(child.attrib.get("value", ""))
+
+    def prefetch_universe(self, universe_element: ET.Element) -> None:
+        """Load the fixture definitions patched in a universe.
+
+        Args:
+            universe_element: The XML definition of the universe.
+
+        """
+        for patching in universe_element.iterfind("patching"):
+            for child in patching:
+                fixture_file = child.attrib.get("fixture_file")
+                if fixture_file and fixture_file not in self._fixture_futures:
+                    self._fixture_futures[fixture_file] = self._pool.submit(
+                        load_fixture, os.path.join(FIXTURES_PATH, fixture_file))
+
+    def prefetch_media_assets(self, media_asset_definition: str) -> None:
+        """Decode the images of the media assets UI hint.
+
+        Args:
+            media_asset_definition: The JSON encoded media assets.
+
+        """
+        try:
+            assets = json.loads(media_asset_definition)
+        except json.JSONDecodeError:
+            # Reported by load_all_media_assets
+            return
+        for asset in assets:
+            if asset.get("type_hint", "") != AssetFactoryObjectHint.IMAGE_EXTERNAL_FILE.value:
+                continue
+            path, _ = resolve_image_path(asset.get("data", ""), self._show_file_path)
+            self._image_futures[asset.get("uuid", "")] = self._pool.submit(decode_image, path)
+
+    def wait_for_fixtures(self) -> None:
+        """Wait until all fixture definitions are loaded into the fixture cache.
+
+        Failing definitions are not reported here. They are loaded again and reported while parsing the patching.
+        """
+        wait_for_futures(self._fixture_futures.values())
+
+    def decoded_image(self, uuid: str) -> tuple[QImage, QImage] | None:
+        """Get the decoded image of a media asset.
+
+        Args:
+            uuid: The UUID of the asset.
+
+        Returns:
+            The decoded image and thumbnail or None if it was not prefetched.
+
+        """
+        future = self._image_futures.get(uuid)
+        if future is None:
+            return None
+        wait_for_futures((future,))
+        if future.exception() is not None:
+            logger.error("Failed to decode image of asset %s: %s", uuid, future.exception())
+            return None
+        return future.result()
+
+    def cancel(self) -> None:
+        """Cancel all work that did not start yet."""
+        for future in (*self._fixture_futures.values(), *self._image_futures.values()):
+            future.cancel()
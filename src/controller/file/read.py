@@ -3,13 +3,21 @@
 import os
 import xml.etree.ElementTree as ET
 from logging import getLogger
+from typing import NamedTuple
 
-import xmlschema
-from defusedxml.ElementTree import parse
 from PySide6.QtWidgets import QMessageBox
 
 import proto.Console_pb2
 import proto.UniverseControl_pb2
+from controller.file.deserialization.loading_pipeline import (
+    FIXTURES_PATH,
+    ShowFilePrefetch,
+    get_loader_pool,
+    get_show_file_schema,
+    iter_show_file_elements,
+    validate_show_file,
+    wait_for_futures,
+)
 from controller.file.deserialization.migrations import replace_old_filter_configurations
 from controller.file.deserialization.post_load_operations import link_patched_fixtures
 from controller.file.recently_used import register_opened_file
@@ -27,7 +35,6 @@
 from model.ofl.fixture_not_found_exception import FixtureDefNotFoundError
 from model.scene import FilterPage
 from model.virtual_filters.vfilter_factory import construct_virtual_filter_instance
-from utility import resource_path
 from view.dialogs import ExceptionsDialog
 from view.show_mode.player.external_ui_windows import update_window_count
 from view.show_mode.show_ui_widgets import WIDGET_LIBRARY, filter_to_ui_widget
@@ -89,16 +96,21 @@ def read_document(file_name: str, board_configuration: BoardConfiguration) -> bo
 
     """
     board_configuration.broadcaster.begin_show_file_parsing.emit()
-    pn = get_process_notifier("Load Showfile", 6)
+    pn = get_process_notifier("Load Showfile", 7)
+    pool = get_loader_pool()
+    prefetch = ShowFilePrefetch(pool, file_name)
 
     try:
-        pn.current_step_description = "Load file from disk."
-        with open(resource_path(os.path.join("resources", "ShowFileSchema.xsd")), "r", encoding="UTF-8") as schema_file:
-            schema = xmlschema.XMLSchema(schema_file)
-        pn.current_step_number += 1
-        schema.validate(file_name)
-        pn.current_step_number += 1
+        with pn.timed_stage("Load show file schema."):
+            schema = get_show_file_schema()
+        validation = pool.submit(validate_show_file, schema, file_name)
+        scan = pool.submit(prefetch.scan)
+        with pn.timed_stage("Validate show file.", steps=2):
+            wait_for_futures((validation, scan), process_events=True)
+            validation.result()
+            scan.result()
     except Exception as error:
+        prefetch.cancel()
         logger.exception("Error while validating show file: %s", error)
         ExceptionsDialog(error).exec()
         board_configuration.broadcaster.end_show_file_parsing.emit()
@@ -107,57 +119,38 @@ def read_document(file_name: str, board_configuration: BoardConfiguration) -> bo
 
     clear_media_registry()
     board_configuration.broadcaster.clear_board_configuration.emit()
-    pn.current_step_number += 1
-    tree = parse(file_name)
-    root = tree.getroot()
+    with pn.timed_stage("Load fixture definitions."):
+        prefetch.wait_for_fixtures()
 
-    prefix = ""
-
-    pn.total_step_count += len(root.attrib.items())
-    for key, value in root.attrib.items():
-        match key:
-            case "show_name":
-                board_configuration.show_name = value
-            case "default_active_scene":
-                board_configuration.default_active_scene = value
-            case "notes":
-                board_configuration.notes = value
-            case "{http://www.w3.org/2001/XMLSchema-instance}schemaLocation":
-                prefix = "{" + value + "}"
-            case _:
-                logger.warning("Found attribute %s=%s while parsing board configuration", key, value)
-        pn.current_step_number += 1
-
-    _clean_tags(root, prefix)
-
-    scene_defs_to_be_parsed = []
+    pn.total_step_count += prefetch.element_count
+    # Scenes are stored in front of the universes and bank sets they depend on. They are constructed while streaming
+    # the file, so that only a single top-level element is held in memory, and bound to the configuration afterward.
     loaded_banksets: dict[str, BankSet] = {}
+    unbound_scenes: list[_UnboundScene] = []
+    with pn.timed_stage("Load show configuration and scenes.", steps=0):
+        elements = iter_show_file_elements(file_name)
+        _parse_board_configuration_attributes(next(elements), board_configuration)
+        for child in elements:
+            match child.tag:
+                case "scene":
+                    unbound_scenes.append(_parse_scene(child, board_configuration))
+                case "universe":
+                    _parse_universe(child, board_configuration)
+                case "uihint":
+                    _parse_ui_hint(child, board_configuration)
+                case "bankset":
+                    _parse_and_add_bankset(child, loaded_banksets)
+                case "eventsource":
+                    _parse_and_add_event_source(child)
+                case "macro":
+                    _parse_and_add_macro(child, board_configuration)
+                case _:
+                    logger.warning("Show %s contains unknown element: %s", board_configuration.show_name, child.tag)
+            pn.current_step_number += 1
 
-    pn.total_step_count += len(root)
-    for child in root:
-        match child.tag:
-            case "scene":
-                scene_defs_to_be_parsed.append(child)
-            case "universe":
-                _parse_universe(child, board_configuration)
-            case "uihint":
-                _parse_ui_hint(child, board_configuration)
-            case "bankset":
-                _parse_and_add_bankset(child, loaded_banksets)
-            case "eventsource":
-                _parse_and_add_event_source(child)
-            case "macro":
-                _parse_and_add_macro(child, board_configuration)
-            case _:
-                logger.warning("Show %s contains unknown element: %s", board_configuration.show_name, child.tag)
-        pn.total_step_count += 1
-
-    pn.total_step_count += len(scene_defs_to_be_parsed)
-    for scene_def in scene_defs_to_be_parsed:
-        _parse_scene(scene_def, board_configuration, loaded_banksets)
-        pn.current_step_number += 1
-
-    pn.current_step_number += 1
+    with pn.timed_stage("Link scenes."):
+        for unbound_scene in unbound_scenes:
+            _bind_scene(unbound_scene, board_configuration, loaded_banksets)
 
     link_patched_fixtures(board_configuration)
     pn.current_step_number += 2
@@ -167,7 +160,8 @@ def read_document(file_name: str, board_configuration: BoardConfiguration) -> bo
     except ValueError as e:
         logger.exception("Unable to parse main brightness setting: %s", e)
     if board_configuration.ui_hints.get("media_assets"):
-        load_all_media_assets(board_configuration.ui_hints.get("media_assets"), file_name)
+        with pn.timed_stage("Load media assets.", steps=0):
+            load_all_media_assets(board_configuration.ui_hints.get("media_assets"), file_name, prefetch)
 
     board_configuration.broadcaster.board_configuration_loaded.emit(file_name)
     board_configuration.file_path = file_name
@@ -186,6 +180,28 @@ def read_document(file_name: str, board_configuration: BoardConfiguration) -> bo
     return True
 
 
+def _parse_board_configuration_attributes(root: ET.Element, board_configuration: BoardConfiguration) -> None:
+    """Load the show settings stored as attributes of the root element.
+
+    Args:
+        root: The root element of the show file.
+        board_configuration: The show file to apply the settings on.
+
+    """
+    for key, value in root.attrib.items():
+        match key:
+            case "show_name":
+                board_configuration.show_name = value
+            case "default_active_scene":
+                board_configuration.default_active_scene = value
+            case "notes":
+                board_configuration.notes = value
+            case "{http://www.w3.org/2001/XMLSchema-instance}schemaLocation":
+                pass
+            case _:
+                logger.warning("Found attribute %s=%s while parsing board configuration", key, value)
+
+
 def lcd_color_from_string(display_color: str) -> proto.Console_pb2.lcd_color:
     """Convert the string representation of the LCD backlight color to the enum.
 
@@ -217,13 +233,6 @@ def lcd_color_from_string(display_color: str) -> proto.Console_pb2.lcd_color:
             return proto.Console_pb2.lcd_color.white
 
 
-def _clean_tags(element: ET.Element, prefix: str) -> None:
-    """Recursively clean up immediate XML tag prefixes."""
-    for child in element:
-        child.tag = child.tag.replace(prefix, "")
-        _clean_tags(child, prefix)
-
-
 def _parse_filter_page(element: ET.Element, parent_scene: Scene, instantiated_pages: list[FilterPage]) -> bool:
     """Load a filter page from the XML representation.
 
@@ -280,15 +289,27 @@ def _parse_dmx_default_value(scene: Scene, child: ET.Element) -> None:
     )
 
 
-def _parse_scene(
-    scene_element: ET.Element, board_configuration: BoardConfiguration, loaded_banksets: dict[str, BankSet]
-) -> None:
+class _UnboundScene(NamedTuple):
+    """A loaded scene whose references to the rest of the show are not resolved yet."""
+
+    scene: Scene
+    linked_bankset_id: str | None
+    virtual_filters: list[VirtualFilter]
+    """Virtual filters that still need to be deserialized, as they may refer to patched fixtures."""
+
+
+def _parse_scene(scene_element: ET.Element, board_configuration: BoardConfiguration) -> _UnboundScene:
     """Load a scene from the show file data structure.
 
+    The universes and bank sets of the show are stored after the scenes. Use `_bind_scene` to complete the scene once
+    they have been loaded.
+
     Args:
         scene_element: The XML element to use.
-        board_configuration: The show configuration object to insert the scene into.
-        loaded_banksets: A list of bank sets that are associated with the scene.
+        board_configuration: The show configuration object the scene belongs to.
+
+    Returns:
+        The scene that still needs to be bound to the show.
 
     """
     human_readable_name = ""
@@ -308,10 +329,13 @@ def _parse_scene(
 
     filter_pages = []
     ui_page_elements = []
+    virtual_filters: list[VirtualFilter] = []
     for child in scene_element:
         match child.tag:
             case "filter":
-                _parse_filter(child, scene)
+                filter_ = _parse_filter(child, scene)
+                if isinstance(filter_, VirtualFilter):
+                    virtual_filters.append(filter_)
             case "filterpage":
                 filter_pages.append(child)
             case "uipage":
@@ -333,12 +357,28 @@ def _parse_scene(
                 logger.error("No suitable parent found while parsing filter pages")
                 break
 
-    if scene_element.attrib.get("linkedBankset") in loaded_banksets:
-        scene.linked_bankset = loaded_banksets[scene_element.attrib["linkedBankset"]]
-
     for ui_page_element in ui_page_elements:
         _append_ui_page(ui_page_element, scene)
 
+    return _UnboundScene(scene, scene_element.attrib.get("linkedBankset"), virtual_filters)
+
+
+def _bind_scene(
+    unbound_scene: _UnboundScene, board_configuration: BoardConfiguration, loaded_banksets: dict[str, BankSet]
+) -> None:
+    """Resolve the references of a loaded scene and add it to the show.
+
+    Args:
+        unbound_scene: The scene loaded by `_parse_scene`.
+        board_configuration: The show configuration object to insert the scene into.
+        loaded_banksets: The bank sets of the show by their ID.
+
+    """
+    scene = unbound_scene.scene
+    for filter_ in unbound_scene.virtual_filters:
+        filter_.deserialize()
+    if unbound_scene.linked_bankset_id in loaded_banksets:
+        scene.linked_bankset = loaded_banksets[unbound_scene.linked_bankset_id]
     board_configuration.broadcaster.scene_created.emit(scene)
 
 
@@ -411,13 +451,18 @@ def _append_ui_page(page_def: ET.Element, scene: Scene) -> None:
     scene.ui_pages.append(page)
 
 
-def _parse_filter(filter_element: ET.Element, scene: Scene) -> None:
+def _parse_filter(filter_element: ET.Element, scene: Scene) -> Filter:
     """Load a filter from the XML definition.
 
+    Virtual filters are not deserialized yet. See `_bind_scene`.
+
     Args:
         filter_element: The XML data to load the filter from.
         scene: The scene to append the filter to.
 
+    Returns:
+        The loaded filter.
+
     """
     filter_id = ""
     filter_type = 0
@@ -452,9 +497,8 @@ def _parse_filter(filter_element: ET.Element, scene: Scene) -> None:
                 logger.warning("Filter %s contains unknown element: %s", filter_id, child.tag)
 
     filter_ = replace_old_filter_configurations(filter_)
-    if isinstance(filter_, VirtualFilter):
-        filter_.deserialize()
     scene.append_filter(filter_)
+    return filter_
 
 
 def _parse_channel_link(initial_parameters_element: ET.Element, filter_: Filter) -> None:
@@ -666,13 +710,11 @@ def _parse_patching(board_configuration: BoardConfiguration, location_element: E
         The loaded fixtures.
 
     """
-    fixtures_path = "/var/cache/missionDMX/fixtures"  # TODO config file
-
     for child in location_element:
         try:
             make_used_fixture(
                 board_configuration,
-                load_fixture(os.path.join(fixtures_path, child.attrib["fixture_file"])),
+                load_fixture(os.path.join(FIXTURES_PATH, child.attrib["fixture_file"])),
                 int(child.attrib["mode"]),
                 universe_id,
                 int(child.attrib["start"]),
@@ -760,8 +802,16 @@ def _parse_and_add_macro(elm: ET.Element, board_configuration: BoardConfiguratio
                 logger.error("Unexpected child in macro definition: %s.", child.tag)
     board_configuration.add_macro(m)
 
-def load_all_media_assets(media_asset_defintion: str, show_file_path: str) -> None:
-    """Load media assets from provided UI hint."""
+def load_all_media_assets(media_asset_defintion: str, show_file_path: str,
+                          prefetch: ShowFilePrefetch | None = None) -> None:
+    """Load media assets from provided UI hint.
+
+    Args:
+        media_asset_defintion: The JSON encoded media assets.
+        show_file_path: The path of the show file.
+        prefetch: The prefetch holding images decoded in the background, if any.
+
+    """
     assets = json.loads(media_asset_defintion)
     for asset in assets:
         load_asset(
@@ -769,5 +819,6 @@ def load_all_media_assets(media_asset_defintion: str, show_file_path: str) -> No
             AssetFactoryObjectHint(asset.get("type_hint", "")),
             asset.get("data", ""),
             show_file_path=show_file_path,
-            name=asset.get("name", "")
+            name=asset.get("name", ""),
+            decoded_image=prefetch.decoded_image(asset.get("uuid", "")) if prefetch is not None else None,
         )
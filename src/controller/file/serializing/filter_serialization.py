@@ -13,18 +13,31 @@
 }
 
 
-def _create_filter_element_for_fish(
-    filter_: Filter, parent: ET.Element, for_fish: bool, om: SceneOptimizerModule
-) -> None:
-    """Create an XML element of type filter.
+def _detached_copy(filter_: Filter) -> Filter:
+    """Copy a filter for a scene snapshot, such that later changes to the model do not affect the copy."""
+    if not filter_.is_virtual_filter:
+        return filter_.copy()
+    # Serialized virtual filters keep their state in their configuration. A plain filter suffices to write it.
+    copy = Filter(filter_.scene, filter_.filter_id, filter_.filter_type, filter_.pos,
+                  filter_configurations=filter_.filter_configurations.copy(),
+                  initial_parameters=filter_.initial_parameters.copy())
+    copy.channel_links.update(filter_.channel_links)
+    return copy
 
-    Examples:
-        <filter type="0" id="id">
-          ...
-        </filter>
+
+def _snapshot_filter(filter_: Filter, for_fish: bool, filters: list[Filter], channel_overrides: dict[str, str]) -> None:
+    """Add a copy of a filter to the snapshot of its scene.
+
+    For Fish, virtual filters are replaced by the filters they instantiate. Otherwise, they serialize their state into
+    their configuration first.
+
+    Args:
+        filter_: The filter to add.
+        for_fish: Whether the snapshot is taken for Fish.
+        filters: The filters of the snapshot to append to.
+        channel_overrides: The mapping of virtual output ports to the ports of instantiated filters to update.
 
     """
-    # TODO check that no optimizations are performed if not fish
     if for_fish and filter_.is_virtual_filter:
         if not isinstance(filter_, VirtualFilter):
             raise RuntimeError(
@@ -34,34 +47,50 @@ def _create_filter_element_for_fish(
         ifl: list[Filter] = []
         filter_.instantiate_filters(ifl)
         for instantiated_filter in ifl:
-            _create_filter_element_for_fish(instantiated_filter, parent, True, om)
+            _snapshot_filter(instantiated_filter, True, filters, channel_overrides)
         for output_channel_name in filter_.out_data_types:
-            om.channel_override_dict[f"{filter_.filter_id}:{output_channel_name}"] = filter_.resolve_output_port_id(
+            channel_overrides[f"{filter_.filter_id}:{output_channel_name}"] = filter_.resolve_output_port_id(
                 output_channel_name
             )
-    else:
-        if for_fish:
-            if om.filter_was_substituted(filter_):
-                return
-        elif isinstance(filter_, VirtualFilter):
-            filter_.serialize()
-        filter_element = ET.SubElement(
-            parent,
-            "filter",
-            attrib={
-                "id": str(filter_.filter_id),
-                "type": str(filter_.filter_type),
-                "pos": f"{filter_.pos[0]},{filter_.pos[1]}",
-            },
-        )
+        return
+    if isinstance(filter_, VirtualFilter):
+        filter_.serialize()
+    filters.append(_detached_copy(filter_))
+
+
+def _create_filter_element_for_fish(
+    filter_: Filter, parent: ET.Element, for_fish: bool, om: SceneOptimizerModule
+) -> None:
+    """Create an XML element of type filter.
+
+    Virtual filters need to be resolved beforehand. See `_snapshot_filter`.
+
+    Examples:
+        <filter type="0" id="id">
+          ...
+        </filter>
+
+    """
+    # TODO check that no optimizations are performed if not fish
+    if for_fish and om.filter_was_substituted(filter_):
+        return
+    filter_element = ET.SubElement(
+        parent,
+        "filter",
+        attrib={
+            "id": str(filter_.filter_id),
+            "type": str(filter_.filter_type),
+            "pos": f"{filter_.pos[0]},{filter_.pos[1]}",
+        },
+    )
 
-        om.channel_link_list.append((filter_, filter_element))
+    om.channel_link_list.append((filter_, filter_element))
 
-        for initial_parameter in filter_.initial_parameters.items():
-            _create_initial_parameters_element(initial_parameter=initial_parameter, parent=filter_element)
+    for initial_parameter in filter_.initial_parameters_view.items():
+        _create_initial_parameters_element(initial_parameter=initial_parameter, parent=filter_element)
 
-        for filter_configuration in filter_.filter_configurations.items():
-            _create_filter_configuration_element(filter_configuration=filter_configuration, parent=filter_element)
+    for filter_configuration in filter_.filter_configurations_view.items():
+        _create_filter_configuration_element(filter_configuration=filter_configuration, parent=filter_element)
 
 
 def create_channel_mappings_for_filter_set_for_fish(
@@ -87,8 +116,8 @@ def create_channel_mappings_for_filter_set_for_fish(
     # TODO check that no optimizations are performed if not fish
     om.wrap_up(scene_element)
     channel_links_to_be_created: list[tuple[Filter, ET.SubElement]] = om.channel_link_list
-    override_port_mapping: dict[str, str] = om.channel_override_dict
-    default_nodes: dict[DataType, list] = {}
+    # Ordered sets of the default constants required per data type
+    default_nodes: dict[DataType, dict[str, None]] = {}
     time_node = None
     for f_entry in channel_links_to_be_created:
         if f_entry[0].filter_type == FilterTypeEnumeration.FILTER_TYPE_TIME_INPUT:
@@ -97,40 +126,33 @@ def create_channel_mappings_for_filter_set_for_fish(
     for f_entry in channel_links_to_be_created:
         filter_ = f_entry[0]
         filter_element = f_entry[1]
-        for channel_link in filter_.channel_links.items():
+        for channel_link in filter_.channel_links_view.items():
             output_channel_id: str = channel_link[1]
             if output_channel_id == "":
                 continue
-            override_request = override_port_mapping.get(output_channel_id)
-            if override_request:
-                output_channel_id = override_request
+            output_channel_id = om.resolve_output_port(output_channel_id)
             input_channel_id = channel_link[0]
             _create_channel_link_element(channel_link=(input_channel_id, output_channel_id), parent=filter_element)
         if for_fish:
-            for default_val_id, datatype in filter_.in_data_types.items():
-                if not filter_.channel_links.get(default_val_id) or filter_.channel_links[default_val_id] == "":
+            for default_val_id, datatype in filter_.in_data_types_view.items():
+                if not filter_.channel_links_view.get(default_val_id):
                     if default_val_id == "time":
-                        if not default_nodes.get(datatype):
-                            default_nodes[datatype] = []
                         if time_node is None:
                             time_node = "timedefaultfilter"
-                            default_nodes[datatype].append("time")
+                            default_nodes.setdefault(datatype, {})["time"] = None
                         _create_channel_link_element(
                             channel_link=(default_val_id, time_node + ":value"), parent=filter_element
                         )
                     else:
-                        if not default_nodes.get(datatype):
-                            default_nodes[datatype] = []
                         val = "0"
                         if datatype == DataType.DT_COLOR:
                             val = "0,0,0"
                         default_value = (
-                            filter_.default_values[default_val_id]
-                            if filter_.default_values and default_val_id in filter_.default_values
+                            filter_.default_values_view[default_val_id]
+                            if filter_.default_values_view and default_val_id in filter_.default_values_view
                             else val
                         )
-                        if default_value not in default_nodes[datatype]:
-                            default_nodes[datatype].append(default_value)
+                        default_nodes.setdefault(datatype, {})[default_value] = None
                         _create_channel_link_element(
                             channel_link=(default_val_id, "const" + str(datatype) + "val" + default_value + ":value"),
                             parent=filter_element,
@@ -1,13 +1,78 @@
 """Post processing helper."""
 
 import xml.etree.ElementTree as ET
+from dataclasses import dataclass
 from logging import getLogger
 
 from model import Filter
 from model.filter import DataType, FilterTypeEnumeration
+from model.filter_graph import analyze_reachability, is_gui_addressed
 
 logger = getLogger(__name__)
 
+_PURE_FILTER_TYPES: frozenset[int] = frozenset({
+    FilterTypeEnumeration.FILTER_CONSTANT_8BIT,
+    FilterTypeEnumeration.FILTER_CONSTANT_16_BIT,
+    FilterTypeEnumeration.FILTER_CONSTANT_FLOAT,
+    FilterTypeEnumeration.FILTER_CONSTANT_COLOR,
+    FilterTypeEnumeration.FILTER_ADAPTER_16BIT_TO_DUAL_8BIT,
+    FilterTypeEnumeration.FILTER_ADAPTER_16BIT_TO_BOOL,
+    FilterTypeEnumeration.FILTER_ARITHMETICS_MAC,
+    FilterTypeEnumeration.FILTER_ARITHMETICS_FLOAT_TO_16BIT,
+    FilterTypeEnumeration.FILTER_ARITHMETICS_FLOAT_TO_8BIT,
+    FilterTypeEnumeration.FILTER_ARITHMETICS_ROUND,
+    FilterTypeEnumeration.FILTER_ADAPTER_COLOR_TO_RGB,
+    FilterTypeEnumeration.FILTER_ADAPTER_COLOR_TO_RGBW,
+    FilterTypeEnumeration.FILTER_ADAPTER_COLOR_TO_RGBWA,
+    FilterTypeEnumeration.FILTER_ADAPTER_FLOAT_TO_COLOR,
+    FilterTypeEnumeration.FILTER_TRIGONOMETRICS_SIN,
+    FilterTypeEnumeration.FILTER_TRIGONOMETRICS_COSIN,
+    FilterTypeEnumeration.FILTER_TRIGONOMETRICS_TANGENT,
+    FilterTypeEnumeration.FILTER_TRIGONOMETRICS_ARCSIN,
+    FilterTypeEnumeration.FILTER_TRIGONOMETRICS_ARCCOSIN,
+    FilterTypeEnumeration.FILTER_TRIGONOMETRICS_ARCTANGENT,
+    FilterTypeEnumeration.FILTER_WAVES_SQUARE,
+    FilterTypeEnumeration.FILTER_WAVES_TRIANGLE,
+    FilterTypeEnumeration.FILTER_WAVES_SAWTOOTH,
+    FilterTypeEnumeration.FILTER_ARITHMETICS_LOGARITHM,
+    FilterTypeEnumeration.FILTER_ARITHMETICS_EXPONENTIAL,
+    FilterTypeEnumeration.FILTER_ARITHMETICS_MINIMUM,
+    FilterTypeEnumeration.FILTER_ARITHMETICS_MAXIMUM,
+    FilterTypeEnumeration.FILTER_TYPE_ADAPTER_8BIT_TO_FLOAT,
+    FilterTypeEnumeration.FILTER_TYPE_ADAPTER_16BIT_TO_FLOAT,
+    FilterTypeEnumeration.FILTER_ADAPTER_COLOR_TO_FLOAT,
+    FilterTypeEnumeration.FILTER_ADAPTER_FLOAT_TO_8BIT_RANGE,
+    FilterTypeEnumeration.FILTER_ADAPTER_FLOAT_TO_16BIT_RANGE,
+    FilterTypeEnumeration.FILTER_ADAPTER_FLOAT_TO_FLOAT_RANGE,
+    FilterTypeEnumeration.FILTER_ADAPTER_DUAL_BYTE_TO_16BIT,
+    FilterTypeEnumeration.FILTER_ADAPTER_8BIT_TO_16BIT,
+    FilterTypeEnumeration.FILTER_COLOR_MIXER_HSV,
+    FilterTypeEnumeration.FILTER_COLOR_MIXER_ADDITIVE_RGB,
+    FilterTypeEnumeration.FILTER_COLOR_MIXER_NORMATVE_RGB,
+    FilterTypeEnumeration.FILTER_SUM_8BIT,
+    FilterTypeEnumeration.FILTER_SUM_16BIT,
+    FilterTypeEnumeration.FILTER_SUM_FLOAT,
+})
+"""Filter types without state or side effects. Their outputs only depend on their configuration and inputs."""
+
+
+@dataclass
+class OptimizationReport:
+    """Statistics of the filter graph optimization of a single scene."""
+
+    scene_id: int
+    placed_filters: int = 0
+    """Number of filters placed before the optimization pass."""
+    merged_filters: int = 0
+    """Number of filters replaced by an identical one."""
+    removed_filters: int = 0
+    """Number of filters removed as they do not contribute to any sink."""
+
+    @property
+    def remaining_filters(self) -> int:
+        """Number of filters left after the optimization pass."""
+        return self.placed_filters - self.merged_filters - self.removed_filters
+
 
 class SceneOptimizerModule:
     """Post-processing helper for a single scene.
@@ -17,20 +82,28 @@ class SceneOptimizerModule:
     of universe filters.
     """
 
-    def __init__(self, replacing_enabled: bool) -> None:
+    def __init__(self, replacing_enabled: bool, pinned_filter_ids: frozenset[str] = frozenset(),
+                 addressed_ids: frozenset[str] = frozenset()) -> None:
         """Initialize the scene optimizer.
 
         Args:
             replacing_enabled: Whether substitution of filters is allowed.
+            pinned_filter_ids: The IDs of the filters placed by the user, which are never merged.
+            addressed_ids: The IDs of the filters addressed by the GUI. See `is_gui_addressed`.
 
         """
         self._replacing_enabled = replacing_enabled
+        self._pinned_filter_ids = pinned_filter_ids
+        self._addressed_ids = addressed_ids
         self.channel_override_dict: dict[str, str] = {}
         self.channel_link_list: list[tuple[Filter, ET.SubElement]] = []
         self._global_time_input_filter: Filter | None = None
         self._main_brightness_input_filter: Filter | None = None
         self._universe_filter_dict: dict[str, list[tuple[str, str, str]]] = {}
         self._first_universe_filter_id: dict[str, str] = {}
+        self._merged_filter_ids: dict[str, str] = {}
+        self.report: OptimizationReport | None = None
+        """The statistics of the optimization pass, available after `wrap_up`."""
 
     def _substitute_universe_filter(self, f: Filter) -> None:
         """Register a universe filter for later aggregation.
@@ -42,15 +115,15 @@ def _substitute_universe_filter(self, f: Filter) -> None:
             f: The universe filter to register.
 
         """
-        universe_id = f.filter_configurations["universe"]
+        universe_id = f.filter_configurations_view["universe"]
         fde = self._universe_filter_dict.get(universe_id)
         if not fde:
             fde = []
             self._universe_filter_dict[universe_id] = fde
-        for k, v in f.filter_configurations.items():
+        for k, v in f.filter_configurations_view.items():
             if k == "universe":
                 continue
-            fde.append((f"{f.filter_id}__{k}", v, str(f.channel_links.get(k))))
+            fde.append((f"{f.filter_id}__{k}", v, str(f.channel_links_view.get(k))))
         self._first_universe_filter_id[universe_id] = f.filter_id
 
     def filter_was_substituted(self, f: Filter) -> bool:
@@ -69,7 +142,7 @@ def filter_was_substituted(self, f: Filter) -> bool:
         match f.filter_type:
             # TODO expand this by also reduce constants with the same value
             case FilterTypeEnumeration.FILTER_TYPE_TIME_INPUT:
-                if len(f.out_data_types) == 0:
+                if len(f.out_data_types_view) == 0:
                     f.out_data_types["value"] = DataType.DT_DOUBLE
                 if self._global_time_input_filter is not None:
                     self._fill_ch_sub_dict(f, self._global_time_input_filter)
@@ -78,7 +151,7 @@ def filter_was_substituted(self, f: Filter) -> bool:
                 self._global_time_input_filter = f
                 return False
             case FilterTypeEnumeration.FILTER_TYPE_MAIN_BRIGHTNESS:
-                if len(f.out_data_types) == 0:
+                if len(f.out_data_types_view) == 0:
                     f.out_data_types["brightness"] = DataType.DT_16_BIT
                 if self._main_brightness_input_filter is not None:
                     self._fill_ch_sub_dict(f, self._main_brightness_input_filter)
@@ -112,7 +185,7 @@ def _fill_ch_sub_dict(self, f: Filter, substitution_filter: Filter) -> None:
         logger.debug(
             "Substituted filter %s with %s in scene %s.", f.filter_id, substitution_filter.filter_id, f.scene.scene_id
         )
-        for output_channel_name in f.out_data_types:
+        for output_channel_name in f.out_data_types_view:
             self.channel_override_dict[f"{f.filter_id}:{output_channel_name}"] = (
                 f"{substitution_filter.filter_id}:{output_channel_name}"
             )
@@ -130,8 +203,7 @@ def _emplace_universe_filters(self, scene_element: ET.Element) -> None:
             for channel_mapping in channel_list:
                 filter_input_channel, universe_channel, foreign_filter_output_channel = channel_mapping
                 filter_config_parameters[filter_input_channel] = str(int(universe_channel) - 1)
-                if foreign_filter_output_channel in self.channel_override_dict:
-                    foreign_filter_output_channel = self.channel_override_dict.get(foreign_filter_output_channel)
+                foreign_filter_output_channel = self.resolve_output_port(foreign_filter_output_channel)
                 channel_mappings[filter_input_channel] = foreign_filter_output_channel
             filter_element = ET.SubElement(
                 scene_element,
@@ -171,4 +243,108 @@ def wrap_up(self, scene_element: ET.Element) -> None:
             scene_element: The XML element representing the scene.
 
         """
+        if self._replacing_enabled and len(self.channel_link_list) > 0:
+            self._optimize_filter_graph(scene_element)
         self._emplace_universe_filters(scene_element)
+
+    def resolve_output_port(self, port: str) -> str:
+        """Translate an output port to the port of the filter that is actually placed.
+
+        Args:
+            port: The ``filter_id:output`` string to resolve.
+
+        Returns:
+            The port after applying all substitutions.
+
+        """
+        seen: set[str] = set()
+        while port not in seen:
+            seen.add(port)
+            override = self.channel_override_dict.get(port)
+            if override:
+                port = override
+                continue
+            filter_id, separator, output = port.partition(":")
+            merged_into = self._merged_filter_ids.get(filter_id)
+            if merged_into is None:
+                break
+            port = f"{merged_into}{separator}{output}"
+        return port
+
+    def _is_mergeable(self, f: Filter, pinned_ids: frozenset[str], addressed_ids: frozenset[str]) -> bool:
+        """Check whether a filter may be replaced by an identical one.
+
+        Only pure filters instantiated by virtual filters are considered. Filters placed by the user or filters
+        addressed by the GUI may receive parameter updates by their ID and are kept.
+        """
+        if f.filter_type not in _PURE_FILTER_TYPES or f.filter_id in pinned_ids:
+            return False
+        return not is_gui_addressed(f.filter_id, addressed_ids)
+
+    def _optimize_filter_graph(self, scene_element: ET.Element) -> None:
+        """Merge structurally identical pure filters and remove filters that do not contribute to any sink.
+
+        Identical filters are found through hash-consing: a filter is identified by its type, its configuration and
+        its already deduplicated inputs. Thus, whole identical subgraphs collapse into a single instance. Afterwards,
+        only filters reachable from a sink are kept. See `model.filter_graph.analyze_reachability`.
+
+        Args:
+            scene_element: The XML element representing the scene.
+
+        """
+        scene = self.channel_link_list[0][0].scene
+        self.report = OptimizationReport(scene.scene_id, placed_filters=len(self.channel_link_list))
+        pinned_ids = self._pinned_filter_ids
+        addressed_ids = self._addressed_ids
+        placed: dict[str, tuple[Filter, ET.Element]] = {f.filter_id: (f, e) for f, e in self.channel_link_list}
+        mergeable = {fid for fid, (f, _) in placed.items()
+                     if self._is_mergeable(f, pinned_ids, addressed_ids)}
+
+        representatives: dict[tuple, str] = {}
+        visiting: set[str] = set()
+        canonical_ids: dict[str, str] = {}
+
+        def canonical(filter_id: str) -> str:
+            if filter_id in canonical_ids or filter_id not in mergeable or filter_id in visiting:
+                return canonical_ids.get(filter_id, filter_id)
+            visiting.add(filter_id)
+            f = placed[filter_id][0]
+            inputs = []
+            for input_name, port in f.channel_links_view.items():
+                if not port:
+                    continue
+                resolved = self.resolve_output_port(port)
+                source_id, separator, output = resolved.partition(":")
+                inputs.append((input_name, f"{canonical(source_id)}{separator}{output}"))
+            visiting.discard(filter_id)
+            key = (f.filter_type, tuple(sorted(f.initial_parameters_view.items())),
+                   tuple(sorted(f.filter_configurations_view.items())), tuple(sorted(f.default_values_view.items())),
+                   tuple(sorted(inputs)))
+            representative = representatives.setdefault(key, filter_id)
+            if representative != filter_id:
+                self._merged_filter_ids[filter_id] = representative
+            canonical_ids[filter_id] = representative
+            return representative
+
+        for filter_id in placed:
+            canonical(filter_id)
+
+        # Drop everything that does not feed a universe output or another sink
+        universe_sources = [self.resolve_output_port(foreign_output).partition(":")[0]
+                            for channel_list in self._universe_filter_dict.values()
+                            for _, _, foreign_output in channel_list]
+        reachability = analyze_reachability(
+            (f for fid, (f, _) in placed.items() if fid not in self._merged_filter_ids),
+            addressed_ids, self.resolve_output_port, universe_sources)
+        removed = set(reachability.unreachable)
+
+        dropped = removed | self._merged_filter_ids.keys()
+        for filter_id in dropped:
+            scene_element.remove(placed[filter_id][1])
+        self.channel_link_list = [entry for entry in self.channel_link_list if entry[0].filter_id not in dropped]
+        self.report.merged_filters = len(self._merged_filter_ids)
+        self.report.removed_filters = len(removed)
+        if dropped:
+            logger.info("Optimized scene %s: %d filters merged, %d unreachable filters removed, "
+                        "%d of %d filters remain.", scene.scene_id, self.report.merged_filters,
+                        self.report.removed_filters, self.report.remaining_filters, self.report.placed_filters)
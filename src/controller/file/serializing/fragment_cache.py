@@ -0,0 +1,228 @@
+"""Cache of serialized scene fragments for uploading shows to Fish."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import xml.etree.ElementTree as ET
+from typing import TYPE_CHECKING, NamedTuple
+from uuid import uuid4
+
+from controller.file.serializing.general_serialization import snapshot_show
+from controller.file.serializing.scene_serialization import (
+    SceneSnapshot,
+    generate_scene_xml_description,
+    snapshot_scene,
+)
+from model.filter_graph import gui_addressed_filter_ids
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from controller.utils.process_notifications import ProcessNotifier
+    from model import BoardConfiguration, Scene
+
+
+class FishDocument(NamedTuple):
+    """A show file serialized for Fish."""
+
+    data: bytes
+    """The encoded XML document."""
+
+    scene_count: int
+    """The number of scenes in the document."""
+
+    regenerated_scenes: int
+    """The number of scenes that were serialized, as their cached fragment was missing or outdated."""
+
+
+def _update_with_mapping(digest: hashlib.blake2b, mapping: Mapping[str, str]) -> None:
+    for key, value in mapping.items():
+        digest.update(f"{key}\x1f{value}\x1e".encode())
+
+
+def scene_content_hash(scene: Scene) -> bytes:
+    """Compute a hash of everything that contributes to the Fish representation of a scene.
+
+    Virtual filters are asked to serialize their state into their configuration first. Dependencies outside the scene,
+    like the patched fixtures, are not covered. See `patching_fingerprint`.
+
+    Args:
+        scene: The scene to hash.
+
+    Returns:
+        The digest of the scene.
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    bankset_id = scene.linked_bankset.id if scene.linked_bankset else ""
+    digest.update(f"{scene.scene_id}\x1d{scene.human_readable_name}\x1d{bankset_id}\x1d".encode())
+    for filter_ in scene.filters:
+        if filter_.is_virtual_filter:
+            filter_.serialize()
+        digest.update(f"{filter_.filter_id}\x1d{filter_.filter_type}\x1d{filter_.pos}\x1d".encode())
+        _update_with_mapping(digest, filter_.initial_parameters_view)
+        digest.update(b"\x1d")
+        _update_with_mapping(digest, filter_.filter_configurations_view)
+        digest.update(b"\x1d")
+        _update_with_mapping(digest, filter_.channel_links_view)
+        digest.update(b"\x1c")
+    # Filters addressed by the GUI are exempt from the filter graph optimization
+    digest.update("\x1d".join(sorted(gui_addressed_filter_ids(scene))).encode())
+    digest.update(b"\x1c")
+    for default_value in scene.dmx_default_values:
+        digest.update(f"{default_value.universe_id}.{default_value.channel}={default_value.value}\x1e".encode())
+    return digest.digest()
+
+
+def patching_fingerprint(board_configuration: BoardConfiguration) -> bytes:
+    """Compute a hash of the patched fixtures, which virtual filters may resolve while being instantiated.
+
+    Args:
+        board_configuration: The show to hash the patching of.
+
+    Returns:
+        The digest of the patching.
+
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for fixture in board_configuration.fixtures:
+        digest.update(f"{fixture.uuid}\x1d{fixture.fixture_file}\x1d{fixture.mode_index}\x1d"
+                      f"{fixture.universe_id}\x1d{fixture.start_index}\x1e".encode())
+    return digest.digest()
+
+
+class FishDocumentSnapshot:
+    """A show prepared for Fish, detached from the model.
+
+    The snapshot holds the snapshots of the scenes that need to be serialized and the cached fragments of all other
+    scenes. Encoding it does not touch the model and may happen in a worker thread.
+    """
+
+    def __init__(self, cache: SceneFragmentCache, fingerprint: bytes, root: ET.Element,
+                 scenes: list[bytes | tuple[bytes, SceneSnapshot]]) -> None:
+        """Initialize a snapshot.
+
+        Args:
+            cache: The cache to store newly serialized fragments in.
+            fingerprint: The patching fingerprint the scenes were expanded with.
+            root: The document without its scenes.
+            scenes: Per scene either its cached fragment or its content hash and snapshot.
+
+        """
+        self._cache = cache
+        self._fingerprint = fingerprint
+        self._root = root
+        self._scenes = scenes
+
+    def encode(self) -> FishDocument:
+        """Serialize the snapshot and update the fragment cache.
+
+        The filter graphs of the scenes that are not cached are optimized here.
+
+        Returns:
+            The serialized document.
+
+        """
+        fragments: list[bytes] = []
+        regenerated_scenes = 0
+        for scene in self._scenes:
+            if isinstance(scene, bytes):
+                fragments.append(scene)
+                continue
+            content_hash, scene_snapshot = scene
+            container = ET.Element("scenes")
+            generate_scene_xml_description(True, container, scene_snapshot)
+            fragment = b"".join(ET.tostring(element, encoding="utf-8") for element in container)
+            self._cache.store(scene_snapshot.scene_id, content_hash, fragment, self._fingerprint)
+            fragments.append(fragment)
+            regenerated_scenes += 1
+
+        # Scenes are the first children of the document. A unique comment marks their place.
+        marker = ET.Comment(uuid4().hex)
+        self._root.insert(0, marker)
+        document = ET.tostring(self._root, encoding="utf8", method="xml")
+        self._root.remove(marker)
+        document = document.replace(ET.tostring(marker, encoding="utf-8"), b"".join(fragments), 1)
+        return FishDocument(document, len(fragments), regenerated_scenes)
+
+
+class SceneFragmentCache:
+    """Keeps the serialized Fish representation of every scene and only regenerates the ones that changed."""
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._fragments: dict[int, tuple[bytes, bytes]] = {}
+        self._patching_fingerprint: bytes = b""
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Drop all cached fragments."""
+        with self._lock:
+            self._fragments.clear()
+            self._patching_fingerprint = b""
+
+    def store(self, scene_id: int, content_hash: bytes, fragment: bytes, fingerprint: bytes) -> None:
+        """Store the serialized fragment of a scene.
+
+        Args:
+            scene_id: The ID of the scene.
+            content_hash: The content hash of the scene the fragment was serialized from.
+            fragment: The serialized scene.
+            fingerprint: The patching fingerprint the fragment was created with. Outdated fragments are dropped.
+
+        """
+        with self._lock:
+            if fingerprint == self._patching_fingerprint:
+                self._fragments[scene_id] = (content_hash, fragment)
+
+    def snapshot(self, board_configuration: BoardConfiguration, pn: ProcessNotifier) -> FishDocumentSnapshot:
+        """Take a snapshot of a show for Fish, reusing the cached fragments of unchanged scenes.
+
+        This method needs to be called from the thread owning the model. The virtual filters of dirty scenes are
+        instantiated here. Optimizing and encoding them is left to the snapshot.
+
+        Args:
+            board_configuration: The show to serialize.
+            pn: The process notifier to report progress to.
+
+        Returns:
+            The snapshot, which may be encoded in a worker thread.
+
+        """
+        fingerprint = patching_fingerprint(board_configuration)
+        scenes: list[bytes | tuple[bytes, SceneSnapshot]] = []
+        with self._lock:
+            if fingerprint != self._patching_fingerprint:
+                self._fragments.clear()
+                self._patching_fingerprint = fingerprint
+            scene_ids = {scene.scene_id for scene in board_configuration.scenes}
+            for stale_scene_id in self._fragments.keys() - scene_ids:
+                del self._fragments[stale_scene_id]
+            cached_fragments = dict(self._fragments)
+
+        for scene in board_configuration.scenes:
+            content_hash = scene_content_hash(scene)
+            cached = cached_fragments.get(scene.scene_id)
+            if cached is not None and cached[0] == content_hash:
+                scenes.append(cached[1])
+                continue
+            scenes.append((content_hash, snapshot_scene(True, scene, pn)))
+
+        root = snapshot_show(board_configuration, pn, assemble_for_fish_loading=True, include_scenes=False).root
+        return FishDocumentSnapshot(self, fingerprint, root, scenes)
+
+    def assemble(self, board_configuration: BoardConfiguration, pn: ProcessNotifier) -> FishDocument:
+        """Serialize a show for Fish, reusing the cached fragments of unchanged scenes.
+
+        The result is identical to serializing the output of `create_xml` with `assemble_for_fish_loading` set.
+
+        Args:
+            board_configuration: The show to serialize.
+            pn: The process notifier to report progress to.
+
+        Returns:
+            The serialized document.
+
+        """
+        return self.snapshot(board_configuration, pn).encode()
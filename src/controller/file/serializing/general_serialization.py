@@ -1,9 +1,14 @@
 """Contains general serialization functions."""
 import xml.etree.ElementTree as ET
 from logging import getLogger
+from typing import NamedTuple
 
 from controller.file.serializing.events_and_macros import _write_event_sender, _write_macro
-from controller.file.serializing.scene_serialization import generate_scene_xml_description
+from controller.file.serializing.scene_serialization import (
+    SceneSnapshot,
+    generate_scene_xml_description,
+    snapshot_scene,
+)
 from controller.file.serializing.ui_settings_serialization import _create_ui_hint_element, update_assets_ui_hint_element
 from controller.file.serializing.universe_serialization import (
     _create_artnet_location_element,
@@ -19,8 +24,18 @@
 logger = getLogger(__name__)
 
 
+class ShowSnapshot(NamedTuple):
+    """A show prepared for serialization, detached from the model."""
+
+    root: ET.Element
+    """The document without its scenes."""
+    scenes: list[SceneSnapshot]
+    """The snapshots of the scenes, in the order they are written."""
+    assemble_for_fish_loading: bool
+
+
 def create_xml(board_configuration: BoardConfiguration, pn: ProcessNotifier,
-               assemble_for_fish_loading: bool = False) -> ET.Element:
+               assemble_for_fish_loading: bool = False, include_scenes: bool = True) -> ET.Element:
     """Creates an XML element from the given board configuration.
 
     Args:
@@ -28,21 +43,66 @@ def create_xml(board_configuration: BoardConfiguration, pn: ProcessNotifier,
         pn (ProcessNotifier): The process notifier to update about progress.
         assemble_for_fish_loading: Pass True if the XML is build for fish.
                                     This will skip the UI and resolve virtual filters
+        include_scenes: Pass False to leave out the scenes, for example if they are serialized separately.
 
     Returns:
         The XML element containing the board configuration.
         See https://github.com/Mission-DMX/Docs/blob/main/FormatSchemes/ProjectFile/ShowFile_v0.xsd for more information
 
+    """
+    return build_xml(snapshot_show(board_configuration, pn, assemble_for_fish_loading, include_scenes))
+
+
+def build_xml(snapshot: ShowSnapshot) -> ET.Element:
+    """Create the XML element of a show from its snapshot.
+
+    This includes generating the scenes and optimizing them for Fish. It does not access the model and may run in a
+    worker thread. The snapshot is consumed.
+
+    Args:
+        snapshot: The snapshot of the show, see `snapshot_show`.
+
+    Returns:
+        The XML element containing the board configuration.
+
+    """
+    # Scenes are the first children of the document
+    container = ET.Element("bord_configuration")
+    for scene in snapshot.scenes:
+        generate_scene_xml_description(snapshot.assemble_for_fish_loading, container, scene)
+    snapshot.root[0:0] = list(container)
+    return snapshot.root
+
+
+def snapshot_show(board_configuration: BoardConfiguration, pn: ProcessNotifier,
+                  assemble_for_fish_loading: bool = False, include_scenes: bool = True) -> ShowSnapshot:
+    """Take a snapshot of a show for serialization.
+
+    This needs to be called from the thread owning the model. The document without its scenes is created here, as it
+    is small. The scenes are only copied. Their XML is generated by `build_xml`.
+
+    Args:
+        board_configuration: The board configuration to be converted.
+        pn: The process notifier to update about progress.
+        assemble_for_fish_loading: Pass True if the XML is build for fish.
+                                    This will skip the UI and resolve virtual filters
+        include_scenes: Pass False to leave out the scenes, for example if they are serialized separately.
+
+    Returns:
+        The snapshot of the show.
+
     """
     pn.current_step_description = "Creating document root."
     pn.total_step_count += 1 + len(board_configuration.scenes) + 3
     root = _create_board_configuration_element(board_configuration)
-    pn.current_step_description = "Writing scenes."
+    pn.current_step_description = "Copying scenes."
     pn.current_step_number += 1
 
-    for scene in board_configuration.scenes:
-        generate_scene_xml_description(assemble_for_fish_loading, root, scene, pn)
-        pn.total_step_count += 1
+    scenes: list[SceneSnapshot] = []
+    if include_scenes:
+        for scene in board_configuration.scenes:
+            scenes.append(snapshot_scene(assemble_for_fish_loading, scene, pn))
+            pn.total_step_count += 1
 
     pn.current_step_description = "Creating universes."
     remaining_fixtures = set(board_configuration.fixtures)
@@ -83,7 +143,7 @@ def create_xml(board_configuration: BoardConfiguration, pn: ProcessNotifier,
             _write_macro(root, m)
     pn.total_step_count += 1
 
-    return root
+    return ShowSnapshot(root, scenes, assemble_for_fish_loading)
 
 
 def _create_board_configuration_element(board_configuration: BoardConfiguration) -> ET.Element:
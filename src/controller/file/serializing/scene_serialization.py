@@ -1,16 +1,43 @@
 """Serialization of Scenes to XML."""
 
 import xml.etree.ElementTree as ET
+from typing import NamedTuple
 
 from controller.file.serializing.bankset_config_serialization import _create_scene_bankset
 from controller.file.serializing.filter_serialization import (
     _create_filter_element_for_fish,
+    _snapshot_filter,
     create_channel_mappings_for_filter_set_for_fish,
 )
 from controller.file.serializing.fish_optimizer import SceneOptimizerModule
 from controller.utils.process_notifications import ProcessNotifier
-from model import Scene, UIPage
-from model.scene import FilterPage
+from model import Filter, Scene, UIPage
+from model.filter_graph import gui_addressed_filter_ids
+from model.scene import DmxDefaultValue, FilterPage
+
+
+class SceneSnapshot(NamedTuple):
+    """The data of a scene required to serialize it, detached from the model.
+
+    Snapshots are taken in the thread owning the model. Generating their XML description does not access the model.
+    """
+
+    scene_id: int
+    human_readable_name: str
+    linked_bankset_id: str | None
+    filters: list[Filter]
+    """Copies of the filters to place. For Fish, virtual filters are replaced by the filters they instantiate."""
+    channel_overrides: dict[str, str]
+    """Output ports of the instantiated virtual filters, mapped to the ports of the filters implementing them."""
+    pinned_filter_ids: frozenset[str]
+    """IDs of the filters placed by the user."""
+    gui_addressed_filter_ids: frozenset[str]
+    """IDs of the filters that may receive updates from the GUI."""
+    dmx_default_values: list[DmxDefaultValue]
+    bankset_element: ET.Element | None
+    """The linked bank set of the scene. It is not sent to Fish."""
+    page_elements: list[ET.Element]
+    """The filter pages and UI pages of the scene. They are not sent to Fish."""
 
 
 def _add_filter_page_to_element(scene_element: ET.Element, page: FilterPage, parent_page: FilterPage | None) -> None:
@@ -78,36 +105,76 @@ def _add_ui_page_to_element(scene_element: ET.Element, ui_page: UIPage) -> None:
             )
 
 
-def generate_scene_xml_description(
-    assemble_for_fish_loading: bool, root: ET.Element, scene: Scene, pn: ProcessNotifier
-) -> None:
+def snapshot_scene(assemble_for_fish_loading: bool, scene: Scene, pn: ProcessNotifier) -> SceneSnapshot:
+    """Take a snapshot of a scene for serialization.
+
+    This needs to be called from the thread owning the model. For Fish, virtual filters are instantiated here.
+
+    Args:
+        assemble_for_fish_loading: Should be True if the data is being transferred to Fish.
+        scene: The scene to take the snapshot of.
+        pn: The process notifier.
+
+    Returns:
+        The snapshot of the scene.
+
+    """
+    pn.total_step_count += len(scene.filters)
+    filters: list[Filter] = []
+    channel_overrides: dict[str, str] = {}
+    for filter_ in scene.filters:
+        _snapshot_filter(filter_, assemble_for_fish_loading, filters, channel_overrides)
+        pn.current_step_number += 1
+
+    bankset_element: ET.Element | None = None
+    page_container = ET.Element("scene")
+    if not assemble_for_fish_loading:
+        if scene.linked_bankset:
+            bankset_container = ET.Element("bord_configuration")
+            _create_scene_bankset(bankset_container, scene)
+            bankset_element = bankset_container[0]
+        for page in scene.pages:
+            _add_filter_page_to_element(page_container, page, None)
+        for ui_page in scene.ui_pages:
+            _add_ui_page_to_element(page_container, ui_page)
+
+    return SceneSnapshot(
+        scene_id=scene.scene_id,
+        human_readable_name=scene.human_readable_name,
+        linked_bankset_id=scene.linked_bankset.id if scene.linked_bankset else None,
+        filters=filters,
+        channel_overrides=channel_overrides,
+        pinned_filter_ids=frozenset(f.filter_id for f in scene.filters),
+        gui_addressed_filter_ids=gui_addressed_filter_ids(scene),
+        dmx_default_values=scene.dmx_default_values,
+        bankset_element=bankset_element,
+        page_elements=list(page_container),
+    )
+
+
+def generate_scene_xml_description(assemble_for_fish_loading: bool, root: ET.Element, scene: SceneSnapshot) -> None:
     """Generate the DOM tree for a given scene.
 
+    This includes the optimization of the filter graph for Fish. It does not access the model and may run in a worker
+    thread.
+
     Args:
         assemble_for_fish_loading: Should be True if the data is being transferred to Fish.
         root: The DOM root.
-        scene: The scene to generate the XML data for.
-        pn: The process notifier.
+        scene: The snapshot of the scene to generate the XML data for.
 
     """
     scene_element = _create_scene_element(scene=scene, parent=root)
-    if scene.linked_bankset and not assemble_for_fish_loading:
-        _create_scene_bankset(root, scene)
-    pn.total_step_count += len(scene.filters)
-    om = SceneOptimizerModule(assemble_for_fish_loading)
+    if scene.bankset_element is not None:
+        root.append(scene.bankset_element)
+    om = SceneOptimizerModule(assemble_for_fish_loading, scene.pinned_filter_ids, scene.gui_addressed_filter_ids)
+    om.channel_override_dict.update(scene.channel_overrides)
     for filter_ in scene.filters:
         _create_filter_element_for_fish(
             filter_=filter_, parent=scene_element, for_fish=assemble_for_fish_loading, om=om
         )
-        pn.current_step_number += 1
     create_channel_mappings_for_filter_set_for_fish(assemble_for_fish_loading, om, scene_element)
-    if not assemble_for_fish_loading:
-        for page in scene.pages:
-            _add_filter_page_to_element(scene_element, page, None)
-
-        for ui_page in scene.ui_pages:
-            _add_ui_page_to_element(scene_element, ui_page)
-    scene.sort_dmx_default_values()
+    scene_element.extend(scene.page_elements)
     for default_value in scene.dmx_default_values:
         ET.SubElement(scene_element, "dmxdefaultvalue", attrib={
             "universe": str(default_value.universe_id),
@@ -116,7 +183,7 @@ def generate_scene_xml_description(
         })
 
 
-def _create_scene_element(scene: Scene, parent: ET.Element) -> ET.Element:
+def _create_scene_element(scene: SceneSnapshot, parent: ET.Element) -> ET.Element:
     """Create an XML element of type scene.
 
     Examples:
@@ -133,6 +200,6 @@ def _create_scene_element(scene: Scene, parent: ET.Element) -> ET.Element:
             "human_readable_name": str(scene.human_readable_name),
         },
     )
-    if scene.linked_bankset:
-        se.attrib["linkedBankset"] = str(scene.linked_bankset.id)
+    if scene.linked_bankset_id is not None:
+        se.attrib["linkedBankset"] = str(scene.linked_bankset_id)
     return se
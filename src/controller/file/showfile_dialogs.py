@@ -49,13 +49,14 @@ def _load_show_file(file_name: str, show_data: BoardConfiguration) -> bool:
 def _save_show_file(file_name: str, show_data: BoardConfiguration) -> None:
     """Save the board configuration to a specified file.
 
+    The file path of the show is updated by the main window once the file was written.
+
     Args:
         file_name: File in which the config is saved.
         show_data: Board configuration to be saved.
 
     """
-    if write_document(file_name, show_data) and show_data.file_path != file_name:
-        show_data.file_path = file_name
+    write_document(file_name, show_data)
 
 
 def show_save_showfile_dialog(parent: QWidget, show_data: BoardConfiguration) -> None:
@@ -1,21 +1,36 @@
 """Transmitting data as XML to Fish."""
+import time
 from logging import getLogger
 
-from controller.file.serializing.general_serialization import create_xml
+from controller.file.background_jobs import run_in_background
+from controller.file.serializing.fragment_cache import FishDocument, SceneFragmentCache
 from controller.network import NetworkManager
 from controller.utils.process_notifications import get_process_notifier
 from model import BoardConfiguration
 
 logger = getLogger(__name__)
 
+_fragment_cache = SceneFragmentCache()
+
 
 def transmit_to_fish(show: BoardConfiguration, goto_default_scene: bool = True) -> bool:
-    """Send the current board configuration as an XML file to fish."""
+    """Send the current board configuration as an XML file to fish.
+
+    The snapshot of the show is taken in the calling thread, while it is serialized in the background. Once the show
+    was sent, `show_file_applied` is emitted. Errors are reported through `show_file_upload_failed`.
+
+    Args:
+        show: The show to upload.
+        goto_default_scene: Whether Fish should switch to the default scene after loading the show.
+
+    Returns:
+        True if the upload was started.
+
+    """
     if not NetworkManager().connection_state():
         logger.error("Fish is not connected. Therefore we cannot transmit a show to it.")
         return False
-    # TODO this could be an external QThread
-    pn = get_process_notifier("Uploading Show to Fish", len(show.scenes))
+    pn = get_process_notifier("Uploading Show to Fish", len(show.scenes) + 1)
     pn.current_step_description = "Checking for unlinked fader bank sets."
     for scene in show.scenes:
         if scene.linked_bankset:
@@ -24,11 +39,26 @@ def transmit_to_fish(show: BoardConfiguration, goto_default_scene: bool = True)
             if scene.linked_bankset.update_required:
                 scene.linked_bankset.update()
         pn.current_step_number += 1
-    xml = create_xml(show, pn, assemble_for_fish_loading=True)
-    # TODO query current active scene
-    show.broadcaster.transmitting_show_file.emit(xml, goto_default_scene)
-    # TODO jump to current active scene and active bank set
-    # TODO implement error handling
-    pn.close()
-    show.broadcaster.show_file_applied.emit()  # TODO make sure this only gets called if there was no error
+    start = time.perf_counter()
+    with pn.timed_stage("Creating snapshot of the show.", steps=0):
+        snapshot = _fragment_cache.snapshot(show, pn)
+    snapshot_duration = time.perf_counter() - start
+    pn.current_step_description = "Serializing show."
+
+    def _encoded(document: FishDocument) -> None:
+        # TODO query current active scene
+        show.broadcaster.transmitting_show_file.emit(document.data, goto_default_scene)
+        logger.info("Uploaded show to Fish: %d bytes, %d of %d scenes regenerated, snapshot in %.1f ms, "
+                    "done after %.1f ms.", len(document.data), document.regenerated_scenes, document.scene_count,
+                    snapshot_duration * 1000, (time.perf_counter() - start) * 1000)
+        # TODO jump to current active scene and active bank set
+        pn.current_step_number += 1
+        pn.close()
+        show.broadcaster.show_file_applied.emit()
+
+    def _failed(error: Exception) -> None:
+        pn.close()
+        show.broadcaster.show_file_upload_failed.emit(str(error))
+
+    run_in_background(snapshot.encode, _encoded, _failed)
     return True
@@ -4,13 +4,58 @@
     xml = createXML(board_configuration)
     writeDocument("ShowFiles/show_file.xml", xml)
 """
+from __future__ import annotations
+
 import os
+from logging import getLogger
 from shutil import copyfile
+from typing import TYPE_CHECKING
 from xml.etree import ElementTree as ET
 
-from controller.file.serializing.general_serialization import create_xml
+from controller.file.background_jobs import run_in_background
+from controller.file.serializing.general_serialization import ShowSnapshot, build_xml, snapshot_show
 from controller.utils.process_notifications import get_process_notifier
-from model import BoardConfiguration
+
+if TYPE_CHECKING:
+    from PySide6.QtCore import SignalInstance
+
+    from model import BoardConfiguration
+
+logger = getLogger(__name__)
+
+
+def _write_xml(file_name: str, snapshot: ShowSnapshot, create_backup: bool) -> None:
+    """Serialize a show and write it to disk. This does not access the model and runs in the show file worker."""
+    xml = build_xml(snapshot)
+    if create_backup and os.path.exists(file_name):
+        # TODO introduce proper version control
+        copyfile(file_name, os.path.splitext(file_name)[0] + ".show_backup")
+    ET.indent(xml)
+    data = ET.tostring(xml, encoding="unicode", method="xml")
+    with open(file_name, "w+", encoding="UTF-8") as file:
+        file.write(data)
+
+
+def _write_in_background(file_name: str, show_data: BoardConfiguration, assemble_for_fish_loading: bool,
+                         process_name: str, done: SignalInstance) -> bool:
+    pn = get_process_notifier(process_name, 2)
+    # The snapshot is taken in the GUI thread as it reads the model and the UI pages. Generating the scenes, including
+    # the scene optimizer pass, happens in the background.
+    with pn.timed_stage("Creating snapshot of the show."):
+        snapshot = snapshot_show(show_data, pn, assemble_for_fish_loading=assemble_for_fish_loading)
+    pn.current_step_description = "Writing to disk."
+
+    def _saved(_: None) -> None:
+        done.emit(file_name)
+        pn.current_step_number += 1
+        pn.close()
+
+    def _failed(error: Exception) -> None:
+        pn.close()
+        show_data.broadcaster.show_file_save_failed.emit(file_name, str(error))
+
+    run_in_background(lambda: _write_xml(file_name, snapshot, not assemble_for_fish_loading), _saved, _failed)
+    return True
 
 
 def write_document(file_name: str, show_data: BoardConfiguration) -> bool:
@@ -18,33 +63,18 @@ def write_document(file_name: str, show_data: BoardConfiguration) -> bool:
 
     See https://github.com/Mission-DMX/Docs/blob/main/FormatSchemes/ProjectFile/ShowFile_v0.xsd for more information.
 
+    A snapshot of the show is taken in the calling thread. Its XML tree is built and written in the background. The
+    outcome is reported through the `show_file_saved` and `show_file_save_failed` signals.
+
     Args:
         file_name: The (path and) file to which the xml element should be written.
         show_data: The show to save.
 
     Returns:
-        True, if successfully, otherwise false with error message.
+        True, if the save was started.
 
     """
-    pn = get_process_notifier("Saving Showfile", 2)
-    xml = create_xml(show_data, pn)
-    if os.path.exists(file_name):
-        # TODO introduce proper version control
-        copyfile(file_name, os.path.splitext(file_name)[0] + ".show_backup")
-    pn.current_step_description = "Writing to disk."
-    pn.current_step_number += 1
-    with open(file_name, "w+", encoding="UTF-8") as file:
-        ET.indent(xml)
-        file.write(ET.tostring(xml, encoding="unicode", method="xml"))
-    pn.current_step_number += 1
-    pn.close()
-    return True
-    # try:
-    #
-    #    return True
-    # except IOError:
-    #    print(f"Could not save {file_name}")
-    #    return False
+    return _write_in_background(file_name, show_data, False, "Saving Showfile", show_data.broadcaster.show_file_saved)
 
 
 def export_document(file_name: str, show_data: BoardConfiguration) -> bool:
@@ -52,21 +82,15 @@ def export_document(file_name: str, show_data: BoardConfiguration) -> bool:
 
     Warning: This method will override existing files without warning.
 
+    The outcome is reported through the `show_file_exported` and `show_file_save_failed` signals.
+
     Args:
         file_name: The (path and) file to which the xml element should be written.
         show_data: The show to save
 
     Returns:
-        True, if successfully, otherwise false with error message.
+        True, if the export was started.
 
     """
-    pn = get_process_notifier("Exporting Showfile", 2)
-    xml = create_xml(show_data, pn, assemble_for_fish_loading=True)
-    pn.current_step_description = "Writing to disk."
-    pn.current_step_number += 1
-    with open(file_name, "w+", encoding="UTF-8") as file:
-        ET.indent(xml)
-        file.write(ET.tostring(xml, encoding="unicode", method="xml"))
-    pn.current_step_number += 1
-    pn.close()
-    return True
+    return _write_in_background(file_name, show_data, True, "Exporting Showfile",
+                                show_data.broadcaster.show_file_exported)
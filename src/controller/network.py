@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-import math
-import queue
+import time
 import xml.etree.ElementTree as ET
 from logging import getLogger
 from typing import TYPE_CHECKING, Self
 
-import numpy as np
 from PySide6 import QtCore, QtNetwork
 from PySide6.QtCore import QTimer
 
@@ -19,12 +17,21 @@
 import proto.MessageTypes_pb2
 import proto.RealTimeControl_pb2
 import proto.UniverseControl_pb2
-import varint
 import x_touch
+from controller.network_stream import (
+    CoalescingMessageQueue,
+    FrameDecoder,
+    FrameWriteBuffer,
+    SendStatistics,
+    StreamStatistics,
+)
+from controller.utils.log_buffer import FISH_LOGGER_NAME
 from model.broadcaster import Broadcaster, QObjectSingletonMeta
 from model.filter import FilterTypeEnumeration
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from PySide6.QtNetwork import QLocalSocket
 
     from model import Scene
@@ -32,6 +39,7 @@
     from model.universe import Universe
 
 logger = getLogger(__name__)
+_fish_logger = getLogger(FISH_LOGGER_NAME)
 
 
 class NetworkManager(QtCore.QObject, metaclass=QObjectSingletonMeta):
@@ -40,6 +48,7 @@ class NetworkManager(QtCore.QObject, metaclass=QObjectSingletonMeta):
     status_updated: QtCore.Signal = QtCore.Signal(str)
     last_cycle_time_update: QtCore.Signal = QtCore.Signal(int)
     run_mode_changed: QtCore.Signal = QtCore.Signal(int)
+    _flush_requested: QtCore.Signal = QtCore.Signal()
 
     def __new__(cls) -> Self:
         """Override __new__ for singleton behavior."""
@@ -53,7 +62,17 @@ def __init__(self) -> None:
         logger.info("generate new Network Manager")
         self._broadcaster: Broadcaster = Broadcaster()
         self._socket: QtNetwork.QLocalSocket = QtNetwork.QLocalSocket()
-        self._message_queue: queue.Queue[tuple[bytes, proto.MessageTypes_pb2.MsgType]] = queue.Queue()
+        self._message_queue: CoalescingMessageQueue = CoalescingMessageQueue()
+        self._frame_decoder: FrameDecoder = FrameDecoder()
+        self._processing_incoming_frames: bool = False
+        self._send_buffer: FrameWriteBuffer = FrameWriteBuffer()
+        self._send_statistics: SendStatistics = SendStatistics()
+        self._oldest_pending_message_ns: int | None = None
+        self._flush_timer: QTimer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.push_messages)
+        self._flush_requested.connect(self._schedule_flush)
 
         self._last_run_mode = None
         self._last_active_scene: int = -1
@@ -87,6 +106,29 @@ def __init__(self) -> None:
         self._gui_update_ready_queue: list[proto.FilterMode_pb2.update_parameter] = []
         self._in_ready_wait_mode: bool = False
 
+    @property
+    def receive_statistics(self) -> StreamStatistics:
+        """Return the throughput statistics of the data received from Fish."""
+        return self._frame_decoder.statistics
+
+    @property
+    def send_statistics(self) -> SendStatistics:
+        """Return the statistics of the batched send path."""
+        return self._send_statistics
+
+    @property
+    def max_send_latency(self) -> int:
+        """Return the maximum time in milliseconds a message waits before the send queue is flushed.
+
+        A latency of 0 flushes the queue once the event loop finished the current iteration.
+        """
+        return self._flush_timer.interval()
+
+    @max_send_latency.setter
+    def max_send_latency(self, latency: int) -> None:
+        """Set the maximum time in milliseconds a message waits before the send queue is flushed."""
+        self._flush_timer.setInterval(max(0, latency))
+
     @property
     def is_running(self) -> bool:
         """Check if the Fish socket is already running."""
@@ -148,6 +190,8 @@ def start(self, active: bool = False) -> None:
         """Establish a connection with the current Fish socket."""
         if self._socket.state() != QtNetwork.QLocalSocket.LocalSocketState.ConnectedState:
             logger.info("connect local socket to Server: %s", self._server_name)
+            if not self._processing_incoming_frames:
+                self._frame_decoder.clear()
             self._socket.connectToServer(self._server_name)
             if self._socket.state() == QtNetwork.QLocalSocket.LocalSocketState.ConnectedState:
                 self._is_running = True
@@ -162,6 +206,7 @@ def start(self, active: bool = False) -> None:
     def disconnect(self) -> None:
         """Disconnect from the Fish socket."""
         logger.info("disconnect local socket from Server")
+        self.push_messages()
         self._socket.disconnectFromServer()
         self._is_running = False
 
@@ -175,10 +220,14 @@ def _send_universe(self, universe: Universe) -> None:
         if self._socket.state() == QtNetwork.QLocalSocket.LocalSocketState.ConnectedState:
             msg = proto.DirectMode_pb2.dmx_output(
                 universe_id=universe.universe_proto.id,
-                channel_data=[channel.value for channel in universe.channels],
+                channel_data=universe.values.tolist(),
             )
 
-            self._send_with_format(msg.SerializeToString(), proto.MessageTypes_pb2.MSGT_DMX_OUTPUT)
+            self._send_with_format(
+                msg.SerializeToString(),
+                proto.MessageTypes_pb2.MSGT_DMX_OUTPUT,
+                coalescing_key=(proto.MessageTypes_pb2.MSGT_DMX_OUTPUT, universe.universe_proto.id),
+            )
 
     def _react_request_dmx_data(self, universe: Universe) -> None:
         """Send a request for DMX data of a universe.
@@ -206,105 +255,155 @@ def button_msg_to_x_touch(self, msg: proto.Console_pb2.button_state_change) -> N
         if self._socket.state() == QtNetwork.QLocalSocket.LocalSocketState.ConnectedState:
             self._send_with_format(msg.SerializeToString(), proto.MessageTypes_pb2.MSGT_BUTTON_STATE_CHANGE)
 
-    def _send_with_format(self, msg: bytes, msg_type: proto.MessageTypes_pb2.MsgType, push_direct: bool = True) -> None:
-        """Send message in correct format to fish."""
-        self._enqueue_message(msg, msg_type)
+    def _send_with_format(
+        self,
+        msg: bytes,
+        msg_type: proto.MessageTypes_pb2.MsgType,
+        push_direct: bool = True,
+        coalescing_key: Hashable | None = None,
+    ) -> None:
+        """Send message in correct format to fish.
+
+        Messages are not written one by one. Instead, a flush of the send queue is scheduled for the end of the
+        current event loop iteration, or after the configured maximum send latency.
+        """
+        self._enqueue_message(msg, msg_type, coalescing_key)
         if push_direct:
-            self.push_messages()
+            self._flush_requested.emit()
+
+    def _schedule_flush(self) -> None:
+        """Start the flush timer unless a flush is already pending."""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
     def push_messages(self) -> None:
         """Push the queued messages to Fish.
 
+        All queued messages are collected into a single buffer and written at once.
         Call this method from the GUI thread.
         """
-        while not self._message_queue.empty():
-            msg, msg_type = self._message_queue.get()
+        self._flush_timer.stop()
+        if self._message_queue.empty():
+            return
+        for msg, msg_type in self._message_queue.take_all():
             logger.debug("message to send: %s with type: %s", msg, msg_type)
-            if self._socket.state() == QtNetwork.QLocalSocket.LocalSocketState.ConnectedState:
-                self._socket.write(varint.encode(msg_type) + varint.encode(len(msg)) + msg)
-            else:
-                logger.error("not Connected with fish server")
+            self._send_buffer.append(msg_type, msg)
+        frame_count = self._send_buffer.frame_count
+        data = self._send_buffer.take()
+        latency = time.monotonic_ns() - self._oldest_pending_message_ns if self._oldest_pending_message_ns else 0
+        self._oldest_pending_message_ns = None
+        if self._socket.state() == QtNetwork.QLocalSocket.LocalSocketState.ConnectedState:
+            self._socket.write(data)
+            self._send_statistics.record_flush(frame_count, len(data), latency)
+        else:
+            logger.error("not Connected with fish server. Dropped %s messages.", frame_count)
 
-    def _enqueue_message(self, msg: bytes, msg_type: proto.MessageTypes_pb2.MsgType) -> None:
+    def _enqueue_message(
+        self, msg: bytes, msg_type: proto.MessageTypes_pb2.MsgType, coalescing_key: Hashable | None = None
+    ) -> None:
         """Push a message to the send queue.
 
         Args:
             msg: The message to enqueue.
             msg_type: The type of the message to enqueue.
+            coalescing_key: If provided, a pending message with the same key is replaced by this one.
 
         """
-        self._message_queue.put((msg, msg_type))
+        if self._oldest_pending_message_ns is None:
+            self._oldest_pending_message_ns = time.monotonic_ns()
+        if self._message_queue.put(msg, msg_type, coalescing_key):
+            self._send_statistics.coalesced_messages += 1
 
     def _on_ready_read(self) -> None:
-        """Process incoming data."""
-        msg_bytes = self._socket.readAll()
-        while len(msg_bytes) > 0:
-            try:
-                msg_type = varint.decode_bytes(bytes(msg_bytes[0]))
-                msg_len = varint.decode_bytes(bytes(msg_bytes[1:]))
-            except EOFError:
-                self.disconnect()
-            start = 1 + math.ceil(np.log2(msg_len + 1) / 7)
-            msg = msg_bytes[start : start + msg_len]
-            msg_bytes = msg_bytes[start + msg_len :]
-            try:
-                match msg_type:
-                    case proto.MessageTypes_pb2.MSGT_CURRENT_STATE_UPDATE:
-                        message: proto.RealTimeControl_pb2.current_state_update = (
-                            proto.RealTimeControl_pb2.current_state_update()
-                        )
-                        message.ParseFromString(bytes(msg))
-                        self._fish_update(message)
-                    case proto.MessageTypes_pb2.MSGT_LOG_MESSAGE:
-                        message: proto.RealTimeControl_pb2.long_log_update = proto.RealTimeControl_pb2.long_log_update()
-                        message.ParseFromString(bytes(msg))
-                        self._log_fish(message)
-                    case proto.MessageTypes_pb2.MSGT_BUTTON_STATE_CHANGE:
-                        message: proto.Console_pb2.button_state_change = proto.Console_pb2.button_state_change()
-                        message.ParseFromString(bytes(msg))
-                        self._button_clicked(message)
-                    case proto.MessageTypes_pb2.MSGT_DESK_UPDATE:
-                        message: proto.Console_pb2.desk_update = proto.Console_pb2.desk_update()
-                        message.ParseFromString(bytes(msg))
-                        self._handle_desk_update(message)
-                    case proto.MessageTypes_pb2.MSGT_UPDATE_COLUMN:
-                        message: proto.Console_pb2.fader_column = proto.Console_pb2.fader_column()
-                        message.ParseFromString(bytes(msg))
-                        from model.control_desk import BankSet
-
-                        BankSet.handle_column_update_message(message)
-                    case proto.MessageTypes_pb2.MSGT_UPDATE_PARAMETER:
-                        message: proto.FilterMode_pb2.update_parameter = proto.FilterMode_pb2.update_parameter()
-                        message.ParseFromString(bytes(msg))
-                        self._broadcaster.update_filter_parameter.emit(message)
-                    case proto.MessageTypes_pb2.MSGT_DMX_OUTPUT:
-                        message: proto.DirectMode_pb2.dmx_output = proto.DirectMode_pb2.dmx_output()
-                        message.ParseFromString(bytes(msg))
-                        self._broadcaster.dmx_from_fish.emit(message)
-                    case proto.MessageTypes_pb2.MSGT_EVENT_SENDER_UPDATE:
-                        message: proto.Events_pb2.event_sender = proto.Events_pb2.event_sender()
-                        message.ParseFromString(bytes(msg))
-                        self._broadcaster.event_sender_update.emit(message)
-                    case proto.MessageTypes_pb2.MSGT_EVENT:
-                        message: proto.Events_pb2.event_sender = proto.Events_pb2.event()
-                        message.ParseFromString(bytes(msg))
-                        self._broadcaster.fish_event_received.emit(message)
-                    case proto.MessageTypes_pb2.MSGT_READYMODE_UPDATE:
-                        msg_p: proto.RealTimeControl_pb2.readymode_update = proto.RealTimeControl_pb2.readymode_update()
-                        msg_p.ParseFromString(bytes(msg))
-                        match msg_p.cause:
-                            case proto.RealTimeControl_pb2.RUC_COMMITED:
-                                self.commit_readymode(False)
-                            case proto.RealTimeControl_pb2.RUC_ABORTED:
-                                self.abort_readymode(False)
-                            case proto.RealTimeControl_pb2.RUC_ENTERED:
-                                self.enter_readymode(False)
-                    case _:
-                        logger.warning("Received not implemented message type: %s", msg_type)
-            except Exception as e:
-                logger.exception("Failed to parse message.", exc_info=e, stack_info=True)
+        """Process incoming data.
+
+        Fish may deliver frames faster than the GUI drains them. Therefore, a single read may end in the middle of a
+        frame. The frame decoder keeps such partial frames until the remaining bytes arrive.
+        """
+        if self._processing_incoming_frames:
+            # A message handler processed Qt events. The outer call picks up the remaining data.
+            return
+        self._processing_incoming_frames = True
+        try:
+            while self._socket.bytesAvailable() > 0:
+                self._frame_decoder.feed(self._socket.readAll().data())
+                try:
+                    for msg_type, msg in self._frame_decoder.frames():
+                        try:
+                            self._handle_message(msg_type, msg)
+                        except Exception as e:
+                            logger.exception("Failed to parse message.", exc_info=e, stack_info=True)
+                except ValueError:
+                    logger.exception("Received corrupted data from Fish. Reconnecting.")
+                    self._frame_decoder.clear()
+                    self.disconnect()
+                    break
+        finally:
+            self._processing_incoming_frames = False
         self.push_messages()
 
+    def _handle_message(self, msg_type: int, msg: memoryview) -> None:
+        """Dispatch a received message.
+
+        Args:
+            msg_type: The type of the message.
+            msg: The serialized message. The view is only valid during this call.
+
+        """
+        match msg_type:
+            case proto.MessageTypes_pb2.MSGT_CURRENT_STATE_UPDATE:
+                message: proto.RealTimeControl_pb2.current_state_update = (
+                    proto.RealTimeControl_pb2.current_state_update()
+                )
+                message.ParseFromString(msg)
+                self._fish_update(message)
+            case proto.MessageTypes_pb2.MSGT_LOG_MESSAGE:
+                message: proto.RealTimeControl_pb2.long_log_update = proto.RealTimeControl_pb2.long_log_update()
+                message.ParseFromString(msg)
+                self._log_fish(message)
+            case proto.MessageTypes_pb2.MSGT_BUTTON_STATE_CHANGE:
+                message: proto.Console_pb2.button_state_change = proto.Console_pb2.button_state_change()
+                message.ParseFromString(msg)
+                self._button_clicked(message)
+            case proto.MessageTypes_pb2.MSGT_DESK_UPDATE:
+                message: proto.Console_pb2.desk_update = proto.Console_pb2.desk_update()
+                message.ParseFromString(msg)
+                self._handle_desk_update(message)
+            case proto.MessageTypes_pb2.MSGT_UPDATE_COLUMN:
+                message: proto.Console_pb2.fader_column = proto.Console_pb2.fader_column()
+                message.ParseFromString(msg)
+                from model.control_desk import BankSet
+
+                BankSet.handle_column_update_message(message)
+            case proto.MessageTypes_pb2.MSGT_UPDATE_PARAMETER:
+                message: proto.FilterMode_pb2.update_parameter = proto.FilterMode_pb2.update_parameter()
+                message.ParseFromString(msg)
+                self._broadcaster.update_filter_parameter.emit(message)
+            case proto.MessageTypes_pb2.MSGT_DMX_OUTPUT:
+                message: proto.DirectMode_pb2.dmx_output = proto.DirectMode_pb2.dmx_output()
+                message.ParseFromString(msg)
+                self._broadcaster.dmx_from_fish.emit(message)
+            case proto.MessageTypes_pb2.MSGT_EVENT_SENDER_UPDATE:
+                message: proto.Events_pb2.event_sender = proto.Events_pb2.event_sender()
+                message.ParseFromString(msg)
+                self._broadcaster.event_sender_update.emit(message)
+            case proto.MessageTypes_pb2.MSGT_EVENT:
+                message: proto.Events_pb2.event_sender = proto.Events_pb2.event()
+                message.ParseFromString(msg)
+                self._broadcaster.fish_event_received.emit(message)
+            case proto.MessageTypes_pb2.MSGT_READYMODE_UPDATE:
+                msg_p: proto.RealTimeControl_pb2.readymode_update = proto.RealTimeControl_pb2.readymode_update()
+                msg_p.ParseFromString(msg)
+                match msg_p.cause:
+                    case proto.RealTimeControl_pb2.RUC_COMMITED:
+                        self.commit_readymode(False)
+                    case proto.RealTimeControl_pb2.RUC_ABORTED:
+                        self.abort_readymode(False)
+                    case proto.RealTimeControl_pb2.RUC_ENTERED:
+                        self.enter_readymode(False)
+            case _:
+                logger.warning("Received not implemented message type: %s", msg_type)
+
     def _fish_update(self, msg: proto.RealTimeControl_pb2.current_state_update) -> None:
         """Return the current state of Fish.
 
@@ -334,13 +433,13 @@ def _log_fish(self, msg: proto.RealTimeControl_pb2.long_log_update) -> None:
         """
         match msg.level:
             case proto.RealTimeControl_pb2.LogLevel.LL_INFO:
-                logger.info(msg.what)
+                _fish_logger.info(msg.what)
             case proto.RealTimeControl_pb2.LogLevel.LL_DEBUG:
-                logger.debug(msg.what)
+                _fish_logger.debug(msg.what)
             case proto.RealTimeControl_pb2.LogLevel.LL_ERROR:
-                logger.error(msg.what)
+                _fish_logger.error(msg.what)
             case proto.RealTimeControl_pb2.LogLevel.LL_WARNING:
-                logger.warning(msg.what)
+                _fish_logger.warning(msg.what)
 
     def _button_clicked(self, msg: proto.Console_pb2.button_state_change) -> None:
         """Handle incoming button events.
@@ -440,17 +539,16 @@ def connection_state(self) -> bool:
         except RuntimeError:
             return False
 
-    def transmit_show_file(self, xml: ET.Element, goto_default_scene: bool) -> None:
+    def transmit_show_file(self, xml: ET.Element | bytes, goto_default_scene: bool) -> None:
         """Send the show file as XML data to Fish.
 
         Args:
-            xml: XML data to be sent.
+            xml: XML data to be sent, either as a tree or already encoded.
             goto_default_scene: Scene to be loaded.
 
         """
-        # print(ET.tostring(xml, encoding="utf8", method="xml"))
         msg = proto.FilterMode_pb2.load_show_file(
-            show_data=ET.tostring(xml, encoding="utf8", method="xml"),
+            show_data=xml if isinstance(xml, bytes) else ET.tostring(xml, encoding="utf8", method="xml"),
             goto_default_scene=goto_default_scene,
         )
         self._send_with_format(msg.SerializeToString(), proto.MessageTypes_pb2.MSGT_LOAD_SHOW_FILE)
@@ -538,8 +636,22 @@ def send_desk_update_message(self, msg: proto.Console_pb2.desk_update, update_fr
         else:
             self._enqueue_message(msg.SerializeToString(), proto.MessageTypes_pb2.MSGT_DESK_UPDATE)
 
-    def send_gui_update_to_fish(self, scene_id: int, filter_id: str, key: str, value: str, enque: bool = False) -> None:
-        """Send the current state of the GUI to Fish."""
+    def send_gui_update_to_fish(
+        self, scene_id: int, filter_id: str, key: str, value: str, enque: bool = False, coalesce: bool = False
+    ) -> None:
+        """Send the current state of the GUI to Fish.
+
+        Args:
+            scene_id: The scene of the filter to update.
+            filter_id: The filter to update.
+            key: The parameter to update.
+            value: The new value of the parameter.
+            enque: If true, the message is only queued and sent with the next explicit push.
+            coalesce: If true, a pending update of the same parameter that has not been transmitted yet is replaced.
+                Only enable this for parameters that hold a state, such as fader or constant values. Commands like
+                the run mode of a cue filter need to be transmitted one by one.
+
+        """
         if not self.is_running:
             return
         msg = proto.FilterMode_pb2.update_parameter()
@@ -550,10 +662,15 @@ def send_gui_update_to_fish(self, scene_id: int, filter_id: str, key: str, value
         if self._in_ready_wait_mode:
             self._gui_update_ready_queue.append(msg)
         else:
-            if enque:
-                self._enqueue_message(msg.SerializeToString(), proto.MessageTypes_pb2.MSGT_UPDATE_PARAMETER)
-            else:
-                self._send_with_format(msg.SerializeToString(), proto.MessageTypes_pb2.MSGT_UPDATE_PARAMETER)
+            coalescing_key = (
+                (proto.MessageTypes_pb2.MSGT_UPDATE_PARAMETER, scene_id, filter_id, key) if coalesce else None
+            )
+            self._send_with_format(
+                msg.SerializeToString(),
+                proto.MessageTypes_pb2.MSGT_UPDATE_PARAMETER,
+                push_direct=not enque,
+                coalescing_key=coalescing_key,
+            )
 
     def send_event_sender_update(self, msg: proto.Events_pb2.event_sender, push_direct: bool = False) -> None:
         """Send event that Sender has updated to Fish."""
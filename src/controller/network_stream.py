@@ -0,0 +1,412 @@
+"""Framing helpers for the Fish socket stream.
+
+Fish messages are framed as ``varint(message type) + varint(payload length) + payload``. A local socket does not
+preserve message boundaries, so a single ``readyRead`` may deliver several frames, a fraction of one frame or any
+mix of both. The classes in this module carry partial frames across reads, coalesce and batch outgoing frames into
+single writes and keep track of throughput.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterator
+
+_MAX_VARINT_LENGTH = 10
+
+
+class StreamStatistics:
+    """Throughput counters of a frame stream.
+
+    The rates are computed over a sliding window. They are refreshed once the current window is older than
+    ``window_length`` seconds, which keeps the per-frame bookkeeping at a couple of integer additions.
+    """
+
+    def __init__(self, window_length: float = 1.0) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            window_length: Length of the measurement window in seconds.
+
+        """
+        self._window_length_ns: int = int(window_length * 1_000_000_000)
+        self._window_start_ns: int = time.monotonic_ns()
+        self._window_bytes: int = 0
+        self._window_frames: int = 0
+        self._window_parse_time_ns: int = 0
+        self._bytes_per_second: float = 0.0
+        self._frames_per_second: float = 0.0
+        self._parse_time_per_second: float = 0.0
+        self.total_bytes: int = 0
+        self.total_frames: int = 0
+        self.total_parse_time_ns: int = 0
+
+    def record(self, byte_count: int, frame_count: int, parse_time_ns: int) -> None:
+        """Account for a processed chunk of the stream.
+
+        Args:
+            byte_count: The number of bytes that were processed.
+            frame_count: The number of complete frames that were processed.
+            parse_time_ns: The time in nanoseconds it took to process them.
+
+        """
+        self.total_bytes += byte_count
+        self.total_frames += frame_count
+        self.total_parse_time_ns += parse_time_ns
+        self._window_bytes += byte_count
+        self._window_frames += frame_count
+        self._window_parse_time_ns += parse_time_ns
+        now = time.monotonic_ns()
+        elapsed = now - self._window_start_ns
+        if elapsed >= self._window_length_ns:
+            self._bytes_per_second = self._window_bytes * 1_000_000_000 / elapsed
+            self._frames_per_second = self._window_frames * 1_000_000_000 / elapsed
+            self._parse_time_per_second = self._window_parse_time_ns / elapsed
+            self._window_start_ns = now
+            self._window_bytes = 0
+            self._window_frames = 0
+            self._window_parse_time_ns = 0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Return the byte rate of the last completed window."""
+        return self._bytes_per_second
+
+    @property
+    def frames_per_second(self) -> float:
+        """Return the frame rate of the last completed window."""
+        return self._frames_per_second
+
+    @property
+    def parse_load(self) -> float:
+        """Return the fraction of wall time spent parsing during the last completed window."""
+        return self._parse_time_per_second
+
+    @property
+    def average_parse_time_ns(self) -> float:
+        """Return the average parse time per frame in nanoseconds over the lifetime of the stream."""
+        if self.total_frames == 0:
+            return 0.0
+        return self.total_parse_time_ns / self.total_frames
+
+    def __str__(self) -> str:
+        """Format the statistics for logging."""
+        return (
+            f"{self._bytes_per_second:.0f} B/s, {self._frames_per_second:.1f} frames/s, "
+            f"{self.average_parse_time_ns / 1000:.1f} us/frame"
+        )
+
+
+class FrameDecoder:
+    """Streaming decoder of Fish message frames.
+
+    Received bytes are appended to a persistent buffer. Complete frames are handed out as ``memoryview`` slices of
+    that buffer, so the payload is not copied before the protobuf parser reads it. Incomplete trailing data stays in
+    the buffer until the next call to :meth:`feed`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty decoder."""
+        self._buffer: bytearray = bytearray()
+        self._read_position: int = 0
+        self._decoding: bool = False
+        self.statistics: StreamStatistics = StreamStatistics()
+
+    @property
+    def pending_bytes(self) -> int:
+        """Return the number of buffered bytes that do not yet form a complete frame."""
+        return len(self._buffer) - self._read_position
+
+    def clear(self) -> None:
+        """Drop all buffered data, for example after a reconnect."""
+        if self._decoding:
+            raise RuntimeError("Cannot clear the frame decoder while frames are being decoded.")
+        self._buffer.clear()
+        self._read_position = 0
+
+    def feed(self, data: bytes | bytearray | memoryview) -> None:
+        """Append received data to the buffer.
+
+        Args:
+            data: The bytes read from the socket.
+
+        """
+        if self._decoding:
+            raise RuntimeError("Cannot feed the frame decoder while frames are being decoded.")
+        self._buffer += data
+
+    def frames(self) -> Iterator[tuple[int, memoryview]]:
+        """Decode all complete frames in the buffer.
+
+        The yielded payload views are only valid until the iteration advances. Consumers need to parse or copy them
+        right away.
+
+        Yields:
+            Tuples of the message type and the payload of every complete frame.
+
+        Raises:
+            ValueError: If a varint in the stream is malformed.
+
+        """
+        start_time = time.perf_counter_ns()
+        start_position = self._read_position
+        frame_count = 0
+        self._decoding = True
+        view = memoryview(self._buffer)
+        try:
+            buffer_length = len(view)
+            position = self._read_position
+            while position < buffer_length:
+                msg_type, payload_start = _decode_varint(view, position, buffer_length)
+                if payload_start < 0:
+                    break
+                msg_len, payload_start = _decode_varint(view, payload_start, buffer_length)
+                if payload_start < 0:
+                    break
+                payload_end = payload_start + msg_len
+                if payload_end > buffer_length:
+                    break
+                position = payload_end
+                self._read_position = position
+                frame_count += 1
+                payload = view[payload_start:payload_end]
+                try:
+                    yield msg_type, payload
+                finally:
+                    payload.release()
+        finally:
+            view.release()
+            self._decoding = False
+            consumed_bytes = self._read_position - start_position
+            self._compact()
+            self.statistics.record(consumed_bytes, frame_count, time.perf_counter_ns() - start_time)
+
+    def _compact(self) -> None:
+        """Discard consumed bytes from the front of the buffer."""
+        if self._read_position == len(self._buffer):
+            self._buffer.clear()
+            self._read_position = 0
+        elif self._read_position > 0 and self._read_position * 2 >= len(self._buffer):
+            del self._buffer[: self._read_position]
+            self._read_position = 0
+
+
+def _decode_varint(view: memoryview, position: int, end: int) -> tuple[int, int]:
+    """Decode a varint from a buffer.
+
+    Args:
+        view: The buffer to read from.
+        position: The index of the first byte of the varint.
+        end: The index after the last valid byte in the buffer.
+
+    Returns:
+        The decoded value and the index after the varint. If the varint is incomplete, the index is -1.
+
+    Raises:
+        ValueError: If the varint is longer than any valid 64-bit varint.
+
+    """
+    result = 0
+    shift = 0
+    limit = position + _MAX_VARINT_LENGTH
+    truncated = limit > end
+    if truncated:
+        limit = end
+    while position < limit:
+        byte = view[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, position
+        shift += 7
+    if not truncated:
+        raise ValueError("Malformed varint in Fish stream.")
+    return 0, -1
+
+
+class SendStatistics:
+    """Counters of the batched send path."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.flush_count: int = 0
+        self.total_frames: int = 0
+        self.total_bytes: int = 0
+        self.max_queue_depth: int = 0
+        self.last_flush_latency_ns: int = 0
+        self.max_flush_latency_ns: int = 0
+        self.total_flush_latency_ns: int = 0
+        self.coalesced_messages: int = 0
+
+    def record_flush(self, frame_count: int, byte_count: int, latency_ns: int) -> None:
+        """Account for a flush of the send buffer.
+
+        Args:
+            frame_count: The number of frames written by the flush.
+            byte_count: The number of bytes written by the flush.
+            latency_ns: The time the oldest frame waited in the queue in nanoseconds.
+
+        """
+        self.flush_count += 1
+        self.total_frames += frame_count
+        self.total_bytes += byte_count
+        self.max_queue_depth = max(self.max_queue_depth, frame_count)
+        self.last_flush_latency_ns = latency_ns
+        self.max_flush_latency_ns = max(self.max_flush_latency_ns, latency_ns)
+        self.total_flush_latency_ns += latency_ns
+
+    @property
+    def average_frames_per_flush(self) -> float:
+        """Return the average number of frames that were combined into a single write."""
+        if self.flush_count == 0:
+            return 0.0
+        return self.total_frames / self.flush_count
+
+    @property
+    def average_flush_latency_ns(self) -> float:
+        """Return the average time in nanoseconds the oldest frame of a flush waited in the queue."""
+        if self.flush_count == 0:
+            return 0.0
+        return self.total_flush_latency_ns / self.flush_count
+
+    def __str__(self) -> str:
+        """Format the statistics for logging."""
+        return (
+            f"{self.flush_count} flushes, {self.average_frames_per_flush:.1f} frames/flush, "
+            f"{self.coalesced_messages} coalesced, "
+            f"max queue depth {self.max_queue_depth}, "
+            f"latency avg {self.average_flush_latency_ns / 1000:.1f} us / max {self.max_flush_latency_ns / 1000:.1f} us"
+        )
+
+
+class CoalescingMessageQueue:
+    """Thread safe send queue with last-value-wins semantics for keyed messages.
+
+    Messages without a key are always transmitted. If a message is queued with a key that is already pending, the
+    pending message is dropped and the new one is appended to the end of the queue. Thus, the newest value is never
+    sent earlier than it was issued relative to the other messages.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty queue."""
+        self._entries: OrderedDict[Hashable, tuple[bytes, int]] = OrderedDict()
+        self._sequence: itertools.count[int] = itertools.count()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of pending messages."""
+        return len(self._entries)
+
+    def empty(self) -> bool:
+        """Return true if no messages are pending."""
+        return not self._entries
+
+    def put(self, msg: bytes, msg_type: int, key: Hashable | None = None) -> bool:
+        """Enqueue a message.
+
+        Args:
+            msg: The serialized message.
+            msg_type: The type of the message.
+            key: If provided, a pending message with the same key is replaced. Keys must not be integers.
+
+        Returns:
+            True if a pending message was replaced.
+
+        """
+        with self._lock:
+            if key is None:
+                self._entries[next(self._sequence)] = (msg, msg_type)
+                return False
+            replaced = self._entries.pop(key, None) is not None
+            self._entries[key] = (msg, msg_type)
+            return replaced
+
+    def take_all(self) -> list[tuple[bytes, int]]:
+        """Remove and return all pending messages in transmission order."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        return entries
+
+
+class FrameWriteBuffer:
+    """Preallocated buffer collecting outgoing frames for a single write.
+
+    Headers are encoded in place and payloads are copied once into the buffer. The buffer only grows if a batch does
+    not fit and keeps its capacity afterwards.
+    """
+
+    def __init__(self, initial_capacity: int = 64 * 1024) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            initial_capacity: The number of bytes to preallocate.
+
+        """
+        self._buffer: bytearray = bytearray(initial_capacity)
+        self._length: int = 0
+        self._frame_count: int = 0
+
+    def __len__(self) -> int:
+        """Return the number of bytes in the buffer."""
+        return self._length
+
+    @property
+    def frame_count(self) -> int:
+        """Return the number of frames in the buffer."""
+        return self._frame_count
+
+    def append(self, msg_type: int, payload: bytes) -> None:
+        """Append a frame to the buffer.
+
+        Args:
+            msg_type: The type of the message.
+            payload: The serialized message.
+
+        """
+        payload_length = len(payload)
+        end = self._length + 2 * _MAX_VARINT_LENGTH + payload_length
+        if end > len(self._buffer):
+            self._buffer.extend(bytes(max(end - len(self._buffer), len(self._buffer))))
+        position = _encode_varint(self._buffer, self._length, msg_type)
+        position = _encode_varint(self._buffer, position, payload_length)
+        self._buffer[position : position + payload_length] = payload
+        self._length = position + payload_length
+        self._frame_count += 1
+
+    def take(self) -> bytearray:
+        """Return the collected frames and reset the buffer.
+
+        Returns:
+            A copy of the used part of the buffer.
+
+        """
+        data = self._buffer[: self._length]
+        self._length = 0
+        self._frame_count = 0
+        return data
+
+
+def _encode_varint(buffer: bytearray, position: int, number: int) -> int:
+    """Encode a varint into a buffer.
+
+    Args:
+        buffer: The buffer to write to. It needs to have enough space left.
+        position: The index of the first byte to write.
+        number: The non-negative number to encode.
+
+    Returns:
+        The index after the encoded varint.
+
+    """
+    while number > 0x7F:
+        buffer[position] = (number & 0x7F) | 0x80
+        number >>= 7
+        position += 1
+    buffer[position] = number
+    return position + 1
@@ -0,0 +1,247 @@
+"""Bounded storage of received fish events for the event setup view.
+
+EventLogEntry -- A received event or an aggregated burst of ongoing events.
+SenderStatistics -- Event rate and last-seen time of an event sender.
+EventLog -- Fixed-capacity log of events with per-sender statistics and aggregation of ongoing events.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
+from proto.Events_pb2 import ONGOING_EVENT
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from proto.Events_pb2 import event
+
+RATE_WINDOW: float = 2.0
+"""Length of the sliding window in seconds over which event rates are computed."""
+
+
+class EventLogEntry:
+    """A received event.
+
+    If aggregation of ongoing events is enabled, an entry may stand for a burst of ongoing events of the same sender
+    function. It then shows the arguments of the latest event of the burst.
+    """
+
+    __slots__ = ("arguments", "count", "event_id", "event_type", "first_seen", "last_seen", "sender_function",
+                 "sender_id", "sequence")
+
+    def __init__(self, ev: event, received: float) -> None:
+        """Capture an event.
+
+        Args:
+            ev: The event message received from fish.
+            received: The POSIX time stamp the event was received at.
+
+        """
+        self.event_id: int = ev.event_id
+        self.sender_id: int = ev.sender_id
+        self.sender_function: int = ev.sender_function
+        self.event_type: int = int(ev.type)
+        self.arguments: tuple[int, ...] = tuple(ev.arguments)
+        self.first_seen: float = received
+        self.last_seen: float = received
+        self.count: int = 1
+        self.sequence: int = -1
+        """Sequence number in the log or -1 if the entry has not been appended yet."""
+
+    def merge(self, ev: event, received: float) -> None:
+        """Add an ongoing event to the burst represented by this entry."""
+        self.event_id = ev.event_id
+        self.arguments = tuple(ev.arguments)
+        self.last_seen = received
+        self.count += 1
+
+    @property
+    def event_tuple(self) -> tuple[int, int, str]:
+        """The key used by `EventSender.renamed_events` to look up a name for this event."""
+        return self.event_type, self.sender_function, "".join([chr(c) for c in self.arguments])
+
+
+class SenderStatistics:
+    """Event rate and last-seen time of an event sender."""
+
+    __slots__ = ("_window", "last_seen", "total")
+
+    def __init__(self) -> None:
+        """Initialize the statistics of a sender that did not send any events yet."""
+        self.total: int = 0
+        self.last_seen: float = 0.0
+        self._window: deque[float] = deque()
+
+    def record(self, received: float) -> None:
+        """Count an event received at the given POSIX time stamp."""
+        self.total += 1
+        self.last_seen = received
+        self._window.append(received)
+        self._expire(received)
+
+    def _expire(self, now: float) -> None:
+        window = self._window
+        while window and window[0] <= now - RATE_WINDOW:
+            window.popleft()
+
+    def rate(self, now: float) -> float:
+        """Get the number of events per second received during the last `RATE_WINDOW` seconds before `now`."""
+        self._expire(now)
+        return len(self._window) / RATE_WINDOW
+
+
+class EventLog:
+    """Fixed-capacity log of received events.
+
+    Every appended entry receives a sequence number, counting up from 0. Adding events is split into two steps, so that
+    an item model can announce the row changes: `collect` turns events into entries and updates entries already in the
+    log, `append` stores the new entries and evicts the oldest ones beyond the capacity.
+
+    If `ongoing_window` is positive, ongoing events of a sender function that arrive within that many seconds after the
+    start of a burst are merged into the entry of the burst instead of creating a new one. All events are counted in
+    the per-sender statistics, including those hidden by the ongoing event filter.
+    """
+
+    def __init__(self, capacity: int, ongoing_window: float = 0.0) -> None:
+        """Initialize an empty log.
+
+        Args:
+            capacity: The maximum number of entries to keep.
+            ongoing_window: Duration of an aggregated burst of ongoing events in seconds. 0 disables aggregation.
+
+        """
+        if capacity <= 0:
+            raise ValueError("The capacity of an event log needs to be positive.")
+        self._capacity = capacity
+        self._entries: list[EventLogEntry | None] = [None] * capacity
+        self._first_sequence = 0
+        self._next_sequence = 0
+        self.ongoing_window: float = ongoing_window
+        self.ongoing_filter: Callable[[int], bool] | None = None
+        """Predicate on the sender ID deciding if ongoing events of the sender are logged. All are logged if None."""
+        self._bursts: dict[tuple[int, int], EventLogEntry] = {}
+        self._statistics: dict[int, SenderStatistics] = {}
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of entries."""
+        return self._capacity
+
+    @property
+    def first_sequence(self) -> int:
+        """Sequence number of the oldest entry in the log."""
+        return self._first_sequence
+
+    @property
+    def next_sequence(self) -> int:
+        """Sequence number the next appended entry will receive."""
+        return self._next_sequence
+
+    @property
+    def statistics(self) -> dict[int, SenderStatistics]:
+        """The statistics of all senders that sent events, by their sender ID."""
+        return self._statistics
+
+    def __len__(self) -> int:
+        return self._next_sequence - self._first_sequence
+
+    def __getitem__(self, sequence: int) -> EventLogEntry:
+        """Get an entry by its sequence number.
+
+        Raises:
+            IndexError: If the entry is not in the log.
+
+        """
+        if not self._first_sequence <= sequence < self._next_sequence:
+            raise IndexError(f"Event log entry {sequence} is not in the log.")
+        return self._entries[sequence % self._capacity]
+
+    def collect(self, events: Iterable[tuple[event, float]]) -> tuple[list[EventLogEntry], list[int]]:
+        """Process received events.
+
+        Args:
+            events: Pairs of an event and the POSIX time stamp it was received at, in the order of reception.
+
+        Returns:
+            The entries that need to be appended and the sequence numbers of the entries in the log that were updated.
+
+        """
+        fresh: list[EventLogEntry] = []
+        updated: set[int] = set()
+        # Bursts started by this call. They are not in the log yet and have no sequence number.
+        started: set[tuple[int, int]] = set()
+        for ev, received in events:
+            statistics = self._statistics.get(ev.sender_id)
+            if statistics is None:
+                statistics = self._statistics[ev.sender_id] = SenderStatistics()
+            statistics.record(received)
+            if ev.type != ONGOING_EVENT:
+                fresh.append(EventLogEntry(ev, received))
+                continue
+            if self.ongoing_filter is not None and not self.ongoing_filter(ev.sender_id):
+                continue
+            if self.ongoing_window <= 0:
+                fresh.append(EventLogEntry(ev, received))
+                continue
+            key = (ev.sender_id, ev.sender_function)
+            burst = self._bursts.get(key)
+            if (burst is not None and received - burst.first_seen < self.ongoing_window
+                    and (key in started or burst.sequence >= self._first_sequence)):
+                burst.merge(ev, received)
+                if key not in started:
+                    updated.add(burst.sequence)
+            else:
+                burst = self._bursts[key] = EventLogEntry(ev, received)
+                started.add(key)
+                fresh.append(burst)
+        return fresh, sorted(updated)
+
+    def evictions(self, count: int) -> int:
+        """Get the number of entries that appending `count` entries evicts."""
+        return min(len(self), max(0, len(self) + count - self._capacity))
+
+    def append(self, entries: list[EventLogEntry]) -> None:
+        """Append entries collected by `collect`, evicting the oldest ones if the log is full.
+
+        If more entries than the capacity are passed, only the newest ones are kept. The others still take up their
+        sequence numbers.
+        """
+        overflow = len(entries) - self._capacity
+        if overflow > 0:
+            self.discard_oldest(len(self))
+            self._next_sequence += overflow
+            self._first_sequence = self._next_sequence
+            entries = entries[overflow:]
+        self.discard_oldest(self.evictions(len(entries)))
+        for entry in entries:
+            entry.sequence = self._next_sequence
+            self._entries[self._next_sequence % self._capacity] = entry
+            self._next_sequence += 1
+
+    def discard_oldest(self, count: int) -> None:
+        """Remove the `count` oldest entries."""
+        count = min(max(count, 0), len(self))
+        for sequence in range(self._first_sequence, self._first_sequence + count):
+            self._entries[sequence % self._capacity] = None
+        self._first_sequence += count
+
+    def clear(self) -> None:
+        """Remove all entries. Sender statistics are kept."""
+        self.discard_oldest(len(self))
+        self._bursts.clear()
+
+    def resize(self, capacity: int) -> None:
+        """Change the capacity, keeping the newest entries that fit.
+
+        Sequence numbers of the kept entries do not change.
+        """
+        if capacity <= 0:
+            raise ValueError("The capacity of an event log needs to be positive.")
+        self.discard_oldest(len(self) - capacity)
+        kept = [self[sequence] for sequence in range(self._first_sequence, self._next_sequence)]
+        self._capacity = capacity
+        self._entries = [None] * capacity
+        for entry in kept:
+            self._entries[entry.sequence % capacity] = entry
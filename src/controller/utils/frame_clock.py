@@ -0,0 +1,241 @@
+"""Shared clock driving periodic UI and virtual filter updates.
+
+FrameClock -- Single timer calling all subscribed callbacks.
+SubscriberStatistics -- Measured callback cost of a subscriber.
+get_frame_clock -- Get the frame clock of the application.
+"""
+
+from __future__ import annotations
+
+import time
+from logging import getLogger
+from typing import TYPE_CHECKING, NamedTuple, override
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from PySide6.QtWidgets import QWidget
+
+logger = getLogger(__name__)
+
+DEFAULT_FRAME_RATE: float = 60.0
+"""Default number of ticks per second."""
+
+
+class SubscriberStatistics(NamedTuple):
+    """Measured callback cost of a subscriber."""
+
+    name: str
+    calls: int
+    total: float
+    """Accumulated time spent in the callback in seconds."""
+    maximum: float
+    """Longest single call in seconds."""
+
+    @property
+    def mean(self) -> float:
+        """Average time per call in seconds."""
+        return self.total / self.calls if self.calls > 0 else 0.0
+
+
+class _Subscription:
+    __slots__ = ("active", "callback", "calls", "interval", "maximum", "name", "next_due", "slow", "total")
+
+    def __init__(self, callback: Callable[[], None], interval: float, name: str) -> None:
+        self.callback = callback
+        self.interval = interval
+        self.name = name
+        self.next_due = 0.0
+        self.active = True
+        self.calls = 0
+        self.total = 0.0
+        self.maximum = 0.0
+        self.slow = False
+
+
+class FrameClock(QObject):
+    """Single timer calling all subscribed callbacks.
+
+    The timer only runs while there are subscribers. It ticks at the shortest interval requested by a subscriber, but
+    never faster than the rate of the clock. A subscriber with a longer interval is called on the first tick at which
+    its interval has passed, so the tick period bounds the precision of the interval. The time spent in each callback
+    is measured. A callback taking longer than a frame is reported once.
+    """
+
+    def __init__(self, rate: float = DEFAULT_FRAME_RATE, parent: QObject | None = None) -> None:
+        """Initialize a stopped clock.
+
+        Args:
+            rate: Number of ticks per second.
+            parent: The Qt parent of the clock.
+
+        """
+        super().__init__(parent)
+        self._subscriptions: dict[Callable[[], None], _Subscription] = {}
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._tick)
+        self._rate = 0.0
+        self.rate = rate
+
+    @property
+    def rate(self) -> float:
+        """Number of ticks per second."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("The rate of the frame clock needs to be positive.")
+        self._rate = rate
+        self._update_timer_interval()
+
+    @property
+    def interval(self) -> float:
+        """Duration of a frame in seconds. This is the shortest time between two ticks."""
+        return 1 / self._rate
+
+    @property
+    def tick_interval(self) -> float:
+        """Current time between two ticks in seconds."""
+        return self._timer.interval() / 1000
+
+    @property
+    def running(self) -> bool:
+        """Whether the timer is running."""
+        return self._timer.isActive()
+
+    def subscribe(self, callback: Callable[[], None], interval_ms: int = 0, name: str | None = None) -> None:
+        """Call a callback periodically.
+
+        Subscribing an already subscribed callback only updates its interval.
+
+        Args:
+            callback: The function to call.
+            interval_ms: Minimum time between two calls in milliseconds. 0 calls it on every tick.
+            name: Name used in statistics and reports. The qualified name of the callback is used if omitted.
+
+        """
+        subscription = self._subscriptions.get(callback)
+        if subscription is not None:
+            subscription.interval = interval_ms / 1000
+            self._update_timer_interval()
+            return
+        self._subscriptions[callback] = _Subscription(
+            callback, interval_ms / 1000, name or getattr(callback, "__qualname__", repr(callback))
+        )
+        self._update_timer_interval()
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unsubscribe(self, callback: Callable[[], None]) -> None:
+        """Stop calling a callback. Unknown callbacks are ignored."""
+        subscription = self._subscriptions.pop(callback, None)
+        if subscription is not None:
+            subscription.active = False
+        if not self._subscriptions:
+            self._timer.stop()
+        else:
+            self._update_timer_interval()
+
+    def is_subscribed(self, callback: Callable[[], None]) -> bool:
+        """Check if a callback is subscribed."""
+        return callback in self._subscriptions
+
+    def subscribe_while_alive(self, owner: QObject, callback: Callable[[], None], interval_ms: int = 0,
+                              name: str | None = None) -> None:
+        """Call a callback periodically until a Qt object is destroyed.
+
+        Use this for callbacks that access the object, so that they are not called after its C++ part is deleted. See
+        `subscribe` for the arguments.
+        """
+        owner.destroyed.connect(lambda: self.unsubscribe(callback))
+        self.subscribe(callback, interval_ms, name)
+
+    def subscribe_while_visible(self, widget: QWidget, callback: Callable[[], None], interval_ms: int = 0,
+                                name: str | None = None) -> None:
+        """Call a callback periodically while a widget is visible.
+
+        The subscription ends when the widget is destroyed. See `subscribe` for the arguments.
+        """
+        _VisibilitySubscription(self, widget, callback, interval_ms, name)
+
+    def statistics(self) -> list[SubscriberStatistics]:
+        """Get the measured callback cost of all subscribers, most expensive per call first."""
+        result = [SubscriberStatistics(s.name, s.calls, s.total, s.maximum) for s in self._subscriptions.values()]
+        result.sort(key=lambda statistics: statistics.mean, reverse=True)
+        return result
+
+    def _update_timer_interval(self) -> None:
+        shortest = min((subscription.interval for subscription in self._subscriptions.values()), default=0.0)
+        interval_ms = max(1, round(1000 / self._rate), round(shortest * 1000))
+        if interval_ms != self._timer.interval():
+            self._timer.setInterval(interval_ms)
+
+    def _tick(self) -> None:
+        self._run_frame(time.monotonic())
+
+    def _run_frame(self, now: float) -> None:
+        # Allow for timer jitter, so that a subscriber is not pushed back by a whole frame
+        tolerance = self.tick_interval / 2
+        for subscription in list(self._subscriptions.values()):
+            if not subscription.active or now < subscription.next_due - tolerance:
+                continue
+            subscription.next_due = now + subscription.interval
+            start = time.perf_counter()
+            try:
+                subscription.callback()
+            except Exception:
+                logger.exception("Frame clock subscriber %s failed.", subscription.name)
+            duration = time.perf_counter() - start
+            subscription.calls += 1
+            subscription.total += duration
+            subscription.maximum = max(subscription.maximum, duration)
+            if duration > self.interval and not subscription.slow:
+                subscription.slow = True
+                logger.warning("Frame clock subscriber %s took %.1f ms, longer than a frame (%.1f ms).",
+                               subscription.name, duration * 1000, self.interval * 1000)
+
+
+class _VisibilitySubscription(QObject):
+    """Event filter subscribing a callback while its widget is shown.
+
+    The subscription is made through a method of the filter, so that the same callback can be bound to the visibility
+    of several widgets independently.
+    """
+
+    def __init__(self, clock: FrameClock, widget: QWidget, callback: Callable[[], None], interval_ms: int,
+                 name: str | None) -> None:
+        super().__init__(widget)
+        self._clock = clock
+        self._callback = callback
+        self._interval_ms = interval_ms
+        self._name = name or getattr(callback, "__qualname__", repr(callback))
+        widget.installEventFilter(self)
+        run = self._run
+        widget.destroyed.connect(lambda: clock.unsubscribe(run))
+        if widget.isVisible():
+            clock.subscribe(run, interval_ms, self._name)
+
+    def _run(self) -> None:
+        self._callback()
+
+    @override
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Show:
+            self._clock.subscribe(self._run, self._interval_ms, self._name)
+        elif event.type() == QEvent.Type.Hide:
+            self._clock.unsubscribe(self._run)
+        return False
+
+
+_frame_clock: FrameClock | None = None
+
+
+def get_frame_clock() -> FrameClock:
+    """Get the frame clock of the application. It is created on first use."""
+    global _frame_clock  # noqa: PLW0603 the clock needs to be created after the application
+    if _frame_clock is None:
+        _frame_clock = FrameClock()
+    return _frame_clock
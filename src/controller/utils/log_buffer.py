@@ -0,0 +1,297 @@
+"""Bounded storage of structured log records for the logging view.
+
+LogEntry -- A structured log record.
+LogRingBuffer -- Fixed-capacity ring buffer of log entries with indices over level, logger and module.
+LogTransport -- Hand-over of log entries from the logging threads to the GUI.
+get_log_transport -- Get the transport used by the logging view.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import heapq
+from collections import deque
+from logging import DEBUG, Formatter
+from typing import TYPE_CHECKING, Any, NamedTuple
+from zoneinfo import ZoneInfo
+
+from controller.utils.json_formatter import LOG_RECORD_BUILTIN_ATTRS
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable, Sequence
+    from logging import LogRecord
+
+_TIMEZONE = ZoneInfo("Europe/Berlin")
+
+FISH_LOGGER_NAME: str = "controller.network.fish"
+"""Logger of the log messages received from Fish."""
+
+_ATTRIBUTE_FIELDS: tuple[str, ...] = ("level", "message", "logger", "module", "function", "line", "thread_name")
+
+
+class LogEntry(NamedTuple):
+    """A structured log record.
+
+    The fields are named like the keys written by `controller.utils.json_formatter.JSONFormatter`.
+    """
+
+    level: str
+    message: str
+    created: float
+    """Creation time of the record as a POSIX time stamp."""
+    logger: str
+    module: str
+    function: str
+    line: int
+    thread_name: str
+    extra: dict[str, Any] | None = None
+    """Formatted exception and stack information as well as the extra attributes of the record."""
+
+    @classmethod
+    def from_record(cls, record: LogRecord, formatter: Formatter | None = None) -> LogEntry:
+        """Capture a log record.
+
+        Args:
+            record: The record to capture.
+            formatter: Formatter used for exception and stack information. A default formatter is used if omitted.
+
+        Returns:
+            The captured entry.
+
+        """
+        extra = {key: value for key, value in record.__dict__.items() if key not in LOG_RECORD_BUILTIN_ATTRS}
+        if record.exc_info is not None or record.stack_info is not None:
+            formatter = formatter or Formatter()
+            if record.exc_info is not None:
+                extra["exc_info"] = formatter.formatException(record.exc_info)
+            if record.stack_info is not None:
+                extra["stack_info"] = formatter.formatStack(record.stack_info)
+        return cls(record.levelname, record.getMessage(), record.created, record.name, record.module, record.funcName,
+                   record.lineno, record.threadName, extra or None)
+
+    @property
+    def timestamp(self) -> str:
+        """The creation time in ISO format."""
+        return dt.datetime.fromtimestamp(self.created, tz=_TIMEZONE).isoformat()
+
+    def field(self, key: str) -> str | None:
+        """Get the text of a field by its key.
+
+        Args:
+            key: A key of the JSON log format.
+
+        Returns:
+            The text of the field or None if the entry has no such field.
+
+        """
+        if key in _ATTRIBUTE_FIELDS:
+            return str(getattr(self, key))
+        if key == "timestamp":
+            return self.timestamp
+        if self.extra is not None and key in self.extra:
+            return str(self.extra[key])
+        return None
+
+    def fields(self) -> list[tuple[str, str]]:
+        """Get all fields with their keys in the order of the JSON log format."""
+        fields = [("level", self.level), ("message", self.message), ("timestamp", self.timestamp),
+                  ("logger", self.logger), ("module", self.module), ("function", self.function),
+                  ("line", str(self.line)), ("thread_name", self.thread_name)]
+        if self.extra is not None:
+            fields.extend((key, str(value)) for key, value in self.extra.items())
+        return fields
+
+    def matches(self, levels: Collection[str] | None, criteria: Sequence[tuple[str, str]]) -> bool:
+        """Check if the entry passes a filter.
+
+        Args:
+            levels: The accepted levels or None to accept all levels.
+            criteria: Pairs of a key and a text that the field needs to contain.
+
+        Returns:
+            True if the entry passes the filter.
+
+        """
+        if levels is not None and self.level not in levels:
+            return False
+        for key, text in criteria:
+            value = self.field(key)
+            if value is None or text not in value:
+                return False
+        return True
+
+
+class LogRingBuffer:
+    """Fixed-capacity ring buffer of log entries.
+
+    Every appended entry receives a sequence number, counting up from 0. Once the buffer is full, appending an entry
+    evicts the oldest one. The sequence numbers of the entries in the buffer range from `first_sequence` to
+    `next_sequence`. The levels, loggers and modules of the entries are indexed, so filtering by them does not need to
+    look at every entry.
+    """
+
+    INDEXED_FIELDS: tuple[str, ...] = ("level", "logger", "module")
+    """Fields of the entries that are indexed."""
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            capacity: The maximum number of entries to keep.
+
+        """
+        if capacity <= 0:
+            raise ValueError("The capacity of a log buffer needs to be positive.")
+        self._capacity = capacity
+        self._entries: list[LogEntry | None] = [None] * capacity
+        self._next_sequence = 0
+        # Sequence numbers of the entries per value of each indexed field, in ascending order
+        self._indices: dict[str, dict[str, deque[int]]] = {field: {} for field in self.INDEXED_FIELDS}
+
+    @property
+    def capacity(self) -> int:
+        """The maximum number of entries."""
+        return self._capacity
+
+    @property
+    def first_sequence(self) -> int:
+        """Sequence number of the oldest entry in the buffer."""
+        return max(0, self._next_sequence - self._capacity)
+
+    @property
+    def next_sequence(self) -> int:
+        """Sequence number the next appended entry will receive."""
+        return self._next_sequence
+
+    def __len__(self) -> int:
+        return self._next_sequence - self.first_sequence
+
+    def __getitem__(self, sequence: int) -> LogEntry:
+        """Get an entry by its sequence number.
+
+        Raises:
+            IndexError: If the entry is not in the buffer.
+
+        """
+        if not self.first_sequence <= sequence < self._next_sequence:
+            raise IndexError(f"Log entry {sequence} is not in the buffer.")
+        return self._entries[sequence % self._capacity]
+
+    def append(self, entry: LogEntry) -> None:
+        """Append an entry, evicting the oldest one if the buffer is full."""
+        slot = self._next_sequence % self._capacity
+        evicted = self._entries[slot]
+        if evicted is not None:
+            for field in self.INDEXED_FIELDS:
+                index = self._indices[field]
+                value = getattr(evicted, field)
+                sequences = index[value]
+                sequences.popleft()
+                if not sequences:
+                    del index[value]
+        self._entries[slot] = entry
+        for field in self.INDEXED_FIELDS:
+            self._indices[field].setdefault(getattr(entry, field), deque()).append(self._next_sequence)
+        self._next_sequence += 1
+
+    def extend(self, entries: Iterable[LogEntry]) -> None:
+        """Append several entries."""
+        for entry in entries:
+            self.append(entry)
+
+    def values(self, field: str) -> list[str]:
+        """Get the distinct values of an indexed field among the entries in the buffer."""
+        return list(self._indices[field])
+
+    def _select(self, field: str, predicate: Callable[[str], bool]) -> list[int]:
+        """Get the sequence numbers of all entries whose indexed field satisfies the predicate, in ascending order."""
+        return list(heapq.merge(*(sequences for value, sequences in self._indices[field].items() if predicate(value))))
+
+    def query(self, levels: Collection[str] | None = None, criteria: Sequence[tuple[str, str]] = ()) -> list[int]:
+        """Find the entries passing a filter.
+
+        Levels and criteria on indexed fields are resolved through the indices. Only the remaining criteria are checked
+        per entry. See `LogEntry.matches` for the meaning of the filter.
+
+        Args:
+            levels: The accepted levels or None to accept all levels.
+            criteria: Pairs of a key and a text that the field needs to contain.
+
+        Returns:
+            The sequence numbers of the matching entries in ascending order.
+
+        """
+        selections: list[list[int]] = []
+        if levels is not None:
+            selections.append(self._select("level", levels.__contains__))
+        remaining: list[tuple[str, str]] = []
+        for key, text in criteria:
+            if key in self._indices:
+                selections.append(self._select(key, lambda value, text=text: text in value))
+            else:
+                remaining.append((key, text))
+
+        if selections:
+            selections.sort(key=len)
+            others = [set(selection) for selection in selections[1:]]
+            result = [sequence for sequence in selections[0] if all(sequence in other for other in others)]
+        else:
+            result = list(range(self.first_sequence, self._next_sequence))
+        if remaining:
+            result = [sequence for sequence in result if self[sequence].matches(None, remaining)]
+        return result
+
+
+class LogTransport:
+    """Hand-over of log entries from the logging threads to the GUI.
+
+    Producers append entries and the GUI drains them in batches. Both are single, atomic operations on a deque, so
+    neither side takes a lock. Records below the level requested by the GUI are not captured, except for the ones of
+    Fish. If the GUI does not drain the transport, only the newest entries up to the capacity are kept.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty transport.
+
+        Args:
+            capacity: The maximum number of entries waiting for the GUI.
+
+        """
+        self._entries: deque[LogEntry] = deque(maxlen=capacity)
+        self._level: int = DEBUG
+
+    @property
+    def level(self) -> int:
+        """The lowest level of records the GUI displays."""
+        return self._level
+
+    @level.setter
+    def level(self, level: int) -> None:
+        self._level = level
+
+    def accepts(self, record: LogRecord) -> bool:
+        """Check if a record should be captured.
+
+        Records from Fish are captured at every level, as the logging view scans them for Fish exceptions. The view
+        only displays them if their level is selected.
+        """
+        return record.levelno >= self._level or record.name == FISH_LOGGER_NAME
+
+    def put(self, entry: LogEntry) -> None:
+        """Append an entry. This may be called from any thread."""
+        self._entries.append(entry)
+
+    def drain(self) -> list[LogEntry]:
+        """Take all waiting entries in the order they were put. Call this from the GUI thread."""
+        entries = self._entries
+        return [entries.popleft() for _ in range(len(entries))]
+
+
+_TRANSPORT_CAPACITY: int = 20000
+
+_transport = LogTransport(_TRANSPORT_CAPACITY)
+
+
+def get_log_transport() -> LogTransport:
+    """Get the transport from the widget log handler to the logging view."""
+    return _transport
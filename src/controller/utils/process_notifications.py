@@ -1,8 +1,15 @@
 """A process notifier informs the user about the activity and status of background processes."""
 
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from logging import getLogger
+
 from PySide6 import QtCore, QtGui
 from PySide6.QtCore import QObject
 
+logger = getLogger(__name__)
+
 
 class ProcessNotifier:
     """A process notifier that tracks the progress of a background process."""
@@ -19,6 +26,7 @@ def __init__(self, name: str, max_count: int) -> None:
         self._current_step_description: str = ""
         self._current_step_number: int = 0
         self._total_step_count = max_count
+        self._stage_timings: dict[str, float] = {}
 
     @property
     def name(self) -> str:
@@ -72,8 +80,37 @@ def current_step_description(self, new_description: str) -> None:
         """
         self._current_step_description = new_description
 
+    @property
+    def stage_timings(self) -> dict[str, float]:
+        """Return the measured duration in seconds of every timed stage, in the order the stages were entered."""
+        return self._stage_timings
+
+    @contextmanager
+    def timed_stage(self, description: str, steps: int = 1) -> Iterator[None]:
+        """Run a stage of the process and record its duration.
+
+        The description is shown while the stage is running. Once it finished, the step number is advanced.
+
+        Args:
+            description: The human-readable description of the stage.
+            steps: The number of steps the stage accounts for.
+
+        """
+        self.current_step_description = description
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self._stage_timings[description] = self._stage_timings.get(description, 0.0) + duration
+            logger.debug("%s: %s took %.1f ms", self._name, description, duration * 1000)
+            self.current_step_number += steps
+
     def close(self) -> None:
         """Clean up and deregister this process notifier."""
+        if self._stage_timings:
+            logger.info("%s finished: %s", self._name, ", ".join(
+                f"{stage} {duration * 1000:.1f} ms" for stage, duration in self._stage_timings.items()))
         _close_progress_handler(self)
 
 
@@ -13,6 +13,7 @@
 from .device import Device
 from .macro import Macro
 from .ofl.fixture import UsedFixture
+from .patching.fixture_address_index import UniverseFixtureIndex
 from .scene import Scene
 from .universe import Universe
 
@@ -32,6 +33,7 @@ def __init__(self, show_name: str = "", default_active_scene: int = 0, notes: st
         self._devices: list[Device] = []
         self._universes: dict[int, Universe] = {}
         self._fixtures: dict[UUID, UsedFixture] = {}
+        self._fixture_address_index: dict[int, UniverseFixtureIndex] = {}
         self._ui_hints: dict[str, str] = {}
         self._macros: list[Macro] = []
 
@@ -102,6 +104,26 @@ def _add_universe(self, universe: Universe) -> None:
 
     def _add_fixture(self, used_fixture: UsedFixture) -> None:
         self._fixtures[used_fixture.uuid] = used_fixture
+        self._get_fixture_address_index(used_fixture.universe_id).add(used_fixture)
+        used_fixture.address_changed.connect(
+            lambda previous_universe, previous_start, f=used_fixture: self._fixture_address_changed(
+                f, previous_universe, previous_start
+            )
+        )
+
+    def _get_fixture_address_index(self, universe_id: int) -> UniverseFixtureIndex:
+        index = self._fixture_address_index.get(universe_id)
+        if index is None:
+            index = UniverseFixtureIndex()
+            self._fixture_address_index[universe_id] = index
+        return index
+
+    def _fixture_address_changed(self, fixture: UsedFixture, previous_universe: int, previous_start: int) -> None:
+        """Move a fixture within the address index after its universe or start address changed."""
+        previous_index = self._fixture_address_index.get(previous_universe)
+        if previous_index is not None:
+            previous_index.remove(fixture, previous_start)
+        self._get_fixture_address_index(fixture.universe_id).add(fixture)
 
     def _delete_universe(self, universe: Universe) -> None:
         """Remove the passed universe from the list of universes.
@@ -308,14 +330,39 @@ def next_universe_id(self) -> int:
         return nex_id
 
     def get_occupied_channels(self, universe_id: int) -> np.typing.NDArray[int]:
-        """List of all channels that are occupied by a scene."""
-        ranges = [
-            np.arange(fixture.start_index, fixture.start_index + fixture.channel_length)
-            for fixture in self.fixtures
-            if fixture.universe_id == universe_id
-        ]
+        """Sorted array of all channels of a universe that are occupied by a fixture."""
+        index = self._fixture_address_index.get(universe_id)
+        if index is None:
+            return np.array([], dtype=int)
+        return index.occupied_channels()
 
-        return np.concatenate(ranges) if ranges else np.array([], dtype=int)
+    def find_free_channel_range(self, universe_id: int, channel_count: int, start_index: int = 0) -> int | None:
+        """Find the first block of free channels in a universe that is large enough for a fixture.
+
+        Args:
+            universe_id: The universe to search.
+            channel_count: The number of consecutive channels required.
+            start_index: The first channel to consider.
+
+        Returns:
+            The first channel of the free block or None if the universe has no such block.
+
+        """
+        return self._get_fixture_address_index(universe_id).find_free_range(channel_count, start_index)
+
+    def get_overlapping_fixtures(self, universe_id: int, start_index: int, channel_count: int) -> set[UsedFixture]:
+        """Get all fixtures occupying a channel of the given range.
+
+        Args:
+            universe_id: The universe of the range.
+            start_index: The first channel of the range.
+            channel_count: The number of channels in the range.
+
+        """
+        index = self._fixture_address_index.get(universe_id)
+        if index is None:
+            return set()
+        return index.overlapping_fixtures(start_index, channel_count)
 
     def get_fixture(self, fixture_id: str | UUID) -> UsedFixture | None:
         """Get the fixture specified by its id."""
@@ -336,8 +383,7 @@ def get_fixture_by_address(self, fixture_univ: int, fixture_chan: int) -> UsedFi
             The fixture or None if no fixture was found.
 
         """
-        for fixture in self._fixtures.values():
-            if fixture.universe_id == fixture_univ and \
-                fixture.start_index <= fixture_chan < fixture.start_index + fixture.channel_length:
-                return fixture
-        return None
+        index = self._fixture_address_index.get(fixture_univ)
+        if index is None:
+            return None
+        return index.fixture_at(fixture_chan)
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from typing import Any, ParamSpec, Self
-from xml.etree.ElementTree import Element
 
 from PySide6 import QtCore
 
@@ -38,8 +37,12 @@ class Broadcaster(QtCore.QObject, metaclass=QObjectSingletonMeta):
     connection_state_updated: QtCore.Signal = QtCore.Signal(bool)
     change_run_mode: QtCore.Signal = QtCore.Signal(proto.RealTimeControl_pb2.RunMode.ValueType)  # TODO Remove
     change_active_scene: QtCore.Signal = QtCore.Signal(object)
-    transmitting_show_file: QtCore.Signal = QtCore.Signal(Element, bool)
+    transmitting_show_file: QtCore.Signal = QtCore.Signal(object, bool)  # Element or encoded bytes
     show_file_applied: QtCore.Signal = QtCore.Signal()
+    show_file_upload_failed: QtCore.Signal = QtCore.Signal(str)  # error message
+    show_file_saved: QtCore.Signal = QtCore.Signal(str)  # file path
+    show_file_save_failed: QtCore.Signal = QtCore.Signal(str, str)  # file path, error message
+    show_file_exported: QtCore.Signal = QtCore.Signal(str)  # file path
     show_file_loaded: QtCore.Signal = QtCore.Signal()
     show_file_path_changed: QtCore.Signal = QtCore.Signal(str)
     begin_show_file_parsing: QtCore.Signal = QtCore.Signal()
@@ -117,7 +120,6 @@ class Broadcaster(QtCore.QObject, metaclass=QObjectSingletonMeta):
     """Signal is supplied with true if the state is now in wait mode."""
     #################################################################
     select_column_id: QtCore.Signal = QtCore.Signal(str)
-    log_message: QtCore.Signal = QtCore.Signal(str)
     dmx_from_fish: QtCore.Signal = QtCore.Signal(proto.DirectMode_pb2.dmx_output)
     event_sender_update: QtCore.Signal = QtCore.Signal(proto.Events_pb2.event_sender)
 
@@ -10,7 +10,11 @@
     from model import Universe
 
 class Channel(QtCore.QObject):
-    """Basic dmx channel with 256 values."""
+    """Basic dmx channel with 256 values.
+
+    A channel does not store its value itself. It is a view on the value buffer of its universe and is only
+    created once it is accessed.
+    """
 
     updated: QtCore.Signal = QtCore.Signal(int)
 
@@ -21,7 +25,6 @@ def __init__(self, parent_universe: Universe, channel_address: int) -> None:
         if not (0 <= channel_address <= 511):
             raise ValueError(f"Tried to create a channel with address {channel_address}")
         self._address: int = channel_address
-        self._value: int = 0
 
     @property
     def address(self) -> int:
@@ -31,7 +34,7 @@ def address(self) -> int:
     @property
     def value(self) -> int:
         """The current value of the channel."""
-        return self._value
+        return self.parent_universe.get_value(self._address)
 
     @value.setter
     def value(self, value: int) -> None:
@@ -43,7 +46,4 @@ def value(self, value: int) -> None:
             ValueError: The value is below 0 or above 255.
 
         """
-        if not (0 <= value <= 511):
-            raise ValueError(f"Tried to set channel {self._address} to {value}.")
-        self._value = value
-        self.updated.emit(value)
+        self.parent_universe.set_value(self._address, value)
@@ -8,6 +8,7 @@
 
 import abc
 from enum import IntFlag, auto
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
@@ -178,6 +179,21 @@ class FilterTypeEnumeration(IntFlag):
     FILTER_SWITCH_COLOR = 79
 
 
+_SHARED_DICT_ATTRIBUTES: tuple[str, ...] = (
+    "_channel_links",
+    "_initial_parameters",
+    "_filter_configurations",
+    "_gui_update_keys",
+    "_in_data_types",
+    "_default_values",
+    "_out_data_types",
+)
+"""Dicts of a filter that copies of non-virtual filters share until they are accessed through a mutable property.
+
+The read-only views, like `Filter.channel_links_view`, keep them shared.
+"""
+
+
 class Filter:
     """Filter for a show file."""
 
@@ -217,6 +233,7 @@ def __init__(
         self._default_values: dict[str, str] = {}
         self._out_data_types: dict[str, DataType] = {}
         self._configuration_supported: bool = True
+        self._shares_dicts: bool = False
 
     @property
     def scene(self) -> Scene:
@@ -265,38 +282,93 @@ def pos(self, pos: tuple[float, float] | None) -> None:
     @property
     def channel_links(self) -> dict[str, str]:
         """Dict mapping the filter inputs to the connected outputs."""
+        if self._shares_dicts:
+            self._detach_dicts()
         return self._channel_links
 
     @property
     def initial_parameters(self) -> dict[str, str]:
         """The initial parameters."""
+        if self._shares_dicts:
+            self._detach_dicts()
         return self._initial_parameters
 
     @property
     def filter_configurations(self) -> dict[str, str]:
         """The filter configurations."""
+        if self._shares_dicts:
+            self._detach_dicts()
         return self._filter_configurations
 
     @property
     def in_data_types(self) -> dict[str, DataType]:
         """Dict mapping input channel names to their data types."""
+        if self._shares_dicts:
+            self._detach_dicts()
         return self._in_data_types
 
     @property
     def default_values(self) -> dict[str, str]:
         """Dict mapping input channel names to their data types."""
+        if self._shares_dicts:
+            self._detach_dicts()
         return self._default_values
 
     @property
     def out_data_types(self) -> dict[str, DataType]:
         """Dict mapping output channel names to their data types."""
+        if self._shares_dicts:
+            self._detach_dicts()
         return self._out_data_types
 
     @property
     def gui_update_keys(self) -> dict[str, DataType | str]:
         """Get updates that should be transmitted to the filter currently running on fish."""
+        if self._shares_dicts:
+            self._detach_dicts()
         return self._gui_update_keys
 
+    @property
+    def channel_links_view(self) -> MappingProxyType[str, str]:
+        """Read-only view of the channel links. Unlike `channel_links`, this does not copy dicts shared with copies."""
+        return MappingProxyType(self._channel_links)
+
+    @property
+    def initial_parameters_view(self) -> MappingProxyType[str, str]:
+        """Read-only view of the initial parameters. See `channel_links_view`."""
+        return MappingProxyType(self._initial_parameters)
+
+    @property
+    def filter_configurations_view(self) -> MappingProxyType[str, str]:
+        """Read-only view of the filter configurations. See `channel_links_view`."""
+        return MappingProxyType(self._filter_configurations)
+
+    @property
+    def in_data_types_view(self) -> MappingProxyType[str, DataType]:
+        """Read-only view of the input data types. See `channel_links_view`."""
+        return MappingProxyType(self._in_data_types)
+
+    @property
+    def default_values_view(self) -> MappingProxyType[str, str]:
+        """Read-only view of the default values. See `channel_links_view`."""
+        return MappingProxyType(self._default_values)
+
+    @property
+    def out_data_types_view(self) -> MappingProxyType[str, DataType]:
+        """Read-only view of the output data types. See `channel_links_view`."""
+        return MappingProxyType(self._out_data_types)
+
+    @property
+    def gui_update_keys_view(self) -> MappingProxyType[str, DataType | str]:
+        """Read-only view of the GUI update keys. See `channel_links_view`."""
+        return MappingProxyType(self._gui_update_keys)
+
+    def _detach_dicts(self) -> None:
+        """Replace the dicts shared with copies of this filter by private copies."""
+        for name in _SHARED_DICT_ATTRIBUTES:
+            setattr(self, name, getattr(self, name).copy())
+        self._shares_dicts = False
+
     @property
     def is_virtual_filter(self) -> bool:
         """Returns true if the filter has an ID from the virtual range."""
@@ -310,9 +382,9 @@ def copy(self, new_scene: Scene = None, new_id: str | None = None) -> Filter:
             new_id: New id of the new filter object.
 
         """
-        from .virtual_filters.vfilter_factory import construct_virtual_filter_instance
-
         if self.is_virtual_filter:
+            from .virtual_filters.vfilter_factory import construct_virtual_filter_instance
+
             f = construct_virtual_filter_instance(
                 new_scene or self.scene,
                 self._filter_type,
@@ -321,13 +393,12 @@ def copy(self, new_scene: Scene = None, new_id: str | None = None) -> Filter:
             )
             f.filter_configurations.update(self.filter_configurations.copy())
         else:
-            f = Filter(
-                new_scene or self.scene,
-                new_id or self._filter_id,
-                self._filter_type,
-                self._pos,
-                self.filter_configurations.copy(),
-            )
+            # Both filters share their dicts until one of them accesses them
+            f = Filter(new_scene or self.scene, new_id or self._filter_id, self._filter_type, self._pos)
+            for name in _SHARED_DICT_ATTRIBUTES:
+                setattr(f, name, getattr(self, name))
+            f._shares_dicts = self._shares_dicts = True
+            return f
         f._channel_links = self.channel_links.copy()
         f._initial_parameters = self.initial_parameters.copy()
         f._in_data_types = self._in_data_types.copy()
@@ -7,23 +7,39 @@
 StateDouble  -- float state.
 StateColor -- Color state.
 KeyFrame -- Model of a key frame.
+KeyFrameList -- Key frames of a cue, sorted by time.
 Cue -- Cue filter model.
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
 from ctypes import ArgumentError
 from enum import Enum
 from logging import getLogger
-from typing import TYPE_CHECKING, Never, Union, override
+from typing import TYPE_CHECKING, ClassVar, NamedTuple, Never, Union, override
+
+import numpy as np
 
 from model import DataType
 from model.color_hsi import ColorHSI
+from model.filter_data.cues.cue_codec import (
+    TRANSITION_CODES,
+    CueColumns,
+    decode_compact,
+    encode_compact,
+    is_compact,
+    parse_cue_columns,
+)
 from model.filter_data.transfer_function import TransferFunction
 from model.filter_data.utility import format_seconds
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from view.show_mode.editor.node_editor_widgets.cue_editor.cue_editor_widget import ExternalChannelDefinition
 
 logger = getLogger(__name__)
@@ -77,13 +93,68 @@ def from_format_str(f_str: str) -> EndAction:
                 return EndAction.HOLD
 
 
+_UNKNOWN_TRANSITION: int = 255
+"""Storage code of all transitions missing in `TRANSITION_CODES`. The key frame keeps the original transition."""
+
+_TRANSITION_LOOKUP: dict[str, int] = {transition: code for code, transition in enumerate(TRANSITION_CODES)}
+
+
 class State(ABC):
-    """Abstract representation of a state in a cue."""
+    """Abstract representation of a state in a cue.
+
+    States do not hold their values themselves. They are views on the storage of a key frame. States created directly
+    own a private storage until they are appended to a key frame.
+    """
+
+    __slots__ = ("_frame", "_index")
+
+    _WIDTH: ClassVar[int] = 1
+    """Number of storage slots of the value."""
+
+    _DEFAULT: ClassVar[tuple[float, ...]] = (0.0,)
+    """Storage slots of the initial value."""
 
     def __init__(self, transition_type: str) -> None:
         """Initialize state using given transition type."""
-        self._transition_type: str = transition_type
-        self._value = None
+        self._frame: KeyFrame = KeyFrame(None)
+        self._frame._append_slots(type(self), transition_type, self._DEFAULT)
+        self._index: int = 0
+
+    @classmethod
+    def _view(cls, frame: KeyFrame, index: int) -> State:
+        """Create a view on a state stored in a key frame."""
+        s = cls.__new__(cls)
+        s._frame = frame
+        s._index = index
+        return s
+
+    def __eq__(self, other: object) -> bool:
+        """Check if both states refer to the same storage."""
+        return isinstance(other, State) and other._frame is self._frame and other._index == self._index
+
+    def __hash__(self) -> int:
+        """Hash of the referenced storage."""
+        return hash((id(self._frame), self._index))
+
+    @property
+    def _offset(self) -> int:
+        return self._frame._layout.offsets[self._index]
+
+    @property
+    def _value(self) -> int | float | ColorHSI:
+        return self._frame._values[self._offset]
+
+    @_value.setter
+    def _value(self, value: float) -> None:
+        self._frame._values[self._offset] = value
+
+    @property
+    def _transition_type(self) -> str:
+        return self._frame._transition(self._index)
+
+    @_transition_type.setter
+    def _transition_type(self, transition_type: str) -> None:
+        self._frame._set_transition(self._index, transition_type)
 
     @property
     def transition(self) -> str:
@@ -96,10 +167,14 @@ def transition(self, new_value: str) -> None:
             raise ArgumentError(f"Unsupported transition type: {new_value}")
         self._transition_type = new_value
 
-    @abstractmethod
+    @staticmethod
+    def _format_value(values: array[float], offset: int) -> str:
+        """Format a stored value in the filter format."""
+        return f"{float(values[offset])}"
+
     def encode(self) -> str:
         """Get the state encodes in the filter format."""
-        raise NotImplementedError
+        return f"{self._format_value(self._frame._values, self._offset)}@{self._transition_type}"
 
     @abstractmethod
     def decode(self, content: str) -> Never:
@@ -111,43 +186,36 @@ def get_data_type(self) -> DataType:
         """Get the filter data type."""
         raise NotImplementedError
 
-    @abstractmethod
     def copy(self) -> State:
         """Get a copy of the state."""
-        raise NotImplementedError
+        s = type(self)(self._transition_type)
+        offset = self._offset
+        s._frame._values[0:self._WIDTH] = self._frame._values[offset:offset + self._WIDTH]
+        return s
 
 
 class StateEightBit(State):
     """State for 8bit channel."""
 
-    @override
-    def copy(self) -> State:
-        """Get a copy of this state."""
-        s = StateEightBit(self._transition_type)
-        s._value = self._value
-        return s
+    __slots__ = ()
 
-    def __init__(self, transition_type: str) -> None:
-        """Initialize state using given transition type."""
-        super().__init__(transition_type)
-        self._value = 0
+    @property
+    def _value(self) -> int:
+        return int(self._frame._values[self._offset])
+
+    @_value.setter
+    def _value(self, value: int) -> None:
+        self._frame._values[self._offset] = value
 
     @override
-    def encode(self) -> str:
-        if self._value < 0:
-            self._value = 0
-        elif self._value > 255:
-            self._value = 255
-        return f"{int(self._value)}@{self._transition_type}"
+    @staticmethod
+    def _format_value(values: array[float], offset: int) -> str:
+        return str(max(0, min(255, int(values[offset]))))
 
     @override
     def decode(self, content: str) -> None:
         c_arr = content.split("@")
-        self._value = int(c_arr[0])
-        if self._value < 0:
-            self._value = 0
-        elif self._value > 255:
-            self._value = 255
+        self._value = max(0, min(255, int(c_arr[0])))
         self._transition_type = c_arr[1]
 
     @override
@@ -158,33 +226,25 @@ def get_data_type(self) -> DataType:
 class StateSixteenBit(State):
     """State for sixteen bit channel."""
 
-    @override
-    def copy(self) -> State:
-        s = StateSixteenBit(self._transition_type)
-        s._value = self._value
-        return s
+    __slots__ = ()
 
-    def __init__(self, transition_type: str) -> None:
-        """Initialize state using given transition type."""
-        super().__init__(transition_type)
-        self._value = 0
+    @property
+    def _value(self) -> int:
+        return int(self._frame._values[self._offset])
+
+    @_value.setter
+    def _value(self, value: int) -> None:
+        self._frame._values[self._offset] = value
 
     @override
-    def encode(self) -> str:
-        if self._value < 0:
-            self._value = 0
-        elif self._value > 65535:
-            self._value = 65535
-        return f"{int(self._value)}@{self._transition_type}"
+    @staticmethod
+    def _format_value(values: array[float], offset: int) -> str:
+        return str(max(0, min(65535, int(values[offset]))))
 
     @override
     def decode(self, content: str) -> None:
         c_arr = content.split("@")
-        self._value = int(c_arr[0])
-        if self._value < 0:
-            self._value = 0
-        elif self._value > 65535:
-            self._value = 65535
+        self._value = max(0, min(65535, int(c_arr[0])))
         self._transition_type = c_arr[1]
 
     @override
@@ -195,20 +255,7 @@ def get_data_type(self) -> DataType:
 class StateDouble(State):
     """State for double channel."""
 
-    @override
-    def copy(self) -> State:
-        s = StateDouble(self._transition_type)
-        s._value = self._value
-        return s
-
-    def __init__(self, transition_type: str) -> None:
-        """Initialize state using given transition type."""
-        super().__init__(transition_type)
-        self._value = 0.0
-
-    @override
-    def encode(self) -> str:
-        return f"{float(self._value)}@{self._transition_type}"
+    __slots__ = ()
 
     @override
     def decode(self, content: str) -> None:
@@ -222,22 +269,27 @@ def get_data_type(self) -> DataType:
 
 
 class StateColor(State):
-    """State for color channel."""
+    """State for color channel. The storage holds hue, saturation and intensity."""
 
-    @override
-    def copy(self) -> State:
-        s = StateColor(self._transition_type)
-        s._value = self._value.copy()
-        return s
+    __slots__ = ()
 
-    def __init__(self, transition_type: str) -> None:
-        """Initialize state using given transition type."""
-        super().__init__(transition_type)
-        self._value = ColorHSI(180.0, 0.0, 0.0)
+    _WIDTH = 3
+    _DEFAULT = (180.0, 0.0, 0.0)
+
+    @property
+    def _value(self) -> ColorHSI:
+        offset = self._offset
+        return ColorHSI(*self._frame._values[offset:offset + 3])
+
+    @_value.setter
+    def _value(self, value: ColorHSI) -> None:
+        offset = self._offset
+        self._frame._values[offset:offset + 3] = array("d", (value.hue, value.saturation, value.intensity))
 
     @override
-    def encode(self) -> str:
-        return f"{self._value.format_for_filter()}@{self._transition_type}"
+    @staticmethod
+    def _format_value(values: array[float], offset: int) -> str:
+        return f"{values[offset]},{values[offset + 1]},{values[offset + 2]}"
 
     @override
     def decode(self, content: str) -> None:
@@ -259,23 +311,136 @@ def color(self, value: ColorHSI) -> None:
         self._value = value
 
 
+_STATE_TYPES: dict[DataType, type[State]] = {
+    DataType.DT_8_BIT: StateEightBit,
+    DataType.DT_16_BIT: StateSixteenBit,
+    DataType.DT_DOUBLE: StateDouble,
+    DataType.DT_COLOR: StateColor,
+}
+
+
+class _StateLayout(NamedTuple):
+    """Arrangement of the states in the storage of a key frame. Layouts are shared between key frames."""
+
+    state_types: tuple[type[State], ...]
+    """Type of each state."""
+
+    offsets: tuple[int, ...]
+    """Position of the value of each state within the value storage."""
+
+
+_LAYOUTS: dict[tuple[type[State], ...], _StateLayout] = {}
+
+
+def _get_layout(state_types: tuple[type[State], ...]) -> _StateLayout:
+    """Get the shared layout of the given state types."""
+    layout = _LAYOUTS.get(state_types)
+    if layout is None:
+        offsets = []
+        offset = 0
+        for state_type in state_types:
+            offsets.append(offset)
+            offset += state_type._WIDTH
+        layout = _StateLayout(state_types, tuple(offsets))
+        _LAYOUTS[state_types] = layout
+    return layout
+
+
+class _KeyFrameStates(Sequence[State]):
+    """The states of a key frame, created as views on access."""
+
+    __slots__ = ("_frame",)
+
+    def __init__(self, frame: KeyFrame) -> None:
+        self._frame = frame
+
+    def __len__(self) -> int:
+        return len(self._frame._transitions)
+
+    def __getitem__(self, index: int | slice) -> State | list[State]:
+        state_types = self._frame._layout.state_types
+        if isinstance(index, slice):
+            return [state_types[i]._view(self._frame, i) for i in range(*index.indices(len(state_types)))]
+        if index < 0:
+            index += len(state_types)
+        return state_types[index]._view(self._frame, index)
+
+    def __iter__(self) -> Iterator[State]:
+        frame = self._frame
+        return (state_type._view(frame, i) for i, state_type in enumerate(frame._layout.state_types))
+
+
 class KeyFrame:
-    """Model of a key frame."""
+    """Model of a key frame.
+
+    The values of all states are stored in one array of doubles and their transitions in one array of codes. States
+    with a transition missing in `TRANSITION_CODES` keep it in a separate mapping.
+    """
 
-    def __init__(self, parent_cue: Cue) -> None:
+    __slots__ = ("_layout", "_parent", "_timestamp", "_transitions", "_unknown_transitions", "_values",
+                 "only_on_channel")
+
+    def __init__(self, parent_cue: Cue | None) -> None:
         """Initialize key frame using a given parent cue."""
-        self._states: list[State] = []
-        self.timestamp: float = 0.0
+        self._values: array[float] = array("d")
+        self._transitions: bytearray = bytearray()
+        self._unknown_transitions: dict[int, str] | None = None
+        """Transition per state index of the states using `_UNKNOWN_TRANSITION`. None if there are none."""
+        self._layout: _StateLayout = _get_layout(())
+        self._timestamp: float = 0.0
         self._parent = parent_cue
         self.only_on_channel: str | None = None
 
+    @property
+    def timestamp(self) -> float:
+        """Get or set the time stamp in seconds. The key frames of the parent cue stay sorted."""
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: float) -> None:
+        previous_timestamp = self._timestamp
+        self._timestamp = value
+        if self._parent is not None:
+            self._parent._frames._move(self, previous_timestamp)
+
+    @property
+    def _states(self) -> _KeyFrameStates:
+        """States of the key frame, one per channel. Use `append_state` to add states."""
+        return _KeyFrameStates(self)
+
     def get_data_types(self) -> list[DataType]:
         """Get data types of associated channels."""
         return [s.get_data_type() for s in self._states]
 
+    def _transition(self, index: int) -> str:
+        """Get the transition of the state at the given position."""
+        code = self._transitions[index]
+        if code == _UNKNOWN_TRANSITION:
+            return self._unknown_transitions[index]
+        return TRANSITION_CODES[code]
+
+    def _set_transition(self, index: int, transition: str) -> None:
+        """Set the transition of the state at the given position."""
+        code = _TRANSITION_LOOKUP.get(transition, _UNKNOWN_TRANSITION)
+        self._transitions[index] = code
+        if code == _UNKNOWN_TRANSITION:
+            if self._unknown_transitions is None:
+                self._unknown_transitions = {}
+            self._unknown_transitions[index] = transition
+        elif self._unknown_transitions is not None:
+            self._unknown_transitions.pop(index, None)
+
     def format_filter_str(self) -> str:
         """Serialize for filter."""
-        return f"{self.timestamp}:{'&'.join([s.encode() for s in self._states])}"
+        values = self._values
+        layout = self._layout
+        if self._unknown_transitions:
+            transitions = [self._transition(index) for index in range(len(self._transitions))]
+        else:
+            transitions = [TRANSITION_CODES[code] for code in self._transitions]
+        states = [f"{state_type._format_value(values, offset)}@{transition}" for state_type, offset, transition
+                  in zip(layout.state_types, layout.offsets, transitions, strict=True)]
+        return f"{self.timestamp}:{'&'.join(states)}"
 
     @staticmethod
     def from_format_str(f_str: str, channel_data_types: list[tuple[str, DataType]], parent_cue: Cue) -> KeyFrame:
@@ -293,33 +458,52 @@ def from_format_str(f_str: str, channel_data_types: list[tuple[str, DataType]],
         f = KeyFrame(parent_cue)
         f.timestamp = float(parts[0])
 
-        for i, state_dev in enumerate(parts[1].split("&")):
+        state_devs = parts[1].split("&")
+        state_types: list[type[State]] = []
+        for i, state_dev in enumerate(state_devs):
             state_dev_parts = state_dev.split("@")
             if i >= len(channel_data_types):
                 if i == 0 and len(channel_data_types) == 0:
                     return None
                 raise ArgumentError("There are more elements in the key frame than channel data types")
-            dt = channel_data_types[i][1]
-            match dt:
-                case DataType.DT_COLOR:
-                    s_entry = StateColor(state_dev_parts[1])
-                case DataType.DT_8_BIT:
-                    s_entry = StateEightBit(state_dev_parts[1])
-                case DataType.DT_16_BIT:
-                    s_entry = StateSixteenBit(state_dev_parts[1])
-                case DataType.DT_DOUBLE:
-                    s_entry = StateDouble(state_dev_parts[1])
-                case _:
-                    raise ArgumentError(f"Unsupported filter data type: {state_dev_parts[1]}")
-            s_entry.decode(state_dev)
-            f._states.append(s_entry)
+            state_type = _STATE_TYPES.get(channel_data_types[i][1])
+            if state_type is None:
+                raise ArgumentError(f"Unsupported filter data type: {state_dev_parts[1]}")
+            state_types.append(state_type)
+            f._values.extend(state_type._DEFAULT)
+            f._transitions.append(0)
+            f._set_transition(i, state_dev_parts[1])
+        f._layout = _get_layout(tuple(state_types))
+        for i, (state_type, state_dev) in enumerate(zip(state_types, state_devs, strict=False)):
+            state_type._view(f, i).decode(state_dev)
 
         return f
 
+    def _append_slots(self, state_type: type[State], transition: str, values: Sequence[float]) -> None:
+        """Add the storage of a state."""
+        self._values.extend(values)
+        self._transitions.append(0)
+        self._set_transition(len(self._transitions) - 1, transition)
+        self._layout = _get_layout((*self._layout.state_types, state_type))
+
     def append_state(self, s: State) -> None:
-        """Add a state to this frame."""
+        """Add a state to this frame. The state becomes a view on the storage of this frame."""
         if s is not None:
-            self._states.append(s)
+            offset = s._offset
+            self._append_slots(type(s), s._frame._transition(s._index), s._frame._values[offset:offset + s._WIDTH])
+            s._frame = self
+            s._index = len(self._transitions) - 1
+
+    def _remove_state(self, index: int) -> None:
+        """Remove the state at the given position."""
+        state_types = self._layout.state_types
+        offset = self._layout.offsets[index]
+        del self._values[offset:offset + state_types[index]._WIDTH]
+        del self._transitions[index]
+        if self._unknown_transitions is not None:
+            self._unknown_transitions = {i if i < index else i - 1: transition
+                                         for i, transition in self._unknown_transitions.items() if i != index} or None
+        self._layout = _get_layout(state_types[:index] + state_types[index + 1:])
 
     def delete_from_parent_cue(self) -> None:
         """Delete the frame from the parent."""
@@ -329,18 +513,128 @@ def copy(self, new_parent: Cue) -> KeyFrame:
         """Copy the object."""
         kf = KeyFrame(new_parent)
         kf.timestamp = self.timestamp
-        for s in self._states:
-            kf._states.append(s.copy())
+        kf._values = array("d", self._values)
+        kf._transitions = bytearray(self._transitions)
+        if self._unknown_transitions is not None:
+            kf._unknown_transitions = dict(self._unknown_transitions)
+        kf._layout = self._layout
         return kf
 
 
+class KeyFrameList(Sequence[KeyFrame]):
+    """Key frames of a cue, sorted by their time stamps.
+
+    Key frames with equal time stamps keep the order in which they were added. Insertion, removal and lookups by time
+    use binary search.
+    """
+
+    def __init__(self, frames: Iterable[KeyFrame] = ()) -> None:
+        """Initialize the list with the given key frames."""
+        self._frames: list[KeyFrame] = []
+        self._timestamps: list[float] = []
+        for f in frames:
+            self.append(f)
+
+    def __len__(self) -> int:
+        """Get the number of key frames."""
+        return len(self._frames)
+
+    def __getitem__(self, index: int | slice) -> KeyFrame | list[KeyFrame]:
+        """Get the key frame at the given position in time order."""
+        return self._frames[index]
+
+    def __iter__(self) -> Iterator[KeyFrame]:
+        """Iterate over the key frames in time order."""
+        return iter(self._frames)
+
+    def __contains__(self, frame: object) -> bool:
+        """Check if the key frame is part of the list."""
+        return isinstance(frame, KeyFrame) and self._index_of(frame, frame.timestamp) >= 0
+
+    @property
+    def duration(self) -> float:
+        """Latest time stamp, at least 0."""
+        return max(self._timestamps[-1], 0.0) if self._timestamps else 0.0
+
+    def _index_of(self, frame: KeyFrame, timestamp: float) -> int:
+        """Find the position of a key frame with the given time stamp or return -1."""
+        for i in range(bisect_left(self._timestamps, timestamp), bisect_right(self._timestamps, timestamp)):
+            if self._frames[i] is frame:
+                return i
+        return -1
+
+    def append(self, frame: KeyFrame) -> None:
+        """Add a key frame behind all key frames with the same or an earlier time stamp."""
+        i = bisect_right(self._timestamps, frame.timestamp)
+        self._timestamps.insert(i, frame.timestamp)
+        self._frames.insert(i, frame)
+
+    def remove(self, frame: KeyFrame) -> None:
+        """Remove a key frame.
+
+        Raises:
+            ValueError: If the key frame is not part of the list.
+
+        """
+        i = self._index_of(frame, frame.timestamp)
+        if i < 0:
+            raise ValueError("The key frame is not part of the cue.")
+        del self._timestamps[i]
+        del self._frames[i]
+
+    def clear(self) -> None:
+        """Remove all key frames."""
+        self._frames.clear()
+        self._timestamps.clear()
+
+    def _move(self, frame: KeyFrame, previous_timestamp: float) -> None:
+        """Restore the order after the time stamp of a key frame changed. Unknown key frames are ignored."""
+        i = self._index_of(frame, previous_timestamp)
+        if i >= 0:
+            del self._timestamps[i]
+            del self._frames[i]
+            self.append(frame)
+
+    def nearest(self, timestamp: float) -> KeyFrame | None:
+        """Get the key frame closest to a time stamp.
+
+        Args:
+            timestamp: The time stamp in seconds.
+
+        Returns:
+            The closest key frame, or None if there are no key frames. On ties, the earliest and first added key frame
+            is returned.
+
+        """
+        timestamps = self._timestamps
+        i = bisect_left(timestamps, timestamp)
+        if i == len(timestamps) or (i > 0 and timestamp - timestamps[i - 1] <= timestamps[i] - timestamp):
+            if i == 0:
+                return None
+            i = bisect_left(timestamps, timestamps[i - 1])
+        return self._frames[i]
+
+    def in_range(self, start: float, end: float) -> list[KeyFrame]:
+        """Get the key frames with time stamps within a time window, including its bounds.
+
+        Args:
+            start: The start of the window in seconds.
+            end: The end of the window in seconds.
+
+        Returns:
+            The key frames in time order.
+
+        """
+        return self._frames[bisect_left(self._timestamps, start):bisect_right(self._timestamps, end)]
+
+
 class Cue:
     """Model of a cue from a cue filter."""
 
     def __init__(self, definition: str | None = None) -> None:
         """Initialize cue model."""
         self.end_action = EndAction.HOLD
-        self._frames: list[KeyFrame] = []
+        self._frames: KeyFrameList = KeyFrameList()
         self._channel_definitions: list[tuple[str, DataType]] = []
         self.restart_on_another_play_press: bool = False
         self.index_in_editor = 0
@@ -351,10 +645,12 @@ def __init__(self, definition: str | None = None) -> None:
     @property
     def duration(self) -> float:
         """Length of the cue."""
-        latest_timestamp = 0.0
-        for f in self._frames:
-            latest_timestamp = max(latest_timestamp, f.timestamp)
-        return latest_timestamp
+        return self._frames.duration
+
+    @property
+    def frames(self) -> KeyFrameList:
+        """Key frames of the cue, sorted by time."""
+        return self._frames
 
     @property
     def duration_formatted(self) -> str:
@@ -383,17 +679,91 @@ def format_cue(self) -> str:
             self.name = "No Name"
         return f"{'|'.join(frames_str_list)}#{end_handling_str}#{restart_beh_str}#{self.name.replace('#', '')}"
 
+    def format_cue_compact(self) -> str:
+        """Format the cue in the compact format.
+
+        Fish expects the text format of `format_cue`. Use this for storage only.
+
+        Raises:
+            ValueError: If a key frame does not define a state for every channel.
+
+        """
+        return encode_compact(self.to_columns(), self._channel_definitions)
+
+    def to_columns(self) -> CueColumns:
+        """Get the columnar representation of the cue.
+
+        Raises:
+            ValueError: If a key frame does not define a state for every channel or uses an unknown transition.
+
+        """
+        layout = _get_layout(tuple(_STATE_TYPES[data_type] for _, data_type in self._channel_definitions))
+        if any(f._layout is not layout or f.only_on_channel is not None for f in self._frames):
+            raise ValueError("Every key frame needs to define a state for every channel.")
+        frame_count = len(self._frames)
+        width = sum(state_type._WIDTH for state_type in layout.state_types)
+        storage = np.frombuffer(b"".join(f._values.tobytes() for f in self._frames), dtype=np.float64)
+        storage = storage.reshape(frame_count, width)
+        transitions = np.frombuffer(b"".join(f._transitions for f in self._frames), dtype=np.uint8)
+        transitions = transitions.reshape(frame_count, len(layout.state_types))
+        if transitions.size > 0 and transitions.max() >= len(TRANSITION_CODES):
+            raise ValueError("The cue uses unknown transitions.")
+        values = []
+        for offset, (_, data_type) in zip(layout.offsets, self._channel_definitions, strict=True):
+            if data_type == DataType.DT_COLOR:
+                values.append(storage[:, offset:offset + 3].copy())
+            elif data_type == DataType.DT_DOUBLE:
+                values.append(storage[:, offset].copy())
+            else:
+                limit = 255 if data_type == DataType.DT_8_BIT else 65535
+                values.append(np.clip(storage[:, offset].astype(np.int64), 0, limit))
+        restart_beh_str = "restart" if self.restart_on_another_play_press else "do_nothing"
+        trailer = (self.end_action.get_filter_format_str(), restart_beh_str, (self.name or "No Name").replace("#", ""))
+        return CueColumns(np.array([f.timestamp for f in self._frames], dtype=np.float64), tuple(values),
+                          transitions.copy(), trailer)
+
+    def _append_columns(self, columns: CueColumns) -> None:
+        """Create the key frames of the given columns. Each key frame receives a row of the columns as storage."""
+        if columns.frame_count == 0:
+            return
+        layout = _get_layout(tuple(_STATE_TYPES[data_type] for _, data_type in self._channel_definitions))
+        storage = np.column_stack([values.reshape(columns.frame_count, -1).astype(np.float64)
+                                   for values in columns.values])
+        transitions = columns.transitions.astype(np.uint8)
+        for timestamp, values, codes in zip(columns.timestamps.tolist(), storage, transitions, strict=True):
+            f = KeyFrame(self)
+            f._timestamp = timestamp
+            f._values = array("d", values.tobytes())
+            f._transitions = bytearray(codes.tobytes())
+            f._layout = layout
+            self._frames.append(f)
+
     def from_string_definition(self, definition: str) -> None:
-        """Deserialize filter definition."""
-        primary_tokens = definition.split("#")
-        frame_definitions = primary_tokens[0].split("|")
-        for frame_dev in frame_definitions:
-            if frame_dev:
-                frame_pt = KeyFrame.from_format_str(frame_dev, self._channel_definitions, self)
-                if frame_pt is None:
-                    logger.error("Got empty Keyframe while parsing.")
-                else:
-                    self._frames.append(frame_pt)
+        """Deserialize filter definition.
+
+        Definitions in the text format are parsed into columns in one pass. Definitions with partial key frames or
+        unknown transitions are parsed frame by frame instead. Definitions in the compact format are accepted as well.
+        """
+        if is_compact(definition):
+            columns = decode_compact(definition, self._channel_definitions)
+        else:
+            try:
+                columns = parse_cue_columns(definition, self._channel_definitions)
+            except ValueError:
+                columns = None
+        if columns is not None:
+            self._append_columns(columns)
+            primary_tokens = ["", *columns.trailer]
+        else:
+            primary_tokens = definition.split("#")
+            frame_definitions = primary_tokens[0].split("|")
+            for frame_dev in frame_definitions:
+                if frame_dev:
+                    frame_pt = KeyFrame.from_format_str(frame_dev, self._channel_definitions, self)
+                    if frame_pt is None:
+                        logger.error("Got empty Keyframe while parsing.")
+                    else:
+                        self._frames.append(frame_pt)
         if len(primary_tokens) > 1:
             self.end_action = EndAction.from_format_str(primary_tokens[1])
         if len(primary_tokens) > 2:
@@ -412,22 +782,12 @@ def add_channel(self, name: str, t: str | DataType) -> None:
 
                 raise ValueError("This channel name already exists with a different data type.")
         self._channel_definitions.append((name, dt))
+        state_type = _STATE_TYPES.get(dt, StateEightBit)
         for kf in self._frames:
-            match dt:
-                case DataType.DT_COLOR:
-                    kf_s = StateColor(TransferFunction.EDGE.value)
-                case DataType.DT_8_BIT:
-                    kf_s = StateEightBit(TransferFunction.EDGE.value)
-                case DataType.DT_DOUBLE:
-                    kf_s = StateDouble(TransferFunction.EDGE.value)
-                case DataType.DT_16_BIT:
-                    kf_s = StateSixteenBit(TransferFunction.EDGE.value)
-                case _:
-                    kf_s = StateEightBit(TransferFunction.EDGE.value)
-            kf._states.append(kf_s)
+            kf._append_slots(state_type, TransferFunction.EDGE.value, state_type._DEFAULT)
 
     def insert_frame(self, f: KeyFrame) -> None:
-        """Add a frame to the cue."""
+        """Add a frame to the cue, according to its time stamp."""
         self._frames.append(f)
 
     def remove_channel(self, c: Union[ExternalChannelDefinition, tuple[str, DataType]]) -> None:
@@ -442,7 +802,7 @@ def remove_channel(self, c: Union[ExternalChannelDefinition, tuple[str, DataType
         if target_index == -1:
             return
         for f in self._frames:
-            f._states.pop(target_index)
+            f._remove_state(target_index)
 
     def copy(self) -> Cue:
         """Get a copy of the object."""
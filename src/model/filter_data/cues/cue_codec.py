@@ -0,0 +1,247 @@
+"""Columnar codec for cue definitions.
+
+A cue definition in the filter text format consists of the key frames, separated by ``|``, followed by the ``#``
+separated end action, restart behavior and name. Each key frame is a time stamp and the ``&`` separated states of all
+channels. A state is a value and a transition, separated by ``@``. This module parses such definitions in a single pass
+into one array per column, instead of creating an object per state. Additionally, it provides a compact binary
+encoding of the columns that round-trips with the text format.
+
+CueColumns -- Columnar representation of a cue definition.
+parse_cue_columns -- Parse a cue definition from the text format.
+format_cue_columns -- Format columns in the text format.
+encode_compact -- Encode columns in the compact format.
+decode_compact -- Decode columns from the compact format.
+is_compact -- Check if a cue definition uses the compact format.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import struct
+import zlib
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from model import DataType
+from model.filter_data.transfer_function import TransferFunction
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+TRANSITION_CODES: tuple[str, ...] = tuple(tf.value for tf in TransferFunction)
+"""Transition of each transition code."""
+
+COMPACT_PREFIX = "~1"
+"""Prefix of cue definitions in the compact format, followed by the base64 encoded, compressed columns."""
+
+_TRANSITION_CODE_LOOKUP: dict[str, int] = {transition: code for code, transition in enumerate(TRANSITION_CODES)}
+
+_VALUE_DTYPES: dict[DataType, np.dtype] = {
+    DataType.DT_8_BIT: np.dtype("<u1"),
+    DataType.DT_16_BIT: np.dtype("<u2"),
+    DataType.DT_DOUBLE: np.dtype("<f8"),
+    DataType.DT_COLOR: np.dtype("<f8"),
+}
+
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+class CueColumns(NamedTuple):
+    """Columnar representation of a cue definition."""
+
+    timestamps: NDArray[np.float64]
+    """Time stamp of each key frame."""
+
+    values: tuple[NDArray, ...]
+    """Values of each channel per key frame. Colors are stored as rows of hue, saturation and intensity."""
+
+    transitions: NDArray[np.uint8]
+    """Transition code per key frame and channel. See `TRANSITION_CODES`."""
+
+    trailer: tuple[str, ...]
+    """The tokens following the key frames: end action, restart behavior and name."""
+
+    @property
+    def frame_count(self) -> int:
+        """Number of key frames."""
+        return len(self.timestamps)
+
+
+def _parse_channel(tokens: list[str], data_type: DataType) -> NDArray:
+    """Convert the value tokens of a channel, clamping them like the states of the cue model."""
+    match data_type:
+        case DataType.DT_8_BIT:
+            return np.clip(np.fromiter(map(int, tokens), np.int64, len(tokens)), 0, 255).astype(np.uint8)
+        case DataType.DT_16_BIT:
+            return np.clip(np.fromiter(map(int, tokens), np.int64, len(tokens)), 0, 65535).astype(np.uint16)
+        case DataType.DT_DOUBLE:
+            return np.fromiter(map(float, tokens), np.float64, len(tokens))
+        case DataType.DT_COLOR:
+            components = ",".join(tokens).split(",")
+            if len(components) != 3 * len(tokens):
+                raise ValueError("Expected HSI format: hue,saturation,intensity")
+            colors = np.fromiter(map(float, components), np.float64, len(components)).reshape(-1, 3)
+            colors[:, 0] %= 360.0
+            np.clip(colors[:, 1:], 0.0, 1.0, out=colors[:, 1:])
+            return colors
+        case _:
+            raise ValueError(f"Unsupported filter data type: {data_type}")
+
+
+def parse_cue_columns(definition: str, channels: list[tuple[str, DataType]]) -> CueColumns:
+    """Parse a cue definition from the filter text format.
+
+    All frames need to define a state for every channel.
+
+    Args:
+        definition: The cue definition.
+        channels: The names and data types of the channels of the cue.
+
+    Returns:
+        The parsed columns.
+
+    Raises:
+        ValueError: If the definition is malformed or does not match the channels.
+
+    """
+    primary_tokens = definition.split("#")
+    frames = [frame for frame in primary_tokens[0].split("|") if frame]
+    channel_count = len(channels)
+    if frames and channel_count == 0:
+        raise ValueError("The cue defines key frames but no channels.")
+
+    timestamps: list[str] = []
+    states: list[str] = []
+    for frame in frames:
+        timestamp, separator, frame_states = frame.partition(":")
+        if not separator or ":" in frame_states:
+            raise ValueError("A keyframe definition should contain exactly two elements")
+        if frame_states.count("&") != channel_count - 1:
+            raise ValueError("The number of states in the key frame does not match the channels.")
+        timestamps.append(timestamp)
+        states.append(frame_states)
+
+    tokens = "&".join(states).replace("@", "&").split("&") if states else []
+    if len(tokens) != 2 * len(frames) * channel_count:
+        raise ValueError("Every state needs to consist of a value and a transition.")
+    try:
+        transitions = np.fromiter(map(_TRANSITION_CODE_LOOKUP.__getitem__, tokens[1::2]), np.uint8,
+                                  len(tokens) // 2)
+    except KeyError as e:
+        raise ValueError(f"Unsupported transition type: {e.args[0]}") from e
+
+    value_tokens = tokens[0::2]
+    values = tuple(_parse_channel(value_tokens[i::channel_count], data_type)
+                   for i, (_, data_type) in enumerate(channels))
+    return CueColumns(np.fromiter(map(float, timestamps), np.float64, len(timestamps)), values,
+                      transitions.reshape(len(frames), channel_count), tuple(primary_tokens[1:]))
+
+
+def _format_channel(values: NDArray, data_type: DataType) -> list[str]:
+    """Format the values of a channel like the states of the cue model."""
+    if data_type == DataType.DT_COLOR:
+        return [f"{h},{s},{i}" for h, s, i in values.tolist()]
+    if data_type == DataType.DT_DOUBLE:
+        return list(map(repr, values.tolist()))
+    return list(map(str, values.tolist()))
+
+
+def format_cue_columns(columns: CueColumns, channels: list[tuple[str, DataType]]) -> str:
+    """Format columns in the filter text format.
+
+    Args:
+        columns: The columns to format.
+        channels: The names and data types of the channels of the cue.
+
+    Returns:
+        The cue definition.
+
+    """
+    transitions = [[TRANSITION_CODES[code] for code in row] for row in columns.transitions.tolist()]
+    channel_values = [_format_channel(values, data_type) for values, (_, data_type) in zip(columns.values, channels,
+                                                                                             strict=True)]
+    frames = [
+        f"{timestamp}:{'&'.join(f'{value[frame]}@{transition}' for value, transition in zip(channel_values, row,
+                                                                                               strict=True))}"
+        for frame, (timestamp, row) in enumerate(zip(columns.timestamps.tolist(), transitions, strict=True))
+    ]
+    return "#".join(["|".join(frames), *columns.trailer])
+
+
+def is_compact(definition: str) -> bool:
+    """Check if a cue definition uses the compact format."""
+    return definition.startswith(COMPACT_PREFIX)
+
+
+def encode_compact(columns: CueColumns, channels: list[tuple[str, DataType]]) -> str:
+    """Encode columns in the compact format.
+
+    The result contains none of the separators of the text formats of cues and cue lists.
+
+    Args:
+        columns: The columns to encode.
+        channels: The names and data types of the channels of the cue.
+
+    Returns:
+        The encoded cue definition, starting with `COMPACT_PREFIX`.
+
+    """
+    header = json.dumps({
+        "frames": columns.frame_count,
+        "types": [data_type.format_for_filters() for _, data_type in channels],
+        "trailer": list(columns.trailer),
+    }, separators=(",", ":")).encode()
+    payload = [_HEADER_LENGTH.pack(len(header)), header, columns.timestamps.astype("<f8").tobytes()]
+    payload.extend(values.astype(_VALUE_DTYPES[data_type]).tobytes()
+                   for values, (_, data_type) in zip(columns.values, channels, strict=True))
+    payload.append(columns.transitions.astype(np.uint8).tobytes())
+    return COMPACT_PREFIX + base64.b64encode(zlib.compress(b"".join(payload))).decode("ascii")
+
+
+def decode_compact(definition: str, channels: list[tuple[str, DataType]]) -> CueColumns:
+    """Decode columns from the compact format.
+
+    Args:
+        definition: The cue definition, starting with `COMPACT_PREFIX`.
+        channels: The names and data types of the channels of the cue.
+
+    Returns:
+        The decoded columns.
+
+    Raises:
+        ValueError: If the definition is malformed or does not match the channels.
+
+    """
+    if not is_compact(definition):
+        raise ValueError("The cue definition does not use the compact format.")
+    try:
+        payload = zlib.decompress(base64.b64decode(definition[len(COMPACT_PREFIX):], validate=True))
+    except (zlib.error, ValueError) as e:
+        raise ValueError("Malformed compact cue definition.") from e
+    (header_length,) = _HEADER_LENGTH.unpack_from(payload)
+    offset = _HEADER_LENGTH.size + header_length
+    header = json.loads(payload[_HEADER_LENGTH.size:offset])
+    if header["types"] != [data_type.format_for_filters() for _, data_type in channels]:
+        raise ValueError("The channels of the compact cue definition do not match the cue.")
+
+    frame_count = header["frames"]
+
+    def read(dtype: np.dtype, count: int) -> NDArray:
+        nonlocal offset
+        array = np.frombuffer(payload, dtype, count, offset)
+        offset += array.nbytes
+        return array
+
+    timestamps = read(np.dtype("<f8"), frame_count).astype(np.float64)
+    values = []
+    for _, data_type in channels:
+        if data_type == DataType.DT_COLOR:
+            values.append(read(_VALUE_DTYPES[data_type], 3 * frame_count).reshape(-1, 3).copy())
+        else:
+            values.append(read(_VALUE_DTYPES[data_type], frame_count).copy())
+    transitions = read(np.dtype(np.uint8), frame_count * len(channels)).reshape(frame_count, len(channels)).copy()
+    if offset != len(payload):
+        raise ValueError("Malformed compact cue definition.")
+    return CueColumns(timestamps, tuple(values), transitions, tuple(header["trailer"]))
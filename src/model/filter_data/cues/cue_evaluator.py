@@ -0,0 +1,228 @@
+"""Local evaluation of cues and sequencer transitions.
+
+The evaluator compiles the key frames of a cue into NumPy arrays and samples all channels for a complete vector of
+time stamps at once. This allows previewing and verifying cues without a connection to Fish.
+
+CompiledCue -- Array representation of a cue, ready for sampling.
+compile_cue -- Compile a cue.
+compile_transition -- Compile a sequencer transition.
+"""
+
+from __future__ import annotations
+
+from logging import getLogger
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+
+from model import DataType
+from model.color_hsi import ColorHSI
+from model.filter_data.cues.cue import EndAction
+from model.filter_data.transfer_function import TransferFunction
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    from model.filter_data.cues.cue import Cue, State
+    from model.filter_data.sequencer.transition import Transition
+
+logger = getLogger(__name__)
+
+_TRANSFER_FUNCTION_CODES: dict[str, int] = {tf.value: code for code, tf in enumerate(TransferFunction)}
+
+_SIGMOID_STEEPNESS = 12.0
+_SIGMOID_OFFSET = 1.0 / (1.0 + np.exp(_SIGMOID_STEEPNESS / 2))
+_SIGMOID_SCALE = 1.0 - 2 * _SIGMOID_OFFSET
+
+
+def _value_columns(value: float | ColorHSI, data_type: DataType) -> list[float]:
+    """Get the numeric columns of a state value. Colors are represented by hue, saturation and intensity."""
+    if data_type == DataType.DT_COLOR:
+        return [float(value.hue), float(value.saturation), float(value.intensity)]
+    return [float(value)]
+
+
+def _column_count(data_type: DataType) -> int:
+    return 3 if data_type == DataType.DT_COLOR else 1
+
+
+def _default_value(data_type: DataType) -> float | ColorHSI:
+    return ColorHSI(180.0, 0.0, 0.0) if data_type == DataType.DT_COLOR else 0.0
+
+
+def _transition_progress(relative_time: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Compute the progress of every transfer function for the relative times within a transition.
+
+    Returns:
+        An array with one row per transfer function, in the order of `TransferFunction`.
+
+    """
+    progress = np.empty((len(_TRANSFER_FUNCTION_CODES), *relative_time.shape))
+    progress[_TRANSFER_FUNCTION_CODES[TransferFunction.EDGE.value]] = relative_time >= 0.5
+    progress[_TRANSFER_FUNCTION_CODES[TransferFunction.LINEAR.value]] = relative_time
+    sigmoid = 1.0 / (1.0 + np.exp(_SIGMOID_STEEPNESS * (0.5 - relative_time)))
+    progress[_TRANSFER_FUNCTION_CODES[TransferFunction.SIGMOIDAL.value]] = (sigmoid - _SIGMOID_OFFSET) / _SIGMOID_SCALE
+    progress[_TRANSFER_FUNCTION_CODES[TransferFunction.EASE_IN.value]] = relative_time * relative_time
+    progress[_TRANSFER_FUNCTION_CODES[TransferFunction.EASE_OUT.value]] = 1.0 - (1.0 - relative_time) ** 2
+    return progress
+
+
+class _ChannelGroup(NamedTuple):
+    """Channels sharing the same key frame time stamps."""
+
+    columns: NDArray[np.intp]
+    """Output columns of the group."""
+
+    timestamps: NDArray[np.float64]
+    """Sorted key frame time stamps, starting at 0."""
+
+    values: NDArray[np.float64]
+    """Values per key frame and column."""
+
+    transfer_functions: NDArray[np.intp]
+    """Transfer function codes per key frame and column, used for the transition into the key frame."""
+
+
+class CompiledCue:
+    """Array representation of a cue, ready for sampling."""
+
+    def __init__(self, channels: list[tuple[str, DataType]], groups: list[_ChannelGroup], duration: float,
+                 end_action: EndAction) -> None:
+        """Initialize a compiled cue. Use `compile_cue` to create one.
+
+        Args:
+            channels: The channels of the cue.
+            groups: The compiled key frames, grouped by their time stamps.
+            duration: The duration of the cue in seconds.
+            end_action: What happens once the duration passed.
+
+        """
+        self._groups = groups
+        self.duration: float = duration
+        self.end_action: EndAction = end_action
+        self.channel_slices: dict[str, slice] = {}
+        """Columns of each channel in the sampled array. Color channels span hue, saturation and intensity."""
+        column = 0
+        for name, data_type in channels:
+            self.channel_slices[name] = slice(column, column + _column_count(data_type))
+            column += _column_count(data_type)
+        self.column_count: int = column
+
+    def sample(self, times: ArrayLike) -> NDArray[np.float64]:
+        """Sample all channels of the cue.
+
+        Between two key frames of a channel, the transfer function of the later key frame interpolates from the value of
+        the earlier one. Edges switch half-way through the transition. Before the first key frame, the initial value is
+        held. After the end of the cue, the last values are held, unless the cue restarts. Values are not quantized to
+        the channel's data type and hues are interpolated linearly.
+
+        Args:
+            times: The time stamps in seconds since the cue was started.
+
+        Returns:
+            An array with one row per time stamp and the channel columns described by `channel_slices`.
+
+        """
+        times = np.asarray(times, dtype=np.float64).ravel()
+        if self.end_action == EndAction.START_AGAIN and self.duration > 0:
+            times = np.mod(times, self.duration)
+        times = np.maximum(times, 0.0)
+
+        result = np.empty((len(times), self.column_count))
+        for group in self._groups:
+            frame_count = len(group.timestamps)
+            following = np.searchsorted(group.timestamps, times, side="right")
+            previous = following - 1
+            finished = following >= frame_count
+            following[finished] = frame_count - 1
+            durations = group.timestamps[following] - group.timestamps[previous]
+            relative_time = np.ones_like(times)
+            running = ~finished
+            relative_time[running] = (times[running] - group.timestamps[previous[running]]) / durations[running]
+            progress = np.choose(group.transfer_functions[following], _transition_progress(relative_time)[:, :, None])
+            start = group.values[previous]
+            result[:, group.columns] = start + (group.values[following] - start) * progress
+        return result
+
+
+def _channel_frames(cue: Cue, channel_index: int, channel_name: str) -> list[tuple[float, State]]:
+    """Collect the time stamps and states of a channel, sorted by time."""
+    frames: list[tuple[float, State]] = []
+    for frame in cue._frames:
+        if frame.only_on_channel is None:
+            if channel_index < len(frame._states):
+                frames.append((frame.timestamp, frame._states[channel_index]))
+        elif frame.only_on_channel == channel_name and len(frame._states) > 0:
+            frames.append((frame.timestamp, frame._states[0]))
+    frames.sort(key=lambda entry: entry[0])
+    return frames
+
+
+def compile_cue(cue: Cue, initial_values: dict[str, float | ColorHSI] | None = None) -> CompiledCue:
+    """Compile a cue into arrays for sampling.
+
+    Args:
+        cue: The cue to compile.
+        initial_values: The values of the channels when the cue starts. Channels without an initial value start at
+            their first key frame.
+
+    Returns:
+        The compiled cue.
+
+    """
+    initial_values = initial_values or {}
+    channels = cue.channels
+    compiled_channels: dict[tuple[float, ...], list[tuple[list[int], list[list[float]], list[int]]]] = {}
+    column = 0
+    for channel_index, (name, data_type) in enumerate(channels):
+        frames = _channel_frames(cue, channel_index, name)
+        width = _column_count(data_type)
+        columns = list(range(column, column + width))
+        column += width
+
+        initial_value = initial_values.get(name)
+        if initial_value is None:
+            initial_value = frames[0][1]._value if frames else _default_value(data_type)
+        timestamps = [0.0]
+        values = [_value_columns(initial_value, data_type)]
+        transfer_functions = [_TRANSFER_FUNCTION_CODES[TransferFunction.EDGE.value]]
+        for timestamp, state in frames:
+            code = _TRANSFER_FUNCTION_CODES.get(state.transition)
+            if code is None:
+                logger.warning("Unknown transition type '%s' in channel %s. Assuming linear.", state.transition, name)
+                code = _TRANSFER_FUNCTION_CODES[TransferFunction.LINEAR.value]
+            if timestamp <= 0.0:
+                # A key frame at the start replaces the initial value
+                values[0] = _value_columns(state._value, data_type)
+                continue
+            timestamps.append(timestamp)
+            values.append(_value_columns(state._value, data_type))
+            transfer_functions.append(code)
+        compiled_channels.setdefault(tuple(timestamps), []).append((columns, values, transfer_functions))
+
+    groups = []
+    for timestamps, members in compiled_channels.items():
+        group_columns = [c for columns, _, _ in members for c in columns]
+        group_values = np.array([[v for _, values, _ in members for v in values[frame]]
+                                 for frame in range(len(timestamps))])
+        group_transfer_functions = np.array([[tf[frame] for columns, _, tf in members for _ in columns]
+                                             for frame in range(len(timestamps))], dtype=np.intp)
+        groups.append(_ChannelGroup(np.array(group_columns, dtype=np.intp), np.array(timestamps), group_values,
+                                    group_transfer_functions))
+    return CompiledCue(channels, groups, cue.duration, cue.end_action)
+
+
+def compile_transition(transition: Transition) -> CompiledCue:
+    """Compile a sequencer transition into arrays for sampling.
+
+    The channels start at their default values.
+
+    Args:
+        transition: The transition to compile.
+
+    Returns:
+        The compiled transition.
+
+    """
+    initial_values = {frame.channel.name: frame.channel.default_value for frame in transition.frames}
+    return compile_cue(transition.to_cue(), initial_values)
@@ -267,9 +267,8 @@ def update_frames_from_cue(
         """
         channel_dict = _force_channel_dict(channel_dict)
         self._frames.clear()
-        c._frames.sort(key=lambda x: x.timestamp)
         channel_ages = Counter()
-        for cf in c._frames:
+        for cf in c.frames:
             skf = SequenceKeyFrame(channel_dict.get(cf.only_on_channel))
             skf._target_value = cf._states[0]._value
             skf._tf = TransferFunction(cf._states[0].transition)
@@ -0,0 +1,195 @@
+"""Analysis of the data flow between the filters of a scene."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple
+
+from controller.cli.arguments import split_arguments
+from model.filter import FilterTypeEnumeration
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Iterable
+
+    from model import Filter, Scene
+
+SINK_FILTER_TYPES: frozenset[int] = frozenset({
+    FilterTypeEnumeration.FILTER_UNIVERSE_OUTPUT,
+    FilterTypeEnumeration.VFILTER_UNIVERSE,
+    FilterTypeEnumeration.VFILTER_EFFECTSSTACK,
+    FilterTypeEnumeration.FILTER_DEBUG_OUTPUT_8BIT,
+    FilterTypeEnumeration.FILTER_DEBUG_OUTPUT_16BIT,
+    FilterTypeEnumeration.FILTER_DEBUG_OUTPUT_FLOAT,
+    FilterTypeEnumeration.FILTER_DEBUG_OUTPUT_COLOR,
+    FilterTypeEnumeration.FILTER_REMOTE_DEBUG_8BIT,
+    FilterTypeEnumeration.FILTER_REMOTE_DEBUG_16BIT,
+    FilterTypeEnumeration.FILTER_REMOTE_DEBUG_FLOAT,
+    FilterTypeEnumeration.FILTER_REMOTE_DEBUG_PIXEL,
+    FilterTypeEnumeration.FILTER_SCRIPTING_LUA,
+})
+"""Filter types with effects outside the filter graph, like DMX output, debug output or emitted events."""
+
+GUI_CONTROLLED_FILTER_TYPES: frozenset[int] = frozenset({
+    FilterTypeEnumeration.FILTER_FADER_RAW,
+    FilterTypeEnumeration.FILTER_FADER_HSI,
+    FilterTypeEnumeration.FILTER_FADER_HSIA,
+    FilterTypeEnumeration.FILTER_FADER_HSIU,
+    FilterTypeEnumeration.FILTER_FADER_HSIAU,
+    FilterTypeEnumeration.FILTER_TYPE_CUES,
+    FilterTypeEnumeration.FILTER_SEQUENCER,
+    FilterTypeEnumeration.FILTER_COLOR_CHASER,
+    FilterTypeEnumeration.VFILTER_CUES,
+    FilterTypeEnumeration.VFILTER_SEQUENCER,
+    FilterTypeEnumeration.VFILTER_AUTOTRACKER,
+})
+"""Filter types that exchange updates with the GUI. They and the filters they instantiate are addressed by ID."""
+
+
+class FilterReachability(NamedTuple):
+    """Result of the reachability analysis of a filter graph."""
+
+    reachable: set[str]
+    """IDs of the filters contributing to a sink."""
+
+    unreachable: list[str]
+    """IDs of the filters without any effect, in the order of the analyzed filters."""
+
+    @property
+    def filter_count(self) -> int:
+        """Number of analyzed filters."""
+        return len(self.reachable) + len(self.unreachable)
+
+
+VIRTUAL_FILTER_CHILD_SEPARATOR: str = "__"
+"""Separates the ID of a virtual filter from the rest of the IDs of the filters it instantiates."""
+
+
+def gui_addressed_filter_ids(scene: Scene) -> frozenset[str]:
+    """Collect the IDs of the filters that may receive updates from the GUI.
+
+    This includes the filters that macros send updates to. Filters instantiated by an addressed virtual filter are
+    addressed as well. See `is_gui_addressed`.
+
+    Args:
+        scene: The scene to inspect.
+
+    Returns:
+        The IDs of the addressed filters.
+
+    """
+    addressed = {fid for ui_page in scene.ui_pages for widget in ui_page.widgets for fid in widget.filter_ids}
+    addressed.update(f.filter_id for f in scene.filters
+                     if f.filter_type in GUI_CONTROLLED_FILTER_TYPES or len(f.gui_update_keys_view) > 0)
+    if scene.board_configuration is not None:
+        addressed.update(filtermsg_targets(
+            (line for macro in scene.board_configuration.macros for line in macro.content.split("\n")), scene.scene_id))
+    return frozenset(addressed)
+
+
+def is_gui_addressed(filter_id: str, addressed_ids: Collection[str]) -> bool:
+    """Check whether a filter may receive updates from the GUI.
+
+    A filter is addressed if its ID is one of the addressed IDs or if it was instantiated by an addressed virtual
+    filter, i.e. its ID starts with an addressed ID followed by `VIRTUAL_FILTER_CHILD_SEPARATOR`.
+
+    Args:
+        filter_id: The ID of the filter to check.
+        addressed_ids: The IDs of the addressed filters. See `gui_addressed_filter_ids`.
+
+    Returns:
+        True if the filter is addressed.
+
+    """
+    if filter_id in addressed_ids:
+        return True
+    separator = filter_id.find(VIRTUAL_FILTER_CHILD_SEPARATOR)
+    while separator != -1:
+        if filter_id[:separator] in addressed_ids:
+            return True
+        separator = filter_id.find(VIRTUAL_FILTER_CHILD_SEPARATOR, separator + 1)
+    return False
+
+
+def filtermsg_targets(commands: Iterable[str], scene_id: int) -> set[str]:
+    """Collect the IDs of the filters of a scene that CLI commands send updates to using ``showctl filtermsg``.
+
+    Commands selecting the scene through a variable are attributed to every scene. Filter IDs given through a variable
+    cannot be resolved and are not found.
+
+    Args:
+        commands: The command lines, for example the lines of a macro.
+        scene_id: The ID of the scene to collect the addressed filters of.
+
+    Returns:
+        The IDs of the addressed filters.
+
+    """
+    addressed: set[str] = set()
+    for command in commands:
+        args = split_arguments(command)
+        if len(args) < 4 or args[0] != "showctl" or args[1] != "filtermsg":
+            continue
+        if args[2].startswith("$") or (args[2].isdecimal() and int(args[2]) == scene_id):
+            addressed.add(args[3])
+    return addressed
+
+
+def analyze_reachability(
+    filters: Iterable[Filter],
+    addressed_ids: Collection[str] = (),
+    resolve_port: Callable[[str], str] | None = None,
+    extra_sinks: Iterable[str] = (),
+) -> FilterReachability:
+    """Find the filters whose outputs contribute to a sink of the filter graph.
+
+    Sinks are filters of a type in `SINK_FILTER_TYPES` or `GUI_CONTROLLED_FILTER_TYPES`, filters with GUI update keys
+    and filters addressed by the GUI or by macros. Everything feeding a sink, directly or through other filters, is
+    reachable.
+
+    Args:
+        filters: The filters of the graph.
+        addressed_ids: IDs of the filters addressed by the GUI or by macros. See `is_gui_addressed`.
+        resolve_port: Translates a connected ``filter_id:output`` port before its filter is looked up.
+        extra_sinks: IDs of further filters to treat as sinks.
+
+    Returns:
+        The reachable and unreachable filters.
+
+    """
+    filters = list(filters)
+    filter_ids = {f.filter_id for f in filters}
+    sources: dict[str, list[str]] = {}
+    worklist: list[str] = [fid for fid in extra_sinks if fid in filter_ids]
+    for f in filters:
+        ports = [port for port in f.channel_links_view.values() if port]
+        if resolve_port is not None:
+            ports = [resolve_port(port) for port in ports]
+        source_ids = [port.partition(":")[0] for port in ports]
+        if f.filter_type == FilterTypeEnumeration.VFILTER_IMPORT:
+            source_ids.append(f.filter_configurations_view.get("target", ""))
+        sources[f.filter_id] = source_ids
+        if (f.filter_type in SINK_FILTER_TYPES or f.filter_type in GUI_CONTROLLED_FILTER_TYPES
+                or len(f.gui_update_keys_view) > 0
+                or is_gui_addressed(f.filter_id, addressed_ids)):
+            worklist.append(f.filter_id)
+
+    reachable: set[str] = set()
+    while worklist:
+        filter_id = worklist.pop()
+        if filter_id in reachable or filter_id not in filter_ids:
+            continue
+        reachable.add(filter_id)
+        worklist.extend(sources[filter_id])
+    return FilterReachability(reachable, [f.filter_id for f in filters if f.filter_id not in reachable])
+
+
+def analyze_scene_reachability(scene: Scene) -> FilterReachability:
+    """Find the filters of a scene that contribute to its output.
+
+    Args:
+        scene: The scene to analyze.
+
+    Returns:
+        The reachable and unreachable filters of the scene.
+
+    """
+    return analyze_reachability(scene.filters, gui_addressed_filter_ids(scene))
@@ -8,10 +8,12 @@
 from model.media_assets.image import LocalImage
 
 if TYPE_CHECKING:
+    from PySide6.QtGui import QImage
+
     from model.media_assets.asset import MediaAsset
 
 def load_asset(uuid: str, type_hint: AssetFactoryObjectHint | str, serialized_data: str, show_file_path: str = "",
-               name: str = "") -> MediaAsset | None:
+               name: str = "", decoded_image: tuple[QImage, QImage] | None = None) -> MediaAsset | None:
     """Load a media asset based on type and provided data.
 
     Args:
@@ -20,6 +22,7 @@ def load_asset(uuid: str, type_hint: AssetFactoryObjectHint | str, serialized_da
         serialized_data: The serialized data of the asset
         show_file_path: The file path of the asset. Default: empty string if no show file path is available
         name: The name of the asset if any.
+        decoded_image: Image data decoded ahead of time by `model.media_assets.image.decode_image`, if any.
 
     Returns:
         MediaAsset | None: The media asset if it was loadable.
@@ -30,7 +33,7 @@ def load_asset(uuid: str, type_hint: AssetFactoryObjectHint | str, serialized_da
     asset: MediaAsset | None = None
     match type_hint:
         case AssetFactoryObjectHint.IMAGE_EXTERNAL_FILE:
-            asset = LocalImage(serialized_data, uuid, show_file_path)
+            asset = LocalImage(serialized_data, uuid, show_file_path, decoded_image)
         case _:
             asset = None
     if asset is not None:
@@ -37,46 +37,76 @@ def get_image_for_ui(self) -> QImage:
         """
         raise NotImplementedError
 
+def resolve_image_path(path: str, show_file_path: str = "") -> tuple[str | None, bool]:
+    """Locate an image file.
+
+    Args:
+        path: The path of the image as stored in the show file.
+        show_file_path: The path to the current show file. Leave as empty string if none is loaded.
+
+    Returns:
+        The resolved path (None if the image was not found) and whether it is located in the global asset directory.
+
+    """
+    if os.path.isfile(path):
+        return path, False
+    global_asset_dir = os.path.join(GLOBAL_ASSET_FOLDER, "images")
+    if not os.path.exists(global_asset_dir):
+        os.mkdir(global_asset_dir)
+    if os.path.isfile(os.path.join(global_asset_dir, path)):
+        return os.path.join(global_asset_dir, path), True
+    if len(show_file_path) > 0:
+        potential_file_path = os.path.join(os.path.dirname(os.path.abspath(show_file_path)), path)
+        if os.path.isfile(potential_file_path):
+            return potential_file_path, False
+        return path, False
+    logger.error("Could not find asset of type image based on path '%s'. "
+                 "Searched global asset directory: %s", path, global_asset_dir)
+    return None, False
+
+
+def decode_image(path: str | None) -> tuple[QImage, QImage]:
+    """Decode an image and scale down its thumbnail.
+
+    Only QImage is used, thus this function may be called from worker threads.
+
+    Args:
+        path: The resolved path of the image or None to use the placeholder.
+
+    Returns:
+        The image and its scaled thumbnail image.
+
+    """
+    image = QImage(path) if path is not None else _NO_IMAGE_FOUND_PLACEHOLDER
+    resized_image = image.scaled(
+        64, 64,
+        Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+        Qt.TransformationMode.SmoothTransformation
+    )
+    return image, resized_image
+
+
 class LocalImage(AbstractImageAsset):
     """An image located in a local file."""
 
-    def __init__(self, path: str, uuid: str = "", show_file_path: str = "") -> None:
+    def __init__(self, path: str, uuid: str = "", show_file_path: str = "",
+                 decoded_image: tuple[QImage, QImage] | None = None) -> None:
         """Load and register an image located in a local file.
 
         Args:
             path: The path to the local file.
             uuid: The UUID of the asset.
             show_file_path: The path to the current show file. Leave as empty string if none is loaded.
+            decoded_image: The result of `decode_image` if the image was already decoded by a worker.
 
         """
         super().__init__(uuid)
         self._path = path
-        self._is_shared_path = False
-        if not os.path.isfile(path):
-            global_asset_dir = os.path.join(GLOBAL_ASSET_FOLDER, "images")
-            if not os.path.exists(global_asset_dir):
-                os.mkdir(global_asset_dir)
-            if os.path.isfile(os.path.join(global_asset_dir, path)):
-                path = os.path.join(global_asset_dir, path)
-                self._is_shared_path = True
-            elif len(show_file_path) > 0:
-                potential_file_path = os.path.join(os.path.dirname(os.path.abspath(show_file_path)), path)
-                if os.path.isfile(potential_file_path):
-                    path = potential_file_path
-            else:
-                path = None
-                logger.error("Could not find asset of type image based on path '%s'. "
-                             "Searched global asset directory: %s", path, global_asset_dir)
-        if path is not None:
-            self._image: QImage = QImage(path)
-        else:
-            self._image: QImage = _NO_IMAGE_FOUND_PLACEHOLDER
-        resized_image = self._image.scaled(
-            64, 64,
-            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self._thumbnail = QPixmap.fromImage(resized_image)
+        resolved_path, self._is_shared_path = resolve_image_path(path, show_file_path)
+        if decoded_image is None:
+            decoded_image = decode_image(resolved_path)
+        self._image: QImage = decoded_image[0]
+        self._thumbnail = QPixmap.fromImage(decoded_image[1])
 
     @override
     def get_image_for_ui(self) -> QImage:
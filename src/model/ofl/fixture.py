@@ -6,7 +6,8 @@
 import math
 import os
 import random
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 from enum import IntFlag
 from logging import getLogger
 from typing import TYPE_CHECKING, Final
@@ -57,18 +58,66 @@ def __str__(self) -> str:
         return "+".join(s)
 
 
+FIXTURE_CACHE_SIZE: Final[int] = 256
+"""Number of validated fixture definitions kept in memory."""
+
+_fixture_cache: OrderedDict[str, tuple[tuple[int, int], OflFixture]] = OrderedDict()
+_fixture_cache_lock = threading.Lock()
+
+
+def file_stamp(file: str) -> tuple[int, int]:
+    """Get the modification time and size of a file, used to detect changed fixture definitions."""
+    stat = os.stat(file)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def clear_fixture_cache() -> None:
+    """Drop all cached fixture definitions."""
+    with _fixture_cache_lock:
+        _fixture_cache.clear()
+
+
 def load_fixture(file: str) -> OflFixture:
-    """Load fixture from OFL JSON."""
+    """Load fixture from OFL JSON.
+
+    Validated definitions are kept in a LRU cache shared by path. As the models are immutable, all users of the same
+    fixture file get the same instance. A cached definition is reloaded if the file changed on disk. This function
+    may be called from worker threads.
+
+    Args:
+        file: Path to the fixture definition.
+
+    Returns:
+        The validated fixture definition.
+
+    Raises:
+        FixtureDefNotFoundError: The file does not exist or is no valid JSON.
+
+    """
     if not os.path.isfile(file):
         logger.error("Fixture definition %s not found.", file)
         raise FixtureDefNotFoundError(file, "Path is no file. Does it exist?")
+    key = os.path.normpath(file)
+    stamp = file_stamp(key)
+    with _fixture_cache_lock:
+        cached = _fixture_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            _fixture_cache.move_to_end(key)
+            return cached[1]
     with open(file, "r", encoding="UTF-8") as f:
         try:
             ob: dict = json.load(f)
         except json.decoder.JSONDecodeError as e:
             logger.error("Fixture definition (%s) JSON error: %s", file, e)
+            raise FixtureDefNotFoundError(file, str(e)) from e
     ob.update({"fileName": file.split("/fixtures/")[1]})
-    return OflFixture.model_validate(ob)
+    fixture = OflFixture.model_validate(ob)
+    with _fixture_cache_lock:
+        _fixture_cache[key] = (stamp, fixture)
+        _fixture_cache.move_to_end(key)
+        while len(_fixture_cache) > FIXTURE_CACHE_SIZE:
+            _fixture_cache.popitem(last=False)
+    return fixture
 
 
 def _load_colorwheel_mappings(f: OflFixture, channels: list[FixtureChannel]) -> \
@@ -109,6 +158,7 @@ class UsedFixture(QtCore.QObject):
     """Fixture in use with a specific mode."""
 
     static_data_changed: QtCore.Signal = QtCore.Signal()
+    address_changed: QtCore.Signal = QtCore.Signal(int, int)  # previous universe ID, previous start index
 
     def __init__(
         self,
@@ -234,7 +284,10 @@ def universe_id(self) -> int:
 
     @universe_id.setter
     def universe_id(self, universe_id: int) -> None:
+        previous_universe_id = self._universe_id
         self._universe_id = universe_id
+        if previous_universe_id != universe_id:
+            self.address_changed.emit(previous_universe_id, self._start_index)
 
     @property
     def channel_length(self) -> int:
@@ -4,12 +4,15 @@
 
 import json
 import os.path
-from typing import TYPE_CHECKING, LiteralString, NotRequired, TypedDict, cast
+from logging import getLogger
+from typing import Final, NotRequired, TypedDict, cast
 
-from model.ofl.fixture import load_fixture
+from model.ofl.fixture import file_stamp
 
-if TYPE_CHECKING:
-    from model.ofl.ofl_fixture import OflFixture
+logger = getLogger(__name__)
+
+FIXTURE_INDEX_VERSION: Final[int] = 1
+"""Format version of the on-disk fixture index. Indices of other versions are rebuilt."""
 
 
 class Manufacture(TypedDict):
@@ -21,20 +24,117 @@ class Manufacture(TypedDict):
     rdmID: NotRequired[int]
 
 
-def generate_manufacturers(fixture_directory: LiteralString) -> list[tuple[Manufacture, list[OflFixture]]]:
-    """generate all Manufactures"""
+class FixtureSummary(TypedDict):
+    """Pre-parsed summary of a fixture definition, enough to list the fixture without loading it."""
+
+    file: str
+    """Absolute path of the fixture definition."""
+
+    name: str
+    shortName: str
+    categories: list[str]
+    modes: list[str]
+    """Names of the DMX modes, in definition order."""
+
+
+def _summarize_fixture(fixture_file: str) -> FixtureSummary | None:
+    """Build the summary of a fixture definition from its raw JSON.
+
+    Args:
+        fixture_file: Path to the fixture definition.
+
+    Returns:
+        The summary or None if the file is no valid fixture definition.
+
+    """
+    try:
+        with open(fixture_file, "r", encoding="UTF-8") as f:
+            ob: dict = json.load(f)
+        return FixtureSummary(
+            file=fixture_file,
+            name=ob["name"],
+            shortName=ob.get("shortName", ""),
+            categories=list(ob.get("categories", [])),
+            modes=[mode["name"] for mode in ob.get("modes", [])],
+        )
+    except (OSError, json.decoder.JSONDecodeError, KeyError, TypeError) as e:
+        logger.error("Failed to index fixture definition %s: %s", fixture_file, e)
+        return None
+
+
+def _read_index(index_file: str) -> dict[str, dict]:
+    """Read the cached fixture summaries, keyed by path relative to the fixture directory."""
+    try:
+        with open(index_file, "r", encoding="UTF-8") as f:
+            ob: dict = json.load(f)
+    except (OSError, json.decoder.JSONDecodeError):
+        return {}
+    if not isinstance(ob, dict) or ob.get("version") != FIXTURE_INDEX_VERSION:
+        return {}
+    return ob.get("fixtures", {})
+
+
+def _write_index(index_file: str, entries: dict[str, dict]) -> None:
+    """Atomically replace the on-disk fixture index."""
+    temp_file = index_file + ".tmp"
+    try:
+        with open(temp_file, "w", encoding="UTF-8") as f:
+            json.dump({"version": FIXTURE_INDEX_VERSION, "fixtures": entries}, f)
+        os.replace(temp_file, index_file)
+    except OSError as e:
+        logger.warning("Failed to write fixture index %s: %s", index_file, e)
+
+
+def generate_manufacturers(
+    fixture_directory: str, index_file: str | None = None
+) -> list[tuple[Manufacture, list[FixtureSummary]]]:
+    """Generate all manufacturers together with the summaries of their fixtures.
+
+    The summaries are cached in an index file. An entry is only rebuilt if the modification time or size of its
+    fixture definition changed. The fixture definitions themselves are not validated here; use
+    `model.ofl.fixture.load_fixture` with the summary's file once a fixture is actually needed.
+
+    Args:
+        fixture_directory: The directory of the extracted fixture library.
+        index_file: The location of the index. Defaults to `fixture_index.json` next to the fixture directory.
+
+    Returns:
+        The manufacturers and their fixture summaries.
+
+    """
+    if index_file is None:
+        index_file = os.path.join(os.path.dirname(os.path.normpath(fixture_directory)), "fixture_index.json")
+    cached_entries = _read_index(index_file)
+    entries: dict[str, dict] = {}
+    index_changed = False
+
     with open(os.path.join(fixture_directory, "manufacturers.json"), "r", encoding="UTF-8") as f:
         ob: dict = json.load(f)
     iter_manufactures = iter(ob)
     next(iter_manufactures)
-    manufactures: list[tuple[Manufacture, list[OflFixture]]] = []
+    manufactures: list[tuple[Manufacture, list[FixtureSummary]]] = []
     for o in iter_manufactures:
-        manufacturer_directory = os.path.join(os.path.join(fixture_directory, o))
-        fixtures = []
+        manufacturer_directory = os.path.join(fixture_directory, o)
+        fixtures: list[FixtureSummary] = []
         for filename in os.listdir(manufacturer_directory):
             fixture_file = os.path.join(manufacturer_directory, filename)
             # checking if it is a file
-            if os.path.isfile(fixture_file):
-                fixtures.append(load_fixture(fixture_file))
+            if not os.path.isfile(fixture_file):
+                continue
+            relative_path = os.path.join(o, filename)
+            stamp = list(file_stamp(fixture_file))
+            entry = cached_entries.get(relative_path)
+            if entry is None or entry.get("stamp") != stamp:
+                summary = _summarize_fixture(fixture_file)
+                if summary is None:
+                    continue
+                entry = {"stamp": stamp, "summary": summary}
+                index_changed = True
+            entry["summary"]["file"] = fixture_file
+            entries[relative_path] = entry
+            fixtures.append(cast("FixtureSummary", entry["summary"]))
         manufactures.append((cast("Manufacture", ob[o]), fixtures))
+
+    if index_changed or entries.keys() != cached_entries.keys():
+        _write_index(index_file, entries)
     return manufactures
@@ -0,0 +1,135 @@
+"""Address index of the fixtures patched into a universe."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from model.universe import NUMBER_OF_CHANNELS
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from model.ofl.fixture import UsedFixture
+
+
+class UniverseFixtureIndex:
+    """Owner map of the channels of a single universe.
+
+    Every one of the 512 slots stores the fixture that occupies the channel. If fixtures overlap, the slot is
+    owned by the fixture that was inserted last, but every fixture is counted in the occupancy counter. Lookups by
+    address are O(1). Occupancy and free range queries are vectorized over the 512 slots.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty universe index."""
+        self._owners: list[UsedFixture | None] = [None] * NUMBER_OF_CHANNELS
+        self._occupancy: NDArray[np.int_] = np.zeros(NUMBER_OF_CHANNELS, dtype=np.int16)
+        self._fixtures: set[UsedFixture] = set()
+
+    def __len__(self) -> int:
+        """Return the number of fixtures in the universe."""
+        return len(self._fixtures)
+
+    @staticmethod
+    def _channel_range(start_index: int, channel_length: int) -> range:
+        return range(max(start_index, 0), min(start_index + channel_length, NUMBER_OF_CHANNELS))
+
+    def add(self, fixture: UsedFixture, start_index: int | None = None) -> None:
+        """Insert a fixture into the index.
+
+        Args:
+            fixture: The fixture to insert.
+            start_index: The start address to use. Defaults to the start index of the fixture.
+
+        """
+        if start_index is None:
+            start_index = fixture.start_index
+        channels = self._channel_range(start_index, fixture.channel_length)
+        for channel in channels:
+            self._owners[channel] = fixture
+        self._occupancy[channels.start:channels.stop] += 1
+        self._fixtures.add(fixture)
+
+    def remove(self, fixture: UsedFixture, start_index: int | None = None) -> None:
+        """Remove a fixture from the index.
+
+        Args:
+            fixture: The fixture to remove.
+            start_index: The start address the fixture was inserted with. Defaults to its current start index.
+
+        """
+        if fixture not in self._fixtures:
+            return
+        if start_index is None:
+            start_index = fixture.start_index
+        self._fixtures.discard(fixture)
+        channels = self._channel_range(start_index, fixture.channel_length)
+        self._occupancy[channels.start:channels.stop] -= 1
+        for channel in channels:
+            if self._owners[channel] is fixture:
+                self._owners[channel] = None
+        if any(self._occupancy[channels.start:channels.stop]):
+            # Restore the owners of overlapping fixtures
+            for other in self._fixtures:
+                other_channels = self._channel_range(other.start_index, other.channel_length)
+                if other_channels.start < channels.stop and channels.start < other_channels.stop:
+                    for channel in range(max(channels.start, other_channels.start),
+                                         min(channels.stop, other_channels.stop)):
+                        if self._owners[channel] is None:
+                            self._owners[channel] = other
+
+    def fixture_at(self, channel: int) -> UsedFixture | None:
+        """Get the fixture occupying a channel.
+
+        Args:
+            channel: The 0-indexed channel address.
+
+        Returns:
+            The fixture or None if the channel is free.
+
+        """
+        if not (0 <= channel < NUMBER_OF_CHANNELS):
+            return None
+        return self._owners[channel]
+
+    def occupied_channels(self) -> NDArray[np.int_]:
+        """Return the sorted addresses of all occupied channels."""
+        return np.flatnonzero(self._occupancy)
+
+    def overlapping_fixtures(self, start_index: int, channel_length: int) -> set[UsedFixture]:
+        """Return the fixtures occupying any channel of the given range.
+
+        Args:
+            start_index: The first channel of the range.
+            channel_length: The number of channels in the range.
+
+        """
+        channels = self._channel_range(start_index, channel_length)
+        if not self._occupancy[channels.start:channels.stop].any():
+            return set()
+        return {
+            other for other in self._fixtures
+            if other.start_index < channels.stop and channels.start < other.start_index + other.channel_length
+        }
+
+    def find_free_range(self, channel_length: int, start_index: int = 0) -> int | None:
+        """Find the first block of consecutive free channels.
+
+        Args:
+            channel_length: The number of consecutive channels required.
+            start_index: The first address to consider.
+
+        Returns:
+            The start address of the free block or None if there is no such block.
+
+        """
+        if channel_length <= 0:
+            return start_index
+        free = np.concatenate(([0], np.cumsum(self._occupancy[start_index:] == 0)))
+        # free[i + n] - free[i] equals n if the n channels starting at i are all free
+        candidates = np.flatnonzero(free[channel_length:] - free[:-channel_length] == channel_length)
+        if len(candidates) == 0:
+            return None
+        return start_index + int(candidates[0])
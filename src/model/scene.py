@@ -4,16 +4,21 @@
 
 from typing import TYPE_CHECKING, NamedTuple, override
 
+import numpy as np
 from PySide6.QtCore import QObject, Signal
 
-from .universe import Universe
+from .universe import NUMBER_OF_CHANNELS, Universe
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from .board_configuration import BoardConfiguration
     from .control_desk import BankSet
     from .filter import Filter
     from .ui_configuration import UIPage
 
+_NO_DEFAULT_VALUE: int = -1
+
 
 class FilterPage:
     """Filter page in a Scene."""
@@ -90,7 +95,8 @@ def __init__(self, scene_id: int, human_readable_name: str, board_configuration:
         self._filter_pages: list[FilterPage] = []
         self._associated_bankset: BankSet | None = None
         self._ui_pages: list[UIPage] = []
-        self._dmx_default_values: list[DmxDefaultValue] = []
+        # Dense value array per universe ID. Channels without a default value are marked with _NO_DEFAULT_VALUE.
+        self._dmx_default_values: dict[int, np.ndarray] = {}
 
     @property
     def scene_id(self) -> int:
@@ -134,8 +140,45 @@ def pages(self) -> list[FilterPage]:
 
     @property
     def dmx_default_values(self) -> list[DmxDefaultValue]:
-        """Get the list of default values to be applied on scene switch."""
-        return self._dmx_default_values.copy()
+        """Get the list of default values to be applied on scene switch.
+
+        The values are sorted by their universe and channel.
+        """
+        default_values: list[DmxDefaultValue] = []
+        for universe_id in sorted(self._dmx_default_values):
+            values = self._dmx_default_values[universe_id]
+            channels = np.flatnonzero(values != _NO_DEFAULT_VALUE)
+            default_values.extend(
+                DmxDefaultValue(universe_id, channel, value)
+                for channel, value in zip(channels.tolist(), values[channels].tolist(), strict=True)
+            )
+        return default_values
+
+    def get_dmx_default_value(self, universe: Universe | int, channel: int) -> int | None:
+        """Get the default value of a channel.
+
+        Args:
+            universe: target universe or its ID.
+            channel: target channel.
+
+        Returns:
+            The default value or None if the channel has no default value.
+
+        """
+        universe_id = universe.id if isinstance(universe, Universe) else universe
+        values = self._dmx_default_values.get(universe_id)
+        if values is None or values[channel] == _NO_DEFAULT_VALUE:
+            return None
+        return int(values[channel])
+
+    def _get_default_value_array(self, universe_id: int, channel: int) -> np.ndarray:
+        if not (0 <= channel < NUMBER_OF_CHANNELS):
+            raise ValueError(f"Tried to set a default value for channel {channel} of universe {universe_id}.")
+        values = self._dmx_default_values.get(universe_id)
+        if values is None:
+            values = np.full(NUMBER_OF_CHANNELS, _NO_DEFAULT_VALUE, dtype=np.int16)
+            self._dmx_default_values[universe_id] = values
+        return values
 
     def insert_dmx_default_value(self, universe: Universe | int, channel: int, value: int,
                                  supress_emission: bool = False) -> bool:
@@ -155,16 +198,35 @@ def insert_dmx_default_value(self, universe: Universe | int, channel: int, value
 
         """
         universe_id = universe.id if isinstance(universe, Universe) else universe
-        value_to_remove = None
-        for existing_value in self._dmx_default_values:
-            if existing_value.universe_id == universe_id and existing_value.channel == channel:
-                value_to_remove = existing_value
-        if value_to_remove is not None:
-            self._dmx_default_values.remove(value_to_remove)
-        self._dmx_default_values.append(DmxDefaultValue(universe_id, channel, value))
+        values = self._get_default_value_array(universe_id, channel)
+        value_existed = values[channel] != _NO_DEFAULT_VALUE
+        values[channel] = value
+        if not supress_emission:
+            self.default_values_changed.emit()
+        return bool(value_existed)
+
+    def insert_dmx_default_values(self, universe: Universe | int, values: np.ndarray | Sequence[int],
+                                  start_channel: int = 0, supress_emission: bool = False) -> None:
+        """Add or update the default values of a channel range at once.
+
+        This can be used to capture a snapshot of a whole universe.
+
+        Args:
+            universe: target universe or its ID.
+            values: The values to set on scene entry, starting at start_channel.
+            start_channel: The channel of the first value.
+            supress_emission: If this is enabled to change signal will be enabled. Only use this if you're certain
+                            you're taking care of all updates yourself.
+
+        """
+        universe_id = universe.id if isinstance(universe, Universe) else universe
+        end_channel = start_channel + len(values)
+        if end_channel > NUMBER_OF_CHANNELS:
+            raise ValueError(f"Tried to set default values up to channel {end_channel - 1} of universe {universe_id}.")
+        default_values = self._get_default_value_array(universe_id, start_channel)
+        default_values[start_channel:end_channel] = values
         if not supress_emission:
             self.default_values_changed.emit()
-        return value_to_remove is not None
 
     def remove_dmx_default_value(self, universe: Universe | int, channel: int, supress_emission: bool = False) -> None:
         """Remove a default DMX value from the scene.
@@ -177,11 +239,11 @@ def remove_dmx_default_value(self, universe: Universe | int, channel: int, supre
 
         """
         universe_id = universe.id if isinstance(universe, Universe) else universe
-        values_to_remove = [val for val in self._dmx_default_values if
-                            val.universe_id == universe_id and val.channel == channel]
-        for item in values_to_remove:
-            self._dmx_default_values.remove(item)
-        if len(values_to_remove) > 0 and not supress_emission:
+        values = self._dmx_default_values.get(universe_id)
+        if values is None or values[channel] == _NO_DEFAULT_VALUE:
+            return
+        values[channel] = _NO_DEFAULT_VALUE
+        if not supress_emission:
             self.default_values_changed.emit()
 
     def insert_filterpage(self, fp: FilterPage) -> None:
@@ -231,36 +293,53 @@ def copy(self, existing_scenes: list[Scene]) -> Scene:
             existing_scenes: A list of scenes to check the new id against.
 
         """
+        used_ids = {s.scene_id for s in existing_scenes}
         chosen_id = len(existing_scenes)
-        id_check_passed: bool = False
-        while not id_check_passed:
-            for s in existing_scenes:
-                if chosen_id == s.scene_id:
-                    chosen_id *= 2
-                    break
-            id_check_passed = True
+        while chosen_id in used_ids:
+            chosen_id = chosen_id * 2 if chosen_id > 0 else 1
         scene = Scene(
             scene_id=chosen_id,
             human_readable_name=str(self.human_readable_name),
             board_configuration=self.board_configuration,
         )
-        for f in self._filters:
-            new_filter = f.copy(new_scene=scene)
-            scene.append_filter(new_filter)
+        scene._adopt_filters([f.copy(new_scene=scene) for f in self._filters])
         for fp in self._filter_pages:
             scene._filter_pages.append(fp.copy(scene))
         scene.linked_bankset = self._associated_bankset.copy()
         for page in self._ui_pages:
             scene._ui_pages.append(page.copy(scene))
-        for ddv in self._dmx_default_values:
-            scene._dmx_default_values.append(ddv)
+        for universe_id, values in self._dmx_default_values.items():
+            scene._dmx_default_values[universe_id] = values.copy()
         return scene
 
+    def _adopt_filters(self, filters: list[Filter]) -> None:
+        """Append filters of this scene in bulk.
+
+        The IDs are checked against the index in one pass. Only filters with colliding IDs take the regular path of
+        `append_filter`, which renames them.
+
+        Args:
+            filters: The filters to append. Their scene needs to be this scene already.
+
+        """
+        colliding: list[Filter] = []
+        for f in filters:
+            if f.filter_id in self._filter_index:
+                colliding.append(f)
+                continue
+            self._filters.append(f)
+            self._filter_index[f.filter_id] = f
+        for f in colliding:
+            self.append_filter(f)
+
     def get_filter_by_id(self, fid: str) -> Filter | None:
         """Get filter by filter ID."""
         f = self._filter_index.get(fid)
         if f:
             return f
+        if len(self._filter_index) == len(self._filters):
+            # The index covers every filter, so scanning them cannot find anything else
+            return None
         for f in self._filters:
             if f.filter_id == fid:
                 self._filter_index[fid] = f
@@ -297,7 +376,9 @@ def append_filter(self, f: Filter, filter_page_index: int = -1) -> None:
         """
         if f.scene and f.scene != self:
             raise Exception(f"This filter ({f.filter_id}) is already added to a scene other than this one")
-        if f.scene == self and f in self.filters:
+        if (f.scene == self
+                and (self._filter_index.get(f.filter_id) is f or len(self._filter_index) != len(self._filters))
+                and f in self._filters):
             return
         f.filter_id = self.ensure_name_uniqueness(f.filter_id)
         self._filters.append(f)
@@ -338,10 +419,10 @@ def notify_about_filter_rename_action(self, sender: Filter, old_id: str) -> None
                 widget.notify_id_rename(old_id, sender.filter_id)
 
     def sort_dmx_default_values(self) -> None:
-        """Sorts the dmx defaults by their universe and channel.
+        """Notify listeners about changed dmx defaults.
 
-        This improves human interaction and performance of fish.
+        The default values are always stored sorted by their universe and channel. Call this after inserting values
+        with suppressed emission.
 
         """
-        self._dmx_default_values.sort(key=lambda x: (x.universe_id * 512) + x.channel)
         self.default_values_changed.emit()
@@ -26,6 +26,12 @@ class UIWidget(ABC):
     This class represents a link between an interactable widget on a page and the corresponding filter.
     """
 
+    coalesce_updates: bool = False
+    """Whether the updates of this widget are states, so that a newer update may replace a pending one.
+
+    Widgets sending commands need to keep this disabled, as every single update needs to reach fish.
+    """
+
     def __init__(self, parent_page: UIPage, configuration: dict[str, str] | None = None) -> None:
         """Set up the basic components of a widget.
 
@@ -211,7 +217,9 @@ def push_update(self) -> None:
                 k = split_key[1]
             else:
                 target_fid = self.filter_ids[0]
-            self._network_manager.send_gui_update_to_fish(self.parent.scene.scene_id, target_fid, k, v)
+            self._network_manager.send_gui_update_to_fish(
+                self.parent.scene.scene_id, target_fid, k, v, coalesce=self.coalesce_updates
+            )
 
     def close(self) -> None:
         """Implement this method to react on the widget being removed from the widget holder."""
@@ -1,5 +1,9 @@
 """DMX Universe."""
-from typing import Final
+from collections.abc import Iterator, Sequence
+from typing import overload
+
+import numpy as np
+from PySide6 import QtCore
 
 import proto.UniverseControl_pb2
 from model.broadcaster import Broadcaster
@@ -8,8 +12,58 @@
 NUMBER_OF_CHANNELS: int = 512
 
 
+class _UniverseSignals(QtCore.QObject):
+    """Signals of a universe.
+
+    The universe itself is not a QObject. Thus, its signals are stored in this helper object.
+    """
+
+    values_changed: QtCore.Signal = QtCore.Signal(int, int)  # first changed channel, number of channels
+
+
+class _ChannelList(Sequence[Channel]):
+    """Sequence of channel facades that are only created once they are accessed."""
+
+    def __init__(self, universe: "Universe") -> None:
+        self._universe = universe
+        self._channels: list[Channel | None] = [None] * NUMBER_OF_CHANNELS
+
+    def __len__(self) -> int:
+        return NUMBER_OF_CHANNELS
+
+    @overload
+    def __getitem__(self, index: int) -> Channel: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Channel]: ...
+
+    def __getitem__(self, index: int | slice) -> Channel | list[Channel]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(NUMBER_OF_CHANNELS))]
+        channel = self._channels[index]
+        if channel is None:
+            if index < 0:
+                index += NUMBER_OF_CHANNELS
+            channel = Channel(self._universe, index)
+            self._channels[index] = channel
+        return channel
+
+    def __iter__(self) -> Iterator[Channel]:
+        for i in range(NUMBER_OF_CHANNELS):
+            yield self[i]
+
+    def created(self, address: int) -> Channel | None:
+        """Return the channel facade of an address if it was already created."""
+        return self._channels[address]
+
+
 class Universe:
-    """DMX universe with 512 channels."""
+    """DMX universe with 512 channels.
+
+    The channel values are stored in a single uint8 array. Changes are tracked in a dirty mask and announced using
+    the values_changed signal, which carries the changed channel range. Channel objects are only created for
+    channels that are accessed through the channels property.
+    """
 
     def __init__(self, universe_proto: proto.UniverseControl_pb2.Universe) -> None:
         """Initialize universe model using provided protobuf definition.
@@ -20,8 +74,10 @@ def __init__(self, universe_proto: proto.UniverseControl_pb2.Universe) -> None:
         """
         self._broadcaster = Broadcaster()
         self._universe_proto: proto.UniverseControl_pb2 = universe_proto
-        self._channels: Final[list[Channel]] = [Channel(self, channel_address) for channel_address in
-                                                range(NUMBER_OF_CHANNELS)]
+        self._values: np.ndarray = np.zeros(NUMBER_OF_CHANNELS, dtype=np.uint8)
+        self._dirty: np.ndarray = np.zeros(NUMBER_OF_CHANNELS, dtype=np.bool_)
+        self._signals: _UniverseSignals = _UniverseSignals()
+        self._channels: _ChannelList = _ChannelList(self)
 
         self._name = f"Universe {self.universe_proto.id + 1}"
         self._description = self.name
@@ -37,10 +93,107 @@ def universe_proto(self, proto_: proto.UniverseControl_pb2.Universe) -> None:
         self._universe_proto = proto_
 
     @property
-    def channels(self) -> list[Channel]:
-        """List of all 512 dmx channels belonging to the Universe."""
+    def channels(self) -> Sequence[Channel]:
+        """Sequence of all 512 dmx channels belonging to the Universe."""
         return self._channels
 
+    @property
+    def values_changed(self) -> QtCore.Signal:
+        """Signal emitted with the first changed channel and the number of channels in the changed range."""
+        return self._signals.values_changed
+
+    @property
+    def values(self) -> np.ndarray:
+        """Read-only view of the current channel values.
+
+        The view is not copied and reflects later changes to the universe.
+        """
+        view = self._values.view()
+        view.flags.writeable = False
+        return view
+
+    def get_value(self, address: int) -> int:
+        """Get the value of a single channel.
+
+        Args:
+            address: The 0-indexed channel address.
+
+        """
+        return int(self._values[address])
+
+    def set_value(self, address: int, value: int) -> None:
+        """Update the value of a single channel.
+
+        Args:
+            address: The 0-indexed channel address.
+            value: The new value. Must be between 0 and 255.
+
+        Raises:
+            ValueError: The value is below 0 or above 255.
+
+        """
+        if not (0 <= value <= 255):
+            raise ValueError(f"Tried to set channel {address} to {value}.")
+        self._values[address] = value
+        self._dirty[address] = True
+        channel = self._channels.created(address)
+        if channel is not None:
+            channel.updated.emit(value)
+        self._signals.values_changed.emit(address, 1)
+
+    def get_values(self, start: int = 0, stop: int = NUMBER_OF_CHANNELS) -> np.ndarray:
+        """Get a copy of the values of a channel range.
+
+        Args:
+            start: The first channel of the range.
+            stop: The channel after the last channel of the range.
+
+        """
+        return self._values[start:stop].copy()
+
+    def set_values(self, values: np.ndarray | Sequence[int], start: int = 0) -> None:
+        """Update the values of a channel range at once.
+
+        Only channel objects whose value changed emit their updated signal. The values_changed signal is emitted
+        once for the whole range.
+
+        Args:
+            values: The new values. Every value must be between 0 and 255.
+            start: The address of the first channel to update.
+
+        Raises:
+            ValueError: A value is below 0 or above 255 or the range exceeds the universe.
+
+        """
+        new_values = np.asarray(values)
+        stop = start + len(new_values)
+        if start < 0 or stop > NUMBER_OF_CHANNELS:
+            raise ValueError(f"Tried to set channels {start} to {stop - 1} of a universe.")
+        if len(new_values) == 0:
+            return
+        if new_values.min() < 0 or new_values.max() > 255:
+            raise ValueError(f"Tried to set channels {start} to {stop - 1} to values outside of 0 to 255.")
+        new_values = new_values.astype(np.uint8, copy=False)
+        changed = np.flatnonzero(self._values[start:stop] != new_values)
+        self._values[start:stop] = new_values
+        self._dirty[start:stop] = True
+        for offset in changed:
+            channel = self._channels.created(start + int(offset))
+            if channel is not None:
+                channel.updated.emit(int(new_values[offset]))
+        self._signals.values_changed.emit(start, stop - start)
+
+    @property
+    def has_dirty_channels(self) -> bool:
+        """Return true if channels changed since the dirty mask was last taken."""
+        return bool(self._dirty.any())
+
+    def take_dirty_mask(self) -> np.ndarray:
+        """Return the mask of channels changed since the last call and reset it."""
+        mask = self._dirty.copy()
+        self._dirty[:] = False
+        return mask
+
     @property
     def id(self) -> int:
         """ID of the universe."""
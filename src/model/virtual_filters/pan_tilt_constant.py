@@ -3,9 +3,8 @@
 
 import typing
 
-from PySide6.QtCore import QTimer
-
 from controller.joystick.joystick_enum import JoystickList
+from controller.utils.frame_clock import get_frame_clock
 from model import Broadcaster, Scene
 from model.filter import DataType, Filter, FilterTypeEnumeration, VirtualFilter
 
@@ -14,6 +13,12 @@
 
     from view.show_mode.show_ui_widgets import PanTiltConstantControlUIWidget
 
+_UPDATE_INTERVAL_MS: int = 50
+"""Interval between two applications of the joystick deltas while a joystick is selected."""
+
+_DELTA_SCALE: float = 0.01
+"""Change of pan or tilt per update at a delta of 1."""
+
 
 class PanTiltConstantFilter(VirtualFilter):
     """Virtual filter providing combined constants for pan and tilt."""
@@ -31,10 +36,6 @@ def __init__(self, scene: Scene, filter_id: str, pos: tuple[int] | None = None)
         self._broadcaster.joystick_selected_event.connect(lambda joystick: self.set_joystick(
             JoystickList.NO_JOYSTICK if joystick == self._joystick else self._joystick))
 
-        # Todo: maybe use timer in broadcaster
-        self._timer = QTimer()
-        self._timer.setInterval(50)
-        self._timer.timeout.connect(self._update_time_passed)
         self.observer: dict[PanTiltConstantControlUIWidget, Callable[[], None]] = {}
 
     @typing.override
@@ -155,8 +156,8 @@ def eight_bit_available(self) -> bool:
         return self._filter_configurations["outputs"] == "both" or self._filter_configurations["outputs"] == "8bit"
 
     def _update_time_passed(self) -> None:
-        self._pan = min(max(self._pan + 0.01 * self._pan_delta, 0.0), 1.0)
-        self._tilt = min(max(self._tilt + 0.01 * self._tilt_delta, 0.0), 1.0)
+        self._pan = min(max(self._pan + _DELTA_SCALE * self._pan_delta, 0.0), 1.0)
+        self._tilt = min(max(self._tilt + _DELTA_SCALE * self._tilt_delta, 0.0), 1.0)
         self._notify_observer()
 
     def register_observer(self, obs: PanTiltConstantControlUIWidget, callback: Callable[[], None]) -> None:
@@ -176,9 +177,10 @@ def joystick(self) -> JoystickList:
     def joystick(self, joystick: JoystickList) -> None:
         if joystick != self._joystick:
             if joystick == JoystickList.NO_JOYSTICK:
-                self._timer.stop()
+                get_frame_clock().unsubscribe(self._update_time_passed)
             elif self._joystick == JoystickList.NO_JOYSTICK:
-                self._timer.start()
+                get_frame_clock().subscribe(self._update_time_passed, _UPDATE_INTERVAL_MS,
+                                            f"PanTiltConstantFilter {self.filter_id}")
                 self._pan_delta = 0.0
                 self._tilt_delta = 0.0
             self._broadcaster.joystick_selected_event.emit(joystick)
@@ -1,17 +1,30 @@
-""" logging Handler to broadcast formatted log massages"""
+""" logging Handler to hand log records to the logging view"""
 from logging import Handler, LogRecord
+from typing import override
 
-from model.broadcaster import Broadcaster
+from controller.utils.log_buffer import LogEntry, get_log_transport
 
 
 class SignalLoging(Handler):
-    """logging_view Handler"""
+    """logging_view Handler
+
+    Records are captured as `LogEntry` tuples and put into the log transport, which the logging view drains
+    periodically. Records below the level displayed by the logging view are dropped before they are captured, unless
+    they were received from Fish. See `LogTransport.accepts`.
+    """
 
     def __init__(self) -> None:
         super().__init__()
-        self._broadcaster = Broadcaster()
+        self._transport = get_log_transport()
+
+    @override
+    def handle(self, record: LogRecord) -> bool:
+        # The transport is thread safe on its own, so the handler lock is not needed
+        if not self._transport.accepts(record) or not self.filter(record):
+            return False
+        self.emit(record)
+        return True
 
     def emit(self, record: LogRecord) -> None:
         """emit logging message"""
-        msg: str = self.format(record)
-        self._broadcaster.log_message.emit(msg)
+        self._transport.put(LogEntry.from_record(record, self.formatter))
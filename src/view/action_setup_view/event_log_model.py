@@ -0,0 +1,173 @@
+"""Item model presenting the event log to a table view."""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import TYPE_CHECKING, override
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, QPersistentModelIndex, Qt
+from PySide6.QtGui import QBrush, QColor
+from tzlocal import get_localzone
+
+import proto.Events_pb2
+from model.events import get_sender_by_id
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from controller.utils.event_log import EventLog, EventLogEntry
+    from proto.Events_pb2 import event
+
+_HEADERS: tuple[str, ...] = ("Name", "Event ID", "Sender:Function", "Type", "Arguments", "Count", "Received")
+_NAME_COLUMN = 0
+_ROOT = QModelIndex()
+
+EVENT_TYPE_NAMES: dict[int, str] = {
+    proto.Events_pb2.ONGOING_EVENT: "Ongoing",
+    proto.Events_pb2.START: "Start",
+    proto.Events_pb2.RELEASE: "End",
+    proto.Events_pb2.SINGLE_TRIGGER: "Single",
+}
+"""Display names of the event types."""
+
+_event_type_brush: dict[int, QBrush] = {
+    proto.Events_pb2.START: QBrush(QColor(0x00, 0xA0, 0x00)),
+    proto.Events_pb2.RELEASE: QBrush(QColor(0xFF, 0x00, 0x00)),
+}
+
+
+def format_time(timestamp: float) -> str:
+    """Format a POSIX time stamp as local time of day with milliseconds."""
+    return dt.datetime.fromtimestamp(timestamp, tz=get_localzone()).strftime("%H:%M:%S.%f")[:-3]
+
+
+def _event_name(entry: EventLogEntry) -> str:
+    sender = get_sender_by_id(entry.sender_id)
+    if sender is None:
+        return ""
+    return sender.renamed_events.get(entry.event_tuple, "")
+
+
+class EventLogModel(QAbstractTableModel):
+    """Table model over the entries of an event log.
+
+    Each entry is a row. Rows are only rendered on demand by the view, so the cost of the model depends on the visible
+    rows and not on the number of logged events.
+    """
+
+    def __init__(self, log: EventLog, parent: QObject | None = None) -> None:
+        """Initialize the model.
+
+        Args:
+            log: The log holding the entries.
+            parent: The Qt parent of the model.
+
+        """
+        super().__init__(parent)
+        self._log = log
+
+    @property
+    def log(self) -> EventLog:
+        """The log presented by this model."""
+        return self._log
+
+    def add_events(self, events: Sequence[tuple[event, float]]) -> None:
+        """Add received events to the log and update the rows.
+
+        Rows of aggregated entries are updated in place, rows of evicted entries are removed and rows for new entries
+        are inserted at the end.
+
+        Args:
+            events: Pairs of an event and the POSIX time stamp it was received at, in the order of reception.
+
+        """
+        if not events:
+            return
+        fresh, updated = self._log.collect(events)
+        first = self._log.first_sequence
+        for sequence in updated:
+            self.dataChanged.emit(self.index(sequence - first, 0), self.index(sequence - first, len(_HEADERS) - 1))
+        fresh = fresh[-self._log.capacity:]
+        if not fresh:
+            return
+        evicted = self._log.evictions(len(fresh))
+        if evicted > 0:
+            self.beginRemoveRows(_ROOT, 0, evicted - 1)
+            self._log.discard_oldest(evicted)
+            self.endRemoveRows()
+        self.beginInsertRows(_ROOT, len(self._log), len(self._log) + len(fresh) - 1)
+        self._log.append(fresh)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.beginResetModel()
+        self._log.clear()
+        self.endResetModel()
+
+    def set_capacity(self, capacity: int) -> None:
+        """Change the maximum number of entries, keeping the newest ones."""
+        evicted = max(0, len(self._log) - capacity)
+        if evicted > 0:
+            self.beginRemoveRows(_ROOT, 0, evicted - 1)
+            self._log.discard_oldest(evicted)
+            self.endRemoveRows()
+        self._log.resize(capacity)
+
+    def names_changed(self, sender_id: int) -> None:
+        """Update the displayed event names after the renamed events of a sender changed."""
+        if len(self._log) == 0:
+            return
+        first = self._log.first_sequence
+        rows = [s - first for s in range(first, self._log.next_sequence) if self._log[s].sender_id == sender_id]
+        if rows:
+            self.dataChanged.emit(self.index(rows[0], _NAME_COLUMN), self.index(rows[-1], _NAME_COLUMN))
+
+    def entry(self, index: QModelIndex | QPersistentModelIndex) -> EventLogEntry | None:
+        """Get the entry of a row."""
+        if not index.isValid():
+            return None
+        return self._log[self._log.first_sequence + index.row()]
+
+    @override
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = _ROOT) -> int:
+        return 0 if parent.isValid() else len(self._log)
+
+    @override
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = _ROOT) -> int:
+        return 0 if parent.isValid() else len(_HEADERS)
+
+    @override
+    def data(self, index: QModelIndex | QPersistentModelIndex,
+             role: int = Qt.ItemDataRole.DisplayRole) -> str | QBrush | None:
+        if not index.isValid():
+            return None
+        entry = self.entry(index)
+        column = index.column()
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return _event_type_brush.get(entry.event_type) if column == 3 else None
+        if role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return None
+        match column:
+            case 0:
+                return _event_name(entry)
+            case 1:
+                return str(entry.event_id)
+            case 2:
+                return f"[{entry.sender_id}:{entry.sender_function}]"
+            case 3:
+                return EVENT_TYPE_NAMES.get(entry.event_type, str(entry.event_type))
+            case 4:
+                return ", ".join([str(arg) for arg in entry.arguments])
+            case 5:
+                return str(entry.count)
+            case 6:
+                return format_time(entry.last_seen)
+        return None
+
+    @override
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> str | None:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return _HEADERS[section]
+        return None
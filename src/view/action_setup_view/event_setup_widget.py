@@ -1,9 +1,10 @@
 """Contains EventSetupWidget and required internal helper classes."""
 import os
+import time
 from logging import getLogger
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QModelIndex, Qt
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -12,6 +13,7 @@
     QDialogButtonBox,
     QFormLayout,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QListWidget,
@@ -20,6 +22,7 @@
     QSpinBox,
     QSplitter,
     QStackedLayout,
+    QTableView,
     QTableWidget,
     QTableWidgetItem,
     QToolBar,
@@ -27,12 +30,14 @@
     QWidget,
 )
 
-import proto.Events_pb2
+from controller.utils.event_log import EventLog
+from controller.utils.frame_clock import get_frame_clock
 from model import Broadcaster, events
 from model.events import EventSender, get_sender_by_id, mark_sender_persistent
 from proto.Events_pb2 import event
 from utility import resource_path
 from view.action_setup_view._audio_setup_widget import AudioSetupWidget
+from view.action_setup_view.event_log_model import EVENT_TYPE_NAMES, EventLogModel, format_time
 from view.show_mode.editor.show_browser.annotated_item import AnnotatedListWidgetItem, AnnotatedTableWidgetItem
 
 if TYPE_CHECKING:
@@ -44,16 +49,8 @@
 _keypad_icon = QIcon(resource_path(os.path.join("resources", "icons", "eventsource-keypad.svg")))
 _midi_icon = QIcon(resource_path(os.path.join("resources", "icons", "eventsource-midi.svg")))
 _midirtp_icon = QIcon(resource_path(os.path.join("resources", "icons", "eventsource-midirtp.svg")))
-_rename_icon = QIcon(resource_path(os.path.join("resources", "icons", "rename.svg")))
 _audio_icon = QIcon(resource_path(os.path.join("resources", "icons", "audio.svg")))
 
-_event_type_string: dict[proto.Events_pb2.event_type, str] = {
-    proto.Events_pb2.ONGOING_EVENT: "Ongoing",
-    proto.Events_pb2.START: "Start",
-    proto.Events_pb2.RELEASE: "End",
-    proto.Events_pb2.SINGLE_TRIGGER: "Single",
-}
-
 
 class _SenderConfigurationWidget(QScrollArea):
     """Widget containing the configuration of the current selected event sender."""
@@ -163,7 +160,7 @@ def _update_table(self) -> None:
             k, v = item
             name_item = AnnotatedTableWidgetItem(v)
             name_item.annotated_data = k
-            ev_type_item = QTableWidgetItem(_event_type_string.get(k[0], str(k[0])))
+            ev_type_item = QTableWidgetItem(EVENT_TYPE_NAMES.get(k[0], str(k[0])))
             ev_type_item.setFlags(ev_type_item.flags() & ~Qt.ItemFlag.ItemIsEditable & ~Qt.ItemFlag.ItemIsSelectable)
             s_function_item = QTableWidgetItem(str(k[1]))
             s_function_item.setFlags(
@@ -239,115 +236,6 @@ def __init__(self, parent: QWidget, sender: events.EventSender) -> None:
         self.setLayout(layout)
 
 
-class _EventLogListWidget(QWidget):
-    """Content widget for ListWidgetItems of logged events."""
-
-    _STYLE_ID_TAG = """
-    background-color: #B0B0B0;
-    color: #FFFFFF;
-    border-radius: 5px;
-    padding: 3px;
-    """
-
-    _STYLE_TAG_REGULAR = """
-    border-radius: 5px;
-    padding: 3px;
-    background-color: #B0B0B0;
-    border: 2px solid #262626;
-    color: #FFFFFF;
-    """
-
-    _STYLE_TAG_START = """
-    border-radius: 5px;
-    padding: 3px;
-    background-color: #B0B0B0;
-    border: 2px solid #262626;
-    color: #00A000;
-    """
-
-    _STYLE_TAG_RELEASE = """
-    border-radius: 5px;
-    padding: 3px;
-    background-color: #B0B0B0;
-    border: 2px solid #262626;
-    color: #FF0000;
-    """
-
-    def __init__(self, parent: QWidget, ev: event, b: Broadcaster) -> None:
-        super().__init__(parent=parent)
-        layout = QHBoxLayout()
-        self._id_label = QLabel(str(ev.event_id), parent=self)
-        self._id_label.setToolTip("Event ID")
-        self._id_label.setStyleSheet(_EventLogListWidget._STYLE_ID_TAG)
-        self._sender_label = QLabel(f"[{ev.sender_id}:{ev.sender_function}]", parent=self)
-        self._sender_label.setToolTip("Event Sender and function")
-        self._type_label = QLabel(_event_type_string.get(ev.type, ev.type), parent=self)
-        if ev.type == proto.Events_pb2.START:
-            self._type_label.setStyleSheet(_EventLogListWidget._STYLE_TAG_START)
-        elif ev.type == proto.Events_pb2.RELEASE:
-            self._type_label.setStyleSheet(_EventLogListWidget._STYLE_TAG_RELEASE)
-        else:
-            self._type_label.setStyleSheet(_EventLogListWidget._STYLE_TAG_REGULAR)
-        self._type_label.setToolTip("Event Type")
-        self._args_label = QLabel(", ".join([str(arg) for arg in ev.arguments]), parent=self)
-        self._args_label.setToolTip("Event Arguments")
-        self._add_rename_button = QPushButton(self)
-        self._add_rename_button.setFixedWidth(32)
-        self._add_rename_button.setIcon(_rename_icon)
-        self._add_rename_button.clicked.connect(self._add_rename_entry)
-        layout.addWidget(self._add_rename_button)
-        self._name_label = QLabel(self)
-        self._name_label.setVisible(False)
-        layout.addWidget(self._name_label)
-        intermediate_layout = QHBoxLayout()
-        intermediate_layout.addWidget(self._id_label)
-        intermediate_layout.addStretch()
-        layout.addLayout(intermediate_layout)
-        intermediate_layout = QHBoxLayout()
-        intermediate_layout.addWidget(self._sender_label)
-        intermediate_layout.addStretch()
-        layout.addLayout(intermediate_layout)
-        intermediate_layout = QHBoxLayout()
-        intermediate_layout.addWidget(self._type_label)
-        intermediate_layout.addStretch()
-        layout.addLayout(intermediate_layout)
-        intermediate_layout = QHBoxLayout()
-        intermediate_layout.addWidget(self._args_label)
-        intermediate_layout.addStretch()
-        layout.addLayout(intermediate_layout)
-        self.setLayout(layout)
-        self._event = ev
-        self._broadcaster = b
-        self._broadcaster.event_rename_action_occurred.connect(self._rename_occurred)
-        self._update_name_label()
-
-    def _add_rename_entry(self) -> None:
-        sender = get_sender_by_id(self._event.sender_id)
-        if sender is None:
-            return
-        sender.renamed_events[self._get_event_tuple()] = "New Event"
-        self._broadcaster.event_rename_action_occurred.emit(sender.index_on_fish)
-
-    def _get_event_tuple(self) -> tuple[int, int, str]:
-        return int(self._event.type), self._event.sender_function, "".join([chr(c) for c in self._event.arguments])
-
-    def _rename_occurred(self, sid: int) -> None:
-        if sid != self._event.sender_id:
-            return
-        self._update_name_label()
-
-    def _update_name_label(self) -> None:
-        sender = get_sender_by_id(self._event.sender_id)
-        name = sender.renamed_events.get(self._get_event_tuple())
-        if name is not None:
-            self._add_rename_button.setVisible(False)
-            self._add_rename_button.setEnabled(False)
-            self._name_label.setVisible(True)
-            self._name_label.setFixedWidth(32)
-            self._name_label.setText(name)
-            self._name_label.setToolTip(name)
-
-
 class _SenderAddDialog(QDialog):
     """Dialog to configure new event senders."""
 
@@ -386,6 +274,19 @@ def _apply(self) -> None:
         self.close()
 
 
+EVENT_LOG_CAPACITY: int = 5000
+"""Default maximum number of entries kept in the event log."""
+
+ONGOING_AGGREGATION_MS: int = 500
+"""Default duration of an aggregated burst of ongoing events in milliseconds."""
+
+_FLUSH_INTERVAL_MS: int = 100
+"""Interval between two insertions of received events into the log view."""
+
+_STATISTICS_INTERVAL_MS: int = 1000
+"""Interval between two updates of the sender statistics."""
+
+
 class EventSetupWidget(QSplitter):
     """Widget containing the entire event sender configuration UI."""
 
@@ -404,6 +305,11 @@ def __init__(self, parent: QWidget | None, b: Broadcaster) -> None:
         self._sender_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
         self._sender_list.itemSelectionChanged.connect(self._sender_selected)
         layout.addWidget(self._sender_list)
+        self._statistics_table = QTableWidget(self._selection_panel, rowCount=0, columnCount=4)
+        self._statistics_table.setHorizontalHeaderLabels(["Sender", "Events/s", "Total", "Last Seen"])
+        self._statistics_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self._statistics_table.verticalHeader().setVisible(False)
+        layout.addWidget(self._statistics_table)
         self.addWidget(self._selection_panel)
         self._update_sender_list()
         b.event_sender_model_updated.connect(self._update_sender_list)
@@ -417,21 +323,50 @@ def __init__(self, parent: QWidget | None, b: Broadcaster) -> None:
         self._log_container = QWidget(self._config_splitter)
         log_layout = QVBoxLayout()
         self._log_container.setLayout(log_layout)
-        label_layout = QHBoxLayout()
-        label_layout.addSpacing(48)
-        for label_str in ["Event ID", "Sender:Function", "Type", "Arguments"]:
-            intermediate_layout = QHBoxLayout()
-            intermediate_layout.addWidget(QLabel(label_str, parent=self._log_container))
-            intermediate_layout.addStretch()
-            label_layout.addLayout(intermediate_layout)
-        log_layout.addLayout(label_layout)
-        self._event_log = QListWidget(self._log_container)
+        log_settings_layout = QFormLayout()
+        self._capacity_spin_box = QSpinBox(self._log_container)
+        self._capacity_spin_box.setRange(100, 1000000)
+        self._capacity_spin_box.setSingleStep(1000)
+        self._capacity_spin_box.setValue(EVENT_LOG_CAPACITY)
+        self._capacity_spin_box.setToolTip("Maximum number of events kept in the log. Older events are discarded.")
+        self._capacity_spin_box.editingFinished.connect(self._capacity_changed)
+        log_settings_layout.addRow("Log Capacity", self._capacity_spin_box)
+        self._aggregation_spin_box = QSpinBox(self._log_container)
+        self._aggregation_spin_box.setRange(0, 60000)
+        self._aggregation_spin_box.setSingleStep(100)
+        self._aggregation_spin_box.setSuffix(" ms")
+        self._aggregation_spin_box.setSpecialValueText("Off")
+        self._aggregation_spin_box.setValue(ONGOING_AGGREGATION_MS)
+        self._aggregation_spin_box.setToolTip(
+            "Ongoing events of a sender function arriving within this time are combined into one log entry."
+        )
+        self._aggregation_spin_box.valueChanged.connect(self._aggregation_changed)
+        log_settings_layout.addRow("Aggregate Ongoing Events", self._aggregation_spin_box)
+        log_layout.addLayout(log_settings_layout)
+        event_log = EventLog(EVENT_LOG_CAPACITY, ONGOING_AGGREGATION_MS / 1000)
+        event_log.ongoing_filter = _ongoing_events_included
+        self._event_log_model = EventLogModel(event_log, self)
+        self._event_log = QTableView(self._log_container)
+        self._event_log.setModel(self._event_log_model)
         self._event_log.setMinimumHeight(100)
+        self._event_log.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self._event_log.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+        self._event_log.verticalHeader().setVisible(False)
+        self._event_log.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self._event_log.horizontalHeader().setStretchLastSection(True)
+        self._event_log.setToolTip("Double click an event to give it a name.")
+        self._event_log.doubleClicked.connect(self._add_rename_entry)
         log_layout.addWidget(self._event_log)
         self._config_splitter.addWidget(self._log_container)
         self.setStretchFactor(1, 2)
         self._config_splitter.setStretchFactor(0, 2)
+        self._pending_events: list[tuple[event, float]] = []
+        frame_clock = get_frame_clock()
+        frame_clock.subscribe_while_alive(self, self._flush, _FLUSH_INTERVAL_MS, "EventSetupWidget")
+        frame_clock.subscribe_while_visible(self._statistics_table, self._update_statistics, _STATISTICS_INTERVAL_MS,
+                                            "EventSetupWidget statistics")
         b.fish_event_received.connect(self._event_received)
+        b.event_rename_action_occurred.connect(self._event_log_model.names_changed)
         self._broadcaster = b
         self._dialog: QDialog | None = None
 
@@ -459,14 +394,57 @@ def _add_sender_pressed(self) -> None:
         self._dialog.open()
 
     def _event_received(self, e: event) -> None:
-        if e.type == proto.Events_pb2.ONGOING_EVENT and not get_sender_by_id(e.sender_id).debug_include_ongoing_events:
+        self._pending_events.append((e, time.time()))
+
+    def _flush(self) -> None:
+        """Insert the events received since the last tick into the log."""
+        if not self._pending_events:
             return
-        item = AnnotatedListWidgetItem(self._event_log)
-        w = _EventLogListWidget(self._event_log, e, self._broadcaster)
-        item.setSizeHint(w.sizeHint())
-        item.annotated_data = e
-        self._event_log.addItem(item)
-        self._event_log.setItemWidget(item, w)
+        pending = self._pending_events
+        self._pending_events = []
+        self._event_log_model.add_events(pending)
+
+    def _update_statistics(self) -> None:
+        statistics = self._event_log_model.log.statistics
+        if not statistics:
+            return
+        now = time.time()
+        self._statistics_table.setRowCount(len(statistics))
+        for row, (sender_id, sender_statistics) in enumerate(sorted(statistics.items())):
+            sender = get_sender_by_id(sender_id)
+            cells = [
+                sender.name if sender is not None else str(sender_id),
+                f"{sender_statistics.rate(now):.1f}",
+                str(sender_statistics.total),
+                format_time(sender_statistics.last_seen),
+            ]
+            for column, text in enumerate(cells):
+                item = self._statistics_table.item(row, column)
+                if item is None:
+                    self._statistics_table.setItem(row, column, QTableWidgetItem(text))
+                else:
+                    item.setText(text)
+
+    def _add_rename_entry(self, index: QModelIndex) -> None:
+        entry = self._event_log_model.entry(index)
+        if entry is None:
+            return
+        sender = get_sender_by_id(entry.sender_id)
+        if sender is None or entry.event_tuple in sender.renamed_events:
+            return
+        sender.renamed_events[entry.event_tuple] = "New Event"
+        self._broadcaster.event_rename_action_occurred.emit(sender.index_on_fish)
+
+    def _capacity_changed(self) -> None:
+        self._event_log_model.set_capacity(self._capacity_spin_box.value())
+
+    def _aggregation_changed(self, milliseconds: int) -> None:
+        self._event_log_model.log.ongoing_window = milliseconds / 1000
 
     def _clear_log_pressed(self) -> None:
-        self._event_log.clear()
+        self._event_log_model.clear()
+
+
+def _ongoing_events_included(sender_id: int) -> bool:
+    sender = get_sender_by_id(sender_id)
+    return sender is not None and sender.debug_include_ongoing_events
@@ -7,7 +7,7 @@
 from PySide6.QtGui import QAction, Qt
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QMessageBox, QPushButton, QSizePolicy, QWidget
 
-from view.console_mode.console_universe_widget import DirectUniverseWidget
+from view.console_mode.console_universe_widget import DEFAULT_CONSOLE_FRAME_RATE, DirectUniverseWidget
 from view.dialogs.selection_dialog import SelectionDialog
 from view.show_mode.editor.node_editor_widgets.cue_editor.yes_no_dialog import YesNoDialog
 
@@ -71,7 +71,9 @@ def add_universe(self, universe: Universe) -> None:
         row_layout.addStretch()
         layout.addLayout(row_layout)
 
-        direct_editor: DirectUniverseWidget = DirectUniverseWidget(universe, parent=self)
+        direct_editor: DirectUniverseWidget = DirectUniverseWidget(
+            universe, parent=self, frame_rate=self._console_frame_rate
+        )
         layout.addWidget(direct_editor)
         self._universe_widgets.append(direct_editor)
 
@@ -87,9 +89,20 @@ def send_all_universe(self) -> None:
     def notify_activate(self) -> None:
         """Handle activation of the universe in console."""
         # TODO this obviously breaks given multiple universes but it'll work for now
+        frame_rate = self._console_frame_rate
         for universe_widget in self._universe_widgets:
+            universe_widget.frame_rate = frame_rate
             universe_widget.notify_activate()
 
+    @property
+    def _console_frame_rate(self) -> int:
+        try:
+            return int(
+                self._board_configuration.ui_hints.get("console_dmx_frame_rate") or str(DEFAULT_CONSOLE_FRAME_RATE)
+            )
+        except ValueError:
+            return DEFAULT_CONSOLE_FRAME_RATE
+
     def _automap(self) -> None:
         for uw in self._universe_widgets:
             uw.automap()
@@ -1,5 +1,8 @@
 """Directly edit channels of on univers."""
 
+import math
+import time
+
 from PySide6 import QtCore, QtWidgets
 from PySide6.QtWidgets import QWidget
 
@@ -11,25 +14,41 @@
 from model.universe import Universe
 from view.console_mode.console_channel_widget import ChannelWidget
 
+DEFAULT_CONSOLE_FRAME_RATE: int = 44
+
 
 class DirectUniverseWidget(QtWidgets.QScrollArea):
     """Widget to directly edit channels of one universe.
 
     Allows editing of channels of the specified universes. One universe is shown and editable at a time.
     Buttons allow to change the selected universe.
+
+    Changed channel values are not sent to fish one by one. The universe is marked dirty and sent at most once per
+    frame of the configured frame rate.
     """
 
-    def __init__(self, universe: Universe, parent: QWidget = None) -> None:
+    def __init__(
+        self, universe: Universe, parent: QWidget = None, frame_rate: int = DEFAULT_CONSOLE_FRAME_RATE
+    ) -> None:
         """Initialize a ManualUniverseEditorWidget.
 
         Args:
             universe: The universe to edit.
             parent: The Qt parent of the widget.
+            frame_rate: The maximum number of universe transmissions per second. 0 sends every change immediately.
 
         """
         super().__init__(parent=parent)
         self._universe = universe
         self._broadcaster = Broadcaster()
+        self._frame_rate: int = 0
+        self._frame_interval_ns: int = 0
+        self._last_flush_ns: int = 0
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
+        self.frame_rate = frame_rate
+        self._universe.values_changed.connect(self._universe_values_changed)
         # self._broadcaster.fixture_patched.connect(self._reload_patched_fixtures)
         self._subwidgets: list[ChannelWidget | QtWidgets.QLabel] = []
         self._broadcaster.add_fixture.connect(self._add_fixture)
@@ -71,6 +90,39 @@ def __del__(self) -> None:
         self._broadcaster.jogwheel_rotated_left.disconnect(self._decrease_scroll)
         self._broadcaster.jogwheel_rotated_right.disconnect(self._increase_scroll)
 
+    @property
+    def frame_rate(self) -> int:
+        """Get or set the maximum number of universe transmissions per second.
+
+        A frame rate of 0 sends every change immediately.
+        """
+        return self._frame_rate
+
+    @frame_rate.setter
+    def frame_rate(self, frame_rate: int) -> None:
+        self._frame_rate = max(0, frame_rate)
+        self._frame_interval_ns = 1_000_000_000 // self._frame_rate if self._frame_rate > 0 else 0
+        if self._frame_rate == 0:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send the universe to fish if channels changed since the last transmission."""
+        self._flush_timer.stop()
+        if not self._universe.has_dirty_channels:
+            return
+        self._universe.take_dirty_mask()
+        self._last_flush_ns = time.monotonic_ns()
+        self._broadcaster.send_universe_value.emit(self._universe)
+
+    def _universe_values_changed(self, _start: int, _length: int) -> None:
+        if self._flush_timer.isActive():
+            return
+        remaining_ns = self._last_flush_ns + self._frame_interval_ns - time.monotonic_ns()
+        if remaining_ns <= 0:
+            self.flush()
+        else:
+            self._flush_timer.start(math.ceil(remaining_ns / 1_000_000))
+
     def _translate_scroll_position(self, absolute_position: int) -> float:
         # FIXME scrollbars are always strange and clearly more rules apply here
         maximum = self.horizontalScrollBar().maximum()
@@ -115,8 +167,7 @@ def automap(self) -> None:
 
     def add_settings_to_scenes_default_values(self, scene: Scene) -> None:
         """Add the current universes configuration to the scenes default values."""
-        for channel in self._universe.channels:
-            scene.insert_dmx_default_value(self._universe, channel.address, channel.value, supress_emission=True)
+        scene.insert_dmx_default_values(self._universe, self._universe.values, supress_emission=True)
 
     def _add_fixture(self, fixture: UsedFixture) -> None:
         if fixture.universe_id != self._universe.id:
@@ -131,7 +182,4 @@ def _add_fixture(self, fixture: UsedFixture) -> None:
                 self,
             )
             layout.addWidget(channel_widget)
-            self._universe.channels[fixture.start_index + channel_index].updated.connect(
-                lambda _, send_universe=self._universe: self._broadcaster.send_universe_value.emit(send_universe)
-            )
         layout.addWidget(QtWidgets.QLabel(fixture.name))
@@ -2,9 +2,8 @@
 
 # ruff: noqa
 from PySide6 import QtCore, QtWidgets
-from PySide6.QtCore import QTimer
-
 import proto.DirectMode_pb2
+from controller.utils.frame_clock import get_frame_clock
 from model import Broadcaster, Universe
 from model.final_globals import FinalGlobals
 
@@ -17,9 +16,6 @@ def __init__(self, broadcaster: Broadcaster):
         super().__init__()
         self.setGeometry(self.geometry().x(), self.geometry().y(), 150, FinalGlobals.get_screen_height())
         self._broadcaster = broadcaster
-        self._timer = QTimer()
-        self._timer.setInterval(1000)
-        self._timer.timeout.connect(self._request_dmx_data)
 
         self._widgets = QtWidgets.QTabWidget(self)
         self._universes: list[tuple[Universe, list[DmxLogItem]]] = []
@@ -36,11 +32,11 @@ def showEvent(self, event):
         """show logging Window start timer"""
 
         self._request_dmx_data()
-        self._timer.start()
+        get_frame_clock().subscribe(self._request_dmx_data, 1000, "DmxDataLogWidget")
 
     def closeEvent(self, event):
-        """close logging Window stp timer"""
-        self._timer.stop()
+        """close logging Window stop requesting data"""
+        get_frame_clock().unsubscribe(self._request_dmx_data)
 
     def _request_dmx_data(self) -> None:
         """send signal to request dmx data from fish for each universe"""
@@ -0,0 +1,122 @@
+"""Item model presenting a log ring buffer to a tree view."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import TYPE_CHECKING, override
+
+from PySide6.QtCore import QAbstractItemModel, QModelIndex, QObject, QPersistentModelIndex, Qt
+
+if TYPE_CHECKING:
+    from collections.abc import Collection, Sequence
+
+    from controller.utils.log_buffer import LogEntry, LogRingBuffer
+
+_HEADERS: tuple[str, str] = ("key", "value")
+_ROOT = QModelIndex()
+
+
+class LogModel(QAbstractItemModel):
+    """Tree model over the entries of a log ring buffer that pass the current filter.
+
+    Each entry is a top-level row showing its level and the first line of its message. Its children list all fields of
+    the entry. Rows are only created on demand by the view, so the cost of the model depends on the visible rows and not
+    on the number of entries.
+    """
+
+    def __init__(self, buffer: LogRingBuffer, parent: QObject | None = None) -> None:
+        """Initialize the model.
+
+        Args:
+            buffer: The buffer holding the entries.
+            parent: The Qt parent of the model.
+
+        """
+        super().__init__(parent)
+        self._buffer = buffer
+        self._levels: Collection[str] | None = None
+        self._criteria: Sequence[tuple[str, str]] = ()
+        # Sequence numbers of the entries passing the filter, in ascending order
+        self._visible: list[int] = buffer.query()
+
+    def set_filter(self, levels: Collection[str] | None, criteria: Sequence[tuple[str, str]]) -> None:
+        """Show only the entries passing a filter. See `LogEntry.matches` for the meaning of the arguments."""
+        self.beginResetModel()
+        self._levels = levels
+        self._criteria = criteria
+        self._visible = self._buffer.query(levels, criteria)
+        self.endResetModel()
+
+    def append_entries(self, entries: Sequence[LogEntry]) -> None:
+        """Append entries to the buffer and update the rows.
+
+        Rows of evicted entries are removed and rows for new entries passing the filter are inserted at the end.
+        """
+        if not entries:
+            return
+        start = self._buffer.next_sequence
+        # Rows need to be removed while their entries are still in the buffer
+        first_kept = max(0, start + len(entries) - self._buffer.capacity)
+        evicted = bisect_left(self._visible, first_kept)
+        if evicted > 0:
+            self.beginRemoveRows(QModelIndex(), 0, evicted - 1)
+            del self._visible[:evicted]
+            self.endRemoveRows()
+        self._buffer.extend(entries)
+        added = [sequence for sequence in range(max(start, self._buffer.first_sequence), self._buffer.next_sequence)
+                 if self._buffer[sequence].matches(self._levels, self._criteria)]
+        if added:
+            self.beginInsertRows(QModelIndex(), len(self._visible), len(self._visible) + len(added) - 1)
+            self._visible.extend(added)
+            self.endInsertRows()
+
+    def entry(self, index: QModelIndex | QPersistentModelIndex) -> LogEntry | None:
+        """Get the entry of a top-level row or of one of its children."""
+        if not index.isValid():
+            return None
+        if index.internalId() == 0:
+            return self._buffer[self._visible[index.row()]]
+        return self._buffer[index.internalId() - 1]
+
+    @override
+    def index(self, row: int, column: int, parent: QModelIndex | QPersistentModelIndex = _ROOT) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        # Children store the sequence number of their entry, offset by one to distinguish them from top-level rows
+        return self.createIndex(row, column, self._visible[parent.row()] + 1)
+
+    @override
+    def parent(self, child: QModelIndex | QPersistentModelIndex = _ROOT) -> QModelIndex:
+        if not child.isValid() or child.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(bisect_left(self._visible, child.internalId() - 1), 0, 0)
+
+    @override
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = _ROOT) -> int:
+        if not parent.isValid():
+            return len(self._visible)
+        if parent.internalId() != 0 or parent.column() != 0:
+            return 0
+        return len(self._buffer[self._visible[parent.row()]].fields())
+
+    @override
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = _ROOT) -> int:
+        return len(_HEADERS)
+
+    @override
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> str | None:
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        entry = self.entry(index)
+        if index.internalId() == 0:
+            return entry.level if index.column() == 0 else entry.message.split("\n", 1)[0]
+        return entry.fields()[index.row()][index.column()]
+
+    @override
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole) -> str | None:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return _HEADERS[section]
+        return None
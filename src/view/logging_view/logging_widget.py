@@ -1,48 +1,41 @@
 """widget for logging_view"""
-import json
-from logging import getLogger
+from logging import CRITICAL, getLevelNamesMapping, getLogger
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtWidgets
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QCompleter, QWidget
 
-from model.broadcaster import Broadcaster
+from controller.utils.frame_clock import get_frame_clock
+from controller.utils.log_buffer import LogRingBuffer, get_log_transport
+from view.dialogs.fish_exception_dialog import FishExceptionsDialog, error_dict
 
-from .logging_item_widget import LoggingItemWidget
+from .log_model import LogModel
 from .search import Operation, Search
 
 logger = getLogger(__name__)
 
+LOG_CAPACITY: int = 20000
+"""Maximum number of log messages kept by the logging widget."""
+
+_FLUSH_INTERVAL_MS: int = 100
+"""Interval between two insertions of received messages into the view."""
+
 
 class LoggingWidget(QtWidgets.QTabWidget):
     """widget for logging_view"""
-    _loging_level_changed: QtCore.Signal = QtCore.Signal(tuple)
 
     def __init__(self, parent: QWidget = None) -> None:
         super().__init__(parent)
 
         select_bar = QtWidgets.QMenuBar()
         level_menu = QtWidgets.QMenu("Level")
-        self._levels: dict = {
-            "DEBUG": QAction("Debug", level_menu, checkable=True, checked=False,
-                             changed=(lambda: self._loging_level_changed.emit(
-                                 ("DEBUG", self._levels["DEBUG"].isChecked())))),
-            "INFO": QAction("Info", level_menu, checkable=True, checked=False,
-                            changed=(
-                                lambda: self._loging_level_changed.emit(("INFO", self._levels["INFO"].isChecked())))),
-            "WARNING": QAction("WARNING", level_menu, checkable=True, checked=True,
-                               changed=(
-                                   lambda: self._loging_level_changed.emit(
-                                       ("WARNING", self._levels["WARNING"].isChecked())))),
-            "ERROR": QAction("Error", level_menu, checkable=True, checked=True,
-                             changed=(
-                                 lambda: self._loging_level_changed.emit(
-                                     ("ERROR", self._levels["ERROR"].isChecked())))),
-            "CRITICAL": QAction("Critical", level_menu, checkable=True, checked=True,
-                                changed=(
-                                    lambda: self._loging_level_changed.emit(
-                                        ("CRITICAL", self._levels["CRITICAL"].isChecked())))),
+        self._levels: dict[str, QAction] = {
+            "DEBUG": QAction("Debug", level_menu, checkable=True, checked=False),
+            "INFO": QAction("Info", level_menu, checkable=True, checked=False),
+            "WARNING": QAction("WARNING", level_menu, checkable=True, checked=True),
+            "ERROR": QAction("Error", level_menu, checkable=True, checked=True),
+            "CRITICAL": QAction("Critical", level_menu, checkable=True, checked=True),
         }
         level_menu.addAction(QAction("all", level_menu, triggered=(lambda: self.all_log_levels(True))))
         for value in self._levels.values():
@@ -50,23 +43,26 @@ def __init__(self, parent: QWidget = None) -> None:
         level_menu.addAction(QAction("none", level_menu, triggered=(lambda: self.all_log_levels(False))))
         select_bar.addMenu(level_menu)
 
-        self._broadcaster = Broadcaster()
-        self._broadcaster.log_message.connect(self.new_log_message)
-
         searchbar = QtWidgets.QLineEdit()
         searchbar.textChanged.connect(self.update_display)
         completer = QCompleter(["message", "timestamp", "logger", "module", "function", "line", "thread_name"])
         searchbar.setCompleter(completer)
 
-        self._tree = QtWidgets.QTreeWidget()
-        self._tree.setColumnCount(2)
-        self._tree.setHeaderLabels(["key", "value"])
+        self._criteria: list[tuple[str, str]] = []
+        self._model = LogModel(LogRingBuffer(LOG_CAPACITY), self)
+        self._model.set_filter(self._active_levels(), self._criteria)
+        for action in self._levels.values():
+            action.changed.connect(self._apply_filter)
+        self._transport = get_log_transport()
+        self._transport.level = self._lowest_active_level()
+        get_frame_clock().subscribe_while_alive(self, self._flush, _FLUSH_INTERVAL_MS, "LoggingWidget")
+
+        self._tree = QtWidgets.QTreeView()
+        self._tree.setModel(self._model)
+        self._tree.setUniformRowHeights(True)
         self._tree.setColumnWidth(0, 150)
         self._tree.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOn)
         self._tree.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        self._tree.setLayout(QtWidgets.QVBoxLayout())
-
-        self._log_items: list[LoggingItemWidget] = []
 
         container_layout = QtWidgets.QVBoxLayout()
         container_layout.addWidget(select_bar)
@@ -82,14 +78,40 @@ def all_log_levels(self, value: bool) -> None:
         for level in self._levels.values():
             level.setChecked(value)
 
-    def new_log_message(self, message: str) -> None:
-        """handle incoming log messages"""
-        message_dict = json.loads(message)
-        level = message_dict["level"]
-        new_log_item: LoggingItemWidget = LoggingItemWidget(self._tree, message_dict, level,
-                                                            self._levels[level].isChecked(), self._loging_level_changed)
-        self._log_items.append(new_log_item)
-        self._tree.addTopLevelItem(new_log_item)
+    def _active_levels(self) -> set[str]:
+        return {level for level, action in self._levels.items() if action.isChecked()}
+
+    def _lowest_active_level(self) -> int:
+        level_numbers = getLevelNamesMapping()
+        return min((level_numbers[level] for level in self._active_levels()), default=CRITICAL + 1)
+
+    def _apply_filter(self) -> None:
+        self._transport.level = self._lowest_active_level()
+        self._model.set_filter(self._active_levels(), self._criteria)
+
+    def _flush(self) -> None:
+        """Insert the messages received since the last tick into the view.
+
+        Messages below the lowest selected level are not received at all, except for the ones of Fish, which are scanned
+        for Fish exceptions.
+        """
+        entries = self._transport.drain()
+        self._model.append_entries(entries)
+        for entry in entries:
+            self._show_fish_exception(entry.message)
+
+    @staticmethod
+    def _show_fish_exception(message_text: str) -> None:
+        for key in error_dict:
+            if key in message_text:
+                tmp = message_text.split("Logs:\n")[1].split("Reason: ")
+                log: str = tmp[0]
+                tmp = tmp[1].split("Possible causes: ")
+                reason: str = tmp[0]
+                causes: str = tmp[1] if len(tmp) > 1 else "No more info"
+                ex = FishExceptionsDialog(log, reason, causes)
+                ex.exec()
+                break
 
     def update_display(self, text: str) -> None:
         """update display for searching items"""
@@ -99,5 +121,5 @@ def update_display(self, text: str) -> None:
             part = item.split(":")
             if len(part) == 2:
                 search.append(Search((part[0], part[1]), Operation.IS))
-        for widget in self._log_items:
-            widget.search(search)
+        self._criteria = [entry.items for entry in search if entry.operation == Operation.IS]
+        self._apply_filter()
@@ -128,6 +128,9 @@ def __init__(self, parent: QWidget | None = None) -> None:
         self._broadcaster.view_to_color.connect(self._is_column_dialog)
         self._broadcaster.view_to_temperature.connect(self._is_column_dialog)
         self._broadcaster.save_button_pressed.connect(self._save_show)
+        self._broadcaster.show_file_saved.connect(self._show_file_saved)
+        self._broadcaster.show_file_save_failed.connect(self._show_file_save_failed)
+        self._broadcaster.show_file_upload_failed.connect(self._show_file_upload_failed)
         self._broadcaster.view_to_action_config.connect(lambda: self._to_widget(5))
 
         self._fish_connector.start()
@@ -369,6 +372,18 @@ def _save_show(self) -> None:
             else:
                 show_save_showfile_dialog(self, self._board_configuration)
 
+    def _show_file_saved(self, file_name: str) -> None:
+        if self._board_configuration and self._board_configuration.file_path != file_name:
+            self._board_configuration.file_path = file_name
+
+    def _show_file_save_failed(self, file_name: str, error: str) -> None:
+        QtWidgets.QMessageBox.critical(self, "Saving Showfile Failed",
+                                       f"An error occurred while saving the show file to {file_name}:\n\n{error}")
+
+    def _show_file_upload_failed(self, error: str) -> None:
+        QtWidgets.QMessageBox.critical(self, "Uploading Showfile Failed",
+                                       f"An error occurred while uploading the show file to fish:\n\n{error}")
+
     def _open_about_window(self) -> None:
         if not self._about_window:
             from view.misc.about_window import AboutWindow
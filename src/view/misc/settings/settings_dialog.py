@@ -15,6 +15,7 @@
     QWidget,
 )
 
+from view.console_mode.console_universe_widget import DEFAULT_CONSOLE_FRAME_RATE
 from view.show_mode.player.external_ui_windows import update_window_count
 
 if TYPE_CHECKING:
@@ -54,6 +55,14 @@ def __init__(self, parent: QWidget | None, show: "BoardConfiguration") -> None:
         self._default_main_brightness_tb.setToolTip("At which brightness level should the main fader be after the "
                                                     "show file has been loaded?")
         play_layout.addRow("Default Main Brightness", self._default_main_brightness_tb)
+        self._console_frame_rate_tb = QSpinBox(self._play_tab)
+        self._console_frame_rate_tb.setMinimum(0)
+        self._console_frame_rate_tb.setMaximum(1000)
+        self._console_frame_rate_tb.setSuffix(" Hz")
+        self._console_frame_rate_tb.setSpecialValueText("Immediate")
+        self._console_frame_rate_tb.setToolTip("How often per second should changed universes be sent to fish "
+                                               "in console mode? Select 'Immediate' to send every change directly.")
+        play_layout.addRow("Console DMX Frame Rate", self._console_frame_rate_tb)
         self._play_tab.setLayout(play_layout)
         self._category_tab_bar.addTab(self._play_tab, "Play")
 
@@ -101,6 +110,11 @@ def show_file(self, new_show: "BoardConfiguration") -> None:
             self._default_main_brightness_tb.setValue(int(new_show.ui_hints.get("default_main_brightness") or "255"))
         except ValueError:
             self._default_main_brightness_tb.setValue(255)
+        try:
+            self._console_frame_rate_tb.setValue(
+                int(new_show.ui_hints.get("console_dmx_frame_rate") or str(DEFAULT_CONSOLE_FRAME_RATE)))
+        except ValueError:
+            self._console_frame_rate_tb.setValue(DEFAULT_CONSOLE_FRAME_RATE)
         try:
             self._show_ui_window_count_tb.setValue(int(new_show.ui_hints.get("show_ui_window_count", "0")))
         except ValueError:
@@ -113,6 +127,7 @@ def apply(self) -> None:
         self._show.ui_hints["default_main_brightness"] = str(self._default_main_brightness_tb.value())
         self._show.ui_hints[
             "color-mixin-auto-add-disabled"] = "false" if self._brightness_mixin_enbled_cb.isChecked() else "true"
+        self._show.ui_hints["console_dmx_frame_rate"] = str(self._console_frame_rate_tb.value())
         self._show.ui_hints["show_ui_window_count"] = str(self._show_ui_window_count_tb.value())
         update_window_count(self._show_ui_window_count_tb.value(), self._show)
 
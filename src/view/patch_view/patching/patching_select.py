@@ -12,7 +12,9 @@
 
 import style
 from layouts.flow_layout import FlowLayout
-from model.ofl.manufacture import Manufacture, generate_manufacturers
+from model.ofl.fixture import load_fixture
+from model.ofl.fixture_not_found_exception import FixtureDefNotFoundError
+from model.ofl.manufacture import FixtureSummary, Manufacture, generate_manufacturers
 from view.dialogs.patching_dialog import PatchingDialog
 from view.patch_view.patching.fixture_item import FixtureItem
 from view.patch_view.patching.manufacturer_item import ManufacturerItem
@@ -22,7 +24,6 @@
     from PySide6.QtWidgets import QWidget
 
     from model import BoardConfiguration
-    from model.ofl.ofl_fixture import OflFixture
 logger = getLogger(__name__)
 
 
@@ -50,7 +51,7 @@ def __init__(self, board_configuration: BoardConfiguration, parent: QWidget) ->
             with zipfile.ZipFile(zip_path) as zip_ref:
                 zip_ref.extractall(fixtures_path)
             logger.info("Fixture lib downloaded and installed.")
-        manufacturers: list[tuple[Manufacture, list[OflFixture]]] = generate_manufacturers(fixtures_path)
+        manufacturers: list[tuple[Manufacture, list[FixtureSummary]]] = generate_manufacturers(fixtures_path)
         self.index = 0
         self.container = QtWidgets.QStackedWidget()
         manufacturers_layout = FlowLayout()
@@ -65,7 +66,7 @@ def __init__(self, board_configuration: BoardConfiguration, parent: QWidget) ->
         self.setWidget(self.container)
         self.container.setCurrentIndex(self.container.count() - 1)
 
-    def _generate_manufacturer_item(self, manufacturer: tuple[Manufacture, list[OflFixture]]) -> ManufacturerItem:
+    def _generate_manufacturer_item(self, manufacturer: tuple[Manufacture, list[FixtureSummary]]) -> ManufacturerItem:
         manufacturer_layout = FlowLayout()
         reset_button = QtWidgets.QPushButton("...")
         reset_button.setFixedSize(150, 100)
@@ -84,15 +85,15 @@ def _generate_manufacturer_item(self, manufacturer: tuple[Manufacture, list[OflF
 
         return item
 
-    def _generate_fixture_item(self, fixture: OflFixture) -> FixtureItem:
+    def _generate_fixture_item(self, fixture: FixtureSummary) -> FixtureItem:
         fixture_layout = FlowLayout()
         reset_button = QtWidgets.QPushButton("...")
         reset_button.setFixedSize(150, 100)
         reset_button.setStyleSheet(style.PATCH + "background-color: white;")
         reset_button.clicked.connect(self.reset)
         fixture_layout.addWidget(reset_button)
-        for index, mode in enumerate(fixture.modes):
-            mode_item = ModeItem(mode)
+        for index, mode_name in enumerate(fixture["modes"]):
+            mode_item = ModeItem(mode_name)
             mode_item.clicked.connect(lambda _, _fixture=fixture, _index=index: self._run_patch(_fixture, _index))
             fixture_layout.addWidget(mode_item)
 
@@ -112,9 +113,14 @@ def reset(self) -> None:
         """reset to start"""
         self.container.setCurrentIndex(self.container.count() - 1)
 
-    def _run_patch(self, fixture: OflFixture, index: int) -> None:
+    def _run_patch(self, fixture: FixtureSummary, index: int) -> None:
         """run the patching dialog"""
-        dialog = PatchingDialog(self._board_configuration, (fixture, index))
+        try:
+            fixture_definition = load_fixture(fixture["file"])
+        except FixtureDefNotFoundError:
+            logger.exception("Failed to load fixture definition %s", fixture["file"])
+            return
+        dialog = PatchingDialog(self._board_configuration, (fixture_definition, index))
         dialog.finished.connect(lambda: self._patch(dialog))
 
         dialog.open()
@@ -1,21 +1,33 @@
 """File contains internal timeline content widget."""
 
-from collections.abc import Sequence
+from bisect import bisect_right
 from typing import override
 
 import PySide6
 from PySide6 import QtGui
-from PySide6.QtCore import QPoint, Qt, Signal
-from PySide6.QtGui import QBrush, QColor, QMouseEvent, QPainter, QPainterPath, QPaintEvent, QResizeEvent
+from PySide6.QtCore import QEvent, QPoint, QRect, Qt, Signal
+from PySide6.QtGui import QBrush, QColor, QMouseEvent, QPainter, QPainterPath, QPaintEvent, QPixmap, QResizeEvent
 from PySide6.QtWidgets import QWidget
 
 from model import DataType
 from model.control_desk import BankSet, ColorDeskColumn, RawDeskColumn, set_seven_seg_display_content
-from model.filter_data.cues.cue import KeyFrame, State, StateColor, StateDouble, StateEightBit, StateSixteenBit
+from model.filter_data.cues.cue import (
+    KeyFrame,
+    KeyFrameList,
+    State,
+    StateColor,
+    StateDouble,
+    StateEightBit,
+    StateSixteenBit,
+)
 from model.filter_data.utility import format_seconds
 from view.show_mode.editor.node_editor_widgets.cue_editor.keyframe_state_edit_dialog import KeyFrameStateEditDialog
 from view.show_mode.editor.node_editor_widgets.cue_editor.view_settings import CHANNEL_DISPLAY_HEIGHT
 
+_KEYFRAME_MARKER_RADIUS = 12
+_KEYFRAME_LABEL_WIDTH = 120
+"""Horizontal extent of a keyframe marker and its labels, right of the keyframe position."""
+
 
 class TimelineContentWidget(QWidget):
     """Internal widget rendering a timeline."""
@@ -28,9 +40,13 @@ def __init__(self, parent: QWidget = None) -> None:
         self._last_keyframe_end_point = 0  # Defines the length of the Cue in seconds
         self._time_zoom = 0.01  # Defines how many seconds are a pixel, defaults to 1 pixel = 10ms
         self._channels: list[tuple[DataType, str]] = []
-        self._frames: list[KeyFrame] = []
+        self._frames: KeyFrameList = KeyFrameList()
         self._cursor_position = 3.0
         self._drag_begin: tuple[int, int] = None
+        self._static_layer: QPixmap | None = None
+        self._static_layer_rect = QRect()
+        self._timescale_labels: tuple[list[int], list[str]] | None = None
+        self._marker_glyphs: dict[tuple[int, bool], QPixmap] = {}
         self._compute_resize()
         self._cue_index: int = 0
         self._used_bankset: BankSet = None
@@ -46,13 +62,14 @@ def used_bankset(self, bs: BankSet) -> None:
         self._used_bankset = bs
 
     @property
-    def frames(self) -> Sequence[KeyFrame]:
-        """List of keyframes."""
-        return tuple(self._frames)
+    def frames(self) -> KeyFrameList:
+        """Keyframes of the cue, sorted by time."""
+        return self._frames
 
     @frames.setter
-    def frames(self, value: list[KeyFrame]) -> None:
+    def frames(self, value: KeyFrameList) -> None:
         self._frames = value
+        self.invalidate_static_layer()
 
     @property
     def cursor_position(self) -> float:
@@ -75,84 +92,161 @@ def cue_index(self, arg: int) -> None:
             self._cue_index = arg
             self._update_7seg_text()
 
-    @override
-    def paintEvent(self, ev: QPaintEvent) -> None:
-        """Repaint the widget."""
-        # TODO we should implement to only redraw required areas based on the hints provided within ev
-        w = self.width()
+    def invalidate_static_layer(self) -> None:
+        """Discard the pre-rendered keyframes and timescale and schedule a repaint of the whole widget."""
+        self._static_layer = None
+        self._timescale_labels = None
+        self.update()
+
+    def _get_timescale_labels(self) -> tuple[list[int], list[str]]:
+        """Get the positions and texts of the timescale labels for the current zoom and width."""
+        if self._timescale_labels is None:
+            positions: list[int] = []
+            labels: list[str] = []
+            x = 0
+            w = self.width()
+            while x < w:
+                time_str = format_seconds(x * self._time_zoom)
+                positions.append(x)
+                labels.append(time_str)
+                x += 10 * len(time_str)
+            self._timescale_labels = (positions, labels)
+        return self._timescale_labels
+
+    def _get_marker_glyph(self, color: QColor, highlighted: bool) -> QPixmap:
+        """Get the pre-rendered keyframe marker of a color.
+
+        The glyph of a marker at ``(x, y)`` is placed at ``(x - 10, y)``, or at ``(x - 12, y - 2)`` if highlighted.
+        """
+        key = (color.rgb(), highlighted)
+        glyph = self._marker_glyphs.get(key)
+        if glyph is None:
+            radius = 12 if highlighted else 10
+            ratio = self.devicePixelRatioF()
+            glyph = QPixmap(int((2 * radius + 1) * ratio), int((2 * radius + 1) * ratio))
+            glyph.setDevicePixelRatio(ratio)
+            glyph.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(glyph)
+            painter.setRenderHint(QPainter.Antialiasing)
+            marker_path = QPainterPath(QPoint(radius, 0))
+            marker_path.lineTo(2 * radius, radius)
+            marker_path.lineTo(radius, 2 * radius)
+            marker_path.lineTo(0, radius)
+            marker_path.lineTo(radius, 0)
+            painter.fillPath(marker_path, QBrush(color))
+            painter.end()
+            if len(self._marker_glyphs) > 1024:
+                self._marker_glyphs.clear()
+            self._marker_glyphs[key] = glyph
+        return glyph
+
+    def _cursor_rect(self) -> QRect:
+        """Get the area covered by the cursor."""
+        x = int(self._cursor_position / self._time_zoom)
+        return QRect(x - 17, 0, 35, self.height())
+
+    def _render_static_layer(self, rect: QRect) -> None:
+        """Pre-render everything but the cursor within the given area of the widget.
+
+        Only keyframes and timescale labels that intersect the area are drawn. They are found through bisection of
+        their sorted positions.
+        """
         h = self.height()
-        if w == 0 or h == 0:
-            return
-        painter = QtGui.QPainter(self)
+        ratio = self.devicePixelRatioF()
+        layer = QPixmap(int(rect.width() * ratio), int(rect.height() * ratio))
+        layer.setDevicePixelRatio(ratio)
+        painter = QtGui.QPainter(layer)
         painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(-rect.x(), -rect.y())
 
         # Render background
-        painter.fillRect(0, 0, w, h, QColor.fromRgb(0x3A, 0x3A, 0x3A))
+        painter.fillRect(rect, QColor.fromRgb(0x3A, 0x3A, 0x3A))
 
         # render transitions
-
         channel_background_color = QColor.fromRgb(0x4A, 0x4A, 0x4A)
-        for i in range(len(self._channels)):
+        first_channel = max(0, (rect.top() - 20) // CHANNEL_DISPLAY_HEIGHT)
+        last_channel = min(len(self._channels) - 1, (rect.bottom() - 20) // CHANNEL_DISPLAY_HEIGHT)
+        for i in range(first_channel, last_channel + 1):
             if (i % 2) == 0:
                 painter.fillRect(
-                    0, 20 + i * CHANNEL_DISPLAY_HEIGHT, w, CHANNEL_DISPLAY_HEIGHT, channel_background_color
+                    rect.left(), 20 + i * CHANNEL_DISPLAY_HEIGHT, rect.width(), CHANNEL_DISPLAY_HEIGHT,
+                    channel_background_color
                 )
 
         marker_color = QColor.fromRgb(255, 255, 0) if self.isEnabled() else QColor.fromRgb(128, 128, 0)
-        marker_brush = QBrush(marker_color)
+        highlight_color = QColor.fromRgb(0, 50, 255)
         light_gray_brush = QBrush(QColor.fromRgb(0xCC, 0xCC, 0xCC))
         kf_line_brush = QBrush(QColor.fromRgb(0xCC, 0xCC, 0xCC))
         kf_line_brush.setStyle(Qt.HorPattern)
-        for kf in self._frames:
-            if kf:
-                x = int(kf.timestamp / self._time_zoom)
-                painter.setBrush(kf_line_brush)
-                kf_states = kf._states
-                painter.drawLine(x, 20, x, len(kf_states) * CHANNEL_DISPLAY_HEIGHT + 20)
-                painter.setBrush(light_gray_brush)
-                for i, s in enumerate(kf_states):
-                    if kf.only_on_channel is None:
-                        y = 40 + i * CHANNEL_DISPLAY_HEIGHT
-                    else:
-                        y = 40 + self._get_channel_index(kf.only_on_channel) * CHANNEL_DISPLAY_HEIGHT
-                    if s == self._last_clicked_kf_state:
-                        marker_path = QPainterPath(QPoint(x, y - 2))
-                        marker_path.lineTo(x + 12, y + 10)
-                        marker_path.lineTo(x, y + 22)
-                        marker_path.lineTo(x - 12, y + 10)
-                        marker_path.lineTo(x, y - 2)
-                        painter.fillPath(marker_path, QBrush(QColor.fromRgb(0, 50, 255)))
-                    marker_path = QPainterPath(QPoint(x, y))
-                    marker_path.lineTo(x + 10, y + 10)
-                    marker_path.lineTo(x, y + 20)
-                    marker_path.lineTo(x - 10, y + 10)
-                    marker_path.lineTo(x, y)
-                    if isinstance(s, StateColor):
-                        r, g, b = s.color.to_rgb()
-                        selected_brush = QBrush(QColor.fromRgb(r, g, b))
-                        painter.drawText(x + 15, y + 21, str(int(s.color.intensity * 100)) + "%")
-                    elif isinstance(s, StateDouble):
-                        selected_brush = marker_brush
-                        painter.drawText(x + 15, y + 21, f"{s._value:10.4f}")
-                    else:
-                        selected_brush = marker_brush
-                        painter.drawText(x + 15, y + 21, str(s._value))
-                    painter.fillPath(marker_path, selected_brush)
-                    painter.drawText(x + 15, y + 9, s.transition)
-
-        # render cursor, timescale and bars
+        # Keyframes left of the area may still reach into it with their labels
+        for kf in self._frames.in_range((rect.left() - _KEYFRAME_LABEL_WIDTH) * self._time_zoom,
+                                        (rect.right() + _KEYFRAME_MARKER_RADIUS) * self._time_zoom):
+            x = int(kf.timestamp / self._time_zoom)
+            painter.setBrush(kf_line_brush)
+            kf_states = kf._states
+            painter.drawLine(x, 20, x, len(kf_states) * CHANNEL_DISPLAY_HEIGHT + 20)
+            painter.setBrush(light_gray_brush)
+            for i, s in enumerate(kf_states):
+                if kf.only_on_channel is None:
+                    y = 40 + i * CHANNEL_DISPLAY_HEIGHT
+                else:
+                    y = 40 + self._get_channel_index(kf.only_on_channel) * CHANNEL_DISPLAY_HEIGHT
+                if y + 22 < rect.top() or y - 2 > rect.bottom():
+                    continue
+                if s == self._last_clicked_kf_state:
+                    painter.drawPixmap(x - 12, y - 2, self._get_marker_glyph(highlight_color, True))
+                if isinstance(s, StateColor):
+                    r, g, b = s.color.to_rgb()
+                    selected_color = QColor.fromRgb(r, g, b)
+                    painter.drawText(x + 15, y + 21, str(int(s.color.intensity * 100)) + "%")
+                elif isinstance(s, StateDouble):
+                    selected_color = marker_color
+                    painter.drawText(x + 15, y + 21, f"{s._value:10.4f}")
+                else:
+                    selected_color = marker_color
+                    painter.drawText(x + 15, y + 21, str(s._value))
+                painter.drawPixmap(x - 10, y, self._get_marker_glyph(selected_color, False))
+                painter.drawText(x + 15, y + 9, s.transition)
+
+        # render bars
         painter.setBrush(light_gray_brush)
-        painter.drawLine(0, 20, w, 20)
-        painter.drawLine(0, h - 20, w, h - 20)
+        painter.drawLine(rect.left(), 20, rect.right() + 1, 20)
+        painter.drawLine(rect.left(), h - 20, rect.right() + 1, h - 20)
         # render timescale
+        positions, labels = self._get_timescale_labels()
+        first_label = max(0, bisect_right(positions, rect.left()) - 1)
+        last_label = bisect_right(positions, rect.right())
         for y in [20, h]:
-            x = 0
-            painter.setBrush(light_gray_brush)
-            while x < w:
+            if y < rect.top() or y - 20 > rect.bottom():
+                continue
+            for x, time_str in zip(positions[first_label:last_label], labels[first_label:last_label], strict=True):
                 painter.drawLine(x, y - 20, x, y)
-                time_str = format_seconds(x * self._time_zoom)
                 painter.drawText(x, y - 2, time_str)
-                x += 10 * len(time_str)
+        painter.end()
+        self._static_layer = layer
+        self._static_layer_rect = rect
+
+    @override
+    def paintEvent(self, ev: QPaintEvent) -> None:
+        """Repaint the exposed area of the widget.
+
+        The static content is rendered into a layer covering the visible area once and blitted afterward, so cursor
+        movements only need to repaint a narrow strip.
+        """
+        w = self.width()
+        h = self.height()
+        if w == 0 or h == 0:
+            return
+        exposed = ev.rect()
+        if self._static_layer is None or not self._static_layer_rect.contains(exposed):
+            visible = self.visibleRegion().boundingRect()
+            self._render_static_layer(exposed.united(visible) if not visible.isEmpty() else exposed)
+        painter = QtGui.QPainter(self)
+        painter.setClipRect(exposed)
+        painter.drawPixmap(self._static_layer_rect.topLeft(), self._static_layer)
+
+        # render cursor
+        painter.setRenderHint(QPainter.Antialiasing)
         abs_cursor_pos = int(self._cursor_position / self._time_zoom)
         cursor_path = QPainterPath(QPoint(abs_cursor_pos, 0))
         cursor_path.moveTo(-16 + abs_cursor_pos, 0)
@@ -171,16 +265,28 @@ def mousePressEvent(self, ev: QMouseEvent) -> None:
         """Handle user mouse input."""
         super().mousePressEvent(ev)
         self._drag_begin = (ev.x(), ev.y())
-        self.update()
 
     @override
     def resizeEvent(self, event: QResizeEvent) -> None:
         """Trigger the handling resizing of the container."""
         super().resizeEvent(event)
+        self.invalidate_static_layer()
         self.size_changed.emit(QPoint(self.width(), self.height()))
 
+    @override
+    def changeEvent(self, event: QEvent) -> None:
+        """Update the marker colors if the widget gets enabled or disabled."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.EnabledChange:
+            self.invalidate_static_layer()
+
     def _compute_resize(self) -> None:
         """Actual handling of the recomputation of layout after resizing occurred."""
+        self._update_minimum_size()
+        self.invalidate_static_layer()
+
+    def _update_minimum_size(self) -> None:
+        """Grow the widget to fit its parent, the keyframes, the cursor and the channels."""
         p = self.parent()
         if p:
             parent_height = p.height()
@@ -196,7 +302,20 @@ def _compute_resize(self) -> None:
             )
         )
         self.setMinimumHeight(max(parent_height, int(len(self._channels) * CHANNEL_DISPLAY_HEIGHT) + 2 * 20))
-        self.repaint()
+
+    def _deselect_keyframe_state(self) -> None:
+        """Remove the highlight from the last clicked keyframe state."""
+        if self._last_clicked_kf_state is not None:
+            self._last_clicked_kf_state = None
+            self.invalidate_static_layer()
+
+    def _move_cursor(self, new_position: float) -> None:
+        """Move the cursor, only repainting the area it left and the area it entered."""
+        old_cursor_rect = self._cursor_rect()
+        self._cursor_position = new_position
+        self._update_7seg_text()
+        self._update_minimum_size()
+        self.update(old_cursor_rect.united(self._cursor_rect()))
 
     def add_channels(self, channels: list[tuple[DataType, str]]) -> None:
         """Add a channel to the internal model."""
@@ -213,7 +332,7 @@ def insert_frame(self, f: KeyFrame) -> None:
         """Insert a frame from the internal model."""
         self._frames.append(f)
         self._last_clicked_kf_state = None
-        self.repaint()
+        self.invalidate_static_layer()
 
     def zoom_out(self, factor: float = 2.0) -> None:
         """Decrease the zoom factor by the given amount."""
@@ -236,22 +355,16 @@ def move_cursor_right(self) -> None:
         # TODO notify parent scrolling if it is moving out of site.
         if not self.isEnabled():
             return
-        self._cursor_position += self._time_zoom * 10
-        self._last_clicked_kf_state = None
-        self._update_7seg_text()
-        self._compute_resize()
+        self._deselect_keyframe_state()
+        self._move_cursor(self._cursor_position + self._time_zoom * 10)
 
     def move_cursor_left(self) -> None:
         """Move the cursor to the left."""
         # TODO notify parent scrolling if it is moving out of site
         if not self.isEnabled():
             return
-        self._cursor_position -= self._time_zoom * 10
-        if self._cursor_position < 0:
-            self._cursor_position = 0.0
-        self._last_clicked_kf_state = None
-        self._update_7seg_text()
-        self._compute_resize()
+        self._deselect_keyframe_state()
+        self._move_cursor(max(0.0, self._cursor_position - self._time_zoom * 10))
 
     def _update_7seg_text(self) -> None:
         """Generate 7seg display text based on current cursor position and cue index."""
@@ -272,23 +385,20 @@ def mouseReleaseEvent(self, ev: PySide6.QtGui.QMouseEvent) -> None:
         y = ev.y()
         x = ev.x()
         if y <= 20:
-            clicked_timeslot = x * self._time_zoom
-            self._cursor_position = clicked_timeslot
-            self._update_7seg_text()
-        else:
-            state_width = 10 if 20 <= ((y - 20) % CHANNEL_DISPLAY_HEIGHT) <= 40 else 1
-            clicked_timeslot_lower = (x - state_width) * self._time_zoom
-            clicked_timeslot_upper = (x + state_width) * self._time_zoom
-            for kf in self._frames:
-                if clicked_timeslot_lower <= kf.timestamp <= clicked_timeslot_upper:
-                    if kf.only_on_channel is None:
-                        self._clicked_on_keyframe(kf, y)
-                        break
-                    channel_index = self._get_channel_index(kf.only_on_channel)
-                    if channel_index * CHANNEL_DISPLAY_HEIGHT <= y - 20 <= (channel_index + 1) * CHANNEL_DISPLAY_HEIGHT:
-                        self._clicked_on_keyframe(kf, y)
-                        break
-        self.repaint()
+            self._move_cursor(x * self._time_zoom)
+            return
+        state_width = 10 if 20 <= ((y - 20) % CHANNEL_DISPLAY_HEIGHT) <= 40 else 1
+        clicked_timeslot_lower = (x - state_width) * self._time_zoom
+        clicked_timeslot_upper = (x + state_width) * self._time_zoom
+        for kf in self._frames.in_range(clicked_timeslot_lower, clicked_timeslot_upper):
+            if kf.only_on_channel is None:
+                self._clicked_on_keyframe(kf, y)
+                break
+            channel_index = self._get_channel_index(kf.only_on_channel)
+            if channel_index * CHANNEL_DISPLAY_HEIGHT <= y - 20 <= (channel_index + 1) * CHANNEL_DISPLAY_HEIGHT:
+                self._clicked_on_keyframe(kf, y)
+                break
+        self.invalidate_static_layer()
 
     def _clicked_on_keyframe(self, kf: KeyFrame, y: int) -> None:
         """Handle the user double-clicking on a keyframe."""
@@ -331,7 +441,7 @@ def clear_cue(self) -> None:
         """Clear the timeline renderer model."""
         self._channels.clear()
         self._cursor_position = 0.0
-        self._frames = []
+        self._frames = KeyFrameList()
         self._last_keyframe_end_point = 0
         self._update_7seg_text()
         self._compute_resize()
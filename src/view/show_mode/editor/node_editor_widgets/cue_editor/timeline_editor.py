@@ -7,7 +7,16 @@
 
 from model import DataType
 from model.control_desk import BankSet, ColorDeskColumn, DeskColumn, RawDeskColumn, set_seven_seg_display_content
-from model.filter_data.cues.cue import Cue, KeyFrame, State, StateColor, StateDouble, StateEightBit, StateSixteenBit
+from model.filter_data.cues.cue import (
+    Cue,
+    KeyFrame,
+    KeyFrameList,
+    State,
+    StateColor,
+    StateDouble,
+    StateEightBit,
+    StateSixteenBit,
+)
 from view.show_mode.editor.node_editor_widgets.cue_editor.channel_label import TimelineChannelLabel
 from view.show_mode.editor.node_editor_widgets.cue_editor.timeline_content_widget import TimelineContentWidget
 
@@ -131,10 +140,9 @@ def cue(self, c: Cue) -> None:
             for channel in c.channels:
                 self.add_channel(channel[1], channel[0])
             self._keyframes_panel.cue_index = c.index_in_editor
-            # TODO introduce property
-            self._keyframes_panel.frames = c._frames
+            self._keyframes_panel.frames = c.frames
         else:
-            self._keyframes_panel.frames = []
+            self._keyframes_panel.frames = KeyFrameList()
             self._keyframes_panel.cue_index = 0
         self._keyframes_panel.repaint()
 
@@ -4,7 +4,7 @@
 from functools import partial
 
 from PySide6.QtCore import QPoint, Qt
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtGui import QAction, QBrush, QIcon, QPalette
 from PySide6.QtWidgets import (
     QInputDialog,
     QMenu,
@@ -20,6 +20,7 @@
 from controller.file.transmitting_to_fish import transmit_to_fish
 from model import BoardConfiguration, Scene, UIPage
 from model.control_desk import BankSet
+from model.filter_graph import analyze_scene_reachability
 from model.ofl.fixture import UsedFixture
 from model.scene import FilterPage
 from utility import resource_path
@@ -133,6 +134,11 @@ def selected_scene(self, s: Scene | None) -> None:
 
     def _refresh_filter_browser(self) -> None:
         self._filter_browsing_tree.clear()
+        unreachable_filters: set[str] = set()
+        if self._selected_scene:
+            unreachable_filters.update(analyze_scene_reachability(self._selected_scene).unreachable)
+        unreachable_brush = QBrush(self._widget.palette().color(QPalette.ColorGroup.Disabled,
+                                                                 QPalette.ColorRole.Text))
 
         def generate_tree_item(fp: FilterPage, parent: QTreeWidgetItem) -> QTreeWidgetItem:
             item = AnnotatedTreeWidgetItem(parent)
@@ -144,6 +150,9 @@ def generate_tree_item(fp: FilterPage, parent: QTreeWidgetItem) -> QTreeWidgetIt
                 filter_item.setText(0, f.filter_id)
                 filter_item.setIcon(0, ShowBrowser._filter_icon)
                 filter_item.annotated_data = f
+                if f.filter_id in unreachable_filters:
+                    filter_item.setForeground(0, unreachable_brush)
+                    filter_item.setToolTip(0, "This filter does not contribute to any output and is not uploaded.")
             for child_page in fp.child_pages:
                 generate_tree_item(child_page, item)
             return item
@@ -184,6 +193,14 @@ def add_filter_page(parent_item: AnnotatedTreeWidgetItem, fp: FilterPage) -> Non
         default_value_item.setIcon(0, ShowBrowser._dmx_default_value_tab_icon)
         default_value_item.setData(1, Qt.ItemDataRole.WhatsThisRole, "DMXDEFAULTDATA")
         default_value_item.annotated_data = s
+        reachability = analyze_scene_reachability(s)
+        reachability_item = AnnotatedTreeWidgetItem(item)
+        reachability_item.setText(0, "Used filters")
+        reachability_item.setText(1, f"{len(reachability.reachable)} of {reachability.filter_count} filters")
+        if reachability.unreachable:
+            reachability_item.setToolTip(
+                1, "Not contributing to any output:\n" + "\n".join(reachability.unreachable[:20])
+                + ("\n..." if len(reachability.unreachable) > 20 else ""))
 
         if len(s.ui_pages) < 1:
             s.ui_pages.append(UIPage(s))
@@ -2,10 +2,10 @@
 
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QTabWidget
 
 from controller.autotrack.Helpers.InstanceManager import InstanceManager
+from controller.utils.frame_clock import get_frame_clock
 from view.show_mode.show_ui_widgets.autotracker.crop_tab import CropTab
 from view.show_mode.show_ui_widgets.autotracker.detection_tab import DetectionTab
 from view.show_mode.show_ui_widgets.autotracker.gui_tab import GuiTab
@@ -59,9 +59,8 @@ def __init__(self, f: "AutoTrackerFilter", provided_instance: InstanceManager |
 
         self.currentChanged.connect(self.tab_changed)
 
-        self.video_timer = QTimer(self)
-        self.video_timer.timeout.connect(self.video_update_all)
-        self.video_timer.start(1)
+        # Video frames are polled once per frame clock tick while the dialog is visible
+        get_frame_clock().subscribe_while_visible(self, self.video_update_all, name="AutoTrackDialogWidget")
 
     def video_update_all(self) -> None:
         """Update video content for all active tabs."""
@@ -14,6 +14,7 @@
 
 
 class AutoTrackerUIWidget(UIWidget):
+    coalesce_updates = True
 
     def __init__(self, parent_page: "UIPage", configuration: dict[str, str] | None = None) -> None:
         super().__init__(parent_page, configuration)
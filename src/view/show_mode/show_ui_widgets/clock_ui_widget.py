@@ -4,11 +4,11 @@
 import os
 from typing import TYPE_CHECKING, override
 
-from PySide6.QtCore import QTimer
 from PySide6.QtGui import QFont, QFontDatabase, QFontMetrics
 from PySide6.QtWidgets import QDialog, QLabel, QWidget
 from tzlocal import get_localzone
 
+from controller.utils.frame_clock import get_frame_clock
 from model import UIWidget
 from utility import resource_path
 
@@ -33,7 +33,6 @@ class ClockUIWidget(UIWidget):
     def __init__(self, parent: UIPage, configuration: dict[str, str]) -> None:
         super().__init__(parent, configuration)
         self._widget: QLabel | None = None
-        self._timer: QTimer | None = None
 
     @override
     def generate_update_content(self) -> list[tuple[str, str]]:
@@ -52,10 +51,7 @@ def get_configuration_widget(self, parent: QWidget | None) -> QWidget:
 
     def _construct_widget(self, parent: QWidget | None) -> None:
         self._widget = _configure_label(QLabel(parent))
-        self._timer = QTimer()
-        self._timer.setInterval(1000)
-        self._timer.timeout.connect(self._update_label)
-        self._timer.start()
+        get_frame_clock().subscribe_while_visible(self._widget, self._update_label, 1000, "ClockUIWidget")
         self._update_label()
 
     def _update_label(self) -> None:
@@ -21,6 +21,8 @@
 class ColorSelectionUIWidget(UIWidget):
     """UI widget allowing the user to select a color."""
 
+    coalesce_updates = True
+
     def __init__(self, parent: UIPage, configuration: dict[str, str]) -> None:
         """Initialize the widget.
 
@@ -25,6 +25,8 @@
 class ConstantNumberButtonList(UIWidget):
     """Show UI widget to provide the user with configurable buttons that alter the content of a constant filter."""
 
+    coalesce_updates = True
+
     @override
     def get_config_dialog_widget(self, parent: QDialog) -> QWidget:
         """Provide a configuration widget for button control."""
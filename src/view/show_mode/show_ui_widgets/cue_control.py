@@ -4,7 +4,6 @@
 from logging import getLogger
 from typing import override
 
-from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QDialog,
@@ -19,6 +18,7 @@
     QWidget,
 )
 
+from controller.utils.frame_clock import get_frame_clock
 from model import Filter, UIPage, UIWidget
 from model.file_support.cue_state import CueState
 from model.filter_data.cues.cue_filter_model import CueFilterModel
@@ -28,6 +28,9 @@
 
 logger = getLogger(__name__)
 
+_STATUS_UPDATE_INTERVAL_MS: int = 50
+"""Interval between two updates of the cue state while the widget is visible."""
+
 
 class _CueLabel(QWidget):
     _PLAY_ICON = QIcon(resource_path(os.path.join("resources", "icons", "play.svg"))).pixmap(16, 16)
@@ -70,11 +73,6 @@ def __init__(self, parent: UIPage, configuration: dict[str, str] | None = None)
         self._filter: Filter | None = None
         self._cue_state = CueState(self._filter)
 
-        self._timer = QTimer()
-        self._timer.setInterval(50)
-        self._timer.timeout.connect(self._update_time_passed)
-        self._timer.start()
-
         self._player_cue_list_widget: QListWidget | None = None
         self._config_cue_list_widget: QListWidget | None = None
         self._player_widget: QWidget | None = None
@@ -203,6 +201,8 @@ def _construct_widget(self, parent: QWidget | None, enabled: bool) -> QWidget:
             layout.addWidget(QLabel("Cue State Label"))
         layout.addWidget(cue_list)
         self._update_time_passed()
+        get_frame_clock().subscribe_while_visible(w, self._update_time_passed, _STATUS_UPDATE_INTERVAL_MS,
+                                                  "CueControlUIWidget")
 
         w.setLayout(layout)
         w.setFixedHeight(int(self.configuration.get("widget_height") or "350"))
@@ -16,6 +16,7 @@
 
 
 class PanTiltConstantControlUIWidget(UIWidget):
+    coalesce_updates = True
 
     def __init__(self, parent: UIPage, configuration: dict[str, str]) -> None:
         super().__init__(parent, configuration)
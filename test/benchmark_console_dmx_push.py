@@ -0,0 +1,58 @@
+"""Benchmark of universe transmissions caused by console mode.
+
+A scripted sweep moves every channel of a universe through a couple of values, one slider step per millisecond,
+followed by a bulk change of all 512 channels. The script reports how many universe messages per second
+console mode emits with immediate transmission (the previous behaviour) and with frame-rate limited transmission.
+"""
+import time
+
+from PySide6 import QtCore, QtWidgets
+
+import proto.UniverseControl_pb2
+from model.broadcaster import Broadcaster
+from model.control_desk import set_network_manager
+from model.universe import NUMBER_OF_CHANNELS, Universe
+from view.console_mode.console_universe_widget import DEFAULT_CONSOLE_FRAME_RATE, DirectUniverseWidget
+
+SWEEP_STEPS = (64, 128, 255, 0)
+STEP_INTERVAL_MS = 1
+
+
+def _run_sweep(app: QtWidgets.QApplication, frame_rate: int) -> tuple[int, float]:
+    universe = Universe(proto.UniverseControl_pb2.Universe(id=frame_rate))
+    widget = DirectUniverseWidget(universe, frame_rate=frame_rate)
+    sent_messages = 0
+
+    def count(sent_universe: Universe) -> None:
+        nonlocal sent_messages
+        if sent_universe is universe:
+            sent_messages += 1
+
+    Broadcaster().send_universe_value.connect(count)
+    start = time.perf_counter()
+    for value in SWEEP_STEPS:
+        for channel in universe.channels:
+            channel.value = value
+            app.processEvents()
+            QtCore.QThread.msleep(STEP_INTERVAL_MS)
+        universe.set_values([255 - value] * NUMBER_OF_CHANNELS)
+        app.processEvents()
+    deadline = time.perf_counter() + 0.1
+    while time.perf_counter() < deadline:
+        app.processEvents(QtCore.QEventLoop.ProcessEventsFlag.AllEvents, 10)
+    duration = time.perf_counter() - start
+    Broadcaster().send_universe_value.disconnect(count)
+    widget.deleteLater()
+    return sent_messages, duration
+
+
+if __name__ == "__main__":
+    app = QtWidgets.QApplication([])
+    from controller.network import NetworkManager
+
+    set_network_manager(NetworkManager())
+    changes = len(SWEEP_STEPS) * (NUMBER_OF_CHANNELS + 1)
+    for label, rate in (("immediate", 0), (f"{DEFAULT_CONSOLE_FRAME_RATE} Hz", DEFAULT_CONSOLE_FRAME_RATE)):
+        messages, seconds = _run_sweep(app, rate)
+        print(f"{label:>10}: {changes} changes -> {messages} universe messages in {seconds:.3f} s "
+              f"({messages / seconds:.0f} messages/s)")
@@ -0,0 +1,94 @@
+"""Benchmark of the columnar cue codec.
+
+A cue list of 20 cues with 64 channels and 200 key frames each is loaded with the frame-by-frame parser, parsed into
+columns and loaded into cue models through the columns. Additionally, the compact encoding is decoded. The script
+verifies that all variants produce the same cues and reports the timings and the sizes of both formats.
+"""
+import random
+import time
+
+from model import DataType
+from model.filter_data.cues.cue import Cue, EndAction, KeyFrame
+from model.filter_data.cues.cue_codec import decode_compact, parse_cue_columns
+
+CUES = 20
+CHANNELS = 64
+FRAMES = 200
+TRANSITIONS = ("edg", "lin", "sig", "e_i", "e_o")
+CHANNEL_DEFINITIONS = [(f"ch{channel}", (DataType.DT_8_BIT, DataType.DT_16_BIT, DataType.DT_DOUBLE,
+                                          DataType.DT_COLOR)[channel % 4])
+                       for channel in range(CHANNELS)]
+
+
+def _random_value(rng: random.Random, data_type: DataType) -> str:
+    match data_type:
+        case DataType.DT_8_BIT:
+            return str(rng.randrange(256))
+        case DataType.DT_16_BIT:
+            return str(rng.randrange(65536))
+        case DataType.DT_DOUBLE:
+            return repr(rng.random())
+        case _:
+            return f"{rng.uniform(0, 360)},{rng.random()},{rng.random()}"
+
+
+def _build_definitions() -> list[str]:
+    rng = random.Random(42)
+    return ["|".join(f"{frame * 0.5}:" + "&".join(f"{_random_value(rng, data_type)}@{rng.choice(TRANSITIONS)}"
+                                                 for _, data_type in CHANNEL_DEFINITIONS)
+                     for frame in range(FRAMES)) + f"#hold#do_nothing#Cue {cue}"
+            for cue in range(CUES)]
+
+
+def _new_cue() -> Cue:
+    cue = Cue()
+    for name, data_type in CHANNEL_DEFINITIONS:
+        cue.add_channel(name, data_type)
+    return cue
+
+
+def _load_frame_by_frame(definition: str) -> Cue:
+    cue = _new_cue()
+    primary_tokens = definition.split("#")
+    for frame_definition in primary_tokens[0].split("|"):
+        cue._frames.append(KeyFrame.from_format_str(frame_definition, cue._channel_definitions, cue))
+    cue.end_action = EndAction.from_format_str(primary_tokens[1])
+    cue.restart_on_another_play_press = primary_tokens[2] == "restart"
+    cue.name = primary_tokens[3]
+    return cue
+
+
+def _load(definition: str) -> Cue:
+    cue = _new_cue()
+    cue.from_string_definition(definition)
+    return cue
+
+
+def _measure(function: callable, definitions: list[str]) -> tuple[list, float]:
+    start_time = time.perf_counter()
+    results = [function(definition) for definition in definitions]
+    return results, time.perf_counter() - start_time
+
+
+if __name__ == "__main__":
+    text_definitions = _build_definitions()
+    compact_definitions = [_load(definition).format_cue_compact() for definition in text_definitions]
+
+    legacy_cues, legacy_seconds = _measure(_load_frame_by_frame, text_definitions)
+    _, columns_seconds = _measure(lambda d: parse_cue_columns(d, CHANNEL_DEFINITIONS), text_definitions)
+    _, compact_columns_seconds = _measure(lambda d: decode_compact(d, CHANNEL_DEFINITIONS), compact_definitions)
+    text_cues, text_seconds = _measure(_load, text_definitions)
+    compact_cues, compact_seconds = _measure(_load, compact_definitions)
+    for legacy, text, compact in zip(legacy_cues, text_cues, compact_cues, strict=True):
+        if not legacy.format_cue() == text.format_cue() == compact.format_cue():
+            raise RuntimeError("The parsers produced different cues.")
+
+    text_size = sum(map(len, text_definitions))
+    compact_size = sum(map(len, compact_definitions))
+    print(f"{CUES} cues x {CHANNELS} channels x {FRAMES} key frames")
+    print(f"       frame by frame: {legacy_seconds * 1000:.1f} ms to cue models")
+    print(f"  text through columns: {columns_seconds * 1000:.1f} ms to columns, "
+          f"{text_seconds * 1000:.1f} ms to cue models")
+    print(f"               compact: {compact_columns_seconds * 1000:.1f} ms to columns, "
+          f"{compact_seconds * 1000:.1f} ms to cue models")
+    print(f"size: {text_size / 1024:.0f} KiB text, {compact_size / 1024:.0f} KiB compact")
@@ -0,0 +1,74 @@
+"""Benchmark of the log transport from the logging handlers to the logging view.
+
+`NetworkManager.push_messages` logs every outgoing message at DEBUG. The script replays the log calls of a
+`push_messages` call with 64 queued messages and reports the logging overhead per call for the previous path (format
+every record as JSON, emit it through a Qt signal and parse it in the receiver) and for the current transport with
+the logging view displaying DEBUG messages or starting at WARNING.
+"""
+import json
+import logging
+import time
+from collections.abc import Callable
+
+from PySide6.QtCore import QCoreApplication, QObject, Signal
+
+from controller.utils.json_formatter import JSONFormatter
+from controller.utils.log_buffer import LogTransport
+from signal_logging import SignalLoging
+
+MESSAGES_PER_PUSH = 64
+PUSHES = 2000
+MESSAGE = bytes(range(48))
+FMT_KEYS = {"level": "levelname", "message": "message", "timestamp": "timestamp", "logger": "name",
+            "module": "module", "function": "funcName", "line": "lineno", "thread_name": "threadName"}
+
+
+class _Emitter(QObject):
+    log_message = Signal(str)
+
+
+class _JSONSignalHandler(logging.Handler):
+    """The previous widget handler, emitting each record as JSON string."""
+
+    def __init__(self, emitter: _Emitter) -> None:
+        super().__init__()
+        self._emitter = emitter
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._emitter.log_message.emit(self.format(record))
+
+
+def _push_messages(push_logger: logging.Logger) -> None:
+    for msg_type in range(MESSAGES_PER_PUSH):
+        push_logger.debug("message to send: %s with type: %s", MESSAGE, msg_type)
+
+
+def _measure(name: str, handler: logging.Handler, after_push: Callable[[], object]) -> None:
+    push_logger = logging.getLogger(f"benchmark.{name}")
+    push_logger.propagate = False
+    push_logger.setLevel(logging.DEBUG)
+    push_logger.addHandler(handler)
+    start = time.perf_counter()
+    for _ in range(PUSHES):
+        _push_messages(push_logger)
+        after_push()
+    duration = time.perf_counter() - start
+    push_logger.removeHandler(handler)
+    print(f"{name:>28}: {duration / PUSHES * 1e6:8.1f} us per push_messages call")
+
+
+if __name__ == "__main__":
+    app = QCoreApplication([])
+    received: list[dict] = []
+    emitter = _Emitter()
+    emitter.log_message.connect(lambda message: received.append(json.loads(message)))
+    json_handler = _JSONSignalHandler(emitter)
+    json_handler.setFormatter(JSONFormatter(fmt_keys=FMT_KEYS))
+    _measure("JSON through Qt signal", json_handler, received.clear)
+
+    for gui_level in (logging.DEBUG, logging.WARNING):
+        transport_handler = SignalLoging()
+        transport_handler._transport = LogTransport(MESSAGES_PER_PUSH * 2)
+        transport_handler._transport.level = gui_level
+        _measure(f"transport, GUI at {logging.getLevelName(gui_level)}", transport_handler,
+                 transport_handler._transport.drain)
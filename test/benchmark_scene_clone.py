@@ -0,0 +1,61 @@
+"""Benchmark of cloning a scene.
+
+A scene of 1,800 chained constant filters and 200 virtual range adapters is cloned. Plain filters share their
+configuration dicts with the source until they are accessed, so the script reports the time of the clone itself and
+the time of touching every cloned filter afterwards. It verifies that modifying a clone leaves the source untouched.
+"""
+import time
+
+from PySide6.QtWidgets import QApplication
+
+app = QApplication([])
+
+from model import BoardConfiguration, Filter, Scene  # noqa: E402
+from model.filter import FilterTypeEnumeration  # noqa: E402
+from model.scene import FilterPage  # noqa: E402
+from model.virtual_filters.vfilter_factory import construct_virtual_filter_instance  # noqa: E402
+
+CONSTANT_FILTERS = 1800
+VIRTUAL_FILTERS = 200
+REPETITIONS = 5
+
+
+def _build_scene(show: BoardConfiguration) -> Scene:
+    scene = Scene(0, "Benchmark", show)
+    show.broadcaster.scene_created.emit(scene)
+    page = FilterPage(scene)
+    page.name = "default"
+    scene.insert_filterpage(page)
+    for i in range(CONSTANT_FILTERS):
+        f = Filter(scene, f"constant_{i}", FilterTypeEnumeration.FILTER_CONSTANT_FLOAT, (i, 0),
+                   initial_parameters={"value": str(i)})
+        if i > 0:
+            f.channel_links["value_in"] = f"constant_{i - 1}:value"
+        scene.append_filter(f, 0)
+    for i in range(VIRTUAL_FILTERS):
+        scene.append_filter(construct_virtual_filter_instance(
+            scene, FilterTypeEnumeration.VFILTER_FILTER_ADAPTER_8BIT_TO_FLOAT_RANGE, f"adapter_{i}", pos=(0, i)), 0)
+    scene.ensure_bankset()
+    return scene
+
+
+if __name__ == "__main__":
+    board_configuration = BoardConfiguration()
+    source = _build_scene(board_configuration)
+    clone_time = 0.0
+    touch_time = 0.0
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        clone = source.copy(board_configuration.scenes)
+        clone_time += time.perf_counter() - start
+        start = time.perf_counter()
+        for f in clone.filters:
+            _ = f.channel_links
+        touch_time += time.perf_counter() - start
+        if len(clone.filters) != len(source.filters) or len(clone.pages[0].filters) != len(source.filters):
+            raise RuntimeError("The clone does not contain all filters.")
+        clone.get_filter_by_id("constant_1").initial_parameters["value"] = "changed"
+        if source.get_filter_by_id("constant_1").initial_parameters["value"] != "1":
+            raise RuntimeError("Modifying the clone changed the source.")
+    print(f"{len(source.filters)} filters: clone {clone_time / REPETITIONS * 1000:.1f} ms, "
+          f"touching all cloned filters {touch_time / REPETITIONS * 1000:.1f} ms")
@@ -0,0 +1,88 @@
+"""Benchmark of the show file reader.
+
+A synthetic show file of about 50 MB is generated, consisting of scenes with cue filters that carry long
+configuration strings, followed by universes and UI hints like the show files written by the editor. The script
+reports wall time and peak memory of loading the complete document tree and cleaning its tags (the previous reader)
+and of streaming the top-level elements once (the current reader).
+"""
+import os
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from collections.abc import Callable
+
+from defusedxml.ElementTree import parse
+
+from controller.file.deserialization.loading_pipeline import iter_show_file_elements
+
+TARGET_SIZE = 50 * 1024 * 1024
+NAMESPACE = "http://www.asta.uni-luebeck.de/MissionDMX/ShowFile"
+CUE_CONFIGURATION = "#".join(f"{i * 0.25:.2f}:{i % 256}@lin" for i in range(2000))
+
+
+def _write_synthetic_show(file_name: str) -> int:
+    scene_id = 0
+    with open(file_name, "w", encoding="UTF-8") as f:
+        f.write(f'<bord_configuration xmlns="{NAMESPACE}" xsi:schemaLocation="{NAMESPACE}" '
+                'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" show_name="Benchmark" '
+                'default_active_scene="0" notes="">\n')
+        while f.tell() < TARGET_SIZE:
+            f.write(f'<scene id="{scene_id}" human_readable_name="Scene {scene_id}">\n')
+            for filter_index in range(10):
+                f.write(f'<filter id="cues_{filter_index}" type="44" pos="0,0">'
+                        f'<filterConfiguration name="mapping" value="dimmer:8bit;r:8bit;g:8bit;b:8bit" />'
+                        f'<filterConfiguration name="cuelist" value="{CUE_CONFIGURATION}" />'
+                        f'<initialParameters name="value" value="{filter_index}" /></filter>\n')
+            f.write("</scene>\n")
+            scene_id += 1
+        for universe_id in range(8):
+            f.write(f'<universe id="{universe_id}" name="U{universe_id}" description="">'
+                    f'<physical_location>{universe_id}</physical_location></universe>\n')
+        f.write('<uihint name="default_main_brightness" value="255" />\n</bord_configuration>\n')
+    return scene_id
+
+
+def _clean_tags(element: ET.Element, prefix: str) -> None:
+    for child in element:
+        child.tag = child.tag.replace(prefix, "")
+        _clean_tags(child, prefix)
+
+
+def _read_tree(file_name: str) -> int:
+    root = parse(file_name).getroot()
+    _clean_tags(root, "{" + NAMESPACE + "}")
+    scenes = [child for child in root if child.tag == "scene"]
+    others = [child for child in root if child.tag != "scene"]
+    return sum(len(scene) for scene in scenes) + len(others)
+
+
+def _read_streaming(file_name: str) -> int:
+    elements = 0
+    stream = iter_show_file_elements(file_name)
+    next(stream)
+    for child in stream:
+        elements += len(child) if child.tag == "scene" else 1
+    return elements
+
+
+def _measure(reader: Callable[[str], int], file_name: str) -> tuple[int, float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    elements = reader(file_name)
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elements, duration, peak
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        show_file = os.path.join(directory, "synthetic.show")
+        scene_count = _write_synthetic_show(show_file)
+        size = os.path.getsize(show_file)
+        print(f"Synthetic show: {size / 2**20:.1f} MiB, {scene_count} scenes")
+        for label, reader in (("tree", _read_tree), ("streaming", _read_streaming)):
+            count, seconds, peak_memory = _measure(reader, show_file)
+            print(f"{label:>10}: {count} elements in {seconds:.2f} s, peak memory {peak_memory / 2**20:.1f} MiB "
+                  f"({peak_memory / size:.2f}x file size)")
@@ -0,0 +1,111 @@
+"""Benchmark of the YOLOv8 post-processing of the auto tracker.
+
+The script measures the per-frame latency of turning raw detector outputs into person detections, once with the
+previous per-candidate Python loop and once with the vectorized decoder, and checks that both keep the same boxes.
+
+Usage:
+    python benchmark_yolov8_postprocess.py --record VIDEO OUTPUT.npy [--frames N]
+        Run the detector on the frames of a recorded video and store its raw outputs.
+    python benchmark_yolov8_postprocess.py [OUTPUT.npy]
+        Benchmark the post-processing on stored outputs. Without a file, synthetic outputs with a few persons per
+        frame are used.
+"""
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from controller.autotrack.Detection.VideoProcessor import CLASSES, process
+
+CANDIDATES = 8400
+SYNTHETIC_FRAMES = 100
+THRESHOLD = 0.25
+
+
+def _record(video: str, output: str, frames: int) -> None:
+    from controller.autotrack.Detection.Yolo8.Yolo8GPU import Yolo8GPU
+
+    detector = Yolo8GPU()
+    capture = cv2.VideoCapture(video)
+    recorded = []
+    while len(recorded) < frames:
+        success, frame = capture.read()
+        if not success:
+            break
+        outputs = detector.detect(frame)
+        if outputs.ndim == 2:
+            recorded.append(outputs)
+    capture.release()
+    np.save(output, np.stack(recorded))
+    print(f"Recorded the detector outputs of {len(recorded)} frames to {output}")
+
+
+def _synthetic_outputs() -> np.ndarray:
+    rng = np.random.default_rng(42)
+    outputs = np.empty((SYNTHETIC_FRAMES, 4 + len(CLASSES), CANDIDATES), dtype=np.float32)
+    outputs[:, 0:2] = rng.uniform(0, 640, (SYNTHETIC_FRAMES, 2, CANDIDATES))
+    outputs[:, 2:4] = rng.uniform(10, 200, (SYNTHETIC_FRAMES, 2, CANDIDATES))
+    outputs[:, 4:] = rng.uniform(0, 0.05, (SYNTHETIC_FRAMES, len(CLASSES), CANDIDATES))
+    # A few persons per frame, each found by a cluster of overlapping candidates
+    for frame in outputs:
+        for _ in range(rng.integers(1, 6)):
+            center = rng.uniform(100, 540, 2)
+            cluster = rng.choice(CANDIDATES, 30, replace=False)
+            frame[0:2, cluster] = center[:, np.newaxis] + rng.normal(0, 4, (2, 30))
+            frame[2:4, cluster] = np.array([[60.0], [180.0]]) + rng.normal(0, 4, (2, 30))
+            frame[4, cluster] = rng.uniform(0.3, 0.9, 30)
+    return outputs
+
+
+def _process_loop(outputs: np.ndarray, scale: float) -> list[dict]:
+    """The previous post-processing: collect all candidates in Python lists and filter them in NMS."""
+    boxes = []
+    scores = []
+    class_ids = []
+    rows = np.ascontiguousarray(outputs.T)
+    for i in range(rows.shape[0]):
+        (_, max_score, _, (_, max_class_index)) = cv2.minMaxLoc(rows[i][4:])
+        if max_score >= THRESHOLD and CLASSES[max_class_index] == "person":
+            boxes.append([rows[i][0] - 0.5 * rows[i][2], rows[i][1] - 0.5 * rows[i][3], rows[i][2], rows[i][3]])
+            scores.append(max_score)
+            class_ids.append(max_class_index)
+    result_boxes = cv2.dnn.NMSBoxes(boxes, scores, THRESHOLD, 0.45, 0.5)
+    return [{"class_id": class_ids[index], "confidence": scores[index], "box": boxes[index], "scale": scale}
+            for index in np.asarray(result_boxes, dtype=np.intp).reshape(-1)]
+
+
+def _benchmark(recorded: np.ndarray) -> None:
+    loop_times = []
+    vectorized_times = []
+    for outputs in recorded:
+        start = time.perf_counter()
+        expected = _process_loop(outputs, 1.0)
+        loop_times.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        detections = process(outputs, 1.0, THRESHOLD)
+        vectorized_times.append(time.perf_counter() - start)
+        assert len(detections) == len(expected)
+        for detection, reference in zip(detections, expected, strict=True):
+            assert abs(detection["confidence"] - reference["confidence"]) < 1e-5
+            x, y, w, h = detection["box"]
+            assert np.allclose([x - 0.5 * w, y - 0.5 * h, w, h], reference["box"], atol=1e-3)
+
+    for name, times in (("loop", loop_times), ("vectorized", vectorized_times)):
+        milliseconds = np.array(times) * 1000
+        print(f"{name:>10}: mean {milliseconds.mean():.3f} ms, median {np.median(milliseconds):.3f} ms, "
+              f"p95 {np.percentile(milliseconds, 95):.3f} ms per frame")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("outputs", nargs="?", help="stored detector outputs (.npy)")
+    parser.add_argument("--record", nargs=2, metavar=("VIDEO", "OUTPUT"), help="record detector outputs of a video")
+    parser.add_argument("--frames", type=int, default=300, help="number of frames to record")
+    arguments = parser.parse_args()
+    if arguments.record is not None:
+        _record(arguments.record[0], arguments.record[1], arguments.frames)
+    else:
+        recorded_outputs = np.load(arguments.outputs) if arguments.outputs else _synthetic_outputs()
+        print(f"Post-processing {len(recorded_outputs)} frames with {recorded_outputs.shape[-1]} candidates each")
+        _benchmark(recorded_outputs)
@@ -0,0 +1,38 @@
+"""Unit test for the show file background worker."""
+import threading
+import time
+import unittest
+
+from PySide6.QtCore import QCoreApplication
+
+from controller.file.background_jobs import run_in_background
+
+
+class BackgroundJobsTest(unittest.TestCase):
+    """Unit test for the show file background worker."""
+
+    def setUp(self):
+        self._app = QCoreApplication.instance() or QCoreApplication([])
+
+    def _wait_for(self, outcomes: list) -> None:
+        deadline = time.monotonic() + 5
+        while len(outcomes) < 2 and time.monotonic() < deadline:
+            self._app.processEvents()
+
+    def test_outcome_delivered_in_main_thread(self):
+        """Test that the jobs run in a worker and their results and errors arrive in order in the main thread."""
+        outcomes = []
+
+        def _fail() -> None:
+            raise OSError("disk full")
+
+        run_in_background(lambda: threading.current_thread().name,
+                          lambda name: outcomes.append((name, threading.current_thread().name)), outcomes.append)
+        run_in_background(_fail, outcomes.append,
+                          lambda error: outcomes.append((str(error), threading.current_thread().name)))
+        self._wait_for(outcomes)
+        main_thread = threading.main_thread().name
+        self.assertEqual(len(outcomes), 2)
+        self.assertNotEqual(outcomes[0][0], main_thread)
+        self.assertEqual(outcomes[0][1], main_thread)
+        self.assertEqual(outcomes[1], ("disk full", main_thread))
@@ -0,0 +1,52 @@
+"""Unit test for the columnar cue codec."""
+import unittest
+
+import numpy as np
+
+from model import DataType
+from model.filter_data.cues.cue import Cue, EndAction
+from model.filter_data.cues.cue_codec import decode_compact, format_cue_columns, parse_cue_columns
+
+_CHANNELS = [("dimmer", DataType.DT_8_BIT), ("pan", DataType.DT_16_BIT), ("speed", DataType.DT_DOUBLE),
+             ("color", DataType.DT_COLOR)]
+_DEFINITION = ("0.0:5@lin&300@edg&0.5@sig&10.0,0.5,1.0@e_i|1.5:255@e_o&65535@lin&-1.25@lin&10.0,1.0,0.0@lin"
+               "#start_again#restart#Chase")
+
+
+class CueCodecTest(unittest.TestCase):
+    """Unit test for the columnar cue codec."""
+
+    def _cue(self, definition: str) -> Cue:
+        cue = Cue()
+        for name, data_type in _CHANNELS:
+            cue.add_channel(name, data_type)
+        cue.from_string_definition(definition)
+        return cue
+
+    def test_parse_columns(self):
+        """Test that the text format is parsed into clamped columns and formatted back unchanged."""
+        columns = parse_cue_columns(_DEFINITION.replace("1.5:255", "1.5:300"), _CHANNELS)
+        np.testing.assert_array_equal(columns.timestamps, [0.0, 1.5])
+        np.testing.assert_array_equal(columns.values[0], [5, 255])
+        np.testing.assert_array_equal(columns.values[3], [[10.0, 0.5, 1.0], [10.0, 1.0, 0.0]])
+        np.testing.assert_array_equal(columns.transitions, [[1, 0, 2, 3], [4, 1, 1, 1]])
+        self.assertEqual(format_cue_columns(columns, _CHANNELS), _DEFINITION)
+
+    def test_compact_round_trip(self):
+        """Test that cues survive the compact format and that both formats load the same cue."""
+        cue = self._cue(_DEFINITION)
+        self.assertEqual(cue.format_cue(), _DEFINITION)
+        self.assertEqual(cue.end_action, EndAction.START_AGAIN)
+        compact = cue.format_cue_compact()
+        self.assertEqual(format_cue_columns(decode_compact(compact, _CHANNELS), _CHANNELS), _DEFINITION)
+        self.assertEqual(self._cue(compact).format_cue(), _DEFINITION)
+
+    def test_partial_frames_fall_back(self):
+        """Test that key frames the columns cannot represent are still parsed frame by frame."""
+        cue = self._cue("0.0:5@lin&300@edg|1.0:7@foo&1@lin&2.0@lin&1.0,1.0,1.0@lin#hold")
+        self.assertEqual([len(frame._states) for frame in cue._frames], [2, 4])
+        self.assertEqual(cue._frames[1]._states[0].transition, "foo")
+
+
+if __name__ == "__main__":
+    unittest.main()
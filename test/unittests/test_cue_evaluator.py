@@ -0,0 +1,39 @@
+"""Unit test for the local cue evaluator."""
+import unittest
+
+import numpy as np
+
+from model import DataType
+from model.filter_data.cues.cue import Cue, EndAction
+from model.filter_data.cues.cue_evaluator import compile_cue
+
+
+class CueEvaluatorTest(unittest.TestCase):
+    """Unit test for the local cue evaluator."""
+
+    def setUp(self):
+        self._cue = Cue()
+        self._cue.add_channel("dimmer", DataType.DT_8_BIT)
+        self._cue.add_channel("color", DataType.DT_COLOR)
+        self._cue.from_string_definition("0.0:0@lin&0,0,0@lin|2.0:200@lin&120,1,1@edg|4.0:100@e_i&120,1,1@edg#hold")
+
+    def test_transfer_functions(self):
+        """Test linear, edge and ease-in transitions between key frames."""
+        compiled = compile_cue(self._cue)
+        samples = compiled.sample([0.0, 1.0, 0.9, 1.1, 3.0, 4.0])
+        dimmer = samples[:, compiled.channel_slices["dimmer"]].ravel()
+        hue = samples[:, compiled.channel_slices["color"]][:, 0]
+        np.testing.assert_allclose(dimmer, [0.0, 100.0, 90.0, 110.0, 175.0, 100.0])
+        np.testing.assert_allclose(hue, [0.0, 120.0, 0.0, 120.0, 120.0, 120.0])
+
+    def test_end_actions(self):
+        """Test that held cues keep their last values and restarting cues wrap around."""
+        compiled = compile_cue(self._cue)
+        np.testing.assert_allclose(compiled.sample([10.0])[0, 0], 100.0)
+        self._cue.end_action = EndAction.START_AGAIN
+        compiled = compile_cue(self._cue)
+        np.testing.assert_allclose(compiled.sample([4.5])[0, 0], 50.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Unit test for the array-backed states of cue key frames."""
+import unittest
+
+from model import DataType
+from model.color_hsi import ColorHSI
+from model.filter_data.cues.cue import Cue, KeyFrame, StateColor, StateEightBit
+
+
+class CueStatesTest(unittest.TestCase):
+    """Unit test for the array-backed states of cue key frames."""
+
+    def setUp(self):
+        self._cue = Cue()
+        self._cue.add_channel("dimmer", DataType.DT_8_BIT)
+        self._cue.add_channel("color", DataType.DT_COLOR)
+        self._cue.from_string_definition("0.0:10@lin&120.0,1.0,0.5@edg|1.0:20@sig&240.0,0.5,1.0@lin#hold")
+
+    def test_views_write_through(self):
+        """Test that states are views on the key frame and that appended states become views as well."""
+        frame = self._cue.frames[0]
+        frame._states[0]._value = 300
+        frame._states[1].color = ColorHSI(60.0, 1.0, 1.0)
+        frame._states[1].transition = "e_o"
+        self.assertEqual(frame._states[0], frame._states[0])
+        self.assertEqual(frame.format_filter_str(), "0.0:255@lin&60.0,1.0,1.0@e_o")
+
+        new_frame = KeyFrame(self._cue)
+        state = StateEightBit("e_i")
+        state._value = 42
+        new_frame.append_state(state)
+        state._value = 43
+        self.assertEqual(new_frame.format_filter_str(), "0.0:43@e_i")
+        self.assertIsInstance(self._cue.frames[1]._states[1], StateColor)
+
+    def test_copies_and_channels(self):
+        """Test that copies are independent and that channels can be added and removed."""
+        copy = self._cue.copy()
+        copy.frames[0]._states[0]._value = 1
+        self.assertEqual(self._cue.frames[0]._states[0]._value, 10)
+        self._cue.add_channel("speed", DataType.DT_DOUBLE)
+        self._cue.remove_channel(("dimmer", DataType.DT_8_BIT))
+        self.assertEqual(self._cue.format_cue(),
+                         "0.0:120.0,1.0,0.5@edg&0.0@edg|1.0:240.0,0.5,1.0@lin&0.0@edg#hold#do_nothing#No Name")
+        self.assertEqual(copy.format_cue().split("|")[0], "0.0:1@lin&120.0,1.0,0.5@edg")
+
+    def test_unknown_transitions(self):
+        """Test that unknown transitions are kept per state without exhausting the transition codes."""
+        cue = Cue()
+        cue.add_channel("dimmer", DataType.DT_8_BIT)
+        cue.add_channel("speed", DataType.DT_DOUBLE)
+        frames = [f"{i}.0:{i % 256}@custom_{i}&0.5@lin" for i in range(300)]
+        definition = "|".join(frames) + "#hold#do_nothing#Unknown"
+        cue.from_string_definition(definition)
+        self.assertEqual(cue.format_cue(), definition)
+        self.assertEqual(cue.frames[299]._states[0].transition, "custom_299")
+        with self.assertRaises(ValueError):
+            cue.to_columns()
+
+        copy = cue.copy()
+        copy.frames[0]._states[0].transition = "sig"
+        self.assertEqual(copy.frames[0].format_filter_str(), "0.0:0@sig&0.5@lin")
+        self.assertEqual(cue.frames[0].format_filter_str(), "0.0:0@custom_0&0.5@lin")
+
+        cue.add_channel("color", DataType.DT_COLOR)
+        cue.frames[2]._states[2]._transition_type = "late"
+        cue.remove_channel(("dimmer", DataType.DT_8_BIT))
+        cue.frames[1]._states[0]._transition_type = "custom"
+        self.assertEqual(cue.frames[1].format_filter_str(), "1.0:0.5@custom&180.0,0.0,0.0@edg")
+        self.assertEqual(cue.frames[2].format_filter_str(), "2.0:0.5@lin&180.0,0.0,0.0@late")
+
+        state = StateEightBit("custom")
+        new_frame = KeyFrame(self._cue)
+        new_frame.append_state(state)
+        self.assertEqual(new_frame.format_filter_str(), "0.0:0@custom")
+
+
+if __name__ == "__main__":
+    unittest.main()
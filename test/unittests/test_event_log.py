@@ -0,0 +1,83 @@
+"""Unit test for the bounded event log and its item model."""
+import unittest
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtTest import QAbstractItemModelTester
+
+from controller.utils.event_log import RATE_WINDOW, EventLog
+from proto.Events_pb2 import ONGOING_EVENT, SINGLE_TRIGGER, event
+from view.action_setup_view.event_log_model import EventLogModel, format_time
+
+
+def _event(event_id: int, sender_id: int = 1, event_type: int = SINGLE_TRIGGER, function: int = 0) -> event:
+    ev = event()
+    ev.event_id = event_id
+    ev.sender_id = sender_id
+    ev.sender_function = function
+    ev.type = event_type
+    ev.arguments.append(event_id % 256)
+    return ev
+
+
+class EventLogTest(unittest.TestCase):
+    """Unit test for the bounded event log and its item model."""
+
+    def test_eviction_and_statistics(self):
+        """Test that the log keeps only the newest entries and counts events per sender."""
+        log = EventLog(10)
+        fresh, updated = log.collect((_event(i, sender_id=i % 2), i * 0.125) for i in range(25))
+        self.assertEqual(updated, [])
+        log.append(fresh)
+        self.assertEqual(len(log), 10)
+        self.assertEqual(log.first_sequence, 15)
+        self.assertEqual(log[15].event_id, 15)
+        with self.assertRaises(IndexError):
+            _ = log[14]
+        self.assertEqual(log.statistics[0].total, 13)
+        self.assertEqual(log.statistics[1].last_seen, 2.875)
+        self.assertEqual(log.statistics[0].rate(3.0), 8 / RATE_WINDOW)
+
+        log.resize(4)
+        self.assertEqual([log[s].event_id for s in range(log.first_sequence, log.next_sequence)], [21, 22, 23, 24])
+        log.append(log.collect([(_event(25), 3.125)])[0])
+        self.assertEqual(log[25].event_id, 25)
+        self.assertEqual(len(log), 4)
+
+    def test_ongoing_aggregation(self):
+        """Test that bursts of ongoing events are merged and that hidden ongoing events are only counted."""
+        log = EventLog(100, ongoing_window=1.0)
+        fresh, _ = log.collect([(_event(i, event_type=ONGOING_EVENT), i * 0.1) for i in range(5)])
+        self.assertEqual(len(fresh), 1)
+        log.append(fresh)
+        fresh, updated = log.collect([(_event(5, event_type=ONGOING_EVENT), 0.5),
+                                      (_event(6, event_type=ONGOING_EVENT, function=1), 0.5),
+                                      (_event(7, event_type=ONGOING_EVENT), 1.2)])
+        self.assertEqual(updated, [0])
+        self.assertEqual(log[0].count, 6)
+        self.assertEqual(log[0].event_id, 5)
+        self.assertEqual([entry.event_id for entry in fresh], [6, 7])
+
+        log.ongoing_filter = lambda sender_id: sender_id != 1
+        fresh, updated = log.collect([(_event(8, event_type=ONGOING_EVENT), 1.3)])
+        self.assertEqual((fresh, updated), ([], []))
+        self.assertEqual(log.statistics[1].total, 9)
+
+    def test_model_rows_follow_log(self):
+        """Test that the model removes rows of evicted entries and updates rows of aggregated bursts."""
+        _app = QCoreApplication.instance() or QCoreApplication([])
+        model = EventLogModel(EventLog(5, ongoing_window=10.0))
+        _tester = QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+        model.add_events([(_event(i), float(i)) for i in range(3)])
+        self.assertEqual(model.rowCount(), 3)
+        model.add_events([(_event(i, event_type=ONGOING_EVENT), float(i)) for i in range(3, 8)])
+        self.assertEqual(model.rowCount(), 4)
+        self.assertEqual(model.index(3, 5).data(), "5")
+        model.add_events([(_event(i), float(i)) for i in range(8, 12)])
+        self.assertEqual(model.rowCount(), 5)
+        self.assertEqual(model.index(0, 1).data(), "7")
+        self.assertEqual(model.index(0, 6).data(), format_time(7.0))
+        model.set_capacity(2)
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.index(0, 1).data(), "10")
+        model.clear()
+        self.assertEqual(model.rowCount(), 0)
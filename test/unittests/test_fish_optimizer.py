@@ -0,0 +1,109 @@
+"""Unit test for the filter graph optimization of scenes uploaded to Fish."""
+import unittest
+import xml.etree.ElementTree as ET
+
+from controller.file.serializing.filter_serialization import (
+    _create_filter_element_for_fish,
+    create_channel_mappings_for_filter_set_for_fish,
+)
+from controller.file.serializing.fish_optimizer import SceneOptimizerModule
+from model import BoardConfiguration, Filter, Scene
+from model.filter import FilterTypeEnumeration
+from model.filter_graph import (
+    analyze_reachability,
+    analyze_scene_reachability,
+    filtermsg_targets,
+    is_gui_addressed,
+)
+
+
+class FishOptimizerTest(unittest.TestCase):
+    """Unit test for the filter graph optimization of scenes uploaded to Fish."""
+
+    def setUp(self):
+        self._show = BoardConfiguration()
+        self._scene = Scene(0, "Scene", self._show)
+        self._show.broadcaster.scene_created.emit(self._scene)
+
+    def _instantiated_filter(self, filter_id: str, filter_type: int, **kwargs: dict[str, str]) -> Filter:
+        """Create a filter as it would be instantiated by a virtual filter, i.e. not part of the scene's filters."""
+        return Filter(self._scene, filter_id, filter_type, (0, 0), **kwargs)
+
+    def test_identical_subgraphs_are_merged_and_unreachable_filters_removed(self):
+        """Test that identical pure subgraphs collapse, unreachable ones vanish and the outputs are rewired."""
+        filters = []
+        for index in range(2):
+            constant = self._instantiated_filter(f"c{index}", FilterTypeEnumeration.FILTER_CONSTANT_FLOAT,
+                                                 initial_parameters={"value": "0.5"})
+            adapter = self._instantiated_filter(f"a{index}", FilterTypeEnumeration.FILTER_ADAPTER_FLOAT_TO_8BIT_RANGE,
+                                                filter_configurations={"lower_bound": "0", "upper_bound": "255"})
+            adapter.channel_links["value_in"] = f"c{index}:value"
+            filters.extend((constant, adapter))
+        unused = self._instantiated_filter("unused", FilterTypeEnumeration.FILTER_TRIGONOMETRICS_SIN)
+        unused.channel_links["value_in"] = "c0:value"
+        user_constant = Filter(self._scene, "user", FilterTypeEnumeration.FILTER_CONSTANT_FLOAT, (0, 0),
+                               initial_parameters={"value": "0.5"})
+        self._scene.append_filter(user_constant)
+        universe = self._instantiated_filter("out", FilterTypeEnumeration.FILTER_UNIVERSE_OUTPUT,
+                                             filter_configurations={"universe": "1", "ch0": "1", "ch1": "2"})
+        universe.channel_links.update({"ch0": "a0:value", "ch1": "a1:value"})
+        filters.extend((unused, user_constant, universe))
+
+        scene_element = ET.Element("scene")
+        om = SceneOptimizerModule(True, frozenset(f.filter_id for f in self._scene.filters))
+        for f in filters:
+            _create_filter_element_for_fish(f, scene_element, True, om)
+        create_channel_mappings_for_filter_set_for_fish(True, om, scene_element)
+
+        placed_ids = {e.attrib["id"] for e in scene_element.iterfind("filter")}
+        self.assertEqual(placed_ids, {"c0", "a0", "out"})
+        self.assertEqual((om.report.merged_filters, om.report.removed_filters, om.report.remaining_filters), (2, 2, 2))
+        links = {e.attrib["input_channel_id"]: e.attrib["output_channel_id"]
+                 for e in scene_element.find("filter[@id='out']").iterfind("channellink")}
+        self.assertEqual(links, {"out__ch0": "a0:value", "out__ch1": "a0:value"})
+
+    def test_scene_reachability(self):
+        """Test that only filters feeding a sink or addressed by the GUI are reachable."""
+        for filter_id, filter_type in (("c", FilterTypeEnumeration.FILTER_CONSTANT_8BIT),
+                                       ("debug", FilterTypeEnumeration.FILTER_DEBUG_OUTPUT_8BIT),
+                                       ("orphan", FilterTypeEnumeration.FILTER_CONSTANT_8BIT),
+                                       ("fader", FilterTypeEnumeration.FILTER_FADER_RAW)):
+            self._scene.append_filter(Filter(self._scene, filter_id, filter_type, (0, 0)))
+        self._scene.get_filter_by_id("debug").channel_links["value"] = "c:value"
+
+        reachability = analyze_scene_reachability(self._scene)
+        self.assertEqual(reachability.reachable, {"c", "debug", "fader"})
+        self.assertEqual(reachability.unreachable, ["orphan"])
+
+    def test_macro_targets_are_reachable(self):
+        """Test that filters updated by macro commands are kept, unless the command targets another scene."""
+        for filter_id in ("by_macro", "by variable scene", "other_scene"):
+            self._scene.append_filter(Filter(self._scene, filter_id, FilterTypeEnumeration.FILTER_CONSTANT_8BIT,
+                                             (0, 0)))
+        commands = ["showctl filtermsg 0 by_macro value 42",
+                    'showctl filtermsg $scene "by variable scene" value 1  # comment',
+                    "showctl filtermsg 1 other_scene value 2",
+                    "showctl select-scene 0"]
+        addressed = filtermsg_targets(commands, self._scene.scene_id)
+        self.assertEqual(addressed, {"by_macro", "by variable scene"})
+
+        reachability = analyze_reachability(self._scene.filters, tuple(addressed))
+        self.assertEqual(reachability.reachable, {"by_macro", "by variable scene"})
+        self.assertEqual(reachability.unreachable, ["other_scene"])
+
+    def test_addressed_ids_do_not_match_by_plain_prefix(self):
+        """Test that an addressed ID keeps the children of its virtual filter, but not filters sharing its prefix."""
+        for filter_id in ("cue", "cue2", "cue__ch", "cue_ch", "my__cue__ch"):
+            self._scene.append_filter(Filter(self._scene, filter_id, FilterTypeEnumeration.FILTER_CONSTANT_8BIT,
+                                             (0, 0)))
+        addressed = frozenset({"cue", "my__cue"})
+        self.assertTrue(is_gui_addressed("cue__ch", addressed))
+        self.assertFalse(is_gui_addressed("cue2", addressed))
+
+        reachability = analyze_reachability(self._scene.filters, addressed)
+        self.assertEqual(reachability.reachable, {"cue", "cue__ch", "my__cue__ch"})
+        self.assertEqual(reachability.unreachable, ["cue2", "cue_ch"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Unit test for the fixture address index."""
+import unittest
+
+from model.patching.fixture_address_index import UniverseFixtureIndex
+
+
+class _Fixture:
+    def __init__(self, start_index: int, channel_length: int) -> None:
+        self.start_index = start_index
+        self.channel_length = channel_length
+
+
+class FixtureAddressIndexTest(unittest.TestCase):
+    """Unit test for the fixture address index."""
+
+    def test_lookup_and_occupancy(self):
+        """Test address lookups and occupied channel queries."""
+        index = UniverseFixtureIndex()
+        first, second = _Fixture(0, 4), _Fixture(10, 6)
+        index.add(first)
+        index.add(second)
+        self.assertIs(index.fixture_at(3), first)
+        self.assertIsNone(index.fixture_at(4))
+        self.assertIs(index.fixture_at(15), second)
+        self.assertIsNone(index.fixture_at(512))
+        self.assertEqual(index.occupied_channels().tolist(), [0, 1, 2, 3, 10, 11, 12, 13, 14, 15])
+        self.assertEqual(index.overlapping_fixtures(2, 10), {first, second})
+        self.assertEqual(index.overlapping_fixtures(4, 6), set())
+
+    def test_free_ranges_and_moves(self):
+        """Test the free range search and incremental updates after an address change."""
+        index = UniverseFixtureIndex()
+        fixture = _Fixture(4, 8)
+        index.add(fixture)
+        self.assertEqual(index.find_free_range(4), 0)
+        self.assertEqual(index.find_free_range(5), 12)
+        self.assertEqual(index.find_free_range(500), 12)
+        self.assertIsNone(index.find_free_range(501))
+        overlapping = _Fixture(6, 2)
+        index.add(overlapping)
+        index.remove(overlapping)
+        self.assertIs(index.fixture_at(6), fixture)
+        previous_start = fixture.start_index
+        fixture.start_index = 100
+        index.remove(fixture, previous_start)
+        index.add(fixture)
+        self.assertIsNone(index.fixture_at(4))
+        self.assertIs(index.fixture_at(107), fixture)
+        self.assertEqual(index.find_free_range(100), 0)
+        self.assertEqual(len(index), 1)
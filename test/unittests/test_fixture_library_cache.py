@@ -0,0 +1,52 @@
+"""Unit test for the fixture library index and the fixture definition cache."""
+import json
+import os
+import tempfile
+import unittest
+
+from model.ofl.fixture import clear_fixture_cache, load_fixture
+from model.ofl.manufacture import generate_manufacturers
+
+
+def _write_fixture(path: str, name: str, modes: list[str]) -> None:
+    with open(path, "w", encoding="UTF-8") as f:
+        json.dump({"name": name, "categories": ["Dimmer"], "modes": [{"name": m, "channels": []} for m in modes]}, f)
+
+
+class FixtureLibraryCacheTest(unittest.TestCase):
+    """Unit test for the fixture library index and the fixture definition cache."""
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._fixtures = os.path.join(self._directory.name, "fixtures")
+        os.makedirs(os.path.join(self._fixtures, "acme"))
+        with open(os.path.join(self._fixtures, "manufacturers.json"), "w", encoding="UTF-8") as f:
+            json.dump({"$schema": "", "acme": {"name": "Acme"}}, f)
+        self._fixture_file = os.path.join(self._fixtures, "acme", "par.json")
+        _write_fixture(self._fixture_file, "Par", ["1ch", "3ch"])
+        clear_fixture_cache()
+
+    def tearDown(self):
+        clear_fixture_cache()
+        self._directory.cleanup()
+
+    def test_index_invalidation(self):
+        """Test that the index is written and only stale entries are rebuilt."""
+        manufacturers = generate_manufacturers(self._fixtures)
+        self.assertEqual(manufacturers[0][0]["name"], "Acme")
+        self.assertEqual(manufacturers[0][1][0]["modes"], ["1ch", "3ch"])
+        index_file = os.path.join(self._directory.name, "fixture_index.json")
+        self.assertTrue(os.path.isfile(index_file))
+
+        _write_fixture(self._fixture_file, "Par Pro", ["1ch", "3ch", "16ch"])
+        summary = generate_manufacturers(self._fixtures)[0][1][0]
+        self.assertEqual(summary["name"], "Par Pro")
+        self.assertEqual(summary["modes"], ["1ch", "3ch", "16ch"])
+
+    def test_shared_fixture_definition(self):
+        """Test that the validated definition is shared by path and reloaded once the file changes."""
+        fixture = load_fixture(self._fixture_file)
+        self.assertEqual(fixture.fileName, "acme/par.json")
+        self.assertIs(load_fixture(self._fixture_file), fixture)
+        _write_fixture(self._fixture_file, "Par Pro", ["1ch", "3ch", "16ch"])
+        self.assertEqual(len(load_fixture(self._fixture_file).modes), 3)
@@ -0,0 +1,99 @@
+"""Unit test for the shared frame clock."""
+import unittest
+
+from PySide6.QtCore import QCoreApplication, QEvent, QObject
+
+from controller.utils.frame_clock import FrameClock
+
+
+class FrameClockTest(unittest.TestCase):
+    """Unit test for the shared frame clock."""
+
+    def setUp(self):
+        self._app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_intervals_and_timer_state(self):
+        """Test that subscribers are called at their intervals and the timer only runs with subscribers."""
+        clock = FrameClock(rate=20)
+        calls: list[str] = []
+
+        def every_frame() -> None:
+            calls.append("frame")
+
+        def every_200ms() -> None:
+            calls.append("slow")
+
+        self.assertFalse(clock.running)
+        clock.subscribe(every_frame)
+        clock.subscribe(every_200ms, 200)
+        self.assertTrue(clock.running)
+        for frame in range(10):
+            clock._run_frame(100.0 + frame * 0.05)
+        self.assertEqual(calls.count("frame"), 10)
+        # Due at 100.0, 100.2, 100.4
+        self.assertEqual(calls.count("slow"), 3)
+
+        clock.unsubscribe(every_frame)
+        self.assertTrue(clock.running)
+        clock.unsubscribe(every_200ms)
+        self.assertFalse(clock.running)
+        clock.unsubscribe(every_200ms)
+
+    def test_statistics_and_failing_subscribers(self):
+        """Test that callback cost is recorded per subscriber and that a failing subscriber does not stop the tick."""
+        clock = FrameClock(rate=50)
+        calls: list[int] = []
+
+        def failing() -> None:
+            raise RuntimeError("broken subscriber")
+
+        clock.subscribe(failing, name="failing")
+        clock.subscribe(lambda: calls.append(1), name="counting")
+        with self.assertLogs("controller.utils.frame_clock", "ERROR"):
+            clock._run_frame(1.0)
+        self.assertEqual(calls, [1])
+        statistics = {entry.name: entry for entry in clock.statistics()}
+        self.assertEqual(statistics["counting"].calls, 1)
+        self.assertEqual(statistics["failing"].calls, 1)
+        self.assertGreaterEqual(statistics["counting"].maximum, 0.0)
+
+    def test_tick_interval_follows_subscribers(self):
+        """Test that the timer ticks at the shortest subscribed interval, bounded by the rate of the clock."""
+        clock = FrameClock(rate=50)
+
+        def every_100ms() -> None:
+            pass
+
+        def every_frame() -> None:
+            pass
+
+        clock.subscribe(every_100ms, 100)
+        self.assertAlmostEqual(clock.tick_interval, 0.1)
+        clock.subscribe(every_frame)
+        self.assertAlmostEqual(clock.tick_interval, 0.02)
+        clock.subscribe(every_frame, 5)
+        self.assertAlmostEqual(clock.tick_interval, 0.02)
+        clock.unsubscribe(every_frame)
+        self.assertAlmostEqual(clock.tick_interval, 0.1)
+        clock.rate = 5
+        self.assertAlmostEqual(clock.tick_interval, 0.2)
+        clock.unsubscribe(every_100ms)
+
+    def test_subscription_ends_with_owner(self):
+        """Test that a subscription bound to an object is dropped once the object is destroyed."""
+        clock = FrameClock(rate=50)
+        owner = QObject()
+        calls: list[int] = []
+
+        def callback() -> None:
+            calls.append(1)
+
+        clock.subscribe_while_alive(owner, callback)
+        clock._run_frame(1.0)
+        self.assertTrue(clock.is_subscribed(callback))
+        owner.deleteLater()
+        QCoreApplication.sendPostedEvents(owner, QEvent.Type.DeferredDelete)
+        self.assertFalse(clock.is_subscribed(callback))
+        self.assertFalse(clock.running)
+        clock._run_frame(2.0)
+        self.assertEqual(calls, [1])
@@ -0,0 +1,50 @@
+"""Unit test for the sorted key frame storage of cues."""
+import unittest
+
+from model import DataType
+from model.filter_data.cues.cue import Cue, KeyFrame
+
+
+class KeyFrameListTest(unittest.TestCase):
+    """Unit test for the sorted key frame storage of cues."""
+
+    def setUp(self):
+        self._cue = Cue()
+        self._cue.add_channel("dimmer", DataType.DT_8_BIT)
+        self._cue.from_string_definition("2.0:20@lin|0.5:5@lin|1.0:10@lin|1.0:11@lin#hold")
+
+    def _timestamps(self) -> list[float]:
+        return [frame.timestamp for frame in self._cue.frames]
+
+    def test_sorted_insertion(self):
+        """Test that frames are kept sorted and that frames with equal time stamps keep their order."""
+        self.assertEqual(self._timestamps(), [0.5, 1.0, 1.0, 2.0])
+        self.assertEqual([frame._states[0]._value for frame in self._cue.frames], [5, 10, 11, 20])
+        frame = KeyFrame(self._cue)
+        frame.timestamp = 3.0
+        self._cue.insert_frame(frame)
+        self.assertEqual(self._cue.duration, 3.0)
+
+    def test_moving_and_removing(self):
+        """Test that changing time stamps reorders the frames and updates the duration."""
+        last_frame = self._cue.frames[-1]
+        last_frame.timestamp = 0.1
+        self.assertEqual(self._timestamps(), [0.1, 0.5, 1.0, 1.0])
+        self.assertEqual(self._cue.duration, 1.0)
+        self._cue.frames[2].delete_from_parent_cue()
+        self.assertEqual([frame._states[0]._value for frame in self._cue.frames], [20, 5, 11])
+        self.assertNotIn(KeyFrame(self._cue), self._cue.frames)
+
+    def test_queries(self):
+        """Test the lookup of the nearest frame and of the frames within a time window."""
+        frames = self._cue.frames
+        self.assertIs(frames.nearest(0.0), frames[0])
+        self.assertIs(frames.nearest(1.4), frames[1])
+        self.assertIs(frames.nearest(1.6), frames[3])
+        self.assertIs(frames.nearest(9.0), frames[3])
+        self.assertEqual(frames.in_range(0.5, 1.0), frames[0:3])
+        self.assertEqual(frames.in_range(1.5, 1.9), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""Unit test for the bounded log storage and its item model."""
+import logging
+import unittest
+
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtTest import QAbstractItemModelTester
+
+from controller.utils.log_buffer import FISH_LOGGER_NAME, LogEntry, LogRingBuffer, LogTransport
+from signal_logging import SignalLoging
+from view.logging_view.log_model import LogModel
+
+
+def _entry(index: int) -> LogEntry:
+    return LogEntry(("DEBUG", "INFO", "WARNING")[index % 3], f"message {index}\nsecond line", 0.0,
+                    f"logger_{index % 2}", f"module_{index % 5}", "function", index, "MainThread")
+
+
+class LogRingBufferTest(unittest.TestCase):
+    """Unit test for the bounded log storage and its item model."""
+
+    def test_eviction_and_indexed_query(self):
+        """Test that the buffer keeps only the newest entries and that queries match a linear filter."""
+        buffer = LogRingBuffer(10)
+        buffer.extend(_entry(i) for i in range(25))
+        self.assertEqual(len(buffer), 10)
+        self.assertEqual(buffer.first_sequence, 15)
+        self.assertEqual(buffer[15].line, 15)
+        with self.assertRaises(IndexError):
+            _ = buffer[14]
+
+        for levels, criteria in ((None, ()), ({"DEBUG", "WARNING"}, ()), ({"INFO"}, [("logger", "_1")]),
+                                 (None, [("module", "module_3"), ("message", "2")])):
+            expected = [s for s in range(15, 25) if buffer[s].matches(levels, criteria)]
+            self.assertEqual(buffer.query(levels, criteria), expected)
+        self.assertEqual(sorted(buffer.values("module")), [f"module_{i}" for i in range(5)])
+
+    def test_model_rows_follow_buffer(self):
+        """Test that the model removes rows of evicted entries and only inserts entries passing the filter."""
+        _app = QCoreApplication.instance() or QCoreApplication([])
+        model = LogModel(LogRingBuffer(10))
+        _tester = QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+        model.set_filter({"INFO", "WARNING"}, ())
+        model.append_entries([_entry(i) for i in range(6)])
+        self.assertEqual(model.rowCount(), 4)
+        model.append_entries([_entry(i) for i in range(6, 16)])
+        self.assertEqual(model.rowCount(), 6)
+        self.assertEqual(model.index(0, 1).data(), "message 7")
+        child = model.index(1, 1, model.index(0, 0))
+        self.assertEqual(child.data(), "message 7\nsecond line")
+        self.assertEqual(child.parent().row(), 0)
+
+    def test_transport_drops_records_below_gui_level(self):
+        """Test that the handler only captures records at or above the level of the GUI and that draining empties it."""
+        handler = SignalLoging()
+        handler._transport = LogTransport(100)
+        handler._transport.level = logging.INFO
+        test_logger = logging.getLogger("test_log_buffer.transport")
+        test_logger.propagate = False
+        test_logger.setLevel(logging.DEBUG)
+        test_logger.addHandler(handler)
+        try:
+            test_logger.debug("hidden")
+            test_logger.info("shown %d", 1)
+            test_logger.error("extra", extra={"sender": "x"})
+        finally:
+            test_logger.removeHandler(handler)
+        entries = handler._transport.drain()
+        self.assertEqual([entry.message for entry in entries], ["shown 1", "extra"])
+        self.assertEqual(entries[1].field("sender"), "x")
+        self.assertEqual(handler._transport.drain(), [])
+
+    def test_fish_records_bypass_gui_level(self):
+        """Test that records from Fish are captured although no level is displayed, so Fish exceptions are found."""
+        handler = SignalLoging()
+        handler._transport = LogTransport(100)
+        handler._transport.level = logging.CRITICAL + 1
+        self.assertTrue(handler.handle(logging.makeLogRecord(
+            {"name": FISH_LOGGER_NAME, "levelno": logging.DEBUG, "msg": "E003 Logs:\nfailed Reason: broken"})))
+        self.assertFalse(handler.handle(logging.makeLogRecord(
+            {"name": "test_log_buffer.transport", "levelno": logging.ERROR, "msg": "dropped"})))
+        self.assertEqual([entry.message for entry in handler._transport.drain()], ["E003 Logs:\nfailed Reason: broken"])
@@ -0,0 +1,119 @@
+"""Unit test for the Fish stream frame decoder."""
+import unittest
+
+from PySide6.QtCore import QCoreApplication
+
+import proto.FilterMode_pb2
+import proto.MessageTypes_pb2
+import varint
+from controller.network import NetworkManager
+from controller.network_stream import CoalescingMessageQueue, FrameDecoder, FrameWriteBuffer
+
+
+def _frame(msg_type: int, payload: bytes) -> bytes:
+    return varint.encode(msg_type) + varint.encode(len(payload)) + payload
+
+
+class FrameDecoderTest(unittest.TestCase):
+    """Unit test for the Fish stream frame decoder."""
+
+    def test_multiple_frames_in_one_read(self):
+        """Test that all complete frames of a single read are decoded."""
+        decoder = FrameDecoder()
+        decoder.feed(_frame(3, b"abc") + _frame(7, b"") + _frame(12, b"x" * 300))
+        frames = [(msg_type, bytes(payload)) for msg_type, payload in decoder.frames()]
+        self.assertEqual(frames, [(3, b"abc"), (7, b""), (12, b"x" * 300)])
+        self.assertEqual(decoder.pending_bytes, 0)
+        self.assertEqual(decoder.statistics.total_frames, 3)
+
+    def test_frames_split_across_reads(self):
+        """Test that partial frames are carried over until they are complete."""
+        data = _frame(5, b"first payload") + _frame(6, b"y" * 200) + _frame(200, b"last")
+        decoder = FrameDecoder()
+        frames = []
+        for i in range(len(data)):
+            decoder.feed(data[i:i + 1])
+            frames.extend((msg_type, bytes(payload)) for msg_type, payload in decoder.frames())
+        self.assertEqual(frames, [(5, b"first payload"), (6, b"y" * 200), (200, b"last")])
+        self.assertEqual(decoder.pending_bytes, 0)
+        self.assertEqual(decoder.statistics.total_bytes, len(data))
+
+    def test_malformed_varint(self):
+        """Test that an overlong varint is reported as an error."""
+        decoder = FrameDecoder()
+        decoder.feed(b"\xff" * 12)
+        with self.assertRaises(ValueError):
+            list(decoder.frames())
+
+
+class FrameWriteBufferTest(unittest.TestCase):
+    """Unit test for the batched send buffer."""
+
+    def test_round_trip(self):
+        """Test that batched frames match the reference encoding and grow the buffer if required."""
+        write_buffer = FrameWriteBuffer(initial_capacity=16)
+        messages = [(1, b"a"), (130, b"b" * 1000), (14, b"")]
+        for msg_type, payload in messages:
+            write_buffer.append(msg_type, payload)
+        self.assertEqual(write_buffer.frame_count, 3)
+        data = write_buffer.take()
+        self.assertEqual(bytes(data), b"".join(_frame(msg_type, payload) for msg_type, payload in messages))
+        self.assertEqual(len(write_buffer), 0)
+        decoder = FrameDecoder()
+        decoder.feed(data)
+        self.assertEqual([(t, bytes(p)) for t, p in decoder.frames()], messages)
+
+
+class CoalescingMessageQueueTest(unittest.TestCase):
+    """Unit test for the last-value-wins send queue."""
+
+    def test_last_value_wins(self):
+        """Test that only the newest keyed message is kept and moved behind messages issued in between."""
+        message_queue = CoalescingMessageQueue()
+        self.assertFalse(message_queue.put(b"a1", 1, ("param", "a")))
+        self.assertFalse(message_queue.put(b"b1", 1, ("param", "b")))
+        self.assertFalse(message_queue.put(b"cmd", 2))
+        self.assertTrue(message_queue.put(b"a2", 1, ("param", "a")))
+        self.assertFalse(message_queue.put(b"cmd", 2))
+        self.assertEqual(message_queue.take_all(), [(b"b1", 1), (b"cmd", 2), (b"a2", 1), (b"cmd", 2)])
+        self.assertTrue(message_queue.empty())
+
+
+class NetworkManagerSendQueueTest(unittest.TestCase):
+    """Unit test for the coalescing of parameter updates by the network manager."""
+
+    def setUp(self):
+        self._app = QCoreApplication.instance() or QCoreApplication([])
+        self._network_manager = NetworkManager()
+        self._network_manager._message_queue.take_all()
+        self._was_running = self._network_manager._is_running
+        self._network_manager._is_running = True
+
+    def tearDown(self):
+        self._network_manager._message_queue.take_all()
+        self._network_manager._is_running = self._was_running
+
+    def _queued_parameter_values(self) -> list[str]:
+        values = []
+        for msg, msg_type in self._network_manager._message_queue.take_all():
+            if msg_type == proto.MessageTypes_pb2.MSGT_UPDATE_PARAMETER:
+                values.append(proto.FilterMode_pb2.update_parameter.FromString(bytes(msg)).parameter_value)
+        return values
+
+    def test_commands_to_the_same_key_are_all_transmitted(self):
+        """Test that queued commands to the same parameter are not coalesced, neither directly nor in ready mode."""
+        self._network_manager.send_gui_update_to_fish(1, "cue", "run_mode", "stop", enque=True)
+        self._network_manager.send_gui_update_to_fish(1, "cue", "run_mode", "play", enque=True)
+        self.assertEqual(self._queued_parameter_values(), ["stop", "play"])
+
+        self._network_manager.enter_readymode(send_immediately=False)
+        self._network_manager.send_gui_update_to_fish(1, "cue", "run_mode", "to_next_cue", enque=True)
+        self._network_manager.send_gui_update_to_fish(1, "cue", "run_mode", "to_next_cue", enque=True)
+        self._network_manager.commit_readymode(send_immediately=False)
+        self.assertEqual(self._queued_parameter_values(), ["to_next_cue", "to_next_cue"])
+
+    def test_state_updates_are_coalesced_on_request(self):
+        """Test that only the newest state update of a parameter is kept if coalescing is requested."""
+        for value in ("10", "20", "30"):
+            self._network_manager.send_gui_update_to_fish(1, "fader", "value", value, enque=True, coalesce=True)
+        self.assertEqual(self._queued_parameter_values(), ["30"])
@@ -0,0 +1,59 @@
+"""Unit test for cloning scenes."""
+import unittest
+
+from controller.file.serializing.fragment_cache import scene_content_hash
+from model import BoardConfiguration, Filter, Scene
+from model.filter import FilterTypeEnumeration
+
+
+class SceneCloneTest(unittest.TestCase):
+    """Unit test for cloning scenes."""
+
+    def setUp(self):
+        self._show = BoardConfiguration()
+        self._scene = Scene(0, "Scene", self._show)
+        self._show.broadcaster.scene_created.emit(self._scene)
+        for i in range(3):
+            f = Filter(self._scene, f"constant_{i}", FilterTypeEnumeration.FILTER_CONSTANT_8BIT, (0, 0),
+                       initial_parameters={"value": str(i)})
+            if i > 0:
+                f.channel_links["value_in"] = f"constant_{i - 1}:value"
+            self._scene.append_filter(f)
+        self._scene.ensure_bankset()
+
+    def test_clone_is_independent(self):
+        """Test that modifications of a cloned filter or its source do not affect the other one."""
+        clone = self._scene.copy(self._show.scenes)
+        self.assertNotEqual(clone.scene_id, self._scene.scene_id)
+        self.assertEqual([f.filter_id for f in clone.filters], [f.filter_id for f in self._scene.filters])
+        self.assertIs(clone.get_filter_by_id("constant_2").scene, clone)
+
+        clone.get_filter_by_id("constant_1").initial_parameters["value"] = "42"
+        self._scene.get_filter_by_id("constant_2").channel_links["value_in"] = ""
+        self.assertEqual(self._scene.get_filter_by_id("constant_1").initial_parameters["value"], "1")
+        self.assertEqual(clone.get_filter_by_id("constant_2").channel_links["value_in"], "constant_1:value")
+
+    def test_clone_id_is_unique(self):
+        """Test that the ID of a clone differs from all existing scene IDs."""
+        for scene_id in (1, 2):
+            self._show.broadcaster.scene_created.emit(Scene(scene_id, "Other", self._show))
+        clone = self._scene.copy(self._show.scenes)
+        self.assertNotIn(clone.scene_id, [s.scene_id for s in self._show.scenes])
+
+    def test_reading_keeps_dicts_shared(self):
+        """Test that hashing a clone only reads the filter dicts, which stay shared until one side modifies them."""
+        clone = self._scene.copy(self._show.scenes)
+        self.assertEqual(scene_content_hash(clone), scene_content_hash(clone))
+        source_filter = self._scene.get_filter_by_id("constant_2")
+        cloned_filter = clone.get_filter_by_id("constant_2")
+        self.assertIs(cloned_filter._channel_links, source_filter._channel_links)
+        with self.assertRaises(TypeError):
+            cloned_filter.channel_links_view["value_in"] = ""
+
+        cloned_filter.channel_links["value_in"] = ""
+        self.assertIsNot(cloned_filter._channel_links, source_filter._channel_links)
+        self.assertEqual(source_filter.channel_links_view["value_in"], "constant_1:value")
+
+
+if __name__ == "__main__":
+    unittest.main()
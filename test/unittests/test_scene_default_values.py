@@ -0,0 +1,89 @@
+"""Unit test for the DMX default values of scenes."""
+import unittest
+
+import numpy as np
+
+from model import BoardConfiguration, Scene
+from model.scene import DmxDefaultValue
+from model.universe import NUMBER_OF_CHANNELS
+
+
+class SceneDefaultValuesTest(unittest.TestCase):
+    """Unit test for the DMX default values of scenes."""
+
+    def setUp(self):
+        self._show = BoardConfiguration()
+        self._scene = Scene(0, "Scene", self._show)
+        self._show.broadcaster.scene_created.emit(self._scene)
+        self._scene.ensure_bankset()
+        self._changes = 0
+
+        def count_change() -> None:
+            self._changes += 1
+
+        self._scene.default_values_changed.connect(count_change)
+
+    def test_insert_update_and_remove(self):
+        """Test that single values are added, overwritten and removed, and that unset channels have no value."""
+        self.assertIsNone(self._scene.get_dmx_default_value(1, 0))
+        self.assertFalse(self._scene.insert_dmx_default_value(1, 5, 0))
+        self.assertEqual(self._scene.get_dmx_default_value(1, 5), 0)
+        self.assertTrue(self._scene.insert_dmx_default_value(1, 5, 255))
+        self.assertEqual(self._scene.get_dmx_default_value(1, 5), 255)
+        self.assertIsNone(self._scene.get_dmx_default_value(1, 4))
+        self.assertIsNone(self._scene.get_dmx_default_value(2, 5))
+
+        self._scene.remove_dmx_default_value(1, 5)
+        self.assertIsNone(self._scene.get_dmx_default_value(1, 5))
+        self.assertFalse(self._scene.insert_dmx_default_value(1, 5, 7))
+        self.assertEqual(self._changes, 4)
+
+        # Removing unset channels or channels of unknown universes does not emit a change
+        self._scene.remove_dmx_default_value(1, 6)
+        self._scene.remove_dmx_default_value(3, 6)
+        self.assertEqual(self._changes, 4)
+        self._scene.insert_dmx_default_value(1, 6, 1, supress_emission=True)
+        self.assertEqual(self._changes, 4)
+
+        with self.assertRaises(ValueError):
+            self._scene.insert_dmx_default_value(1, NUMBER_OF_CHANNELS, 0)
+        with self.assertRaises(ValueError):
+            self._scene.insert_dmx_default_values(1, [0, 0], start_channel=NUMBER_OF_CHANNELS - 1)
+
+    def test_insert_range_and_order(self):
+        """Test that channel ranges are stored at once and that values are listed by universe and channel."""
+        self._scene.insert_dmx_default_value(2, 3, 30, supress_emission=True)
+        self._scene.insert_dmx_default_values(2, np.array([10, 11, 12]), start_channel=0, supress_emission=True)
+        self._scene.insert_dmx_default_values(1, [255], start_channel=NUMBER_OF_CHANNELS - 1, supress_emission=True)
+        self._scene.insert_dmx_default_value(0, 100, 1, supress_emission=True)
+        self.assertEqual(self._changes, 0)
+        self._scene.sort_dmx_default_values()
+        self.assertEqual(self._changes, 1)
+
+        self.assertEqual(self._scene.dmx_default_values, [
+            DmxDefaultValue(0, 100, 1),
+            DmxDefaultValue(1, NUMBER_OF_CHANNELS - 1, 255),
+            DmxDefaultValue(2, 0, 10),
+            DmxDefaultValue(2, 1, 11),
+            DmxDefaultValue(2, 2, 12),
+            DmxDefaultValue(2, 3, 30),
+        ])
+        self.assertTrue(all(isinstance(value.channel, int) and isinstance(value.value, int)
+                            for value in self._scene.dmx_default_values))
+
+        self._scene.insert_dmx_default_values(2, [20, 21], start_channel=1)
+        self.assertEqual([value.value for value in self._scene.dmx_default_values if value.universe_id == 2],
+                         [10, 20, 21, 30])
+
+    def test_copy_is_independent(self):
+        """Test that a copied scene keeps the default values but does not share them."""
+        self._scene.insert_dmx_default_value(1, 0, 42)
+        self._scene.insert_dmx_default_value(4, 511, 43)
+        clone = self._scene.copy(self._show.scenes)
+        self.assertEqual(clone.dmx_default_values, self._scene.dmx_default_values)
+
+        clone.insert_dmx_default_value(1, 0, 1)
+        clone.remove_dmx_default_value(4, 511)
+        clone.insert_dmx_default_value(1, 1, 2)
+        self.assertEqual(self._scene.dmx_default_values, [DmxDefaultValue(1, 0, 42), DmxDefaultValue(4, 511, 43)])
+        self.assertEqual(clone.dmx_default_values, [DmxDefaultValue(1, 0, 1), DmxDefaultValue(1, 1, 2)])
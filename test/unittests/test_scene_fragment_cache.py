@@ -0,0 +1,40 @@
+"""Unit test for the cache of serialized scenes uploaded to Fish."""
+import unittest
+import xml.etree.ElementTree as ET
+
+from controller.file.serializing.fragment_cache import SceneFragmentCache
+from controller.file.serializing.general_serialization import create_xml
+from controller.utils.process_notifications import get_process_notifier
+from model import BoardConfiguration, Filter, Scene
+from model.filter import FilterTypeEnumeration
+
+
+class SceneFragmentCacheTest(unittest.TestCase):
+    """Unit test for the cache of serialized scenes uploaded to Fish."""
+
+    def setUp(self):
+        self._show = BoardConfiguration()
+        for scene_id in range(3):
+            scene = Scene(scene_id, f"Scene {scene_id}", self._show)
+            scene.append_filter(Filter(scene, "constant", FilterTypeEnumeration.FILTER_CONSTANT_8BIT, (0, 0),
+                                       initial_parameters={"value": str(scene_id)}))
+            scene.insert_dmx_default_value(0, scene_id, 255)
+            self._show.broadcaster.scene_created.emit(scene)
+        self._pn = get_process_notifier("Test", 0)
+
+    def tearDown(self):
+        self._pn.close()
+
+    def test_fragments_match_full_serialization(self):
+        """Test that only changed scenes are regenerated and that the result matches the full serialization."""
+        cache = SceneFragmentCache()
+        document = cache.assemble(self._show, self._pn)
+        self.assertEqual(document.regenerated_scenes, 3)
+        self.assertEqual(cache.assemble(self._show, self._pn).regenerated_scenes, 0)
+
+        self._show.scenes[1].filters[0].initial_parameters["value"] = "42"
+        document = cache.assemble(self._show, self._pn)
+        self.assertEqual(document.regenerated_scenes, 1)
+        expected = ET.tostring(create_xml(self._show, self._pn, assemble_for_fish_loading=True), encoding="utf8",
+                               method="xml")
+        self.assertEqual(document.data, expected)
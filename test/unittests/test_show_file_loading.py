@@ -0,0 +1,39 @@
+"""Unit test for the show file loading pipeline."""
+import os
+import tempfile
+import unittest
+
+from controller.file.deserialization.loading_pipeline import get_show_file_schema
+from controller.utils.process_notifications import get_process_notifier
+
+_SCHEMA = """<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema">
+    <xs:element name="{}" type="xs:string"/>
+</xs:schema>
+"""
+
+
+class ShowFileLoadingTest(unittest.TestCase):
+    """Unit test for the show file loading pipeline."""
+
+    def test_schema_cache(self):
+        """Test that the compiled schema is reused until the schema file changes."""
+        with tempfile.TemporaryDirectory() as directory:
+            schema_file = os.path.join(directory, "schema.xsd")
+            with open(schema_file, "w", encoding="UTF-8") as f:
+                f.write(_SCHEMA.format("show"))
+            schema = get_show_file_schema(schema_file)
+            self.assertIs(get_show_file_schema(schema_file), schema)
+            with open(schema_file, "w", encoding="UTF-8") as f:
+                f.write(_SCHEMA.format("show_file"))
+            self.assertIn("show_file", get_show_file_schema(schema_file).elements)
+
+    def test_stage_timings(self):
+        """Test that timed stages advance the progress and record their duration."""
+        pn = get_process_notifier("Test", 3)
+        with pn.timed_stage("First stage."):
+            pass
+        with pn.timed_stage("Second stage.", steps=2):
+            pass
+        self.assertEqual(pn.current_step_number, 3)
+        self.assertEqual(list(pn.stage_timings), ["First stage.", "Second stage."])
+        pn.close()
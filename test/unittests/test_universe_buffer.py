@@ -0,0 +1,39 @@
+"""Unit test for the array backed universe."""
+import unittest
+
+import numpy as np
+
+import proto.UniverseControl_pb2
+from model.universe import NUMBER_OF_CHANNELS, Universe
+
+
+class UniverseBufferTest(unittest.TestCase):
+    """Unit test for the array backed universe."""
+
+    def test_channel_facade(self):
+        """Test that channel objects read and write the universe buffer."""
+        universe = Universe(proto.UniverseControl_pb2.Universe(id=0))
+        received_values = []
+        universe.channels[10].updated.connect(received_values.append)
+        universe.channels[10].value = 42
+        self.assertEqual(universe.values[10], 42)
+        self.assertEqual(universe.channels[10].address, 10)
+        self.assertIs(universe.channels[10], universe.channels[10])
+        self.assertEqual(received_values, [42])
+        with self.assertRaises(ValueError):
+            universe.channels[10].value = 256
+
+    def test_bulk_update(self):
+        """Test that bulk updates notify the range once and track dirty channels."""
+        universe = Universe(proto.UniverseControl_pb2.Universe(id=0))
+        ranges = []
+        universe.values_changed.connect(lambda start, length: ranges.append((start, length)))
+        universe.set_values(np.full(8, 255), start=100)
+        self.assertEqual(ranges, [(100, 8)])
+        self.assertEqual(universe.get_values(99, 109).tolist(), [0] + [255] * 8 + [0])
+        mask = universe.take_dirty_mask()
+        self.assertEqual(len(mask), NUMBER_OF_CHANNELS)
+        self.assertEqual(np.flatnonzero(mask).tolist(), list(range(100, 108)))
+        self.assertFalse(universe.has_dirty_channels)
+        with self.assertRaises(ValueError):
+            universe.values[0] = 1